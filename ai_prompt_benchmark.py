@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+AI Prompt Benchmark for the Proxilearn API Server
+Calls every AI helper a few times and reports, per helper, the prompt size and
+latency read from GET /api/metrics (before/after deltas) plus the client-side
+time of each call:
+  - estimated prompt tokens (proxilearn_ai_prompt_tokens, local tokenizer)
+  - prompt, completion and cached tokens reported by the provider
+    (proxilearn_ai_tokens_total)
+  - AI call duration (proxilearn_ai_call_duration_seconds)
+
+To compare builds, run it against the old build with --save before.json and
+against the new one with --compare before.json; the old build has no
+estimated-token histogram, so that column is only filled in for new runs.
+
+Note: this creates real records (lesson plans, assessments, quiz assignments,
+doubts and coordinator analytics) and spends AI credits; use a test school.
+
+Environment:
+  PROXILEARN_TEACHER_COOKIE       teacher Cookie header (lesson plan, assessment, quiz)
+  PROXILEARN_STUDENT_COOKIE       student Cookie header (doubts)
+  PROXILEARN_COORDINATOR_COOKIE   coordinator Cookie header (analytics insights)
+  PROXILEARN_SUBJECT_ID           subject to generate content for (required)
+  AI_BENCH_ROUNDS                 calls per helper (default 3)
+  METRICS_TOKEN                   server's token for /metrics (required)
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import time
+from collections import defaultdict
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+SUBJECT_ID = os.environ.get("PROXILEARN_SUBJECT_ID")
+ROUNDS = int(os.environ.get("AI_BENCH_ROUNDS", "3"))
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+SAMPLE_LINE = re.compile(r'^(\w+)\{([^}]*)\} ([\d.eE+-]+)$')
+LABEL = re.compile(r'(\w+)="([^"]*)"')
+
+
+def lesson_plan_request(round_number):
+    return "POST", "/teacher/lesson-plans", {
+        "title": f"Benchmark lesson {round_number}",
+        "subjectId": SUBJECT_ID,
+        "gradeLevel": "8",
+        "duration": 40,
+        "topic": "Photosynthesis",
+        "learningObjectives": "Explain how plants turn light into chemical energy",
+        "useAI": True,
+    }
+
+
+def assessment_request(round_number):
+    return "POST", "/teacher/pdf-assessment", {
+        "title": f"Benchmark assessment {round_number}",
+        "subjectId": SUBJECT_ID,
+        "topics": ["Fractions", "Decimals", "Percentages"],
+        "totalQuestions": 6,
+        "totalMarks": 20,
+        "duration": 30,
+    }
+
+
+def quiz_request(round_number):
+    return "POST", "/assignments/generate-quiz", {
+        "title": f"Benchmark quiz {round_number}",
+        "subjectId": SUBJECT_ID,
+        "topic": "The water cycle",
+        "difficulty": "medium",
+        "questionCount": 5,
+    }
+
+
+def doubt_request(round_number):
+    return "POST", "/doubts", {
+        "title": f"Benchmark doubt {round_number}",
+        "subjectId": SUBJECT_ID,
+        "questionText": "Why does ice float on water if it is made of the same molecules?",
+        "context": "We learned about density in class today.",
+    }
+
+
+def insights_request(round_number):
+    # Stored analytics are reused while they cover the requested period, so a
+    # longer period than any earlier round forces fresh insights each time
+    return "GET", f"/coordinator/analytics?period={400 + round_number}", None
+
+
+# helper (metric label) -> (role, request builder)
+HELPERS = {
+    "generateLessonPlan": ("teacher", lesson_plan_request),
+    "generateAssessmentQuestions": ("teacher", assessment_request),
+    "generateQuizQuestions": ("teacher", quiz_request),
+    "generateDoubtResponse": ("student", doubt_request),
+    "generateCoordinatorInsights": ("coordinator", insights_request),
+}
+
+
+def read_metrics():
+    headers = {"Authorization": f"Bearer {METRICS_TOKEN}"} if METRICS_TOKEN else {}
+    response = requests.get(f"{API_BASE}/metrics", headers=headers, timeout=30)
+    response.raise_for_status()
+    samples = defaultdict(float)
+    for line in response.text.splitlines():
+        match = SAMPLE_LINE.match(line)
+        if match:
+            name, labels, value = match.groups()
+            samples[(name, tuple(sorted(LABEL.findall(labels))))] += float(value)
+    return samples
+
+
+def metric_total(samples, name, **labels):
+    wanted = set(labels.items())
+    return sum(value for (sample_name, sample_labels), value in samples.items()
+               if sample_name == name and wanted <= set(sample_labels))
+
+
+class AiPromptBenchmark:
+    def __init__(self, cookies):
+        self.cookies = cookies
+        self.results = {}
+
+    def call_helper(self, helper, role, build):
+        latencies = []
+        failures = 0
+        for round_number in range(ROUNDS):
+            method, path, body = build(round_number)
+            started = time.perf_counter()
+            response = requests.request(method, f"{API_BASE}{path}", json=body,
+                                        headers={"Cookie": self.cookies[role]}, timeout=180)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 300:
+                failures += 1
+                print(f"   ⚠️  {helper} round {round_number + 1}: {response.status_code} {response.text[:120]}")
+        return latencies, failures
+
+    def run(self):
+        print("=" * 80)
+        print("PROXILEARN AI PROMPT BENCHMARK")
+        print("=" * 80)
+        print(f"{ROUNDS} calls per helper")
+        print()
+
+        for helper, (role, build) in HELPERS.items():
+            if role not in self.cookies:
+                print(f"⏭️  {helper}: no {role} cookie, skipped")
+                continue
+
+            before = read_metrics()
+            latencies, failures = self.call_helper(helper, role, build)
+            after = read_metrics()
+
+            def delta(name, **labels):
+                return metric_total(after, name, helper=helper, **labels) - metric_total(before, name, helper=helper, **labels)
+
+            calls = delta("proxilearn_ai_call_duration_seconds_count")
+            estimated_calls = delta("proxilearn_ai_prompt_tokens_count")
+            result = {
+                "requests": ROUNDS,
+                "failures": failures,
+                "ai_calls": calls,
+                "client_ms_p50": statistics.median(latencies),
+                "ai_call_ms_mean": delta("proxilearn_ai_call_duration_seconds_sum") / calls * 1000 if calls else None,
+                "estimated_prompt_tokens": delta("proxilearn_ai_prompt_tokens_sum") / estimated_calls if estimated_calls else None,
+                "prompt_tokens": delta("proxilearn_ai_tokens_total", type="prompt") / calls if calls else None,
+                "cached_tokens": delta("proxilearn_ai_tokens_total", type="cached") / calls if calls else None,
+                "completion_tokens": delta("proxilearn_ai_tokens_total", type="completion") / calls if calls else None,
+            }
+            self.results[helper] = result
+            print(f"📊 {helper}: {format_result(result)}")
+        print()
+        return self.results
+
+
+def format_value(value, unit=""):
+    return "-" if value is None else f"{value:.0f}{unit}"
+
+
+def format_result(result):
+    return (f"{format_value(result['ai_calls'])} AI calls, "
+            f"client p50 {format_value(result['client_ms_p50'], 'ms')}, "
+            f"AI call {format_value(result['ai_call_ms_mean'], 'ms')}, "
+            f"prompt {format_value(result['prompt_tokens'])} tokens "
+            f"(estimated {format_value(result['estimated_prompt_tokens'])}, "
+            f"cached {format_value(result['cached_tokens'])}), "
+            f"completion {format_value(result['completion_tokens'])}")
+
+
+def print_comparison(baseline, results):
+    print("=" * 80)
+    print("COMPARISON (per AI call; baseline -> this run)")
+    print("=" * 80)
+    for helper, result in results.items():
+        old = baseline.get(helper)
+        if not old:
+            continue
+        print(f"{helper}:")
+        for key, label in (("prompt_tokens", "prompt tokens"), ("cached_tokens", "cached tokens"),
+                           ("completion_tokens", "completion tokens"), ("ai_call_ms_mean", "AI call ms"),
+                           ("client_ms_p50", "client p50 ms")):
+            before, after = old.get(key), result.get(key)
+            change = f" ({(after - before) / before * 100:+.0f}%)" if before and after is not None else ""
+            print(f"   {label:<18} {format_value(before):>8} -> {format_value(after):>8}{change}")
+    print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", help="write the per-helper results to this JSON file")
+    parser.add_argument("--compare", help="compare with results saved by an earlier --save run")
+    args = parser.parse_args()
+
+    cookies = {}
+    for role in ("teacher", "student", "coordinator"):
+        cookie = os.environ.get(f"PROXILEARN_{role.upper()}_COOKIE")
+        if cookie:
+            cookies[role] = cookie
+    if not cookies or not SUBJECT_ID:
+        print("⏭️  SKIP - set PROXILEARN_SUBJECT_ID and at least one of PROXILEARN_TEACHER_COOKIE, "
+              "PROXILEARN_STUDENT_COOKIE or PROXILEARN_COORDINATOR_COOKIE")
+        raise SystemExit(0)
+
+    probe = requests.get(f"{API_BASE}/metrics", timeout=30,
+                         headers={"Authorization": f"Bearer {METRICS_TOKEN}"} if METRICS_TOKEN else {})
+    if probe.status_code != 200:
+        print(f"⏭️  SKIP - GET /api/metrics returned {probe.status_code} (set METRICS_TOKEN?)")
+        raise SystemExit(0)
+
+    results = AiPromptBenchmark(cookies).run()
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            print_comparison(json.load(baseline_file), results)
+    if args.save:
+        with open(args.save, "w") as output:
+            json.dump(results, output, indent=2)
+        print(f"💾 Results saved to {args.save}")
@@ -4,6 +4,56 @@ import { NextResponse } from 'next/server'
 import { createServerClient } from '@supabase/ssr'
 import { cookies } from 'next/headers'
 import OpenAI from 'openai'
+import { enqueueJob, getJob, wantsAsync } from '@/lib/jobs'
+import {
+  assessmentContentHash,
+  getPdfArtifact,
+  loadLogoImage,
+  normalizeRenderOptions,
+  renderAssessmentPdf,
+  savePdfArtifact,
+  streamPdfBuffer,
+  streamPdfChunks
+} from '@/lib/pdf'
+import {
+  CACHE_POLICIES,
+  bumpCacheVersion,
+  cacheVersion,
+  cachedLoad,
+  conditionalJsonResponse,
+  invalidateTags
+} from '@/lib/cache'
+import { addDoubtToIndex, findSimilarDoubt, rebuildSubjectIndex } from '@/lib/doubtIndex'
+import { getTransportStats, pooledFetch } from '@/lib/http'
+import { captureRequest } from '@/lib/capture'
+import { withIdempotency } from '@/lib/idempotency'
+import { IMPORT_BATCH_LIMIT, IMPORT_KINDS, createStudentAccounts, validateImportRows } from '@/lib/bulkImport'
+import { getProcessStats, heapSnapshotLimitReason, heapSnapshotsEnabled, writeHeapSnapshot } from '@/lib/diagnostics'
+import { DeadlineExceededError, deadlineSignal, raceDeadline, runWithDeadline, withTimeBudget } from '@/lib/deadline'
+import {
+  consumeRateLimit,
+  estimateDoubtCost,
+  estimateLessonPlanCost,
+  estimateQuizCost,
+  rateLimitedResponse
+} from '@/lib/rateLimit'
+import {
+  observeAiCall,
+  observeRequest,
+  recordAiParseResult,
+  recordCacheResult,
+  recordPromptTokens,
+  renderMetrics
+} from '@/lib/metrics'
+import {
+  ASSESSMENT_QUESTIONS_FORMAT,
+  QUIZ_QUESTIONS_FORMAT,
+  normalizeAssessmentQuestion,
+  normalizeQuizQuestion,
+  parseJsonItems
+} from '@/lib/aiOutput'
+import { PROMPT_TOKEN_BUDGETS, SYSTEM_PROMPTS, formatSubjectSummaries } from '@/lib/prompts'
+import { countMessageTokens } from '@/lib/tokens'
 
 // MongoDB connection
 let client
@@ -18,6 +68,67 @@ async function connectToMongo() {
   return db
 }
 
+// status_checks is heartbeat data nobody reads after a few weeks; Mongo's TTL
+// monitor deletes documents once `timestamp` is older than the retention
+const STATUS_CHECK_RETENTION_SECONDS = parseInt(process.env.STATUS_CHECK_RETENTION_DAYS || '30') * 24 * 60 * 60
+let statusIndexesReady = null
+
+async function ensureStatusCheckIndexes(db) {
+  if (!statusIndexesReady) {
+    statusIndexesReady = db.collection('status_checks')
+      .createIndex({ timestamp: 1 }, { expireAfterSeconds: STATUS_CHECK_RETENTION_SECONDS })
+      .catch(error => {
+        statusIndexesReady = null
+        console.error('Failed to create status check indexes:', error)
+      })
+  }
+  return statusIndexesReady
+}
+
+// When enabled, submissions store answers packed into one JSONB column on the
+// attempt ({ question_id: [answer, is_correct, points] }) instead of one
+// student_responses row per question (compact_answers_schema.sql)
+const COMPACT_ANSWERS = process.env.COMPACT_ANSWERS === 'true'
+
+// Chat history and alert lists look back this many days by default. Those tables are
+// partitioned by month (partitioning_schema.sql), so the date filter keeps each
+// query on the most recent partitions.
+const RECENT_ACTIVITY_DAYS = 90
+
+function recentSince(days = RECENT_ACTIVITY_DAYS) {
+  return new Date(Date.now() - days * 24 * 60 * 60 * 1000).toISOString()
+}
+
+// Record ids are UUIDs; ids from clients are checked against this before they
+// reach a ::UUID cast in SQL, where anything else fails with 22P02
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+
+// Every request runs under a deadline (lib/deadline.js); upstream calls still
+// pending when it passes are aborted and the client gets a 504. Synchronous AI
+// generation and PDF rendering get the longer deadline.
+const REQUEST_DEADLINE_MS = parseInt(process.env.REQUEST_DEADLINE_MS || '15000')
+const LONG_REQUEST_DEADLINE_MS = parseInt(process.env.LONG_REQUEST_DEADLINE_MS || '120000')
+const LONG_RUNNING_ROUTES = [
+  /^\/assignments\/generate-quiz$/,
+  /^\/doubts$/,
+  /^\/import\/[^\/]+$/,
+  /^\/teacher\/lesson-plans$/,
+  /^\/teacher\/assignments$/,
+  /^\/teacher\/assignments\/[^\/]+\/regrade$/,
+  /^\/teacher\/pdf-assessment$/,
+  /^\/teacher\/pdf-assessments\/[^\/]+\/(pdf|render)$/,
+  /^\/coordinator\/analytics$/,
+  /^\/coordinator\/run-ai-analysis$/
+]
+
+// Optional dashboard sections get this much of the request's time; a section
+// that fails or runs out is left empty and listed in `unavailable`
+const DASHBOARD_SECTION_BUDGET_MS = parseInt(process.env.DASHBOARD_SECTION_BUDGET_MS || '4000')
+
+// Per-request Supabase clients only bind the caller's cookies; every client
+// sends its HTTP calls through the shared keep-alive pool
+const SUPABASE_GLOBAL_OPTIONS = { fetch: pooledFetch }
+
 // Supabase server client
 function createSupabaseServer() {
   const cookieStore = cookies()
@@ -25,6 +136,7 @@ function createSupabaseServer() {
     process.env.NEXT_PUBLIC_SUPABASE_URL,
     process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY,
     {
+      global: SUPABASE_GLOBAL_OPTIONS,
       cookies: {
         getAll() {
           return cookieStore.getAll()
@@ -43,21 +155,314 @@ function createSupabaseServer() {
   )
 }
 
+// Supabase client for background jobs - binds a snapshot of the request cookies,
+// because the request's cookie store is no longer usable once the 202 is sent
+function createSupabaseForJob() {
+  const cookieSnapshot = cookies().getAll()
+  return createServerClient(
+    process.env.NEXT_PUBLIC_SUPABASE_URL,
+    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY,
+    {
+      global: SUPABASE_GLOBAL_OPTIONS,
+      cookies: {
+        getAll() {
+          return cookieSnapshot
+        },
+        setAll() {
+          // Background jobs cannot set response cookies
+        },
+      },
+    }
+  )
+}
+
 // OpenAI client for Kimi K2
 const openai = new OpenAI({
   baseURL: process.env.OPENROUTER_BASE_URL,
   apiKey: process.env.OPENROUTER_API_KEY,
+  fetch: pooledFetch,
 })
 
 // Helper function to handle CORS
 function handleCORS(response) {
   response.headers.set('Access-Control-Allow-Origin', '*')
   response.headers.set('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-  response.headers.set('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+  response.headers.set('Access-Control-Allow-Headers', 'Content-Type, Authorization, Prefer, If-None-Match, Idempotency-Key')
+  response.headers.set('Access-Control-Expose-Headers', 'Location, ETag, Content-Disposition, X-Artifact-Cache, X-Response-Cache, Idempotent-Replayed')
   response.headers.set('Access-Control-Allow-Credentials', 'true')
   return response
 }
 
+// Helper function to serve a read-mostly GET through the response cache.
+// `load` returns { status, body }; only 200s are cached and concurrent misses
+// share one load. Conditional requests get a 304 when the ETag still matches.
+async function respondWithCache(request, cacheKey, { tags, ttlMs, cacheControl }, load) {
+  const result = await cachedLoad(cacheKey, { tags, ttlMs }, load)
+  if (result.status !== 200) {
+    return handleCORS(NextResponse.json(result.body, { status: result.status }))
+  }
+
+  return handleCORS(conditionalJsonResponse(request, result.body, {
+    etag: result.etag,
+    cacheControl,
+    cacheStatus: result.cacheStatus
+  }))
+}
+
+// Helper function to get the scope a user's school-visible payloads can be shared in
+// (their school, or just themselves when no school is on the profile)
+async function getSharingScope(supabase, user) {
+  const result = await cachedLoad(`user-school:${user.id}`, {
+    tags: [`user:${user.id}`],
+    ttlMs: 5 * 60 * 1000
+  }, async () => {
+    const { data: profile, error } = await supabase
+      .from('user_profiles')
+      .select('school_id')
+      .eq('id', user.id)
+      .single()
+
+    if (error || !profile) {
+      return { status: 404, body: { error: "User profile not found", details: error?.message } }
+    }
+    return { status: 200, body: { schoolId: profile.school_id } }
+  })
+  return result.status === 200 && result.body.schoolId
+    ? `school-${result.body.schoolId}`
+    : `user-${user.id}`
+}
+
+// Helper function to load the student-facing question payload of a published
+// assignment. RLS grants it to everyone in the subject's school, so one copy per
+// school is shared; the version in the key changes whenever questions change.
+async function loadAssignmentPayload(supabase, assignmentId, sharingScope) {
+  const scope = `assignment:${assignmentId}`
+  return await cachedLoad(`assignment-payload:${assignmentId}:${sharingScope}:v${cacheVersion(scope)}`, {
+    tags: ['assignments', scope],
+    ttlMs: 10 * 60 * 1000
+  }, async () => {
+    // Verify assignment access
+    const { data: assignment, error: assignmentError } = await supabase
+      .from('assignments')
+      .select('id, title, is_published')
+      .eq('id', assignmentId)
+      .eq('is_published', true)
+      .single()
+
+    if (assignmentError) {
+      return {
+        status: 404,
+        body: { error: "Assignment not found", details: assignmentError.message }
+      }
+    }
+
+    // Get questions (without correct answers for students)
+    const { data: questions, error: questionsError } = await supabase
+      .from('assignment_questions')
+      .select('id, question_text, question_type, options, points, order_index')
+      .eq('assignment_id', assignmentId)
+      .order('order_index')
+
+    if (questionsError) {
+      return {
+        status: 500,
+        body: { error: "Failed to fetch questions", details: questionsError.message }
+      }
+    }
+
+    return {
+      status: 200,
+      body: { assignment, questions: questions || [], count: questions?.length || 0 }
+    }
+  })
+}
+
+// Helper function to load the answer key used for grading (server-side only)
+async function loadAnswerKey(supabase, assignmentId, sharingScope) {
+  const scope = `assignment:${assignmentId}`
+  return await cachedLoad(`answer-key:${assignmentId}:${sharingScope}:v${cacheVersion(scope)}`, {
+    tags: [scope],
+    ttlMs: 10 * 60 * 1000
+  }, async () => {
+    const { data: questions, error } = await supabase
+      .from('assignment_questions')
+      .select('id, correct_answer, points, explanation')
+      .eq('assignment_id', assignmentId)
+
+    if (error) {
+      return { status: 500, body: { error: "Failed to fetch questions for grading" } }
+    }
+    return { status: 200, body: questions || [] }
+  })
+}
+
+// Helper function to build submit results from packed answers plus the cached
+// question payload and answer key, in the shape of the student_responses join
+async function compactDetailedResults(supabase, assignmentId, sharingScope, answerKey, packedAnswers) {
+  const payload = await loadAssignmentPayload(supabase, assignmentId, sharingScope)
+  if (payload.status !== 200) {
+    return { data: null, error: payload.body }
+  }
+
+  const questionsById = new Map(payload.body.questions.map(question => [question.id, question]))
+  const data = answerKey.map(key => {
+    const [studentAnswer, isCorrect, pointsEarned] = packedAnswers[key.id]
+    const question = questionsById.get(key.id) || {}
+    return {
+      question_id: key.id,
+      student_answer: studentAnswer,
+      is_correct: isCorrect,
+      points_earned: pointsEarned,
+      assignment_questions: {
+        question_text: question.question_text,
+        options: question.options,
+        correct_answer: key.correct_answer,
+        explanation: key.explanation
+      }
+    }
+  })
+  return { data, error: null }
+}
+
+// Autosaved quiz answers live in one Mongo document per attempt until the attempt
+// is submitted. Clients send sequence-numbered deltas; each batch is merged with a
+// single update that keeps, per question, the answer with the highest sequence
+// number, so resent or reordered batches are harmless.
+const ATTEMPT_DRAFTS_COLLECTION = 'attempt_drafts'
+const ATTEMPT_DRAFT_RETENTION_SECONDS = 7 * 24 * 60 * 60
+const MAX_ANSWER_DELTAS = 200
+const MAX_DRAFT_ANSWER_LENGTH = 2000
+let draftIndexesReady = null
+
+async function ensureDraftIndexes(db) {
+  if (!draftIndexesReady) {
+    draftIndexesReady = db.collection(ATTEMPT_DRAFTS_COLLECTION)
+      .createIndex({ updated_at: 1 }, { expireAfterSeconds: ATTEMPT_DRAFT_RETENTION_SECONDS })
+      .catch(error => {
+        draftIndexesReady = null
+        console.error('Failed to create attempt draft indexes:', error)
+      })
+  }
+  return draftIndexesReady
+}
+
+function attemptDraftId(userId, assignmentId, attemptNumber) {
+  return `${userId}:${assignmentId}:${attemptNumber}`
+}
+
+// Helper function to validate a batch of answer deltas ({ seq, questionId, answer })
+function answerDeltasError(deltas) {
+  if (!Array.isArray(deltas) || deltas.length === 0 || deltas.length > MAX_ANSWER_DELTAS) {
+    return `deltas must be an array of 1 to ${MAX_ANSWER_DELTAS} answer changes`
+  }
+  for (const delta of deltas) {
+    if (!Number.isInteger(delta?.seq) || delta.seq < 1 || !UUID_PATTERN.test(delta.questionId)) {
+      return 'Each delta needs a positive integer seq and a questionId'
+    }
+    if (delta.answer !== null && (typeof delta.answer !== 'string' || delta.answer.length > MAX_DRAFT_ANSWER_LENGTH)) {
+      return `answer must be a string of at most ${MAX_DRAFT_ANSWER_LENGTH} characters, or null`
+    }
+  }
+  return null
+}
+
+// Helper function to merge answer deltas into the attempt's draft. Steady state is
+// one Mongo update per batch; Supabase is only asked whether the attempt is still
+// in progress when its draft does not exist yet.
+async function saveAnswerDeltas(db, supabase, user, assignmentId, attemptNumber, deltas) {
+  await ensureDraftIndexes(db)
+
+  // Only the newest delta per question in this batch matters
+  const latest = new Map()
+  for (const delta of deltas) {
+    if (!latest.has(delta.questionId) || latest.get(delta.questionId).seq < delta.seq) {
+      latest.set(delta.questionId, delta)
+    }
+  }
+  const maxSeq = Math.max(...deltas.map(delta => delta.seq))
+
+  const merge = [{
+    $set: {
+      user_id: user.id,
+      assignment_id: assignmentId,
+      attempt_number: attemptNumber,
+      ack_seq: { $max: [{ $ifNull: ['$ack_seq', 0] }, maxSeq] },
+      updated_at: '$$NOW',
+      ...Object.fromEntries([...latest.values()].map(({ questionId, seq, answer }) => [
+        `answers.${questionId}`,
+        {
+          $cond: [
+            { $gt: [seq, { $ifNull: [`$answers.${questionId}.seq`, 0] }] },
+            { value: { $literal: answer }, seq },
+            `$answers.${questionId}`
+          ]
+        }
+      ]))
+    }
+  }]
+
+  const drafts = db.collection(ATTEMPT_DRAFTS_COLLECTION)
+  const filter = { _id: attemptDraftId(user.id, assignmentId, attemptNumber) }
+  const options = { returnDocument: 'after', projection: { ack_seq: 1 } }
+  let draft = await drafts.findOneAndUpdate(filter, merge, options)
+
+  if (!draft) {
+    const { data: attempt, error } = await supabase
+      .from('assignment_attempts')
+      .select('status')
+      .eq('assignment_id', assignmentId)
+      .eq('student_id', user.id)
+      .eq('attempt_number', attemptNumber)
+      .maybeSingle()
+
+    if (error) {
+      return { status: 500, body: { error: "Failed to load attempt", details: error.message } }
+    }
+    if (!attempt) {
+      return { status: 404, body: { error: "Attempt not found" } }
+    }
+    if (attempt.status !== 'in_progress') {
+      return { status: 409, body: { error: "Attempt already submitted" } }
+    }
+    draft = await drafts.findOneAndUpdate(filter, merge, { ...options, upsert: true })
+  }
+
+  return { status: 200, body: { ackSeq: draft.ack_seq, saved: latest.size } }
+}
+
+// Helper function to read an attempt's autosaved answers as { question_id: answer }
+async function loadAnswerDraft(db, userId, assignmentId, attemptNumber) {
+  const draft = await db.collection(ATTEMPT_DRAFTS_COLLECTION)
+    .findOne({ _id: attemptDraftId(userId, assignmentId, attemptNumber) })
+  if (!draft) {
+    return null
+  }
+  const answers = Object.fromEntries(
+    Object.entries(draft.answers || {}).map(([questionId, saved]) => [questionId, saved.value])
+  )
+  return { answers, ackSeq: draft.ack_seq }
+}
+
+// Helper function to charge a request to the caller's and their school's rate limit
+// buckets; returns a 429 response when either is exhausted, otherwise null
+async function enforceRateLimit(db, supabase, user, action, cost = 1) {
+  const schoolKey = await getSharingScope(supabase, user)
+  const result = await consumeRateLimit(db, action, { userId: user.id, schoolKey }, cost)
+  return result.allowed ? null : handleCORS(rateLimitedResponse(result))
+}
+
+// Helper function to drop cached questions and answer keys after they change
+function invalidateAssignmentQuestions(assignmentId) {
+  bumpCacheVersion(`assignment:${assignmentId}`)
+  invalidateTags('assignments')
+}
+
+// Helper function to check METRICS_TOKEN on operational endpoints; they stay closed until a token is configured
+function hasMetricsAccess(request) {
+  const token = process.env.METRICS_TOKEN
+  return Boolean(token) && request.headers.get('authorization') === `Bearer ${token}`
+}
+
 // Helper function to get authenticated user
 async function getAuthenticatedUser(supabase) {
   const { data: { user }, error } = await supabase.auth.getUser()
@@ -67,55 +472,129 @@ async function getAuthenticatedUser(supabase) {
   return user
 }
 
-// Helper function to generate AI quiz questions
-async function generateQuizQuestions(topic, difficulty, questionCount, subject) {
-  const prompt = `Create ${questionCount} multiple choice questions about "${topic}" for ${subject} at ${difficulty} level.
-
-Requirements:
-- Questions should be educational and appropriate for students
-- Each question should have 4 options (A, B, C, D)
-- Include clear explanations for correct answers
-- Difficulty: ${difficulty}
-- Topic: ${topic}
-- Subject: ${subject}
-
-Format your response as a JSON array with this structure:
-[
-  {
-    "question": "Question text here?",
-    "options": ["Option A", "Option B", "Option C", "Option D"],
-    "correct_answer": "Option A",
-    "explanation": "Detailed explanation why this is correct"
+// Helper function to run a chat completion, timed and token-counted under the helper's name
+function createChatCompletion(helper, params) {
+  const promptTokens = countMessageTokens(params.messages)
+  recordPromptTokens(helper, promptTokens)
+  if (promptTokens > (PROMPT_TOKEN_BUDGETS[helper] || Infinity)) {
+    console.warn(`${helper} prompt is ~${promptTokens} tokens, over its budget of ${PROMPT_TOKEN_BUDGETS[helper]}`)
   }
-]
+  // The deadline signal makes the SDK give up at once instead of retrying
+  return observeAiCall(helper, () => openai.chat.completions.create(params, { signal: deadlineSignal() }))
+}
 
-Make sure the JSON is valid and properly formatted.`
+// Helper function to load independent dashboard sections in parallel, each
+// within DASHBOARD_SECTION_BUDGET_MS. `sections` maps a name to a function
+// returning a Supabase query; a section whose query errors (including one cut
+// off by its budget) resolves to { data: null, count: null } and is listed in
+// `unavailable`, so a slow upstream degrades the dashboard instead of failing it.
+async function loadDashboardSections(sections) {
+  const names = Object.keys(sections)
+  const results = await Promise.all(names.map(name =>
+    withTimeBudget(DASHBOARD_SECTION_BUDGET_MS, sections[name]).catch(error => ({ error }))
+  ))
+
+  const loaded = {}
+  const unavailable = []
+  names.forEach((name, index) => {
+    const { data = null, count = null, error } = results[index]
+    if (error) {
+      console.error(`Dashboard section ${name} unavailable:`, error.message || error)
+      unavailable.push(name)
+      loaded[name] = { data: null, count: null }
+    } else {
+      loaded[name] = { data, count }
+    }
+  })
+  return { loaded, unavailable }
+}
 
-  try {
-    const completion = await openai.chat.completions.create({
+// Structured output is requested unless AI_STRUCTURED_OUTPUT=off. A 400 retries
+// that call without response_format; structured output is switched off for the
+// process only when the error says the provider does not support it.
+const AI_GENERATION_ATTEMPTS = parseInt(process.env.AI_GENERATION_ATTEMPTS || '3')
+const STRUCTURED_OUTPUT_ERROR = /response_format|json_schema|structured output/i
+let structuredOutputEnabled = process.env.AI_STRUCTURED_OUTPUT !== 'off'
+
+// Helper function to generate `count` question items. Complete items are kept
+// from malformed or truncated output (lib/aiOutput.js) and each retry asks only
+// for the missing ones; `buildPrompt(missing, items)` writes that request.
+// Returns fewer than `count` items only when every attempt came up short.
+async function generateQuestionItems(helper, { count, system, buildPrompt, responseFormat, normalize, maxTokens }) {
+  const items = []
+  const seen = new Set()
+
+  for (let attempt = 1; attempt <= AI_GENERATION_ATTEMPTS && items.length < count; attempt++) {
+    const params = {
       model: process.env.KIMI_MODEL || 'gpt-3.5-turbo',
       messages: [
-        {
-          role: 'system',
-          content: 'You are an expert educational content creator. Generate high-quality quiz questions that are pedagogically sound and appropriate for the specified difficulty level.'
-        },
-        {
-          role: 'user',
-          content: prompt
-        }
+        { role: 'system', content: system },
+        { role: 'user', content: buildPrompt(count - items.length, items) }
       ],
       temperature: 0.7,
-      max_tokens: 2000
-    })
+      max_tokens: maxTokens
+    }
 
-    const content = completion.choices[0].message.content.trim()
-    // Extract JSON from the response (in case there's extra text)
-    const jsonMatch = content.match(/\[[\s\S]*\]/)
-    if (!jsonMatch) {
-      throw new Error('Could not extract valid JSON from AI response')
+    let completion
+    try {
+      completion = await createChatCompletion(helper, structuredOutputEnabled ? { ...params, response_format: responseFormat } : params)
+    } catch (error) {
+      if (!structuredOutputEnabled || error.status !== 400) {
+        throw error
+      }
+      if (STRUCTURED_OUTPUT_ERROR.test(error.message || '')) {
+        console.warn(`AI provider rejected structured output, using prompt-only JSON: ${error.message}`)
+        structuredOutputEnabled = false
+      }
+      completion = await createChatCompletion(helper, params)
     }
 
-    return JSON.parse(jsonMatch[0])
+    const choice = completion.choices[0]
+    const { items: parsed, complete } = parseJsonItems(choice?.message?.content || '')
+    const valid = parsed.map(normalize).filter(Boolean)
+    const clean = complete && valid.length === parsed.length && choice?.finish_reason !== 'length'
+    recordAiParseResult(helper, valid.length === 0 ? 'failed' : clean ? 'complete' : 'salvaged')
+
+    // A retry may repeat a question despite the prompt
+    for (const item of valid) {
+      if (!seen.has(item.question)) {
+        seen.add(item.question)
+        items.push(item)
+      }
+    }
+  }
+
+  if (items.length === 0) {
+    throw new Error('AI response contained no usable questions')
+  }
+  return items.slice(0, count)
+}
+
+// Helper function to list already generated questions in a retry prompt
+function existingQuestionsNote(items) {
+  if (items.length === 0) {
+    return ''
+  }
+  const list = items.map(item => `- ${item.question.slice(0, 150)}`).join('\n')
+  return `\n\nThese questions already exist; do not repeat them:\n${list}`
+}
+
+// Helper function to generate AI quiz questions
+async function generateQuizQuestions(topic, difficulty, questionCount, subject) {
+  const buildPrompt = (missing, items) => `Create ${missing} multiple choice questions.
+Subject: ${subject}
+Topic: ${topic}
+Difficulty: ${difficulty}${existingQuestionsNote(items)}`
+
+  try {
+    return await generateQuestionItems('generateQuizQuestions', {
+      count: questionCount,
+      system: SYSTEM_PROMPTS.generateQuizQuestions,
+      buildPrompt,
+      responseFormat: QUIZ_QUESTIONS_FORMAT,
+      normalize: normalizeQuizQuestion,
+      maxTokens: 2000
+    })
   } catch (error) {
     console.error('AI Quiz Generation Error:', error)
     throw new Error('Failed to generate quiz questions with AI')
@@ -124,54 +603,17 @@ Make sure the JSON is valid and properly formatted.`
 
 // Helper function to generate AI lesson plans
 async function generateLessonPlan(topic, subject, gradeLevel, duration = 40, customPrompt = null) {
-  const prompt = customPrompt || `Create a comprehensive ${duration}-minute lesson plan for ${subject} on the topic "${topic}" for Grade ${gradeLevel} students.
-
-Please provide a structured lesson plan with the following components:
-
-1. Learning Objectives (3-5 clear, measurable objectives)
-2. Key Concepts (main ideas students should understand)
-3. Discussion Points (thought-provoking questions for class engagement)
-4. Activities (interactive learning activities with timing)
-5. Resources (educational materials, videos, links, demonstrations)
-6. Assessment Notes (how to check student understanding)
-7. Homework Suggestions (reinforcement activities)
-
-Format the response as a JSON object with these keys:
-{
-  "keyConcepts": ["concept1", "concept2", ...],
-  "discussionPoints": ["question1", "question2", ...],
-  "activities": [
-    {
-      "type": "activity_type",
-      "description": "activity description",
-      "duration": "10 minutes",
-      "resources": ["resource1", "resource2"]
-    }
-  ],
-  "resources": [
-    {
-      "type": "video|document|website|demonstration",
-      "title": "Resource Title", 
-      "url": "https://example.com (if available)",
-      "description": "How this resource supports learning"
-    }
-  ],
-  "assessmentNotes": "How to assess student understanding during and after the lesson",
-  "homeworkSuggestions": "Suggested homework or follow-up activities"
-}`
+  const prompt = customPrompt || `Create a ${duration}-minute lesson plan.
+Subject: ${subject}
+Topic: ${topic}
+Grade: ${gradeLevel}`
 
   try {
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion('generateLessonPlan', {
       model: process.env.KIMI_MODEL || 'gpt-3.5-turbo',
       messages: [
-        {
-          role: 'system',
-          content: 'You are an experienced educator and curriculum designer. Create engaging, pedagogically sound lesson plans that promote active learning and student engagement.'
-        },
-        {
-          role: 'user',
-          content: prompt
-        }
+        { role: 'system', content: SYSTEM_PROMPTS.generateLessonPlan },
+        { role: 'user', content: prompt }
       ],
       temperature: 0.7,
       max_tokens: 2500
@@ -197,69 +639,26 @@ async function generateAssessmentQuestions(topics, subject, totalQuestions, diff
   const mediumCount = Math.round(totalQuestions * (difficultyDistribution.medium / 100))
   const hardCount = totalQuestions - easyCount - mediumCount
 
-  const prompt = `Generate ${totalQuestions} assessment questions for ${subject} covering these topics: ${topics.join(', ')}.
-
-Distribution needed:
-- Easy: ${easyCount} questions (basic recall and understanding)
-- Medium: ${mediumCount} questions (application and analysis)
-- Hard: ${hardCount} questions (evaluation and synthesis)
-
-For each question, provide:
-1. Question text (clear and unambiguous)
-2. Question type (multiple_choice, short_answer, or essay)
-3. For multiple choice: 4 options with one correct answer
-4. Correct answer
-5. Explanation of the correct answer
-6. Points value (1-5 based on difficulty)
-7. Difficulty level (easy/medium/hard)
-8. Topic covered
-
-Format as a JSON array:
-[
-  {
-    "question": "Question text here?",
-    "type": "multiple_choice",
-    "options": ["A) Option 1", "B) Option 2", "C) Option 3", "D) Option 4"],
-    "correct_answer": "A) Option 1",
-    "explanation": "Explanation of why this is correct",
-    "points": 2,
-    "difficulty": "medium",
-    "topic": "specific topic name"
-  }
-]
+  // Retries ask for whatever part of the distribution is still missing
+  const buildPrompt = (missing, items) => {
+    const remaining = level => Math.max(0, { easy: easyCount, medium: mediumCount, hard: hardCount }[level] -
+      items.filter(item => item.difficulty === level).length)
 
-Ensure questions are:
-- Age-appropriate for the grade level
-- Clear and unambiguous
-- Properly balanced across topics
-- Pedagogically sound
-- Test different cognitive levels according to difficulty`
+    return `Create ${missing} assessment questions.
+Subject: ${subject}
+Topics: ${topics.join(', ')}
+Difficulty mix: ${remaining('easy')} easy, ${remaining('medium')} medium, ${remaining('hard')} hard${existingQuestionsNote(items)}`
+  }
 
   try {
-    const completion = await openai.chat.completions.create({
-      model: process.env.KIMI_MODEL || 'gpt-3.5-turbo',
-      messages: [
-        {
-          role: 'system',
-          content: 'You are an expert assessment designer and educator. Create high-quality, balanced assessment questions that accurately measure student understanding across different cognitive levels.'
-        },
-        {
-          role: 'user',
-          content: prompt
-        }
-      ],
-      temperature: 0.7,
-      max_tokens: 3000
+    return await generateQuestionItems('generateAssessmentQuestions', {
+      count: totalQuestions,
+      system: SYSTEM_PROMPTS.generateAssessmentQuestions,
+      buildPrompt,
+      responseFormat: ASSESSMENT_QUESTIONS_FORMAT,
+      normalize: normalizeAssessmentQuestion,
+      maxTokens: 3000
     })
-
-    const content = completion.choices[0].message.content.trim()
-    // Extract JSON from the response
-    const jsonMatch = content.match(/\[[\s\S]*\]/)
-    if (!jsonMatch) {
-      throw new Error('Could not extract valid JSON from AI assessment response')
-    }
-
-    return JSON.parse(jsonMatch[0])
   } catch (error) {
     console.error('AI Assessment Generation Error:', error)
     throw new Error('Failed to generate assessment questions with AI')
@@ -268,46 +667,19 @@ Ensure questions are:
 
 // Helper function to generate coordinator insights
 async function generateCoordinatorInsights(metricsData, analysisType) {
-  const prompt = `Analyze the following coordinator data and provide insights and recommendations:
-
-Analysis Type: ${analysisType}
-Metrics Data:
-- Total Students: ${metricsData.totalStudents}
-- Total Assignments: ${metricsData.totalAssignments}
-- Average Score: ${metricsData.averageScore.toFixed(2)}%
-- Grade Distribution: A: ${metricsData.gradeDistribution.A}, B: ${metricsData.gradeDistribution.B}, C: ${metricsData.gradeDistribution.C}, D: ${metricsData.gradeDistribution.D}, F: ${metricsData.gradeDistribution.F}
-- Subject Performance: ${JSON.stringify(metricsData.subjectBreakdown, null, 2)}
-
-Please provide:
-1. Key insights about student performance patterns
-2. Areas of concern that need attention
-3. Positive trends to celebrate
-4. Specific action recommendations for the coordinator
-5. Suggestions for teacher collaboration
-6. Ideas for student support interventions
-
-Focus on actionable, supportive guidance rather than just identifying problems. Use encouraging language that emphasizes growth opportunities.
-
-Format the response as JSON:
-{
-  "insights": ["insight1", "insight2", "insight3"],
-  "recommendations": ["recommendation1", "recommendation2", "recommendation3"],
-  "concerns": ["concern1", "concern2"],
-  "positives": ["positive1", "positive2"]
-}`
+  const grades = metricsData.gradeDistribution
+  const prompt = `Analysis type: ${analysisType}
+Students: ${metricsData.totalStudents}, completed assignments: ${metricsData.totalAssignments}, average score: ${metricsData.averageScore.toFixed(1)}%
+Grades: A ${grades.A}, B ${grades.B}, C ${grades.C}, D ${grades.D}, F ${grades.F}
+Subjects:
+${formatSubjectSummaries(metricsData.subjectBreakdown)}`
 
   try {
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion('generateCoordinatorInsights', {
       model: process.env.KIMI_MODEL || 'gpt-3.5-turbo',
       messages: [
-        {
-          role: 'system',
-          content: 'You are an experienced educational coordinator and data analyst. Provide actionable, supportive insights that help coordinators make informed decisions about student support and academic improvements. Focus on positive, growth-oriented recommendations.'
-        },
-        {
-          role: 'user',
-          content: prompt
-        }
+        { role: 'system', content: SYSTEM_PROMPTS.generateCoordinatorInsights },
+        { role: 'user', content: prompt }
       ],
       temperature: 0.7,
       max_tokens: 1500
@@ -376,32 +748,15 @@ function generateTeacherInsights(assignmentPerformance, gradeDistribution) {
 
 // Helper function to generate AI doubt response
 async function generateDoubtResponse(question, context, subject) {
-  const prompt = `A student has asked the following question about ${subject}:
-
-Question: "${question}"
-${context ? `Context: "${context}"` : ''}
-
-Please provide a helpful, educational response that:
-1. Directly answers the student's question
-2. Explains the concept clearly with examples if needed
-3. Is appropriate for a student learning ${subject}
-4. Is encouraging and supportive
-5. Suggests follow-up learning if relevant
-
-Keep the response concise but comprehensive.`
+  const prompt = `Subject: ${subject}
+Question: "${question}"${context ? `\nContext: "${context}"` : ''}`
 
   try {
-    const completion = await openai.chat.completions.create({
+    const completion = await createChatCompletion('generateDoubtResponse', {
       model: process.env.KIMI_MODEL || 'gpt-3.5-turbo',
       messages: [
-        {
-          role: 'system',
-          content: 'You are a helpful, patient, and knowledgeable teacher assistant. Provide clear, accurate, and encouraging responses to student questions.'
-        },
-        {
-          role: 'user',
-          content: prompt
-        }
+        { role: 'system', content: SYSTEM_PROMPTS.generateDoubtResponse },
+        { role: 'user', content: prompt }
       ],
       temperature: 0.7,
       max_tokens: 500
@@ -414,6 +769,536 @@ Keep the response concise but comprehensive.`
   }
 }
 
+// ================================================================================================
+// GENERATION WORKFLOWS
+// ================================================================================================
+// Shared by the synchronous endpoints and background jobs. Each workflow returns
+// { status, body } - the response the synchronous endpoint sends, or the result
+// stored on the job. reportProgress(percent, stage) is a no-op for synchronous calls.
+
+const noProgress = async () => {}
+
+// Generate an AI quiz and store it as a published practice assignment
+async function runQuizGeneration(supabase, user, body, reportProgress = noProgress) {
+  const { topic, difficulty, questionCount, subjectId, title } = body
+
+  // Get subject info for context
+  await reportProgress(5, 'loading_subject')
+  const { data: subject, error: subjectError } = await supabase
+    .from('subjects')
+    .select('name')
+    .eq('id', subjectId)
+    .single()
+
+  if (subjectError) {
+    return {
+      status: 404,
+      body: { error: "Subject not found", details: subjectError.message }
+    }
+  }
+
+  // Generate AI quiz questions
+  await reportProgress(15, 'generating_questions')
+  const questions = await generateQuizQuestions(topic, difficulty, questionCount, subject.name)
+
+  // Create assignment
+  await reportProgress(80, 'saving_assignment')
+  const { data: assignment, error: assignmentError } = await supabase
+    .from('assignments')
+    .insert({
+      title,
+      description: `AI-generated quiz on ${topic}`,
+      subject_id: subjectId,
+      teacher_id: user.id, // Student creates their own practice quiz
+      assignment_type: 'quiz',
+      difficulty_level: difficulty,
+      // Can be short of questionCount when the AI came up short on every attempt
+      total_questions: questions.length,
+      time_limit_minutes: questions.length * 2, // 2 minutes per question
+      max_attempts: 3,
+      is_published: true
+    })
+    .select()
+    .single()
+
+  if (assignmentError) {
+    return {
+      status: 500,
+      body: { error: "Failed to create assignment", details: assignmentError.message }
+    }
+  }
+
+  // The quiz is published immediately, so assignment lists are now stale
+  invalidateTags('assignments')
+
+  // Insert questions
+  await reportProgress(90, 'saving_questions')
+  const questionsToInsert = questions.map((q, index) => ({
+    assignment_id: assignment.id,
+    question_text: q.question,
+    question_type: 'multiple_choice',
+    options: q.options,
+    correct_answer: q.correct_answer,
+    explanation: q.explanation,
+    points: 1.0,
+    order_index: index + 1
+  }))
+
+  const { data: insertedQuestions, error: questionsError } = await supabase
+    .from('assignment_questions')
+    .insert(questionsToInsert)
+    .select()
+
+  if (questionsError) {
+    return {
+      status: 500,
+      body: { error: "Failed to create questions", details: questionsError.message }
+    }
+  }
+
+  return {
+    status: 200,
+    body: {
+      message: "Quiz generated successfully",
+      assignment,
+      questions: insertedQuestions,
+      count: insertedQuestions.length
+    }
+  }
+}
+
+// Create a lesson plan, optionally filled in with AI-generated content
+async function runLessonPlanCreation(supabase, user, body, reportProgress = noProgress) {
+  const {
+    title, description, subjectId, gradeLevel, duration = 40,
+    topic, learningObjectives, useAI = false, aiPrompt
+  } = body
+
+  let aiGeneratedContent = null
+
+  // Generate AI lesson plan if requested
+  if (useAI && (topic || aiPrompt)) {
+    try {
+      await reportProgress(5, 'loading_subject')
+      const { data: subject, error: subjectError } = await supabase
+        .from('subjects')
+        .select('name')
+        .eq('id', subjectId)
+        .single()
+
+      if (!subjectError && subject) {
+        await reportProgress(15, 'generating_lesson_plan')
+        aiGeneratedContent = await generateLessonPlan(
+          topic || title,
+          subject.name,
+          gradeLevel,
+          duration,
+          aiPrompt
+        )
+      }
+    } catch (aiError) {
+      console.error('AI lesson plan generation failed:', aiError)
+    }
+  }
+
+  // Create lesson plan
+  await reportProgress(85, 'saving_lesson_plan')
+  const lessonPlanData = {
+    teacher_id: user.id,
+    subject_id: subjectId,
+    title,
+    description,
+    grade_level: gradeLevel,
+    duration_minutes: duration,
+    learning_objectives: learningObjectives || [],
+    ai_generated: !!aiGeneratedContent,
+    ai_prompt: aiPrompt,
+    status: 'draft'
+  }
+
+  // Add AI-generated content if available
+  if (aiGeneratedContent) {
+    lessonPlanData.key_concepts = aiGeneratedContent.keyConcepts || []
+    lessonPlanData.discussion_points = aiGeneratedContent.discussionPoints || []
+    lessonPlanData.activities = aiGeneratedContent.activities || []
+    lessonPlanData.resources = aiGeneratedContent.resources || []
+    lessonPlanData.assessment_notes = aiGeneratedContent.assessmentNotes
+    lessonPlanData.homework_suggestions = aiGeneratedContent.homeworkSuggestions
+  }
+
+  const { data: lessonPlan, error } = await supabase
+    .from('lesson_plans')
+    .insert(lessonPlanData)
+    .select()
+    .single()
+
+  if (error) {
+    return {
+      status: 500,
+      body: { error: "Failed to create lesson plan", details: error.message }
+    }
+  }
+
+  invalidateTags(`lesson-plans:${user.id}`)
+
+  return {
+    status: 200,
+    body: {
+      message: "Lesson plan created successfully",
+      lessonPlan,
+      aiGenerated: !!aiGeneratedContent
+    }
+  }
+}
+
+// Generate assessment questions and store them as a draft PDF assessment
+async function runPdfAssessmentGeneration(supabase, user, body, reportProgress = noProgress) {
+  const {
+    title, description, subjectId, topics = [],
+    difficultyDistribution = { easy: 30, medium: 50, hard: 20 },
+    totalQuestions, totalMarks, duration, instructions,
+    useAI = true, schoolLogoUrl
+  } = body
+
+  let questions = []
+
+  // Generate questions using AI if requested
+  if (useAI) {
+    try {
+      await reportProgress(5, 'loading_subject')
+      const { data: subject, error: subjectError } = await supabase
+        .from('subjects')
+        .select('name')
+        .eq('id', subjectId)
+        .single()
+
+      if (!subjectError && subject) {
+        await reportProgress(15, 'generating_questions')
+        questions = await generateAssessmentQuestions(
+          topics,
+          subject.name,
+          totalQuestions,
+          difficultyDistribution
+        )
+      }
+    } catch (aiError) {
+      console.error('AI assessment generation failed:', aiError)
+      return {
+        status: 500,
+        body: { error: "Failed to generate assessment questions", details: aiError.message }
+      }
+    }
+  }
+
+  // Create PDF assessment record
+  await reportProgress(85, 'saving_assessment')
+  const assessmentData = {
+    teacher_id: user.id,
+    subject_id: subjectId,
+    title,
+    description,
+    topics,
+    difficulty_distribution: difficultyDistribution,
+    total_questions: totalQuestions,
+    total_marks: totalMarks || totalQuestions,
+    duration_minutes: duration,
+    instructions,
+    questions,
+    school_logo_url: schoolLogoUrl,
+    status: 'draft'
+  }
+
+  const { data: assessment, error } = await supabase
+    .from('pdf_assessments')
+    .insert(assessmentData)
+    .select()
+    .single()
+
+  if (error) {
+    return {
+      status: 500,
+      body: { error: "Failed to create PDF assessment", details: error.message }
+    }
+  }
+
+  return {
+    status: 200,
+    body: {
+      message: "PDF assessment created successfully",
+      assessment,
+      questionsGenerated: questions.length
+    }
+  }
+}
+
+// Batch gradebook updates (gradebook_batch_schema.sql) accept this many changes per request
+const GRADEBOOK_BATCH_LIMIT = 500
+
+// Helper function to validate one change of a batch gradebook update
+function gradeChangeError(change) {
+  if (!change || !UUID_PATTERN.test(change.id)) {
+    return 'id must be a gradebook entry id'
+  }
+  if (!('manualScore' in change) && !('comments' in change)) {
+    return 'manualScore or comments is required'
+  }
+  const score = change.manualScore
+  if (score !== undefined && score !== null && !(typeof score === 'number' && score >= 0 && score <= 999.99)) {
+    return 'manualScore must be a number from 0 to 999.99 or null'
+  }
+  if (change.comments !== undefined && change.comments !== null && typeof change.comments !== 'string') {
+    return 'comments must be a string or null'
+  }
+  return null
+}
+
+// Import one batch of CSV rows with a single set-based SQL call (bulk_import_schema.sql).
+// Roster rows whose email has no account yet come back as `missing`; once their
+// accounts exist they are sent through the same call a second time.
+async function runBulkImport(supabase, kind, rows, dryRun) {
+  const { valid, errors } = validateImportRows(kind, rows)
+  const rpc = IMPORT_KINDS[kind].rpc
+  const summary = { kind, received: rows.length, imported: 0, created: 0, countsUpdated: 0, dryRun, errors }
+
+  const importRows = async batch => {
+    const { data, error } = await supabase.rpc(rpc, { p_rows: batch, p_dry_run: dryRun })
+    if (!error) {
+      summary.imported += data.imported
+      summary.countsUpdated += data.counts_updated || 0
+      errors.push(...data.errors)
+    }
+    return { data, error }
+  }
+
+  if (valid.length > 0) {
+    const { data, error } = await importRows(valid)
+    if (error) {
+      const status = error.code === '42501' ? 403 : 500
+      return {
+        status,
+        body: {
+          error: status === 403 ? "Not allowed to import this data" : "Failed to import rows",
+          details: error.message
+        }
+      }
+    }
+
+    const missing = data.missing || []
+    if (missing.length > 0 && dryRun) {
+      summary.created = missing.length
+    } else if (missing.length > 0) {
+      const accounts = await createStudentAccounts(missing)
+      errors.push(...accounts.errors)
+      summary.created = accounts.created.length
+      if (accounts.created.length > 0) {
+        const retry = await importRows(accounts.created)
+        if (retry.error) {
+          errors.push(...accounts.created.map(({ row }) => ({ row, error: retry.error.message })))
+        }
+      }
+    }
+  }
+
+  errors.sort((a, b) => a.row - b.row)
+  return { status: 200, body: summary }
+}
+
+// Regrade every submitted attempt of an assignment after answer key changes.
+// The work is one set-based SQL call (regrade_schema.sql) so it runs in a single
+// transaction regardless of how many attempts exist.
+async function runAssignmentRegrade(supabase, user, body, reportProgress = noProgress) {
+  const { assignmentId, answerKey, dryRun = false } = body
+
+  await reportProgress(10, 'regrading')
+  const { data: regrade, error } = await supabase.rpc('regrade_assignment', {
+    p_assignment_id: assignmentId,
+    p_answer_key: answerKey || null,
+    p_dry_run: !!dryRun
+  })
+
+  if (error) {
+    // 22P02: an id that is not a UUID slipped past validation
+    const status = error.code === '42501' ? 404 : ['22023', '22P02'].includes(error.code) ? 400 : 500
+    return {
+      status,
+      body: {
+        error: status === 404 ? "Assignment not found" : status === 400 ? "Invalid regrade request" : "Failed to regrade assignment",
+        details: error.message
+      }
+    }
+  }
+
+  if (!dryRun) {
+    // Cached answer keys and question payloads are now out of date
+    invalidateAssignmentQuestions(assignmentId)
+  }
+
+  return {
+    status: 200,
+    body: {
+      message: dryRun ? "Regrade preview generated" : "Assignment regraded successfully",
+      regrade
+    }
+  }
+}
+
+// Helper function to run a generation workflow as a background job (202 Accepted)
+async function startGenerationJob(db, user, type, body, workflow) {
+  const jobSupabase = createSupabaseForJob()
+  const job = await enqueueJob(
+    db,
+    { type, userId: user.id, input: body },
+    (reportProgress) => workflow(jobSupabase, user, body, reportProgress)
+  )
+
+  const response = handleCORS(NextResponse.json({
+    message: "Job accepted",
+    job,
+    statusUrl: `/api/jobs/${job.id}`
+  }, { status: 202 }))
+  response.headers.set('Location', `/api/jobs/${job.id}`)
+  return response
+}
+
+// ================================================================================================
+// PDF RENDERING
+// ================================================================================================
+
+// Helper function to load a teacher's PDF assessment with everything the renderer prints
+async function getTeacherPdfAssessment(supabase, user, assessmentId) {
+  return await supabase
+    .from('pdf_assessments')
+    .select(`
+      id, title, instructions, duration_minutes, total_marks, questions,
+      school_logo_url, template_style, pdf_generated, answer_key_generated,
+      subjects(name)
+    `)
+    .eq('id', assessmentId)
+    .eq('teacher_id', user.id)
+    .single()
+}
+
+// Helper function to build the download URL for a rendered assessment
+function pdfDownloadUrl(assessmentId, { variants, answerKey }) {
+  return `/api/teacher/pdf-assessments/${assessmentId}/pdf?variants=${variants}&answerKey=${answerKey}`
+}
+
+// Helper function to build a filesystem-safe filename for a rendered assessment
+function pdfFilename(assessment, { variants, answerKey }) {
+  const base = (assessment.title || 'assessment').replace(/[^A-Za-z0-9_-]+/g, '_')
+  return `${base}${variants > 1 ? `_${variants}_sets` : ''}${answerKey ? '_with_key' : ''}.pdf`
+}
+
+// Helper function to flag an assessment as printed the first time it is rendered
+async function markPdfGenerated(supabase, assessment, options) {
+  const updates = {}
+  if (!assessment.pdf_generated) {
+    updates.pdf_generated = true
+    updates.pdf_file_path = pdfDownloadUrl(assessment.id, options)
+  }
+  if (options.answerKey && !assessment.answer_key_generated) {
+    updates.answer_key_generated = true
+    updates.answer_key_path = pdfDownloadUrl(assessment.id, options)
+  }
+  if (Object.keys(updates).length === 0) {
+    return
+  }
+
+  const { error } = await supabase
+    .from('pdf_assessments')
+    .update({ ...updates, updated_at: new Date().toISOString() })
+    .eq('id', assessment.id)
+  if (error) {
+    console.error('Failed to mark PDF as generated:', error)
+  }
+}
+
+// Render an assessment (all variant sets, optionally with answer keys) into a
+// cached artifact without streaming it; used to pre-render large print batches
+async function runPdfRender(supabase, user, body, reportProgress = noProgress) {
+  const options = normalizeRenderOptions(body)
+
+  await reportProgress(5, 'loading_assessment')
+  const { data: assessment, error } = await getTeacherPdfAssessment(supabase, user, body.assessmentId)
+  if (error || !assessment) {
+    return {
+      status: 404,
+      body: { error: "PDF assessment not found", details: error?.message }
+    }
+  }
+
+  const db = await connectToMongo()
+  const key = assessmentContentHash(assessment, options)
+  let buffer = await getPdfArtifact(db, key)
+  const cached = Boolean(buffer)
+
+  let logoMissing = false
+  if (!buffer) {
+    await reportProgress(15, 'loading_logo')
+    const logo = await loadLogoImage(assessment.school_logo_url)
+    // The key covers the logo URL, not its bytes: a paper rendered during a logo
+    // outage must not be stored as the artifact for that key
+    logoMissing = Boolean(assessment.school_logo_url) && !logo
+
+    await reportProgress(25, 'rendering')
+    buffer = Buffer.concat([...renderAssessmentPdf(assessment, { ...options, logo })])
+
+    if (!logoMissing) {
+      await reportProgress(90, 'saving_artifact')
+      await savePdfArtifact(db, key, buffer, {
+        assessment_id: assessment.id,
+        teacher_id: user.id,
+        variants: options.variants,
+        answer_key: options.answerKey
+      })
+    }
+  }
+
+  await markPdfGenerated(supabase, assessment, options)
+
+  return {
+    status: 200,
+    body: {
+      message: "PDF rendered successfully",
+      artifact: {
+        key,
+        bytes: buffer.length,
+        variants: options.variants,
+        answerKey: options.answerKey,
+        cached,
+        logoMissing
+      },
+      downloadUrl: pdfDownloadUrl(assessment.id, options)
+    }
+  }
+}
+
+// ================================================================================================
+// SEARCH
+// ================================================================================================
+
+const SEARCH_TYPES = [
+  'lesson_plans', 'doubts', 'pdf_assessments', 'teacher_messages', 'coordinator_communications'
+]
+
+// Helper function to encode the keyset cursor (last row's rank and id)
+function encodeSearchCursor(row) {
+  return Buffer.from(JSON.stringify({ rank: row.rank, id: row.id })).toString('base64url')
+}
+
+// Helper function to decode a search cursor; returns null when malformed
+function decodeSearchCursor(cursor) {
+  try {
+    const { rank, id } = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+    if (rank === undefined || !id) {
+      return null
+    }
+    return { rank, id }
+  } catch {
+    return null
+  }
+}
+
 // OPTIONS handler for CORS
 export async function OPTIONS() {
   return handleCORS(new NextResponse(null, { status: 200 }))
@@ -589,6 +1474,7 @@ async function handleRoute(request, { params }) {
         timestamp: new Date()
       }
 
+      await ensureStatusCheckIndexes(db)
       await db.collection('status_checks').insertOne(statusObj)
       return handleCORS(NextResponse.json(statusObj))
     }
@@ -606,35 +1492,77 @@ async function handleRoute(request, { params }) {
       return handleCORS(NextResponse.json(cleanedStatusChecks))
     }
 
-    // ================================================================================================
-    // STUDENT PHASE APIs
-    // ================================================================================================
+    // GET /api/status/transport - Outbound connection pool and reuse counters
+    if (route === '/status/transport' && method === 'GET') {
+      if (!hasMetricsAccess(request)) {
+        return handleCORS(NextResponse.json({ error: "Metrics token required" }, { status: 401 }))
+      }
+      return handleCORS(NextResponse.json({
+        ...getTransportStats(),
+        deadlines: {
+          requestMs: REQUEST_DEADLINE_MS,
+          longRequestMs: LONG_REQUEST_DEADLINE_MS,
+          dashboardSectionMs: DASHBOARD_SECTION_BUDGET_MS
+        }
+      }))
+    }
 
-    // GET /api/subjects - List subjects for student's school
-    if (route === '/subjects' && method === 'GET') {
+    // GET /api/metrics - Prometheus metrics for this server process
+    if (route === '/metrics' && method === 'GET') {
+      if (!hasMetricsAccess(request)) {
+        return handleCORS(NextResponse.json({ error: "Metrics token required" }, { status: 401 }))
+      }
+
+      const transport = getTransportStats()
+      const body = renderMetrics({
+        proxilearn_upstream_connections_opened: { help: 'Outbound connections opened by the shared pool', value: transport.connectionsOpened },
+        proxilearn_upstream_reused_requests: { help: 'Outbound requests sent on an already-open connection', value: transport.reusedRequests }
+      })
+      return handleCORS(new NextResponse(body, {
+        headers: { 'Content-Type': 'text/plain; version=0.0.4; charset=utf-8', 'Cache-Control': 'no-store' }
+      }))
+    }
+
+    // GET /api/status/process - Memory, heap, file descriptor and handle counts (soak tests)
+    if (route === '/status/process' && method === 'GET') {
+      if (!hasMetricsAccess(request)) {
+        return handleCORS(NextResponse.json({ error: "Metrics token required" }, { status: 401 }))
+      }
+      return handleCORS(NextResponse.json(await getProcessStats()))
+    }
+
+    // POST /api/status/heap-snapshot - Write a V8 heap snapshot (only with ENABLE_HEAP_SNAPSHOTS=true and METRICS_TOKEN)
+    if (route === '/status/heap-snapshot' && method === 'POST') {
+      if (!heapSnapshotsEnabled) {
+        return handleCORS(NextResponse.json({ error: "Heap snapshots are disabled" }, { status: 404 }))
+      }
+      if (!hasMetricsAccess(request)) {
+        return handleCORS(NextResponse.json({ error: "Metrics token required" }, { status: 401 }))
+      }
+      const limitReason = heapSnapshotLimitReason()
+      if (limitReason) {
+        return handleCORS(NextResponse.json({ error: limitReason }, { status: 429 }))
+      }
+      const body = await request.json().catch(() => ({}))
+      const file = writeHeapSnapshot(body.label)
+      return handleCORS(NextResponse.json({ file, stats: await getProcessStats() }))
+    }
+
+    // GET /api/jobs/{id} - Poll a background generation job for progress and result
+    if (route.match(/^\/jobs\/[^\/]+$/) && method === 'GET') {
       try {
         const user = await getAuthenticatedUser(supabase)
-        
-        const { data: subjects, error } = await supabase
-          .from('subjects')
-          .select(`
-            id, name, description, code, grade_level,
-            schools!inner(id, name)
-          `)
-          .eq('is_active', true)
-          .order('name')
+        const jobId = route.split('/')[2]
 
-        if (error) {
+        const job = await getJob(db, jobId, user.id)
+
+        if (!job) {
           return handleCORS(NextResponse.json({
-            error: "Failed to fetch subjects",
-            details: error.message
-          }, { status: 500 }))
+            error: "Job not found"
+          }, { status: 404 }))
         }
 
-        return handleCORS(NextResponse.json({
-          subjects: subjects || [],
-          count: subjects?.length || 0
-        }))
+        return handleCORS(NextResponse.json({ job }))
 
       } catch (error) {
         return handleCORS(NextResponse.json({
@@ -643,41 +1571,69 @@ async function handleRoute(request, { params }) {
       }
     }
 
-    // GET /api/assignments - List published assignments
-    if (route === '/assignments' && method === 'GET') {
+    // GET /api/search?q=...&types=lesson_plans,doubts&limit=20&cursor=... - Ranked full-text search
+    if (route === '/search' && method === 'GET') {
       try {
         const user = await getAuthenticatedUser(supabase)
         const url = new URL(request.url)
-        const subjectId = url.searchParams.get('subject_id')
-        
-        let query = supabase
-          .from('assignments')
-          .select(`
-            id, title, description, assignment_type, difficulty_level,
-            total_questions, time_limit_minutes, max_attempts, passing_score,
-            due_date, created_at,
-            subjects!inner(id, name, code),
-            user_profiles!assignments_teacher_id_fkey!inner(id, full_name)
-          `)
-          .eq('is_published', true)
-          .order('created_at', { ascending: false })
+        const q = (url.searchParams.get('q') || '').trim()
+        const typesParam = url.searchParams.get('types')
+        const limit = Math.min(100, Math.max(1, parseInt(url.searchParams.get('limit')) || 20))
+        const cursorParam = url.searchParams.get('cursor')
 
-        if (subjectId) {
-          query = query.eq('subject_id', subjectId)
+        if (q.length < 2) {
+          return handleCORS(NextResponse.json({
+            error: "Search query must be at least 2 characters"
+          }, { status: 400 }))
         }
 
-        const { data: assignments, error } = await query
+        const types = typesParam ? typesParam.split(',').map(type => type.trim()).filter(Boolean) : null
+        const unknownTypes = (types || []).filter(type => !SEARCH_TYPES.includes(type))
+        if (unknownTypes.length > 0) {
+          return handleCORS(NextResponse.json({
+            error: `Unknown search types: ${unknownTypes.join(', ')}`,
+            allowedTypes: SEARCH_TYPES
+          }, { status: 400 }))
+        }
+
+        const cursor = cursorParam ? decodeSearchCursor(cursorParam) : null
+        if (cursorParam && !cursor) {
+          return handleCORS(NextResponse.json({
+            error: "Invalid cursor"
+          }, { status: 400 }))
+        }
+
+        // Fetch one extra row to know whether another page exists
+        const { data: rows, error } = await supabase.rpc('search_content', {
+          p_query: q,
+          p_types: types,
+          p_limit: limit + 1,
+          p_cursor_rank: cursor?.rank ?? null,
+          p_cursor_id: cursor?.id ?? null
+        })
 
         if (error) {
           return handleCORS(NextResponse.json({
-            error: "Failed to fetch assignments",
+            error: "Search failed",
             details: error.message
           }, { status: 500 }))
         }
 
+        const results = (rows || []).slice(0, limit)
+        const hasMore = (rows || []).length > limit
+
         return handleCORS(NextResponse.json({
-          assignments: assignments || [],
-          count: assignments?.length || 0
+          query: q,
+          results: results.map(row => ({
+            type: row.result_type,
+            id: row.id,
+            title: row.title,
+            snippet: row.snippet,
+            rank: row.rank,
+            createdAt: row.created_at
+          })),
+          count: results.length,
+          nextCursor: hasMore ? encodeSearchCursor(results[results.length - 1]) : null
         }))
 
       } catch (error) {
@@ -687,92 +1643,156 @@ async function handleRoute(request, { params }) {
       }
     }
 
-    // POST /api/assignments/generate-quiz - AI-powered quiz generation
-    if (route === '/assignments/generate-quiz' && method === 'POST') {
+    // POST /api/import/{students|enrollments|grades} - Upsert one batch of CSV rows (bulk_import.py)
+    if (route.match(/^\/import\/[^\/]+$/) && method === 'POST') {
       try {
         const user = await getAuthenticatedUser(supabase)
+        const kind = route.split('/')[2]
         const body = await request.json()
-        
-        const { topic, difficulty, questionCount, subjectId, title } = body
-        
-        if (!topic || !difficulty || !questionCount || !subjectId || !title) {
+
+        if (!IMPORT_KINDS[kind]) {
           return handleCORS(NextResponse.json({
-            error: "Missing required fields: topic, difficulty, questionCount, subjectId, title"
-          }, { status: 400 }))
+            error: "Unknown import type",
+            details: `Expected one of: ${Object.keys(IMPORT_KINDS).join(', ')}`
+          }, { status: 404 }))
         }
 
-        // Get subject info for context
-        const { data: subject, error: subjectError } = await supabase
-          .from('subjects')
-          .select('name')
-          .eq('id', subjectId)
-          .single()
-
-        if (subjectError) {
+        if (!Array.isArray(body.rows) || body.rows.length === 0 || body.rows.length > IMPORT_BATCH_LIMIT) {
           return handleCORS(NextResponse.json({
-            error: "Subject not found",
-            details: subjectError.message
-          }, { status: 404 }))
+            error: `rows must be an array of 1 to ${IMPORT_BATCH_LIMIT} rows`
+          }, { status: 400 }))
         }
 
-        // Generate AI quiz questions
-        const questions = await generateQuizQuestions(topic, difficulty, questionCount, subject.name)
+        const limited = await enforceRateLimit(db, supabase, user, 'write')
+        if (limited) return limited
 
-        // Create assignment
-        const { data: assignment, error: assignmentError } = await supabase
-          .from('assignments')
-          .insert({
-            title,
-            description: `AI-generated quiz on ${topic}`,
-            subject_id: subjectId,
-            teacher_id: user.id, // Student creates their own practice quiz
-            assignment_type: 'quiz',
-            difficulty_level: difficulty,
-            total_questions: questionCount,
-            time_limit_minutes: questionCount * 2, // 2 minutes per question
-            max_attempts: 3,
-            is_published: true
-          })
-          .select()
-          .single()
+        const result = await runBulkImport(supabase, kind, body.rows, !!body.dryRun)
+        return handleCORS(NextResponse.json(result.body, { status: result.status }))
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
+
+    // ================================================================================================
+    // STUDENT PHASE APIs
+    // ================================================================================================
+
+    // GET /api/subjects - List subjects for student's school
+    if (route === '/subjects' && method === 'GET') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+
+        return await respondWithCache(request, `subjects:${user.id}`, {
+          tags: ['subjects'],
+          ttlMs: 5 * 60 * 1000,
+          cacheControl: CACHE_POLICIES.static
+        }, async () => {
+          const { data: subjects, error } = await supabase
+            .from('subjects')
+            .select(`
+              id, name, description, code, grade_level,
+              schools!inner(id, name)
+            `)
+            .eq('is_active', true)
+            .order('name')
+
+          if (error) {
+            return {
+              status: 500,
+              body: { error: "Failed to fetch subjects", details: error.message }
+            }
+          }
+
+          return {
+            status: 200,
+            body: { subjects: subjects || [], count: subjects?.length || 0 }
+          }
+        })
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
+
+    // GET /api/assignments - List published assignments
+    if (route === '/assignments' && method === 'GET') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+        const url = new URL(request.url)
+        const subjectId = url.searchParams.get('subject_id')
+
+        return await respondWithCache(request, `assignments:${user.id}:${subjectId || 'all'}`, {
+          tags: ['assignments'],
+          cacheControl: CACHE_POLICIES.revalidate
+        }, async () => {
+          let query = supabase
+            .from('assignments')
+            .select(`
+              id, title, description, assignment_type, difficulty_level,
+              total_questions, time_limit_minutes, max_attempts, passing_score,
+              due_date, created_at,
+              subjects!inner(id, name, code),
+              user_profiles!assignments_teacher_id_fkey!inner(id, full_name)
+            `)
+            .eq('is_published', true)
+            .order('created_at', { ascending: false })
+
+          if (subjectId) {
+            query = query.eq('subject_id', subjectId)
+          }
+
+          const { data: assignments, error } = await query
+
+          if (error) {
+            return {
+              status: 500,
+              body: { error: "Failed to fetch assignments", details: error.message }
+            }
+          }
+
+          return {
+            status: 200,
+            body: { assignments: assignments || [], count: assignments?.length || 0 }
+          }
+        })
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
 
-        if (assignmentError) {
+    // POST /api/assignments/generate-quiz - AI-powered quiz generation
+    if (route === '/assignments/generate-quiz' && method === 'POST') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+        const body = await request.json()
+        
+        const { topic, difficulty, questionCount, subjectId, title } = body
+        
+        if (!topic || !difficulty || !questionCount || !subjectId || !title) {
           return handleCORS(NextResponse.json({
-            error: "Failed to create assignment",
-            details: assignmentError.message
-          }, { status: 500 }))
+            error: "Missing required fields: topic, difficulty, questionCount, subjectId, title"
+          }, { status: 400 }))
         }
 
-        // Insert questions
-        const questionsToInsert = questions.map((q, index) => ({
-          assignment_id: assignment.id,
-          question_text: q.question,
-          question_type: 'multiple_choice',
-          options: q.options,
-          correct_answer: q.correct_answer,
-          explanation: q.explanation,
-          points: 1.0,
-          order_index: index + 1
-        }))
-
-        const { data: insertedQuestions, error: questionsError } = await supabase
-          .from('assignment_questions')
-          .insert(questionsToInsert)
-          .select()
+        const limited = await enforceRateLimit(db, supabase, user, 'ai', estimateQuizCost(questionCount))
+        if (limited) {
+          return limited
+        }
 
-        if (questionsError) {
-          return handleCORS(NextResponse.json({
-            error: "Failed to create questions",
-            details: questionsError.message
-          }, { status: 500 }))
+        if (wantsAsync(request)) {
+          return await startGenerationJob(db, user, 'generate_quiz', body, runQuizGeneration)
         }
 
-        return handleCORS(NextResponse.json({
-          message: "Quiz generated successfully",
-          assignment,
-          questions: insertedQuestions,
-          count: insertedQuestions.length
-        }))
+        const result = await runQuizGeneration(supabase, user, body)
+        return handleCORS(NextResponse.json(result.body, { status: result.status }))
 
       } catch (error) {
         return handleCORS(NextResponse.json({
@@ -786,40 +1806,17 @@ async function handleRoute(request, { params }) {
       try {
         const user = await getAuthenticatedUser(supabase)
         const assignmentId = route.split('/')[2]
-        
-        // Verify assignment access
-        const { data: assignment, error: assignmentError } = await supabase
-          .from('assignments')
-          .select('id, title, is_published')
-          .eq('id', assignmentId)
-          .eq('is_published', true)
-          .single()
+        const sharingScope = await getSharingScope(supabase, user)
 
-        if (assignmentError) {
-          return handleCORS(NextResponse.json({
-            error: "Assignment not found",
-            details: assignmentError.message
-          }, { status: 404 }))
-        }
-
-        // Get questions (without correct answers for students)
-        const { data: questions, error: questionsError } = await supabase
-          .from('assignment_questions')
-          .select('id, question_text, question_type, options, points, order_index')
-          .eq('assignment_id', assignmentId)
-          .order('order_index')
-
-        if (questionsError) {
-          return handleCORS(NextResponse.json({
-            error: "Failed to fetch questions",
-            details: questionsError.message
-          }, { status: 500 }))
+        const result = await loadAssignmentPayload(supabase, assignmentId, sharingScope)
+        if (result.status !== 200) {
+          return handleCORS(NextResponse.json(result.body, { status: result.status }))
         }
 
-        return handleCORS(NextResponse.json({
-          assignment,
-          questions: questions || [],
-          count: questions?.length || 0
+        return handleCORS(conditionalJsonResponse(request, result.body, {
+          etag: result.etag,
+          cacheControl: CACHE_POLICIES.published,
+          cacheStatus: result.cacheStatus
         }))
 
       } catch (error) {
@@ -835,66 +1832,89 @@ async function handleRoute(request, { params }) {
         const user = await getAuthenticatedUser(supabase)
         const assignmentId = route.split('/')[2]
         
-        // Check if assignment exists and is published
-        const { data: assignment, error: assignmentError } = await supabase
-          .from('assignments')
-          .select('id, title, max_attempts')
-          .eq('id', assignmentId)
-          .eq('is_published', true)
-          .single()
+        // Availability check, next attempt number and insert run in one transaction
+        // (atomic_rpc_schema.sql) so concurrent starts cannot reuse an attempt number
+        const { data: started, error: startError } = await supabase.rpc('start_assignment_attempt', {
+          p_assignment_id: assignmentId
+        })
 
-        if (assignmentError) {
+        if (startError) {
+          if (startError.code === 'P0002') {
+            return handleCORS(NextResponse.json({
+              error: "Assignment not found"
+            }, { status: 404 }))
+          }
+          if (startError.code === 'AT001') {
+            return handleCORS(NextResponse.json({
+              error: "Maximum attempts exceeded"
+            }, { status: 400 }))
+          }
           return handleCORS(NextResponse.json({
-            error: "Assignment not found"
-          }, { status: 404 }))
+            error: "Failed to start assignment attempt",
+            details: startError.message
+          }, { status: 500 }))
         }
 
-        // Check existing attempts
-        const { data: existingAttempts, error: attemptsError } = await supabase
-          .from('assignment_attempts')
-          .select('attempt_number')
-          .eq('assignment_id', assignmentId)
-          .eq('student_id', user.id)
-          .order('attempt_number', { ascending: false })
+        return handleCORS(NextResponse.json({
+          message: "Assignment attempt started",
+          attempt: started.attempt,
+          attemptNumber: started.attempt_number
+        }))
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
+
+    // POST /api/assignments/{id}/answers - Autosave a batch of sequence-numbered answer changes
+    if (route.match(/^\/assignments\/[^\/]+\/answers$/) && method === 'POST') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+        const assignmentId = route.split('/')[2]
+        const body = await request.json()
 
-        if (attemptsError) {
+        const { attemptNumber, deltas } = body
+
+        if (!Number.isInteger(attemptNumber) || attemptNumber < 1) {
           return handleCORS(NextResponse.json({
-            error: "Failed to check existing attempts"
-          }, { status: 500 }))
+            error: "Missing required field: attemptNumber"
+          }, { status: 400 }))
         }
 
-        const nextAttemptNumber = (existingAttempts?.[0]?.attempt_number || 0) + 1
-
-        if (nextAttemptNumber > assignment.max_attempts) {
+        const deltasError = answerDeltasError(deltas)
+        if (deltasError) {
           return handleCORS(NextResponse.json({
-            error: "Maximum attempts exceeded"
+            error: deltasError
           }, { status: 400 }))
         }
 
-        // Create new attempt
-        const { data: attempt, error: createAttemptError } = await supabase
-          .from('assignment_attempts')
-          .insert({
-            assignment_id: assignmentId,
-            student_id: user.id,
-            attempt_number: nextAttemptNumber,
-            status: 'in_progress'
-          })
-          .select()
-          .single()
+        const result = await saveAnswerDeltas(db, supabase, user, assignmentId, attemptNumber, deltas)
+        return handleCORS(NextResponse.json(result.body, { status: result.status }))
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
+
+    // GET /api/assignments/{id}/answers?attemptNumber=n - Autosaved answers of an attempt
+    if (route.match(/^\/assignments\/[^\/]+\/answers$/) && method === 'GET') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+        const assignmentId = route.split('/')[2]
+        const attemptNumber = parseInt(new URL(request.url).searchParams.get('attemptNumber'))
 
-        if (createAttemptError) {
+        if (!attemptNumber) {
           return handleCORS(NextResponse.json({
-            error: "Failed to start assignment attempt",
-            details: createAttemptError.message
-          }, { status: 500 }))
+            error: "Missing required parameter: attemptNumber"
+          }, { status: 400 }))
         }
 
-        return handleCORS(NextResponse.json({
-          message: "Assignment attempt started",
-          attempt,
-          attemptNumber: nextAttemptNumber
-        }))
+        const draft = await loadAnswerDraft(db, user.id, assignmentId, attemptNumber)
+        return handleCORS(NextResponse.json(draft || { answers: {}, ackSeq: 0 }))
 
       } catch (error) {
         return handleCORS(NextResponse.json({
@@ -910,7 +1930,11 @@ async function handleRoute(request, { params }) {
         const assignmentId = route.split('/')[2]
         const body = await request.json()
         
-        const { answers, attemptNumber, timeSpent } = body
+        const { attemptNumber, timeSpent } = body
+
+        // Answers sent with the submit win over autosaved ones, which fill any gaps
+        const draft = attemptNumber ? await loadAnswerDraft(db, user.id, assignmentId, attemptNumber) : null
+        const answers = draft || body.answers ? { ...draft?.answers, ...body.answers } : null
         
         if (!answers || !attemptNumber) {
           return handleCORS(NextResponse.json({
@@ -918,22 +1942,20 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
-        // Get assignment questions with correct answers
-        const { data: questions, error: questionsError } = await supabase
-          .from('assignment_questions')
-          .select('id, correct_answer, points, explanation')
-          .eq('assignment_id', assignmentId)
+        // Get assignment questions with correct answers (shared, warm after publish)
+        const sharingScope = await getSharingScope(supabase, user)
+        const answerKey = await loadAnswerKey(supabase, assignmentId, sharingScope)
 
-        if (questionsError) {
-          return handleCORS(NextResponse.json({
-            error: "Failed to fetch questions for grading"
-          }, { status: 500 }))
+        if (answerKey.status !== 200) {
+          return handleCORS(NextResponse.json(answerKey.body, { status: answerKey.status }))
         }
+        const questions = answerKey.body
 
         // Grade answers and create responses
         let totalScore = 0
         let totalPossiblePoints = 0
         const responses = []
+        const packedAnswers = {}
 
         for (const question of questions) {
           totalPossiblePoints += question.points
@@ -951,18 +1973,21 @@ async function handleRoute(request, { params }) {
             points_earned: pointsEarned,
             attempt_number: attemptNumber
           })
+          packedAnswers[question.id] = [studentAnswer ?? null, isCorrect, pointsEarned]
         }
 
-        // Insert student responses
-        const { error: responsesError } = await supabase
-          .from('student_responses')
-          .insert(responses)
+        // Insert student responses (compact mode stores them with the attempt below)
+        if (!COMPACT_ANSWERS) {
+          const { error: responsesError } = await supabase
+            .from('student_responses')
+            .insert(responses)
 
-        if (responsesError) {
-          return handleCORS(NextResponse.json({
-            error: "Failed to save responses",
-            details: responsesError.message
-          }, { status: 500 }))
+          if (responsesError) {
+            return handleCORS(NextResponse.json({
+              error: "Failed to save responses",
+              details: responsesError.message
+            }, { status: 500 }))
+          }
         }
 
         // Calculate percentage
@@ -976,7 +2001,8 @@ async function handleRoute(request, { params }) {
             total_score: totalScore,
             percentage_score: percentage,
             total_time_spent_seconds: timeSpent || 0,
-            submitted_at: new Date().toISOString()
+            submitted_at: new Date().toISOString(),
+            ...(COMPACT_ANSWERS ? { answers: packedAnswers } : {})
           })
           .eq('assignment_id', assignmentId)
           .eq('student_id', user.id)
@@ -991,16 +2017,24 @@ async function handleRoute(request, { params }) {
           }, { status: 500 }))
         }
 
+        if (draft) {
+          await db.collection(ATTEMPT_DRAFTS_COLLECTION)
+            .deleteOne({ _id: attemptDraftId(user.id, assignmentId, attemptNumber) })
+        }
+
         // Get detailed results with explanations
-        const { data: detailedResults, error: resultsError } = await supabase
-          .from('student_responses')
-          .select(`
-            question_id, student_answer, is_correct, points_earned,
-            assignment_questions!inner(question_text, options, correct_answer, explanation)
-          `)
-          .eq('assignment_id', assignmentId)
-          .eq('student_id', user.id)
-          .eq('attempt_number', attemptNumber)
+        const { data: detailedResults, error: resultsError } = COMPACT_ANSWERS
+          ? await compactDetailedResults(supabase, assignmentId, sharingScope, questions, packedAnswers)
+          : await supabase
+              .from('student_responses')
+              .select(`
+                question_id, student_answer, is_correct, points_earned,
+                assignment_questions!inner(question_text, options, correct_answer, explanation)
+              `)
+              .eq('assignment_id', assignmentId)
+              .eq('student_id', user.id)
+              .eq('attempt_number', attemptNumber)
+              .gte('submitted_at', updatedAttempt.started_at || '-infinity') // Only this attempt's partitions
 
         if (resultsError) {
           return handleCORS(NextResponse.json({
@@ -1041,6 +2075,11 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
+        const limited = await enforceRateLimit(db, supabase, user, 'write')
+        if (limited) {
+          return limited
+        }
+
         // Create study group
         const { data: group, error: groupError } = await supabase
           .from('study_groups')
@@ -1103,65 +2142,28 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
-        // Find group by invite code
-        const { data: group, error: groupError } = await supabase
-          .from('study_groups')
-          .select('id, name, max_members')
-          .eq('invite_code', inviteCode.toUpperCase())
-          .eq('is_active', true)
-          .single()
-
-        if (groupError) {
-          return handleCORS(NextResponse.json({
-            error: "Invalid invite code"
-          }, { status: 404 }))
-        }
-
-        // Check if user is already a member
-        const { data: existingMember, error: existingError } = await supabase
-          .from('group_members')
-          .select('id')
-          .eq('group_id', group.id)
-          .eq('student_id', user.id)
-          .single()
-
-        if (existingMember) {
-          return handleCORS(NextResponse.json({
-            error: "You are already a member of this group"
-          }, { status: 400 }))
-        }
-
-        // Check group capacity
-        const { data: members, error: membersError } = await supabase
-          .from('group_members')
-          .select('id')
-          .eq('group_id', group.id)
-          .eq('is_active', true)
-
-        if (membersError) {
-          return handleCORS(NextResponse.json({
-            error: "Failed to check group capacity"
-          }, { status: 500 }))
-        }
-
-        if (members?.length >= group.max_members) {
-          return handleCORS(NextResponse.json({
-            error: "Group is full"
-          }, { status: 400 }))
+        const limited = await enforceRateLimit(db, supabase, user, 'write')
+        if (limited) {
+          return limited
         }
 
-        // Add user to group
-        const { data: newMember, error: joinError } = await supabase
-          .from('group_members')
-          .insert({
-            group_id: group.id,
-            student_id: user.id,
-            role: 'member'
-          })
-          .select()
-          .single()
+        // Lookup, membership and capacity checks and the insert run in one
+        // transaction under a group row lock (atomic_rpc_schema.sql)
+        const { data: joined, error: joinError } = await supabase.rpc('join_study_group', {
+          p_invite_code: inviteCode
+        })
 
         if (joinError) {
+          if (joinError.code === 'P0002') {
+            return handleCORS(NextResponse.json({
+              error: "Invalid invite code"
+            }, { status: 404 }))
+          }
+          if (joinError.code === 'SG001' || joinError.code === 'SG002') {
+            return handleCORS(NextResponse.json({
+              error: joinError.message
+            }, { status: 400 }))
+          }
           return handleCORS(NextResponse.json({
             error: "Failed to join group",
             details: joinError.message
@@ -1170,8 +2172,8 @@ async function handleRoute(request, { params }) {
 
         return handleCORS(NextResponse.json({
           message: "Successfully joined study group",
-          group,
-          member: newMember
+          group: joined.group,
+          member: joined.member
         }))
 
       } catch (error) {
@@ -1314,6 +2316,7 @@ async function handleRoute(request, { params }) {
             user_profiles!group_chat_messages_sender_id_fkey!inner(id, full_name)
           `)
           .eq('group_id', groupId)
+          .gte('created_at', recentSince())
           .order('created_at', { ascending: true })
           .limit(100) // Limit to last 100 messages
 
@@ -1350,6 +2353,11 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
+        const limited = await enforceRateLimit(db, supabase, user, 'ai', estimateDoubtCost(questionText, context))
+        if (limited) {
+          return limited
+        }
+
         // Get subject name for AI context
         const { data: subject, error: subjectError } = await supabase
           .from('subjects')
@@ -1385,9 +2393,22 @@ async function handleRoute(request, { params }) {
           }, { status: 500 }))
         }
 
+        const doubtFields = { subjectId, assignmentId, title, questionText, context }
+
+        // Reuse the answer of a near-identical doubt when there is one
+        let similarDoubt = null
+        try {
+          similarDoubt = await findSimilarDoubt(db, doubtFields)
+        } catch (indexError) {
+          console.error('Similar doubt lookup failed:', indexError)
+        }
+        recordCacheResult('doubt_answer', similarDoubt ? 'HIT' : 'MISS')
+
         // Generate AI response
         try {
-          const aiResponse = await generateDoubtResponse(questionText, context, subject.name)
+          const aiResponse = similarDoubt
+            ? similarDoubt.responseText
+            : await generateDoubtResponse(questionText, context, subject.name)
           
           // Save AI response
           const { data: response, error: responseError } = await supabase
@@ -1405,10 +2426,23 @@ async function handleRoute(request, { params }) {
             console.error('Failed to save AI response:', responseError)
           }
 
+          // Only index answers that were saved, so a match always has a response to show
+          if (!similarDoubt && response) {
+            addDoubtToIndex(db, {
+              ...doubtFields,
+              doubtId: doubt.id,
+              responseId: response?.id,
+              responseText: aiResponse
+            }).catch(indexError => console.error('Failed to index doubt:', indexError))
+          }
+
           return handleCORS(NextResponse.json({
             message: "Doubt submitted successfully",
             doubt,
-            aiResponse: response
+            aiResponse: response,
+            ...(similarDoubt && {
+              matchedDoubt: { doubtId: similarDoubt.doubtId, similarity: similarDoubt.similarity }
+            })
           }))
 
         } catch (aiError) {
@@ -1427,6 +2461,68 @@ async function handleRoute(request, { params }) {
       }
     }
 
+    // POST /api/teacher/doubt-index/rebuild - Backfill the similar-doubt index for a subject
+    if (route === '/teacher/doubt-index/rebuild' && method === 'POST') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+
+        // Verify user is a teacher; a rebuild rescans up to 5000 doubts
+        const { data: profile, error: profileError } = await supabase
+          .from('user_profiles')
+          .select('role')
+          .eq('id', user.id)
+          .single()
+
+        if (profileError || profile.role !== 'teacher') {
+          return handleCORS(NextResponse.json({
+            error: "Access denied. Teacher role required."
+          }, { status: 403 }))
+        }
+
+        const body = await request.json()
+
+        const { subjectId } = body
+
+        if (!subjectId) {
+          return handleCORS(NextResponse.json({
+            error: "Missing required field: subjectId"
+          }, { status: 400 }))
+        }
+
+        // RLS limits this to doubts in subjects the teacher can see
+        const { data: doubts, error } = await supabase
+          .from('doubts')
+          .select(`
+            id, assignment_id, title, question_text, context, created_at,
+            doubt_responses(id, response_text, response_type, is_helpful, upvotes)
+          `)
+          .eq('subject_id', subjectId)
+          .order('created_at', { ascending: false })
+          .limit(5000)
+
+        if (error) {
+          return handleCORS(NextResponse.json({
+            error: "Failed to fetch doubts",
+            details: error.message
+          }, { status: 500 }))
+        }
+
+        const indexed = await rebuildSubjectIndex(db, subjectId, doubts || [])
+
+        return handleCORS(NextResponse.json({
+          message: "Doubt index rebuilt successfully",
+          subjectId,
+          doubtsScanned: doubts?.length || 0,
+          doubtsIndexed: indexed
+        }))
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
+
     // GET /api/doubts - Get student's doubts and responses
     if (route === '/doubts' && method === 'GET') {
       try {
@@ -1470,15 +2566,30 @@ async function handleRoute(request, { params }) {
       try {
         const user = await getAuthenticatedUser(supabase)
         
-        // Get overall progress
-        const { data: progress, error: progressError } = await supabase
-          .from('student_progress')
-          .select(`
-            id, total_assignments, completed_assignments, average_score,
-            total_time_spent_minutes, streak_days, last_activity_date,
-            subjects!inner(id, name, code)
-          `)
-          .eq('student_id', user.id)
+        // Overall progress is required; recent attempts are optional and run alongside it
+        const [{ data: progress, error: progressError }, { loaded, unavailable }] = await Promise.all([
+          supabase
+            .from('student_progress')
+            .select(`
+              id, total_assignments, completed_assignments, average_score,
+              total_time_spent_minutes, streak_days, last_activity_date,
+              subjects!inner(id, name, code)
+            `)
+            .eq('student_id', user.id),
+          loadDashboardSections({
+            recentAttempts: () => supabase
+              .from('assignment_attempts')
+              .select(`
+                id, percentage_score, submitted_at,
+                assignments!inner(id, title, assignment_type),
+                assignments.subjects!inner(name)
+              `)
+              .eq('student_id', user.id)
+              .eq('status', 'completed')
+              .order('submitted_at', { ascending: false })
+              .limit(10)
+          })
+        ])
 
         if (progressError) {
           return handleCORS(NextResponse.json({
@@ -1486,25 +2597,7 @@ async function handleRoute(request, { params }) {
             details: progressError.message
           }, { status: 500 }))
         }
-
-        // Get recent assignment attempts
-        const { data: recentAttempts, error: attemptsError } = await supabase
-          .from('assignment_attempts')
-          .select(`
-            id, percentage_score, submitted_at,
-            assignments!inner(id, title, assignment_type),
-            assignments.subjects!inner(name)
-          `)
-          .eq('student_id', user.id)
-          .eq('status', 'completed')
-          .order('submitted_at', { ascending: false })
-          .limit(10)
-
-        if (attemptsError) {
-          return handleCORS(NextResponse.json({
-            error: "Failed to fetch recent attempts"
-          }, { status: 500 }))
-        }
+        const recentAttempts = loaded.recentAttempts.data
 
         // Calculate overall stats
         const totalAssignments = progress?.reduce((sum, p) => sum + p.total_assignments, 0) || 0
@@ -1521,7 +2614,8 @@ async function handleRoute(request, { params }) {
             overallAverage: Math.round(overallAverage * 100) / 100
           },
           subjectProgress: progress || [],
-          recentAttempts: recentAttempts || []
+          recentAttempts: recentAttempts || [],
+          unavailable
         }))
 
       } catch (error) {
@@ -1553,41 +2647,44 @@ async function handleRoute(request, { params }) {
           }, { status: 403 }))
         }
 
-        // Get teacher's classes and student counts
-        const { data: classes, error: classesError } = await supabase
-          .from('teacher_classes')
-          .select(`
-            id, class_name, grade_level, section, student_count,
-            subjects!inner(id, name)
-          `)
-          .eq('teacher_id', user.id)
-          .eq('is_active', true)
-
-        // Get recent assignments
-        const { data: recentAssignments, error: assignmentsError } = await supabase
-          .from('assignments')
-          .select(`
-            id, title, assignment_type, created_at, due_date,
-            subjects!inner(name),
-            assignment_attempts(id, status)
-          `)
-          .eq('teacher_id', user.id)
-          .order('created_at', { ascending: false })
-          .limit(5)
-
-        // Get lesson plans count
-        const { count: lessonPlansCount, error: lpCountError } = await supabase
-          .from('lesson_plans')
-          .select('*', { count: 'exact', head: true })
-          .eq('teacher_id', user.id)
-          .eq('status', 'active')
-
-        // Get unread messages count
-        const { count: unreadMessages, error: messagesError } = await supabase
-          .from('teacher_messages')
-          .select('*', { count: 'exact', head: true })
-          .eq('recipient_id', user.id)
-          .eq('is_read', false)
+        const { loaded, unavailable } = await loadDashboardSections({
+          // Teacher's classes and student counts
+          classes: () => supabase
+            .from('teacher_classes')
+            .select(`
+              id, class_name, grade_level, section, student_count,
+              subjects!inner(id, name)
+            `)
+            .eq('teacher_id', user.id)
+            .eq('is_active', true),
+          // Recent assignments
+          recentAssignments: () => supabase
+            .from('assignments')
+            .select(`
+              id, title, assignment_type, created_at, due_date,
+              subjects!inner(name),
+              assignment_attempts(id, status)
+            `)
+            .eq('teacher_id', user.id)
+            .order('created_at', { ascending: false })
+            .limit(5),
+          // Lesson plans count
+          lessonPlans: () => supabase
+            .from('lesson_plans')
+            .select('*', { count: 'exact', head: true })
+            .eq('teacher_id', user.id)
+            .eq('status', 'active'),
+          // Unread messages count
+          unreadMessages: () => supabase
+            .from('teacher_messages')
+            .select('*', { count: 'exact', head: true })
+            .eq('recipient_id', user.id)
+            .eq('is_read', false)
+        })
+        const classes = loaded.classes.data
+        const recentAssignments = loaded.recentAssignments.data
+        const lessonPlansCount = loaded.lessonPlans.count
+        const unreadMessages = loaded.unreadMessages.count
 
         return handleCORS(NextResponse.json({
           classes: classes || [],
@@ -1600,7 +2697,8 @@ async function handleRoute(request, { params }) {
             activeAssignments: recentAssignments?.filter(a => 
               new Date(a.due_date) > new Date()
             ).length || 0
-          }
+          },
+          unavailable
         }))
 
       } catch (error) {
@@ -1616,10 +2714,7 @@ async function handleRoute(request, { params }) {
         const user = await getAuthenticatedUser(supabase)
         const body = await request.json()
         
-        const { 
-          title, description, subjectId, gradeLevel, duration = 40,
-          topic, learningObjectives, useAI = false, aiPrompt 
-        } = body
+        const { title, subjectId, gradeLevel } = body
         
         if (!title || !subjectId || !gradeLevel) {
           return handleCORS(NextResponse.json({
@@ -1627,73 +2722,19 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
-        let aiGeneratedContent = null
-        
-        // Generate AI lesson plan if requested
-        if (useAI && (topic || aiPrompt)) {
-          try {
-            const { data: subject, error: subjectError } = await supabase
-              .from('subjects')
-              .select('name')
-              .eq('id', subjectId)
-              .single()
-
-            if (!subjectError && subject) {
-              aiGeneratedContent = await generateLessonPlan(
-                topic || title, 
-                subject.name, 
-                gradeLevel, 
-                duration,
-                aiPrompt
-              )
-            }
-          } catch (aiError) {
-            console.error('AI lesson plan generation failed:', aiError)
-          }
-        }
-
-        // Create lesson plan
-        const lessonPlanData = {
-          teacher_id: user.id,
-          subject_id: subjectId,
-          title,
-          description,
-          grade_level: gradeLevel,
-          duration_minutes: duration,
-          learning_objectives: learningObjectives || [],
-          ai_generated: !!aiGeneratedContent,
-          ai_prompt: aiPrompt,
-          status: 'draft'
-        }
-
-        // Add AI-generated content if available
-        if (aiGeneratedContent) {
-          lessonPlanData.key_concepts = aiGeneratedContent.keyConcepts || []
-          lessonPlanData.discussion_points = aiGeneratedContent.discussionPoints || []
-          lessonPlanData.activities = aiGeneratedContent.activities || []
-          lessonPlanData.resources = aiGeneratedContent.resources || []
-          lessonPlanData.assessment_notes = aiGeneratedContent.assessmentNotes
-          lessonPlanData.homework_suggestions = aiGeneratedContent.homeworkSuggestions
+        const limited = await (body.useAI
+          ? enforceRateLimit(db, supabase, user, 'ai', estimateLessonPlanCost(body.aiPrompt || body.topic))
+          : enforceRateLimit(db, supabase, user, 'write'))
+        if (limited) {
+          return limited
         }
 
-        const { data: lessonPlan, error } = await supabase
-          .from('lesson_plans')
-          .insert(lessonPlanData)
-          .select()
-          .single()
-
-        if (error) {
-          return handleCORS(NextResponse.json({
-            error: "Failed to create lesson plan",
-            details: error.message
-          }, { status: 500 }))
+        if (wantsAsync(request)) {
+          return await startGenerationJob(db, user, 'lesson_plan', body, runLessonPlanCreation)
         }
 
-        return handleCORS(NextResponse.json({
-          message: "Lesson plan created successfully",
-          lessonPlan,
-          aiGenerated: !!aiGeneratedContent
-        }))
+        const result = await runLessonPlanCreation(supabase, user, body)
+        return handleCORS(NextResponse.json(result.body, { status: result.status }))
 
       } catch (error) {
         return handleCORS(NextResponse.json({
@@ -1709,39 +2750,44 @@ async function handleRoute(request, { params }) {
         const url = new URL(request.url)
         const status = url.searchParams.get('status') // draft, active, archived
         const subjectId = url.searchParams.get('subject_id')
-        
-        let query = supabase
-          .from('lesson_plans')
-          .select(`
-            id, title, description, grade_level, duration_minutes,
-            learning_objectives, key_concepts, discussion_points,
-            activities, resources, ai_generated, status, created_at, updated_at,
-            subjects!inner(id, name)
-          `)
-          .eq('teacher_id', user.id)
-          .order('updated_at', { ascending: false })
 
-        if (status) {
-          query = query.eq('status', status)
-        }
-        
-        if (subjectId) {
-          query = query.eq('subject_id', subjectId)
-        }
+        return await respondWithCache(request, `lesson-plans:${user.id}:${status || 'all'}:${subjectId || 'all'}`, {
+          tags: [`lesson-plans:${user.id}`],
+          cacheControl: CACHE_POLICIES.revalidate
+        }, async () => {
+          let query = supabase
+            .from('lesson_plans')
+            .select(`
+              id, title, description, grade_level, duration_minutes,
+              learning_objectives, key_concepts, discussion_points,
+              activities, resources, ai_generated, status, created_at, updated_at,
+              subjects!inner(id, name)
+            `)
+            .eq('teacher_id', user.id)
+            .order('updated_at', { ascending: false })
 
-        const { data: lessonPlans, error } = await query
+          if (status) {
+            query = query.eq('status', status)
+          }
 
-        if (error) {
-          return handleCORS(NextResponse.json({
-            error: "Failed to fetch lesson plans",
-            details: error.message
-          }, { status: 500 }))
-        }
+          if (subjectId) {
+            query = query.eq('subject_id', subjectId)
+          }
 
-        return handleCORS(NextResponse.json({
-          lessonPlans: lessonPlans || [],
-          count: lessonPlans?.length || 0
-        }))
+          const { data: lessonPlans, error } = await query
+
+          if (error) {
+            return {
+              status: 500,
+              body: { error: "Failed to fetch lesson plans", details: error.message }
+            }
+          }
+
+          return {
+            status: 200,
+            body: { lessonPlans: lessonPlans || [], count: lessonPlans?.length || 0 }
+          }
+        })
 
       } catch (error) {
         return handleCORS(NextResponse.json({
@@ -1777,6 +2823,8 @@ async function handleRoute(request, { params }) {
           }, { status: 500 }))
         }
 
+        invalidateTags(`lesson-plans:${user.id}`)
+
         return handleCORS(NextResponse.json({
           message: "Lesson plan updated successfully",
           lessonPlan
@@ -1808,6 +2856,8 @@ async function handleRoute(request, { params }) {
           }, { status: 500 }))
         }
 
+        invalidateTags(`lesson-plans:${user.id}`)
+
         return handleCORS(NextResponse.json({
           message: "Lesson plan deleted successfully"
         }))
@@ -1838,6 +2888,11 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
+        const limited = await enforceRateLimit(db, supabase, user, 'write')
+        if (limited) {
+          return limited
+        }
+
         // Create assignment
         const assignmentData = {
           title,
@@ -2030,6 +3085,15 @@ async function handleRoute(request, { params }) {
           }, { status: 500 }))
         }
 
+        // Re-publishing may follow question edits; start a new cache version and
+        // warm it so the first wave of students does not all miss at once
+        invalidateAssignmentQuestions(assignmentId)
+        const sharingScope = await getSharingScope(supabase, user)
+        await Promise.all([
+          loadAssignmentPayload(supabase, assignmentId, sharingScope),
+          loadAnswerKey(supabase, assignmentId, sharingScope)
+        ])
+
         return handleCORS(NextResponse.json({
           message: "Assignment published successfully",
           assignment
@@ -2042,6 +3106,50 @@ async function handleRoute(request, { params }) {
       }
     }
 
+    // POST /api/teacher/assignments/{id}/regrade - Apply answer key fixes and regrade all attempts
+    if (route.match(/^\/teacher\/assignments\/[^\/]+\/regrade$/) && method === 'POST') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+        const assignmentId = route.split('/')[3]
+        const body = await request.json().catch(() => ({}))
+
+        const { answerKey } = body
+
+        if (answerKey !== undefined && answerKey !== null &&
+            (typeof answerKey !== 'object' || Array.isArray(answerKey))) {
+          return handleCORS(NextResponse.json({
+            error: "answerKey must be an object mapping question IDs to correct answers"
+          }, { status: 400 }))
+        }
+
+        if (!UUID_PATTERN.test(assignmentId)) {
+          return handleCORS(NextResponse.json({ error: "Assignment not found" }, { status: 404 }))
+        }
+
+        const invalidKeys = Object.keys(answerKey || {}).filter(key => !UUID_PATTERN.test(key))
+        if (invalidKeys.length > 0) {
+          return handleCORS(NextResponse.json({
+            error: "answerKey keys must be question IDs",
+            invalidKeys: invalidKeys.slice(0, 20)
+          }, { status: 400 }))
+        }
+
+        const regradeBody = { ...body, assignmentId }
+
+        if (wantsAsync(request)) {
+          return await startGenerationJob(db, user, 'regrade', regradeBody, runAssignmentRegrade)
+        }
+
+        const result = await runAssignmentRegrade(supabase, user, regradeBody)
+        return handleCORS(NextResponse.json(result.body, { status: result.status }))
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
+
     // GET /api/teacher/gradebook - Get teacher's gradebook
     if (route === '/teacher/gradebook' && method === 'GET') {
       try {
@@ -2164,6 +3272,63 @@ async function handleRoute(request, { params }) {
       }
     }
 
+    // PUT /api/teacher/gradebook - Apply many manual score / comment changes in one transaction
+    if (route === '/teacher/gradebook' && method === 'PUT') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+        const body = await request.json()
+        const { grades } = body
+
+        if (!Array.isArray(grades) || grades.length === 0 || grades.length > GRADEBOOK_BATCH_LIMIT) {
+          return handleCORS(NextResponse.json({
+            error: `grades must be an array of 1 to ${GRADEBOOK_BATCH_LIMIT} changes`
+          }, { status: 400 }))
+        }
+
+        const invalid = grades
+          .map((change, index) => ({ index, error: gradeChangeError(change) }))
+          .filter(result => result.error)
+        if (invalid.length > 0) {
+          return handleCORS(NextResponse.json({
+            error: "Invalid grade changes",
+            details: invalid
+          }, { status: 400 }))
+        }
+
+        const limited = await enforceRateLimit(db, supabase, user, 'write')
+        if (limited) return limited
+
+        const { data: results, error } = await supabase.rpc('bulk_update_grades', {
+          p_changes: grades.map(change => ({
+            id: change.id,
+            has_manual: 'manualScore' in change,
+            manual_score: change.manualScore ?? null,
+            has_comments: 'comments' in change,
+            comments: change.comments ?? null
+          }))
+        })
+
+        if (error) {
+          return handleCORS(NextResponse.json({
+            error: "Failed to update grades",
+            details: error.message
+          }, { status: 500 }))
+        }
+
+        return handleCORS(NextResponse.json({
+          message: "Grades updated successfully",
+          updated: results.filter(result => result.status === 'updated').length,
+          notFound: results.filter(result => result.status === 'not_found').length,
+          results
+        }))
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
+
     // GET /api/teacher/analytics - Get teacher analytics
     if (route === '/teacher/analytics' && method === 'GET') {
       try {
@@ -2275,12 +3440,7 @@ async function handleRoute(request, { params }) {
         const user = await getAuthenticatedUser(supabase)
         const body = await request.json()
         
-        const { 
-          title, description, subjectId, topics = [], 
-          difficultyDistribution = { easy: 30, medium: 50, hard: 20 },
-          totalQuestions, totalMarks, duration, instructions,
-          useAI = true, schoolLogoUrl
-        } = body
+        const { title, subjectId, topics = [], totalQuestions } = body
         
         if (!title || !subjectId || !topics.length || !totalQuestions) {
           return handleCORS(NextResponse.json({
@@ -2288,69 +3448,19 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
-        let questions = []
-
-        // Generate questions using AI if requested
-        if (useAI) {
-          try {
-            const { data: subject, error: subjectError } = await supabase
-              .from('subjects')
-              .select('name')
-              .eq('id', subjectId)
-              .single()
-
-            if (!subjectError && subject) {
-              questions = await generateAssessmentQuestions(
-                topics, 
-                subject.name,
-                totalQuestions,
-                difficultyDistribution
-              )
-            }
-          } catch (aiError) {
-            console.error('AI assessment generation failed:', aiError)
-            return handleCORS(NextResponse.json({
-              error: "Failed to generate assessment questions",
-              details: aiError.message
-            }, { status: 500 }))
-          }
-        }
-
-        // Create PDF assessment record
-        const assessmentData = {
-          teacher_id: user.id,
-          subject_id: subjectId,
-          title,
-          description,
-          topics,
-          difficulty_distribution: difficultyDistribution,
-          total_questions: totalQuestions,
-          total_marks: totalMarks || totalQuestions,
-          duration_minutes: duration,
-          instructions,
-          questions,
-          school_logo_url: schoolLogoUrl,
-          status: 'draft'
+        const limited = await (body.useAI === false
+          ? enforceRateLimit(db, supabase, user, 'write')
+          : enforceRateLimit(db, supabase, user, 'ai', estimateQuizCost(totalQuestions)))
+        if (limited) {
+          return limited
         }
 
-        const { data: assessment, error } = await supabase
-          .from('pdf_assessments')
-          .insert(assessmentData)
-          .select()
-          .single()
-
-        if (error) {
-          return handleCORS(NextResponse.json({
-            error: "Failed to create PDF assessment",
-            details: error.message
-          }, { status: 500 }))
+        if (wantsAsync(request)) {
+          return await startGenerationJob(db, user, 'pdf_assessment', body, runPdfAssessmentGeneration)
         }
 
-        return handleCORS(NextResponse.json({
-          message: "PDF assessment created successfully",
-          assessment,
-          questionsGenerated: questions.length
-        }))
+        const result = await runPdfAssessmentGeneration(supabase, user, body)
+        return handleCORS(NextResponse.json(result.body, { status: result.status }))
 
       } catch (error) {
         return handleCORS(NextResponse.json({
@@ -2394,6 +3504,106 @@ async function handleRoute(request, { params }) {
       }
     }
 
+    // GET /api/teacher/pdf-assessments/{id}/pdf - Stream the printable PDF (cached artifact)
+    if (route.match(/^\/teacher\/pdf-assessments\/[^\/]+\/pdf$/) && method === 'GET') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+        const assessmentId = route.split('/')[3]
+        const url = new URL(request.url)
+        const options = normalizeRenderOptions({
+          variants: url.searchParams.get('variants'),
+          answerKey: url.searchParams.get('answerKey')
+        })
+
+        const { data: assessment, error } = await getTeacherPdfAssessment(supabase, user, assessmentId)
+
+        if (error || !assessment) {
+          return handleCORS(NextResponse.json({
+            error: "PDF assessment not found",
+            details: error?.message
+          }, { status: 404 }))
+        }
+
+        const key = assessmentContentHash(assessment, options)
+        const etag = `"${key}"`
+        if (request.headers.get('if-none-match') === etag) {
+          return handleCORS(new NextResponse(null, { status: 304, headers: { ETag: etag } }))
+        }
+
+        await markPdfGenerated(supabase, assessment, options)
+
+        const headers = {
+          'Content-Type': 'application/pdf',
+          'Content-Disposition': `${url.searchParams.get('download') === 'true' ? 'attachment' : 'inline'}; filename="${pdfFilename(assessment, options)}"`,
+          'Cache-Control': 'private, no-cache',
+          ETag: etag
+        }
+
+        const cached = await getPdfArtifact(db, key)
+        recordCacheResult('pdf_artifact', cached ? 'HIT' : 'MISS')
+        if (cached) {
+          return handleCORS(new NextResponse(streamPdfBuffer(cached), {
+            headers: { ...headers, 'Content-Length': String(cached.length), 'X-Artifact-Cache': 'HIT' }
+          }))
+        }
+
+        // Stream while rendering; the finished document is stored as the artifact.
+        // A paper rendered while the logo could not be loaded is neither stored
+        // nor given the artifact's ETag, so the next request tries the logo again.
+        const logo = await loadLogoImage(assessment.school_logo_url)
+        const logoMissing = Boolean(assessment.school_logo_url) && !logo
+        if (logoMissing) {
+          delete headers.ETag
+          headers['Cache-Control'] = 'no-store'
+        }
+        const stream = streamPdfChunks(
+          renderAssessmentPdf(assessment, { ...options, logo }),
+          (buffer) => {
+            if (logoMissing) {
+              return
+            }
+            savePdfArtifact(db, key, buffer, {
+              assessment_id: assessment.id,
+              teacher_id: user.id,
+              variants: options.variants,
+              answer_key: options.answerKey
+            }).catch(saveError => console.error('Failed to store PDF artifact:', saveError))
+          }
+        )
+
+        return handleCORS(new NextResponse(stream, {
+          headers: { ...headers, 'X-Artifact-Cache': 'MISS' }
+        }))
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
+
+    // POST /api/teacher/pdf-assessments/{id}/render - Pre-render variant sets and answer keys
+    if (route.match(/^\/teacher\/pdf-assessments\/[^\/]+\/render$/) && method === 'POST') {
+      try {
+        const user = await getAuthenticatedUser(supabase)
+        const assessmentId = route.split('/')[3]
+        const body = await request.json().catch(() => ({}))
+        const renderBody = { ...body, assessmentId }
+
+        if (wantsAsync(request)) {
+          return await startGenerationJob(db, user, 'pdf_render', renderBody, runPdfRender)
+        }
+
+        const result = await runPdfRender(supabase, user, renderBody)
+        return handleCORS(NextResponse.json(result.body, { status: result.status }))
+
+      } catch (error) {
+        return handleCORS(NextResponse.json({
+          error: error.message || "Authentication required"
+        }, { status: 401 }))
+      }
+    }
+
     // POST /api/teacher/messages - Send message to student/parent
     if (route === '/teacher/messages' && method === 'POST') {
       try {
@@ -2412,6 +3622,11 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
+        const limited = await enforceRateLimit(db, supabase, user, 'write')
+        if (limited) {
+          return limited
+        }
+
         const messageData = {
           sender_id: user.id,
           recipient_id: recipientId,
@@ -2547,37 +3762,41 @@ async function handleRoute(request, { params }) {
         startDate.setDate(startDate.getDate() - 30) // Last 30 days
         const endDate = new Date()
 
-        const { data: kpis, error: kpiError } = await supabase
-          .rpc('calculate_coordinator_kpis', {
-            p_coordinator_id: user.id,
-            p_start_date: startDate.toISOString().split('T')[0],
-            p_end_date: endDate.toISOString().split('T')[0]
-          })
-
-        // Get recent support categories
-        const { data: supportCategories, error: supportError } = await supabase
-          .from('student_support_categories')
-          .select(`
-            id, support_type, priority_level, current_status, created_at,
-            user_profiles!student_support_categories_student_id_fkey(id, full_name, grade_level, section)
-          `)
-          .eq('coordinator_id', user.id)
-          .eq('current_status', 'active')
-          .order('created_at', { ascending: false })
-          .limit(10)
-
-        // Get recent alerts
-        const { data: alerts, error: alertsError } = await supabase
-          .from('coordinator_alerts')
-          .select(`
-            id, alert_type, severity_level, alert_title, alert_message,
-            is_resolved, acknowledged, created_at,
-            user_profiles!coordinator_alerts_related_student_id_fkey(id, full_name)
-          `)
-          .eq('coordinator_id', user.id)
-          .eq('is_resolved', false)
-          .order('created_at', { ascending: false })
-          .limit(5)
+        const { loaded, unavailable } = await loadDashboardSections({
+          kpis: () => supabase
+            .rpc('calculate_coordinator_kpis', {
+              p_coordinator_id: user.id,
+              p_start_date: startDate.toISOString().split('T')[0],
+              p_end_date: endDate.toISOString().split('T')[0]
+            }),
+          // Recent support categories
+          supportCategories: () => supabase
+            .from('student_support_categories')
+            .select(`
+              id, support_type, priority_level, current_status, created_at,
+              user_profiles!student_support_categories_student_id_fkey(id, full_name, grade_level, section)
+            `)
+            .eq('coordinator_id', user.id)
+            .eq('current_status', 'active')
+            .order('created_at', { ascending: false })
+            .limit(10),
+          // Recent alerts
+          alerts: () => supabase
+            .from('coordinator_alerts')
+            .select(`
+              id, alert_type, severity_level, alert_title, alert_message,
+              is_resolved, acknowledged, created_at,
+              user_profiles!coordinator_alerts_related_student_id_fkey(id, full_name)
+            `)
+            .eq('coordinator_id', user.id)
+            .eq('is_resolved', false)
+            .gte('created_at', recentSince())
+            .order('created_at', { ascending: false })
+            .limit(5)
+        })
+        const kpis = loaded.kpis.data
+        const supportCategories = loaded.supportCategories.data
+        const alerts = loaded.alerts.data
 
         return handleCORS(NextResponse.json({
           coordinator: userProfile,
@@ -2588,7 +3807,8 @@ async function handleRoute(request, { params }) {
           period: {
             start: startDate.toISOString(),
             end: endDate.toISOString()
-          }
+          },
+          unavailable
         }))
 
       } catch (error) {
@@ -3023,6 +4243,11 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
+        const limited = await enforceRateLimit(db, supabase, user, 'write')
+        if (limited) {
+          return limited
+        }
+
         const { data: communication, error } = await supabase
           .from('coordinator_communications')
           .insert({
@@ -3150,6 +4375,11 @@ async function handleRoute(request, { params }) {
           }, { status: 400 }))
         }
 
+        const limited = await enforceRateLimit(db, supabase, user, 'write')
+        if (limited) {
+          return limited
+        }
+
         const { data: intervention, error } = await supabase
           .from('student_intervention_log')
           .insert({
@@ -3240,7 +4470,7 @@ async function handleRoute(request, { params }) {
       }
     }
 
-    // GET /api/coordinator/alerts - List alerts
+    // GET /api/coordinator/alerts - List alerts (last 90 days unless ?days= is given)
     if (route === '/coordinator/alerts' && method === 'GET') {
       try {
         const user = await getAuthenticatedUser(supabase)
@@ -3248,6 +4478,7 @@ async function handleRoute(request, { params }) {
         const severity = url.searchParams.get('severity')
         const resolved = url.searchParams.get('resolved')
         const alertType = url.searchParams.get('type')
+        const days = parseInt(url.searchParams.get('days')) || RECENT_ACTIVITY_DAYS
 
         let query = supabase
           .from('coordinator_alerts')
@@ -3256,6 +4487,7 @@ async function handleRoute(request, { params }) {
             user_profiles!coordinator_alerts_related_student_id_fkey(id, full_name, grade_level, section)
           `)
           .eq('coordinator_id', user.id)
+          .gte('created_at', recentSince(days))
           .order('created_at', { ascending: false })
 
         if (severity) {
@@ -3383,9 +4615,60 @@ async function handleRoute(request, { params }) {
   }
 }
 
+// POSTs that honour an Idempotency-Key header: retrying them after a timeout would
+// grade an attempt twice, fan out messages twice or pay for another AI call
+const IDEMPOTENT_ROUTES = [
+  /^\/assignments\/[^\/]+\/submit$/,
+  /^\/coordinator\/communications$/,
+  /^\/teacher\/pdf-assessment$/
+]
+
+// Helper function to deduplicate retried POSTs per user and Idempotency-Key
+async function handleIdempotentRoute(request, route, context) {
+  if (request.method !== 'POST' || !IDEMPOTENT_ROUTES.some(pattern => pattern.test(route))) {
+    return handleRoute(request, context)
+  }
+  const resolveUserId = async () => (await getAuthenticatedUser(createSupabaseServer())).id
+  return handleCORS(await withIdempotency(request, route, resolveUserId, () => handleRoute(request, context)))
+}
+
+// Helper function to serve a request within its deadline. Handlers report
+// aborted upstream calls as their usual 401/500, so an error response produced
+// after the deadline passed is reported as the 504 it really is.
+async function handleRouteWithDeadline(request, route, context) {
+  const deadlineMs = LONG_RUNNING_ROUTES.some(pattern => pattern.test(route))
+    ? LONG_REQUEST_DEADLINE_MS
+    : REQUEST_DEADLINE_MS
+  return runWithDeadline(deadlineMs, async () => {
+    try {
+      const response = await raceDeadline(() => handleIdempotentRoute(request, route, context))
+      if (response.status < 400 || !deadlineSignal().aborted) {
+        return response
+      }
+    } catch (error) {
+      if (!(error instanceof DeadlineExceededError)) {
+        throw error
+      }
+    }
+    return handleCORS(NextResponse.json({
+      error: "Request deadline exceeded",
+      details: `No response within ${deadlineMs}ms`
+    }, { status: 504 }))
+  })
+}
+
+// Record latency, status and upstream call counts for every API request, and
+// append it to the traffic capture when TRAFFIC_CAPTURE_FILE is set
+function handleInstrumentedRoute(request, context) {
+  const route = `/${(context.params.path || []).join('/')}`
+  return observeRequest(request.method, route, () =>
+    captureRequest(request, route, () => handleRouteWithDeadline(request, route, context))
+  )
+}
+
 // Export all HTTP methods
-export const GET = handleRoute
-export const POST = handleRoute
-export const PUT = handleRoute
-export const DELETE = handleRoute
-export const PATCH = handleRoute
\ No newline at end of file
+export const GET = handleInstrumentedRoute
+export const POST = handleInstrumentedRoute
+export const PUT = handleInstrumentedRoute
+export const DELETE = handleInstrumentedRoute
+export const PATCH = handleInstrumentedRoute
\ No newline at end of file
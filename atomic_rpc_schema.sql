@@ -0,0 +1,156 @@
+-- ================================================================================================
+-- ATOMIC JOIN / START FUNCTIONS - SUPABASE SQL SCHEMA EXTENSION
+-- ================================================================================================
+-- Server-side functions for the two student flows that used to be several sequential API
+-- round-trips: joining a study group by invite code and starting an assignment attempt.
+-- Each function does its checks and its write in one transaction under a lock, so concurrent
+-- requests can no longer overfill a group or hand out the same attempt number twice.
+-- Prerequisites: Student Phase schema must be applied first.
+-- Execute this script in your Supabase SQL editor.
+--
+-- Errors are raised with distinct SQLSTATEs that the API maps to HTTP statuses:
+--   P0002  invite code / assignment not found            -> 404
+--   SG001  already a member of the group                 -> 400
+--   SG002  group is full                                 -> 400
+--   AT001  maximum attempts exceeded                     -> 400
+
+-- ------------------------------------------------------------------------------------------------
+-- 1. JOIN STUDY GROUP - Lookup, membership check, capacity check and insert in one call
+-- ------------------------------------------------------------------------------------------------
+-- SECURITY DEFINER because group_members RLS hides the rows of groups the caller has not joined
+-- yet, which made the old client-side capacity count read zero. Group visibility is re-checked
+-- here with the same rule as the study_groups policy.
+CREATE OR REPLACE FUNCTION public.join_study_group(p_invite_code TEXT)
+RETURNS JSONB
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    target_group RECORD;
+    new_member RECORD;
+    member_count INTEGER;
+BEGIN
+    -- The row lock serializes joins to the same group until this transaction commits
+    SELECT g.id, g.name, g.max_members
+    INTO target_group
+    FROM public.study_groups g
+    WHERE g.invite_code = upper(p_invite_code)
+    AND g.is_active = true
+    AND g.assignment_id IN (
+        SELECT a.id FROM public.assignments a
+        JOIN public.subjects s ON a.subject_id = s.id
+        JOIN public.user_profiles up ON s.school_id = up.school_id
+        WHERE up.id = auth.uid() AND a.is_published = true
+    )
+    FOR UPDATE OF g;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Invalid invite code' USING ERRCODE = 'P0002';
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM public.group_members
+        WHERE group_id = target_group.id AND student_id = auth.uid()
+    ) THEN
+        RAISE EXCEPTION 'You are already a member of this group' USING ERRCODE = 'SG001';
+    END IF;
+
+    SELECT COUNT(*) INTO member_count
+    FROM public.group_members
+    WHERE group_id = target_group.id AND is_active = true;
+
+    IF member_count >= target_group.max_members THEN
+        RAISE EXCEPTION 'Group is full' USING ERRCODE = 'SG002';
+    END IF;
+
+    INSERT INTO public.group_members (group_id, student_id, role)
+    VALUES (target_group.id, auth.uid(), 'member')
+    RETURNING * INTO new_member;
+
+    RETURN jsonb_build_object(
+        'group', jsonb_build_object(
+            'id', target_group.id,
+            'name', target_group.name,
+            'max_members', target_group.max_members
+        ),
+        'member', to_jsonb(new_member),
+        'member_count', member_count + 1
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION public.join_study_group(TEXT) TO authenticated;
+
+-- ------------------------------------------------------------------------------------------------
+-- 2. START ASSIGNMENT ATTEMPT - Availability check, next attempt number and insert in one call
+-- ------------------------------------------------------------------------------------------------
+-- Runs with the caller's rights: assignment and attempt RLS already allow everything needed.
+-- A transaction-scoped advisory lock per (student, assignment) serializes double-clicks and
+-- retries without blocking the rest of the class starting the same assignment.
+CREATE OR REPLACE FUNCTION public.start_assignment_attempt(p_assignment_id UUID)
+RETURNS JSONB
+SET search_path = public
+AS $$
+DECLARE
+    target_assignment RECORD;
+    new_attempt RECORD;
+    next_attempt_number INTEGER;
+BEGIN
+    SELECT id, title, max_attempts
+    INTO target_assignment
+    FROM public.assignments
+    WHERE id = p_assignment_id AND is_published = true;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Assignment not found' USING ERRCODE = 'P0002';
+    END IF;
+
+    PERFORM pg_advisory_xact_lock(hashtextextended(auth.uid()::TEXT || ':' || p_assignment_id::TEXT, 0));
+
+    SELECT COALESCE(MAX(attempt_number), 0) + 1
+    INTO next_attempt_number
+    FROM public.assignment_attempts
+    WHERE assignment_id = p_assignment_id AND student_id = auth.uid();
+
+    IF next_attempt_number > target_assignment.max_attempts THEN
+        RAISE EXCEPTION 'Maximum attempts exceeded' USING ERRCODE = 'AT001';
+    END IF;
+
+    INSERT INTO public.assignment_attempts (assignment_id, student_id, attempt_number, status)
+    VALUES (p_assignment_id, auth.uid(), next_attempt_number, 'in_progress')
+    RETURNING * INTO new_attempt;
+
+    RETURN jsonb_build_object(
+        'attempt', to_jsonb(new_attempt),
+        'attempt_number', next_attempt_number
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION public.start_assignment_attempt(UUID) TO authenticated;
+
+-- ================================================================================================
+-- SCHEMA VALIDATION FOR ATOMIC JOIN / START FUNCTIONS
+-- ================================================================================================
+
+DO $$
+DECLARE
+    function_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO function_count
+    FROM pg_proc p
+    JOIN pg_namespace n ON n.oid = p.pronamespace
+    WHERE n.nspname = 'public'
+    AND p.proname IN ('join_study_group', 'start_assignment_attempt');
+
+    IF function_count = 2 THEN
+        RAISE NOTICE '🎉 SUCCESS: join_study_group() and start_assignment_attempt() created';
+        RAISE NOTICE '🔒 Group joins and attempt starts now check and write in one transaction';
+    ELSE
+        RAISE NOTICE '❌ Expected 2 atomic functions, found % - check the SQL execution log for errors.', function_count;
+    END IF;
+END $$;
+
+-- ================================================================================================
+-- END OF ATOMIC JOIN / START FUNCTIONS SCHEMA
+-- ================================================================================================
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Concurrency Stress Test for Proxilearn Study-Group Join and Quiz Start
+Fires simultaneous POST /api/study-groups/join and POST /api/assignments/{id}/start
+requests and checks that the single-transaction functions in atomic_rpc_schema.sql
+hold up: a group never ends up with more members than max_members, and one student
+never receives the same attempt number twice. Latency percentiles are reported
+per burst. To compare with the old multi-round-trip handlers, run it with
+--save before.json against a build from before atomic_rpc_schema.sql, then with
+--compare before.json against the current one (same students, group and
+assignment, and a fresh group each run so seats are free).
+
+Environment:
+  PROXILEARN_STUDENT_COOKIES file with one student Cookie header per line (required)
+  PROXILEARN_INVITE_CODE     invite code of a study group with free seats
+  PROXILEARN_ASSIGNMENT_ID   published assignment to start attempts on
+  START_BURST_SIZE           concurrent starts per student (default 10)
+"""
+
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+INVITE_CODE = os.environ.get("PROXILEARN_INVITE_CODE")
+ASSIGNMENT_ID = os.environ.get("PROXILEARN_ASSIGNMENT_ID")
+START_BURST_SIZE = int(os.environ.get("START_BURST_SIZE", "10"))
+
+
+def load_student_cookies():
+    path = os.environ.get("PROXILEARN_STUDENT_COOKIES")
+    if not path:
+        return []
+    with open(path) as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def fire_concurrently(calls):
+    """Run (cookie, url, payload) POSTs behind a barrier so they land together"""
+    barrier = threading.Barrier(len(calls))
+
+    def post(call):
+        cookie, url, payload = call
+        session = requests.Session()
+        barrier.wait()
+        started = time.perf_counter()
+        response = session.post(url, json=payload, headers={'Cookie': cookie})
+        elapsed = (time.perf_counter() - started) * 1000
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        return {'status': response.status_code, 'latency_ms': elapsed, 'body': body}
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        return list(pool.map(post, calls))
+
+
+def report_latency(name, results):
+    latencies = [r['latency_ms'] for r in results]
+    statuses = Counter(r['status'] for r in results)
+    print(f"📊 {name}: {len(results)} concurrent requests")
+    print(f"   Latency p50 {statistics.median(latencies):.0f}ms, p95 {percentile(latencies, 95):.0f}ms, "
+          f"max {max(latencies):.0f}ms")
+    print(f"   Status codes: {dict(statuses)}")
+    return {"requests": len(results), "p50_ms": statistics.median(latencies),
+            "p95_ms": percentile(latencies, 95), "max_ms": max(latencies)}
+
+
+def print_comparison(baseline, latencies):
+    print("=" * 80)
+    print("LATENCY COMPARISON (baseline -> this run)")
+    print("=" * 80)
+    for name, result in latencies.items():
+        old = baseline.get(name)
+        if not old:
+            print(f"{name}: no baseline")
+            continue
+        print(f"{name}:")
+        for key in ("p50_ms", "p95_ms", "max_ms"):
+            change = (result[key] - old[key]) / old[key] * 100 if old[key] else 0
+            print(f"   {key:<7} {old[key]:>8.0f} -> {result[key]:>8.0f} ({change:+.0f}%)")
+    print()
+
+
+class AtomicRpcStressTester:
+    def __init__(self, cookies):
+        self.cookies = cookies
+        self.test_results = []
+        self.latencies = {}
+
+    def log_test(self, test_name, success, message=""):
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status}: {test_name}")
+        if message:
+            print(f"   {message}")
+        print()
+        self.test_results.append({"test": test_name, "success": success, "message": message})
+
+    def test_concurrent_group_join(self):
+        """Every student joins the same group at once; seats must not be oversold"""
+        if not INVITE_CODE:
+            print("⏭️  SKIP: Concurrent group join (PROXILEARN_INVITE_CODE not set)")
+            print()
+            return
+
+        url = f"{API_BASE}/study-groups/join"
+        results = fire_concurrently([(cookie, url, {'inviteCode': INVITE_CODE}) for cookie in self.cookies])
+        self.latencies["Study group join burst"] = report_latency("Study group join burst", results)
+
+        joined = [r for r in results if r['status'] == 200]
+        unexpected = [r for r in results if r['status'] not in (200, 400)]
+        max_members = joined[0]['body']['group']['max_members'] if joined else None
+        member_ids = [r['body']['member']['student_id'] for r in joined]
+
+        if unexpected:
+            self.log_test("Concurrent group join", False,
+                          f"{len(unexpected)} unexpected responses, e.g. {unexpected[0]['body']}")
+        elif max_members is not None and len(joined) > max_members:
+            self.log_test("Concurrent group join", False,
+                          f"Group overfilled: {len(joined)} joins succeeded for {max_members} seats")
+        elif len(member_ids) != len(set(member_ids)):
+            self.log_test("Concurrent group join", False, "A student was added to the group twice")
+        else:
+            rejected = Counter(r['body'].get('error') for r in results if r['status'] == 400)
+            self.log_test("Concurrent group join", True,
+                          f"{len(joined)} joined (max_members {max_members}), rejected: {dict(rejected)}")
+
+    def test_concurrent_attempt_start(self):
+        """Each student double-clicks Start many times; attempt numbers must stay unique"""
+        if not ASSIGNMENT_ID:
+            print("⏭️  SKIP: Concurrent attempt start (PROXILEARN_ASSIGNMENT_ID not set)")
+            print()
+            return
+
+        url = f"{API_BASE}/assignments/{ASSIGNMENT_ID}/start"
+        calls = [(cookie, url, {}) for cookie in self.cookies for _ in range(START_BURST_SIZE)]
+        results = fire_concurrently(calls)
+        self.latencies["Attempt start burst"] = report_latency("Attempt start burst", results)
+
+        unexpected = [r for r in results if r['status'] not in (200, 400)]
+        started = [r['body']['attempt'] for r in results if r['status'] == 200]
+        keys = [(attempt['student_id'], attempt['attempt_number']) for attempt in started]
+        duplicates = [key for key, count in Counter(keys).items() if count > 1]
+
+        if unexpected:
+            self.log_test("Concurrent attempt start", False,
+                          f"{len(unexpected)} unexpected responses, e.g. {unexpected[0]['body']}")
+        elif duplicates:
+            self.log_test("Concurrent attempt start", False,
+                          f"Duplicate attempt numbers handed out: {duplicates[:5]}")
+        else:
+            per_student = Counter(attempt['student_id'] for attempt in started)
+            self.log_test("Concurrent attempt start", True,
+                          f"{len(started)} attempts started, most per student {max(per_student.values(), default=0)}, "
+                          f"no duplicate attempt numbers")
+
+    def run_all_tests(self):
+        print("=" * 80)
+        print("PROXILEARN ATOMIC JOIN / START STRESS TEST")
+        print("=" * 80)
+        print(f"Students: {len(self.cookies)}, starts per student: {START_BURST_SIZE}")
+        print()
+
+        self.test_concurrent_group_join()
+        self.test_concurrent_attempt_start()
+
+        passed = sum(1 for result in self.test_results if result["success"])
+        print("=" * 80)
+        print(f"SUMMARY: {passed}/{len(self.test_results)} tests passed")
+        print("=" * 80)
+        return passed == len(self.test_results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", help="write the burst latencies to this JSON file")
+    parser.add_argument("--compare", help="compare with latencies saved by an earlier --save run")
+    args = parser.parse_args()
+
+    student_cookies = load_student_cookies()
+    if not student_cookies:
+        print("⏭️  SKIP - set PROXILEARN_STUDENT_COOKIES to a file of student Cookie headers")
+        raise SystemExit(0)
+
+    tester = AtomicRpcStressTester(student_cookies)
+    success = tester.run_all_tests()
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            print_comparison(json.load(baseline_file), tester.latencies)
+    if args.save:
+        with open(args.save, "w") as output:
+            json.dump(tester.latencies, output, indent=2)
+        print(f"💾 Latencies saved to {args.save}")
+    raise SystemExit(0 if success else 1)
@@ -584,13 +584,18 @@ class TeacherPhaseAPITester:
         """Test Grade Book Management APIs authentication"""
         endpoints = [
             ("GET", "/teacher/gradebook", "View Gradebook"),
-            ("PUT", "/teacher/gradebook/test-id", "Update Grade")
+            ("PUT", "/teacher/gradebook/test-id", "Update Grade"),
+            ("PUT", "/teacher/gradebook", "Batch Update Grades")
         ]
         
         all_passed = True
         for method, endpoint, name in endpoints:
             try:
-                if method == "PUT":
+                if method == "PUT" and endpoint == "/teacher/gradebook":
+                    response = self.session.put(f"{API_BASE}{endpoint}", json={
+                        "grades": [{"id": str(uuid.uuid4()), "manualScore": 85.5, "comments": "Good work"}]
+                    })
+                elif method == "PUT":
                     response = self.session.put(f"{API_BASE}{endpoint}", json={
                         "manualScore": 85.5,
                         "comments": "Good work"
@@ -741,6 +746,46 @@ class TeacherPhaseAPITester:
             self.log_test("CORS Headers", False, error=str(e))
             return False
 
+    def test_idempotency_keys(self):
+        """Test Idempotency-Key handling on submit, communications and PDF generation"""
+        endpoints = [
+            (f"/assignments/{uuid.uuid4()}/submit", "Submit Assignment"),
+            ("/coordinator/communications", "Send Communication"),
+            ("/teacher/pdf-assessment", "Generate PDF Assessment")
+        ]
+
+        all_passed = True
+        for endpoint, name in endpoints:
+            try:
+                # Malformed keys are rejected before the handler runs
+                response = self.session.post(f"{API_BASE}{endpoint}", json={},
+                                             headers={"Idempotency-Key": "has spaces"})
+                if response.status_code == 400:
+                    self.log_test(f"Idempotency - {name} Invalid Key", True, "Correctly rejects malformed key")
+                else:
+                    self.log_test(f"Idempotency - {name} Invalid Key", False, f"Expected 400, got {response.status_code}")
+                    all_passed = False
+
+                # 401s are never stored, so a retry with the same key is not a replay
+                key = str(uuid.uuid4())
+                for attempt in range(2):
+                    response = self.session.post(f"{API_BASE}{endpoint}", json={},
+                                                 headers={"Idempotency-Key": key})
+                    replayed = response.headers.get("Idempotent-Replayed")
+                    if response.status_code != 401 or replayed:
+                        self.log_test(f"Idempotency - {name} Auth", False,
+                                      f"Attempt {attempt + 1}: got {response.status_code}, replayed={replayed}")
+                        all_passed = False
+                        break
+                else:
+                    self.log_test(f"Idempotency - {name} Auth", True, "Unauthenticated retries are not replayed")
+
+            except Exception as e:
+                self.log_test(f"Idempotency - {name}", False, error=str(e))
+                all_passed = False
+
+        return all_passed
+
     def test_database_schema_dependency(self):
         """Test that endpoints handle missing database schema gracefully"""
         try:
@@ -815,6 +860,7 @@ class TeacherPhaseAPITester:
             self.test_basic_connectivity(),
             self.test_supabase_connection(),
             self.test_cors_headers(),
+            self.test_idempotency_keys(),
             self.test_environment_variables(),
             self.test_database_schema_dependency()
         ]
@@ -879,6 +925,11 @@ class TeacherPhaseAPITester:
         return passed_tests, failed_tests, total_tests
 
 if __name__ == "__main__":
+    # Payload size budgets only (see payload_profiler.py)
+    if "--payload-budgets" in sys.argv:
+        from payload_profiler import PayloadBudgetTester
+        sys.exit(0 if PayloadBudgetTester().run() else 1)
+
     # Test both Teacher Phase and Coordinator Phase
     print("🚀 STARTING COMPREHENSIVE PROXILEARN BACKEND API TESTING")
     print("Testing both Teacher Phase and Coordinator Phase APIs")
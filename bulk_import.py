@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Bulk CSV Import for Proxilearn
+Streams a CSV file to POST /api/import/{kind} in batches, so a roster of
+thousands of students loads in seconds instead of one API call per student.
+Each batch is validated and upserted in one transaction (bulk_import_schema.sql
+must be applied), and derived student counts are recomputed once per batch.
+The file is read lazily, one batch at a time, so its size does not matter.
+
+Usage:
+  python bulk_import.py students roster.csv       email, full_name, grade_level, section, phone
+  python bulk_import.py enrollments classes.csv   email, teacher_class_id
+  python bulk_import.py grades grades.csv         email, assignment_id, score, percentage, comments
+  add --dry-run to validate every row without writing anything
+
+Headers are matched case-insensitively ("Full Name" works for full_name).
+Students are imported by a coordinator, enrollments by a coordinator or the
+class teacher, grades by the teacher who owns the assignments. Roster emails
+without an account get one created when the server has SUPABASE_SERVICE_ROLE_KEY;
+otherwise those rows are reported and can be imported again after sign-up.
+The grades percentage column is optional; without it the percentage is the
+score over the points of the assignment's questions.
+
+Environment:
+  PROXILEARN_AUTH_COOKIE   Cookie header of the importing coordinator or teacher (required)
+  IMPORT_BATCH_SIZE        rows per request (default 500, server limit 1000)
+  IMPORT_ERRORS_FILE       write rejected rows as CSV (row, error)
+"""
+
+import csv
+import itertools
+import os
+import sys
+import time
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+AUTH_COOKIE = os.environ.get("PROXILEARN_AUTH_COOKIE")
+BATCH_SIZE = int(os.environ.get("IMPORT_BATCH_SIZE", "500"))
+ERRORS_FILE = os.environ.get("IMPORT_ERRORS_FILE")
+KINDS = ("students", "enrollments", "grades")
+MAX_RETRIES = 5
+
+
+def normalize_header(name):
+    return "_".join(name.strip().lower().split())
+
+
+def read_batches(path):
+    """Yield lists of row dicts, each tagged with its line number in the file"""
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        reader = csv.DictReader(handle)
+        reader.fieldnames = [normalize_header(name) for name in reader.fieldnames or []]
+        rows = ({**row, "row": reader.line_num} for row in reader)
+        while True:
+            batch = list(itertools.islice(rows, BATCH_SIZE))
+            if not batch:
+                return
+            yield batch
+
+
+class BulkImporter:
+    def __init__(self, kind, path, dry_run):
+        self.kind = kind
+        self.path = path
+        self.dry_run = dry_run
+        self.session = requests.Session()
+        self.session.headers["Cookie"] = AUTH_COOKIE
+        self.totals = {"received": 0, "imported": 0, "created": 0, "countsUpdated": 0}
+        self.errors = []
+
+    def send(self, batch):
+        for attempt in range(MAX_RETRIES):
+            response = self.session.post(f"{API_BASE}/import/{self.kind}",
+                                         json={"rows": batch, "dryRun": self.dry_run}, timeout=300)
+            if response.status_code != 429:
+                break
+            wait = int(response.headers.get("Retry-After", "1"))
+            print(f"   ⏳ Rate limited, retrying in {wait}s ({attempt + 1}/{MAX_RETRIES})")
+            time.sleep(wait)
+        if response.status_code != 200:
+            body = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+            raise RuntimeError(f"HTTP {response.status_code}: {body.get('error')} {body.get('details') or ''}".strip())
+        return response.json()
+
+    def write_errors(self):
+        with open(ERRORS_FILE, "w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=["row", "error"])
+            writer.writeheader()
+            writer.writerows(self.errors)
+        print(f"Rejected rows written to {ERRORS_FILE}")
+
+    def run(self):
+        print("=" * 80)
+        print(f"PROXILEARN BULK IMPORT - {self.kind.upper()}{' (DRY RUN)' if self.dry_run else ''}")
+        print("=" * 80)
+        print(f"File: {self.path}, {BATCH_SIZE} rows per batch")
+        print()
+
+        started = time.perf_counter()
+        for number, batch in enumerate(read_batches(self.path), start=1):
+            try:
+                result = self.send(batch)
+            except (requests.RequestException, RuntimeError) as error:
+                # Earlier batches are committed; rerunning is safe because every import is an upsert
+                print(f"❌ Batch {number} (rows {batch[0]['row']}-{batch[-1]['row']}) failed: {error}")
+                print("   Batches before this one are saved; fix the problem and rerun the whole file.")
+                return False
+
+            for key in self.totals:
+                self.totals[key] += result.get(key, 0)
+            self.errors.extend(result["errors"])
+            elapsed = time.perf_counter() - started
+            print(f"📦 Batch {number}: {result['imported']}/{result['received']} rows imported, "
+                  f"{len(result['errors'])} rejected | total {self.totals['received']} rows, "
+                  f"{self.totals['received'] / elapsed:.0f} rows/s")
+
+        elapsed = time.perf_counter() - started
+        print()
+        print(f"Rows read: {self.totals['received']} in {elapsed:.1f}s")
+        print(f"Imported: {self.totals['imported']}" + (" (would be)" if self.dry_run else ""))
+        if self.kind == "students":
+            print(f"Accounts {'to create' if self.dry_run else 'created'}: {self.totals['created']}")
+        if self.totals["countsUpdated"]:
+            print(f"Student counts recomputed: {self.totals['countsUpdated']}")
+
+        if self.errors:
+            print(f"❌ Rejected: {len(self.errors)} rows")
+            for error in self.errors[:20]:
+                print(f"   line {error['row']}: {error['error']}")
+            if len(self.errors) > 20:
+                print(f"   ... and {len(self.errors) - 20} more")
+            if ERRORS_FILE:
+                self.write_errors()
+        else:
+            print("✅ No rows rejected")
+        return not self.errors
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--dry-run"]
+    if len(args) != 2 or args[0] not in KINDS:
+        print(f"Usage: python bulk_import.py <{'|'.join(KINDS)}> <file.csv> [--dry-run]")
+        raise SystemExit(2)
+    if not AUTH_COOKIE:
+        print("⏭️  SKIP - set PROXILEARN_AUTH_COOKIE to the Cookie header of the importing coordinator or teacher")
+        raise SystemExit(0)
+
+    raise SystemExit(0 if BulkImporter(args[0], args[1], "--dry-run" in sys.argv).run() else 1)
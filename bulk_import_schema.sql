@@ -0,0 +1,425 @@
+-- ================================================================================================
+-- BULK IMPORT - SUPABASE SQL SCHEMA EXTENSION
+-- ================================================================================================
+-- Set-based import of student rosters, class enrollments and grades, used by
+-- POST /api/import/{kind} and bulk_import.py. Each call upserts one batch of CSV rows in a single
+-- statement per table (one transaction), and recomputes the derived student counts once for the
+-- batch instead of once per row through the per-row count triggers.
+-- Prerequisites: Student, Teacher and Coordinator Phase schemas must be applied first.
+-- Execute this script in your Supabase SQL editor.
+--
+-- Every function takes p_rows as a JSON array of objects with a "row" number (the CSV line, echoed
+-- back in errors) and returns
+--   { "received": n, "imported": n, "errors": [{ "row": n, "error": "..." }], "dry_run": bool }
+-- Errors are raised with SQLSTATE 42501 when the caller's role may not import that kind of data.
+
+-- ------------------------------------------------------------------------------------------------
+-- 1. SUPPORTING INDEX - Email lookups
+-- ------------------------------------------------------------------------------------------------
+-- Enrollment and grade rows name students by email; each batch joins on lower(email).
+CREATE INDEX IF NOT EXISTS idx_user_profiles_email_lower
+    ON public.user_profiles(lower(email));
+
+-- ------------------------------------------------------------------------------------------------
+-- 2. SKIPPABLE COUNT TRIGGERS
+-- ------------------------------------------------------------------------------------------------
+-- The import functions set proxilearn.bulk_import for their own transaction; both triggers then
+-- return immediately and the function recomputes the counts of the affected rows at the end.
+-- Outside an import the trigger bodies are unchanged.
+CREATE OR REPLACE FUNCTION update_coordinator_assignment_student_count()
+RETURNS TRIGGER AS $$
+DECLARE
+    coord_assignment RECORD;
+BEGIN
+    IF current_setting('proxilearn.bulk_import', true) = 'on' THEN
+        RETURN COALESCE(NEW, OLD);
+    END IF;
+
+    -- Update student counts for all relevant coordinator assignments
+    FOR coord_assignment IN (
+        SELECT ca.id, ca.grade_level, ca.section FROM public.coordinator_assignments ca
+        WHERE ca.grade_level = COALESCE(NEW.grade_level, OLD.grade_level)
+        AND (ca.section IS NULL OR ca.section = COALESCE(NEW.section, OLD.section))
+        AND ca.is_active = true
+    ) LOOP
+        UPDATE public.coordinator_assignments
+        SET student_count = (
+            SELECT COUNT(*) FROM public.user_profiles up
+            WHERE up.role = 'student'
+            AND up.grade_level = coord_assignment.grade_level
+            AND (coord_assignment.section IS NULL OR up.section = coord_assignment.section)
+            AND COALESCE(up.is_active, true) = true
+        ),
+        updated_at = NOW()
+        WHERE id = coord_assignment.id;
+    END LOOP;
+
+    RETURN COALESCE(NEW, OLD);
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION update_student_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF current_setting('proxilearn.bulk_import', true) = 'on' THEN
+        RETURN COALESCE(NEW, OLD);
+    END IF;
+
+    IF TG_OP = 'INSERT' AND NEW.is_active = true THEN
+        UPDATE public.teacher_classes
+        SET student_count = student_count + 1, updated_at = NOW()
+        WHERE id = NEW.teacher_class_id;
+    ELSIF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND NEW.is_active = false AND OLD.is_active = true) THEN
+        UPDATE public.teacher_classes
+        SET student_count = student_count - 1, updated_at = NOW()
+        WHERE id = COALESCE(OLD.teacher_class_id, NEW.teacher_class_id);
+    ELSIF TG_OP = 'UPDATE' AND NEW.is_active = true AND OLD.is_active = false THEN
+        UPDATE public.teacher_classes
+        SET student_count = student_count + 1, updated_at = NOW()
+        WHERE id = NEW.teacher_class_id;
+    END IF;
+
+    RETURN COALESCE(NEW, OLD);
+END;
+$$ LANGUAGE plpgsql;
+
+-- ------------------------------------------------------------------------------------------------
+-- 3. STUDENT ROSTER IMPORT - user_profiles upsert + coordinator_assignments.student_count
+-- ------------------------------------------------------------------------------------------------
+-- Rows: { row, email, full_name, grade_level, section, phone }. Caller: a coordinator; students
+-- join the coordinator's school.
+--
+-- Profiles are keyed by auth user id, so a student needs an account first. Emails without one are
+-- returned in "missing" instead of failing the batch; the API creates those accounts (when it has
+-- the service role key) and sends the rows again. An email that belongs to a teacher,
+-- coordinator or another school's student is reported as an error and left untouched.
+CREATE OR REPLACE FUNCTION public.bulk_import_students(
+    p_rows JSONB,
+    p_dry_run BOOLEAN DEFAULT false
+)
+RETURNS JSONB
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    caller_school UUID;
+    imported INTEGER := 0;
+    counts_updated INTEGER := 0;
+    errors JSONB;
+    missing JSONB;
+BEGIN
+    SELECT school_id INTO caller_school
+    FROM public.user_profiles
+    WHERE id = auth.uid() AND role = 'coordinator';
+
+    IF caller_school IS NULL THEN
+        RAISE EXCEPTION 'Only coordinators with a school can import students' USING ERRCODE = '42501';
+    END IF;
+
+    PERFORM set_config('proxilearn.bulk_import', 'on', true);
+
+    CREATE TEMP TABLE import_students ON COMMIT DROP AS
+    WITH input AS (
+        SELECT r."row" AS line, lower(trim(r.email)) AS email, trim(r.full_name) AS full_name,
+               trim(r.grade_level) AS grade_level, NULLIF(trim(r.section), '') AS section,
+               NULLIF(trim(r.phone), '') AS phone,
+               -- The last row for an email wins; earlier ones are reported as duplicates
+               row_number() OVER (PARTITION BY lower(trim(r.email)) ORDER BY r."row" DESC) AS dup_rank
+        FROM jsonb_to_recordset(p_rows) AS r("row" INTEGER, email TEXT, full_name TEXT,
+                                             grade_level TEXT, section TEXT, phone TEXT)
+    )
+    SELECT i.*, u.id AS user_id,
+           up.grade_level AS old_grade_level,
+           CASE
+               WHEN i.dup_rank > 1 THEN 'Duplicate email in this batch; a later row was used'
+               WHEN up.role IS NOT NULL AND up.role <> 'student' THEN 'Email belongs to a ' || up.role || ' account'
+               WHEN up.school_id IS NOT NULL AND up.school_id <> caller_school THEN 'Email belongs to a student of another school'
+           END AS error
+    FROM input i
+    LEFT JOIN auth.users u ON u.email = i.email
+    LEFT JOIN public.user_profiles up ON up.id = u.id;
+
+    SELECT COALESCE(jsonb_agg(jsonb_build_object('row', line, 'error', error) ORDER BY line), '[]'::JSONB)
+    INTO errors
+    FROM import_students WHERE error IS NOT NULL;
+
+    SELECT COALESCE(jsonb_agg(jsonb_build_object(
+               'row', line, 'email', email, 'full_name', full_name,
+               'grade_level', grade_level, 'section', section, 'phone', phone
+           ) ORDER BY line), '[]'::JSONB)
+    INTO missing
+    FROM import_students WHERE user_id IS NULL AND error IS NULL;
+
+    IF NOT p_dry_run THEN
+        INSERT INTO public.user_profiles (
+            id, email, full_name, role, school_id, grade_level, section, phone,
+            is_active, onboarding_completed
+        )
+        SELECT user_id, email, full_name, 'student', caller_school, grade_level, section, phone,
+               true, true
+        FROM import_students
+        WHERE user_id IS NOT NULL AND error IS NULL
+        ON CONFLICT (id) DO UPDATE SET
+            full_name = EXCLUDED.full_name,
+            role = 'student',
+            school_id = EXCLUDED.school_id,
+            grade_level = EXCLUDED.grade_level,
+            section = EXCLUDED.section,
+            phone = COALESCE(EXCLUDED.phone, public.user_profiles.phone),
+            is_active = true,
+            onboarding_completed = true;
+        GET DIAGNOSTICS imported = ROW_COUNT;
+
+        -- One recount per affected coordinator assignment, with the trigger's counting rule;
+        -- grade levels students moved out of are recounted as well
+        WITH affected AS (
+            SELECT grade_level FROM import_students WHERE user_id IS NOT NULL AND error IS NULL
+            UNION
+            SELECT old_grade_level FROM import_students WHERE old_grade_level IS NOT NULL AND error IS NULL
+        ), recount AS (
+            SELECT ca.id, (
+                SELECT COUNT(*) FROM public.user_profiles up
+                WHERE up.role = 'student'
+                AND up.grade_level = ca.grade_level
+                AND (ca.section IS NULL OR up.section = ca.section)
+                AND COALESCE(up.is_active, true) = true
+            ) AS student_count
+            FROM public.coordinator_assignments ca
+            WHERE ca.is_active = true AND ca.grade_level IN (SELECT grade_level FROM affected)
+        )
+        UPDATE public.coordinator_assignments ca
+        SET student_count = recount.student_count, updated_at = NOW()
+        FROM recount
+        WHERE ca.id = recount.id AND ca.student_count IS DISTINCT FROM recount.student_count;
+        GET DIAGNOSTICS counts_updated = ROW_COUNT;
+    ELSE
+        SELECT COUNT(*) INTO imported FROM import_students WHERE user_id IS NOT NULL AND error IS NULL;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'received', jsonb_array_length(p_rows),
+        'imported', imported,
+        'missing', missing,
+        'errors', errors,
+        'counts_updated', counts_updated,
+        'dry_run', p_dry_run
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- ------------------------------------------------------------------------------------------------
+-- 4. ENROLLMENT IMPORT - student_class_enrollment upsert + teacher_classes.student_count
+-- ------------------------------------------------------------------------------------------------
+-- Rows: { row, email, teacher_class_id }. Caller: a coordinator (any class taught in their school)
+-- or a teacher (their own classes). Re-importing an inactive enrollment re-activates it.
+CREATE OR REPLACE FUNCTION public.bulk_import_enrollments(
+    p_rows JSONB,
+    p_dry_run BOOLEAN DEFAULT false
+)
+RETURNS JSONB
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    caller RECORD;
+    imported INTEGER := 0;
+    counts_updated INTEGER := 0;
+    errors JSONB;
+BEGIN
+    SELECT id, role, school_id INTO caller
+    FROM public.user_profiles
+    WHERE id = auth.uid() AND role IN ('coordinator', 'teacher') AND school_id IS NOT NULL;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Only teachers and coordinators with a school can import enrollments' USING ERRCODE = '42501';
+    END IF;
+
+    PERFORM set_config('proxilearn.bulk_import', 'on', true);
+
+    CREATE TEMP TABLE import_enrollments ON COMMIT DROP AS
+    WITH input AS (
+        SELECT r."row" AS line, lower(trim(r.email)) AS email, r.teacher_class_id
+        FROM jsonb_to_recordset(p_rows) AS r("row" INTEGER, email TEXT, teacher_class_id UUID)
+    )
+    SELECT i.*, up.id AS student_id, tc.id AS class_id,
+           CASE
+               WHEN up.id IS NULL THEN 'No student with this email in your school'
+               WHEN tc.id IS NULL THEN 'Class not found or not yours to manage'
+           END AS error
+    FROM input i
+    LEFT JOIN public.user_profiles up
+        ON lower(up.email) = i.email AND up.role = 'student' AND up.school_id = caller.school_id
+    LEFT JOIN (
+        SELECT c.id FROM public.teacher_classes c
+        JOIN public.user_profiles t ON t.id = c.teacher_id
+        WHERE t.school_id = caller.school_id
+        AND (caller.role = 'coordinator' OR c.teacher_id = caller.id)
+    ) tc ON tc.id = i.teacher_class_id;
+
+    SELECT COALESCE(jsonb_agg(jsonb_build_object('row', line, 'error', error) ORDER BY line), '[]'::JSONB)
+    INTO errors
+    FROM import_enrollments WHERE error IS NOT NULL;
+
+    IF NOT p_dry_run THEN
+        INSERT INTO public.student_class_enrollment (student_id, teacher_class_id, is_active)
+        SELECT DISTINCT student_id, class_id, true
+        FROM import_enrollments
+        WHERE error IS NULL
+        ON CONFLICT (student_id, teacher_class_id) DO UPDATE SET is_active = true;
+        GET DIAGNOSTICS imported = ROW_COUNT;
+
+        WITH recount AS (
+            SELECT c.id, (
+                SELECT COUNT(*) FROM public.student_class_enrollment e
+                WHERE e.teacher_class_id = c.id AND e.is_active = true
+            ) AS student_count
+            FROM public.teacher_classes c
+            WHERE c.id IN (SELECT class_id FROM import_enrollments WHERE error IS NULL)
+        )
+        UPDATE public.teacher_classes c
+        SET student_count = recount.student_count, updated_at = NOW()
+        FROM recount
+        WHERE c.id = recount.id AND c.student_count IS DISTINCT FROM recount.student_count;
+        GET DIAGNOSTICS counts_updated = ROW_COUNT;
+    ELSE
+        SELECT COUNT(DISTINCT (student_id, class_id)) INTO imported FROM import_enrollments WHERE error IS NULL;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'received', jsonb_array_length(p_rows),
+        'imported', imported,
+        'errors', errors,
+        'counts_updated', counts_updated,
+        'dry_run', p_dry_run
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- ------------------------------------------------------------------------------------------------
+-- 5. GRADE IMPORT - teacher_gradebook upsert
+-- ------------------------------------------------------------------------------------------------
+-- Rows: { row, email, assignment_id, score, percentage, comments }. Caller: the teacher who owns
+-- the assignments. Imported scores are manual scores, so they take precedence over auto scores
+-- exactly like PUT /api/teacher/gradebook/{id}; grade letters come from the existing trigger.
+-- Without a percentage column, percentage is the score over the points of all the assignment's
+-- questions, as in bulk_update_grades (unchanged when the assignment has no questions with points).
+CREATE OR REPLACE FUNCTION public.bulk_import_grades(
+    p_rows JSONB,
+    p_dry_run BOOLEAN DEFAULT false
+)
+RETURNS JSONB
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    caller_school UUID;
+    imported INTEGER := 0;
+    errors JSONB;
+BEGIN
+    SELECT school_id INTO caller_school
+    FROM public.user_profiles
+    WHERE id = auth.uid() AND role = 'teacher';
+
+    IF caller_school IS NULL THEN
+        RAISE EXCEPTION 'Only teachers with a school can import grades' USING ERRCODE = '42501';
+    END IF;
+
+    CREATE TEMP TABLE import_grades ON COMMIT DROP AS
+    WITH input AS (
+        SELECT r."row" AS line, lower(trim(r.email)) AS email, r.assignment_id, r.score, r.percentage,
+               NULLIF(trim(r.comments), '') AS comments,
+               row_number() OVER (PARTITION BY lower(trim(r.email)), r.assignment_id ORDER BY r."row" DESC) AS dup_rank
+        FROM jsonb_to_recordset(p_rows) AS r("row" INTEGER, email TEXT, assignment_id UUID,
+                                             score DECIMAL(5,2), percentage DECIMAL(5,2), comments TEXT)
+    ), totals AS (
+        -- One sum per assignment in the batch, not per row
+        SELECT q.assignment_id, SUM(q.points) AS total_points
+        FROM public.assignment_questions q
+        WHERE q.assignment_id IN (SELECT DISTINCT assignment_id FROM input)
+        GROUP BY q.assignment_id
+    )
+    SELECT i.line, i.email, i.assignment_id, i.score, i.comments, i.dup_rank,
+           COALESCE(
+               i.percentage,
+               CASE WHEN tot.total_points > 0
+                    THEN LEAST(ROUND(i.score / tot.total_points * 100, 2), 999.99)
+               END
+           ) AS percentage,
+           up.id AS student_id,
+           CASE
+               WHEN up.id IS NULL THEN 'No student with this email in your school'
+               WHEN a.id IS NULL THEN 'Assignment not found or not yours'
+               WHEN i.dup_rank > 1 THEN 'Duplicate grade in this batch; a later row was used'
+           END AS error
+    FROM input i
+    LEFT JOIN public.user_profiles up
+        ON lower(up.email) = i.email AND up.role = 'student' AND up.school_id = caller_school
+    LEFT JOIN public.assignments a
+        ON a.id = i.assignment_id AND a.teacher_id = auth.uid()
+    LEFT JOIN totals tot ON tot.assignment_id = i.assignment_id;
+
+    SELECT COALESCE(jsonb_agg(jsonb_build_object('row', line, 'error', error) ORDER BY line), '[]'::JSONB)
+    INTO errors
+    FROM import_grades WHERE error IS NOT NULL;
+
+    IF NOT p_dry_run THEN
+        INSERT INTO public.teacher_gradebook (
+            teacher_id, student_id, assignment_id, manual_score, final_score, percentage,
+            comments, graded_at, graded_by
+        )
+        SELECT auth.uid(), student_id, assignment_id, score, score, percentage,
+               comments, NOW(), auth.uid()
+        FROM import_grades
+        WHERE error IS NULL
+        ON CONFLICT (teacher_id, student_id, assignment_id) DO UPDATE SET
+            manual_score = EXCLUDED.manual_score,
+            final_score = EXCLUDED.final_score,
+            percentage = COALESCE(EXCLUDED.percentage, public.teacher_gradebook.percentage),
+            comments = COALESCE(EXCLUDED.comments, public.teacher_gradebook.comments),
+            graded_at = NOW(),
+            graded_by = EXCLUDED.graded_by,
+            updated_at = NOW();
+        GET DIAGNOSTICS imported = ROW_COUNT;
+    ELSE
+        SELECT COUNT(*) INTO imported FROM import_grades WHERE error IS NULL;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'received', jsonb_array_length(p_rows),
+        'imported', imported,
+        'errors', errors,
+        'dry_run', p_dry_run
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION public.bulk_import_students(JSONB, BOOLEAN) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.bulk_import_enrollments(JSONB, BOOLEAN) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.bulk_import_grades(JSONB, BOOLEAN) TO authenticated;
+
+-- ================================================================================================
+-- SCHEMA VALIDATION FOR BULK IMPORT
+-- ================================================================================================
+
+DO $$
+DECLARE
+    function_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO function_count
+    FROM pg_proc p
+    JOIN pg_namespace n ON n.oid = p.pronamespace
+    WHERE n.nspname = 'public'
+    AND p.proname IN ('bulk_import_students', 'bulk_import_enrollments', 'bulk_import_grades');
+
+    IF function_count = 3 THEN
+        RAISE NOTICE '🎉 SUCCESS: bulk_import_students(), bulk_import_enrollments() and bulk_import_grades() created';
+        RAISE NOTICE '⚡ Student count triggers skip per-row work during imports';
+        RAISE NOTICE '✅ Bulk import is ready: python bulk_import.py students roster.csv';
+    ELSE
+        RAISE NOTICE '❌ Only % of 3 bulk import functions exist - check the SQL execution log for errors.', function_count;
+    END IF;
+END $$;
+
+-- ================================================================================================
+-- END OF BULK IMPORT SCHEMA
+-- ================================================================================================
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Bundle Size Benchmark for the Proxilearn App Shell and Role Dashboards
+Reads the output of `next build` and reports the JavaScript each role downloads
+on first load: the shared app shell for `/` plus the lazily loaded dashboard
+chunk for that role. Sizes are reported raw and gzipped, with an estimated
+download time on a slow school connection.
+
+Render times are measured in the browser instead: start `next dev` with
+NEXT_PUBLIC_PROFILE_RENDERS=true and watch the `[render]` console lines while
+a dashboard mounts and while the quiz timer ticks.
+
+Environment:
+  NEXT_BUILD_DIR        build output directory (default .next)
+  CONNECTION_KBPS       bandwidth for the download estimate (default 1600, "fast 3G")
+  FIRST_LOAD_BUDGET_KB  fail when any role's gzipped first load exceeds this
+"""
+
+import gzip
+import json
+import os
+
+BUILD_DIR = os.environ.get("NEXT_BUILD_DIR", ".next")
+CONNECTION_KBPS = int(os.environ.get("CONNECTION_KBPS", "1600"))
+FIRST_LOAD_BUDGET_KB = os.environ.get("FIRST_LOAD_BUDGET_KB")
+
+# An API path only each dashboard calls; it survives minification and identifies
+# the role's lazy chunk among the emitted static chunks
+DASHBOARD_MARKERS = {
+    "student": b"/api/study-groups",
+    "teacher": b"/api/teacher/dashboard",
+    "coordinator": b"/api/coordinator/dashboard",
+}
+
+
+def chunk_sizes(files):
+    """Raw and gzipped byte counts for a set of build files (JavaScript only)"""
+    raw = compressed = 0
+    for name in sorted(set(files)):
+        if not name.endswith(".js"):
+            continue
+        with open(os.path.join(BUILD_DIR, name), "rb") as handle:
+            data = handle.read()
+        raw += len(data)
+        compressed += len(gzip.compress(data, compresslevel=9))
+    return raw, compressed
+
+
+def download_ms(num_bytes):
+    return num_bytes * 8 / (CONNECTION_KBPS * 1000) * 1000
+
+
+def shell_files():
+    """Chunks the browser loads for `/` before any dashboard is requested"""
+    with open(os.path.join(BUILD_DIR, "app-build-manifest.json")) as handle:
+        pages = json.load(handle)["pages"]
+    files = []
+    for page in ("/layout", "/page"):
+        for key, chunks in pages.items():
+            if key == page or key.endswith(page):
+                files.extend(chunks)
+    return files
+
+
+def dashboard_files():
+    """Lazily loaded chunks for each dashboard, found by their marker string"""
+    chunks_dir = os.path.join(BUILD_DIR, "static", "chunks")
+    files = {role: [] for role in DASHBOARD_MARKERS}
+    for root, _, names in os.walk(chunks_dir):
+        for name in names:
+            if not name.endswith(".js"):
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as handle:
+                data = handle.read()
+            for role, marker in DASHBOARD_MARKERS.items():
+                if marker in data:
+                    files[role].append(os.path.relpath(path, BUILD_DIR))
+    return files
+
+
+def format_kb(num_bytes):
+    return f"{num_bytes / 1024:.1f} KB"
+
+
+def run():
+    print("=" * 80)
+    print("PROXILEARN BUNDLE SIZE BENCHMARK")
+    print("=" * 80)
+    print(f"Build directory: {BUILD_DIR}, connection: {CONNECTION_KBPS} kbps")
+    print()
+
+    shell = shell_files()
+    shell_raw, shell_gzip = chunk_sizes(shell)
+    print(f"📦 App shell (/): {format_kb(shell_raw)} raw, {format_kb(shell_gzip)} gzipped, "
+          f"~{download_ms(shell_gzip):.0f}ms to download")
+    print()
+
+    within_budget = True
+    for role, files in dashboard_files().items():
+        # A dashboard found only in shell chunks is being imported statically again
+        lazy = [name for name in files if name not in shell]
+        if not lazy:
+            print(f"❌ {role}: no lazy chunk found - is the dashboard still imported statically?")
+            print()
+            within_budget = False
+            continue
+        role_raw, role_gzip = chunk_sizes(lazy)
+        total_gzip = shell_gzip + role_gzip
+        print(f"📊 {role.capitalize()} dashboard chunk: {format_kb(role_raw)} raw, {format_kb(role_gzip)} gzipped")
+        print(f"   First load for a {role}: {format_kb(total_gzip)} gzipped, "
+              f"~{download_ms(total_gzip):.0f}ms to download")
+        if FIRST_LOAD_BUDGET_KB and total_gzip / 1024 > float(FIRST_LOAD_BUDGET_KB):
+            print(f"   ❌ Over the {FIRST_LOAD_BUDGET_KB} KB budget")
+            within_budget = False
+        print()
+
+    return within_budget
+
+
+if __name__ == "__main__":
+    if not os.path.exists(os.path.join(BUILD_DIR, "app-build-manifest.json")):
+        print(f"⏭️  SKIP - no build found in {BUILD_DIR}; run `yarn build` first")
+        raise SystemExit(0)
+
+    raise SystemExit(0 if run() else 1)
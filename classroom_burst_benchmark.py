@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Classroom Burst Benchmark for Proxilearn Assignment Questions
+Simulates a class opening a freshly published quiz within the same second:
+N concurrent GET /api/assignments/{id}/questions requests, then a second burst of
+conditional requests (If-None-Match), reporting latency percentiles and how
+many requests were served from cache, coalesced or answered with 304.
+
+Environment:
+  PROXILEARN_ASSIGNMENT_ID   published assignment to open (required)
+  PROXILEARN_STUDENT_COOKIES file with one student Cookie header per line, or
+  PROXILEARN_AUTH_COOKIE     a single Cookie header reused for every request
+  PROXILEARN_TEACHER_COOKIE  optional; re-publish first to measure the warmed cache
+  BURST_SIZE                 concurrent students (default 40)
+"""
+
+import os
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+ASSIGNMENT_ID = os.environ.get("PROXILEARN_ASSIGNMENT_ID")
+TEACHER_COOKIE = os.environ.get("PROXILEARN_TEACHER_COOKIE")
+BURST_SIZE = int(os.environ.get("BURST_SIZE", "40"))
+
+
+def load_student_cookies():
+    """Cookie headers to spread the burst over (cycled when fewer than BURST_SIZE)"""
+    path = os.environ.get("PROXILEARN_STUDENT_COOKIES")
+    if path:
+        with open(path) as handle:
+            cookies = [line.strip() for line in handle if line.strip()]
+        if cookies:
+            return cookies
+    single = os.environ.get("PROXILEARN_AUTH_COOKIE")
+    return [single] if single else []
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class ClassroomBurstBenchmark:
+    def __init__(self, cookies):
+        self.cookies = cookies
+        self.etags = {}
+
+    def publish(self):
+        """Re-publish as the teacher so the burst hits a freshly warmed cache"""
+        started = time.perf_counter()
+        response = requests.put(
+            f"{API_BASE}/teacher/assignments/{ASSIGNMENT_ID}/publish",
+            headers={'Cookie': TEACHER_COOKIE}
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"Publish (with cache warm-up): HTTP {response.status_code} in {elapsed:.0f}ms")
+        print()
+        return response.status_code == 200
+
+    def run_burst(self, name, conditional=False):
+        barrier = threading.Barrier(BURST_SIZE)
+
+        def open_quiz(index):
+            cookie = self.cookies[index % len(self.cookies)]
+            headers = {'Cookie': cookie, 'Accept': 'application/json'}
+            if conditional and cookie in self.etags:
+                headers['If-None-Match'] = self.etags[cookie]
+            session = requests.Session()
+            barrier.wait()
+            started = time.perf_counter()
+            response = session.get(f"{API_BASE}/assignments/{ASSIGNMENT_ID}/questions", headers=headers)
+            elapsed = (time.perf_counter() - started) * 1000
+            if response.headers.get('ETag'):
+                self.etags[cookie] = response.headers['ETag']
+            return {
+                'status': response.status_code,
+                'latency_ms': elapsed,
+                'cache': response.headers.get('X-Response-Cache', 'none'),
+                'bytes': len(response.content)
+            }
+
+        wall_started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=BURST_SIZE) as pool:
+            results = list(pool.map(open_quiz, range(BURST_SIZE)))
+        wall = (time.perf_counter() - wall_started) * 1000
+
+        latencies = [r['latency_ms'] for r in results]
+        statuses = Counter(r['status'] for r in results)
+        cache = Counter(r['cache'] for r in results)
+        print(f"📊 {name}: {BURST_SIZE} concurrent requests in {wall:.0f}ms wall time")
+        print(f"   Latency p50 {statistics.median(latencies):.0f}ms, p95 {percentile(latencies, 95):.0f}ms, "
+              f"max {max(latencies):.0f}ms")
+        print(f"   Status codes: {dict(statuses)}")
+        print(f"   Server cache: {dict(cache)}")
+        print(f"   Bytes transferred: {sum(r['bytes'] for r in results)}")
+        print()
+        return results
+
+    def run(self):
+        print("=" * 80)
+        print("PROXILEARN CLASSROOM BURST BENCHMARK")
+        print("=" * 80)
+        print(f"Assignment: {ASSIGNMENT_ID}, students: {BURST_SIZE}, distinct sessions: {len(self.cookies)}")
+        print()
+
+        if TEACHER_COOKIE and not self.publish():
+            print("❌ Publish failed; continuing against the current cache state")
+            print()
+
+        first = self.run_burst("Quiz start burst")
+        self.run_burst("Revalidation burst (If-None-Match)", conditional=True)
+
+        failures = [r for r in first if r['status'] != 200]
+        return len(failures) == 0
+
+
+if __name__ == "__main__":
+    student_cookies = load_student_cookies()
+    if not ASSIGNMENT_ID or not student_cookies:
+        print("⏭️  SKIP - set PROXILEARN_ASSIGNMENT_ID and PROXILEARN_STUDENT_COOKIES "
+              "(or PROXILEARN_AUTH_COOKIE) to run the benchmark")
+        raise SystemExit(0)
+
+    benchmark = ClassroomBurstBenchmark(student_cookies)
+    raise SystemExit(0 if benchmark.run() else 1)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Compact Answer Storage Benchmark for Proxilearn Quiz Submissions
+Starts and submits one attempt per student on a published assignment, timing
+POST /api/assignments/{id}/submit (which also reads back the detailed results),
+then asks the database for the storage used by student_responses rows versus
+answers packed on assignment_attempts, and how long reading every answer of the
+assignment takes from each.
+
+Run it once against a server with COMPACT_ANSWERS unset and once with
+COMPACT_ANSWERS=true (after applying compact_answers_schema.sql); the storage
+mode of each run is detected from the submitted attempts.
+
+Environment:
+  PROXILEARN_STUDENT_COOKIES  file with one student Cookie header per line (required)
+  PROXILEARN_ASSIGNMENT_ID    published assignment with attempts left (required)
+  NEXT_PUBLIC_SUPABASE_URL    with SUPABASE_SERVICE_ROLE_KEY, enables the storage report
+  SUPABASE_SERVICE_ROLE_KEY
+"""
+
+import os
+import statistics
+import time
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+ASSIGNMENT_ID = os.environ.get("PROXILEARN_ASSIGNMENT_ID")
+SUPABASE_URL = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
+SERVICE_ROLE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+
+
+def load_student_cookies():
+    path = os.environ.get("PROXILEARN_STUDENT_COOKIES")
+    if not path:
+        return []
+    with open(path) as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def pick_answer(question):
+    options = question.get("options")
+    if isinstance(options, list) and options:
+        return options[0]
+    if isinstance(options, dict) and options:
+        return next(iter(options))
+    return "A"
+
+
+def storage_report():
+    response = requests.post(
+        f"{SUPABASE_URL}/rest/v1/rpc/answer_storage_report",
+        json={"p_assignment_id": ASSIGNMENT_ID},
+        headers={"apikey": SERVICE_ROLE_KEY, "Authorization": f"Bearer {SERVICE_ROLE_KEY}"},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+class CompactAnswersBenchmark:
+    def __init__(self, cookies):
+        self.cookies = cookies
+
+    def submit_once(self, cookie):
+        session = requests.Session()
+        session.headers["Cookie"] = cookie
+
+        questions = session.get(f"{API_BASE}/assignments/{ASSIGNMENT_ID}/questions").json().get("questions", [])
+        started = session.post(f"{API_BASE}/assignments/{ASSIGNMENT_ID}/start", json={})
+        if started.status_code != 200:
+            return {"status": started.status_code, "error": started.json().get("error")}
+
+        payload = {
+            "answers": {question["id"]: pick_answer(question) for question in questions},
+            "attemptNumber": started.json()["attemptNumber"],
+            "timeSpent": 60,
+        }
+        began = time.perf_counter()
+        response = session.post(f"{API_BASE}/assignments/{ASSIGNMENT_ID}/submit", json=payload)
+        latency = (time.perf_counter() - began) * 1000
+        body = response.json()
+        return {
+            "status": response.status_code,
+            "latency_ms": latency,
+            "questions": len(questions),
+            "results": len(body.get("results", {}).get("detailedResults", [])),
+            "packed": bool(body.get("attempt", {}).get("answers")),
+            "error": body.get("error"),
+        }
+
+    def run(self):
+        print("=" * 80)
+        print("PROXILEARN COMPACT ANSWER STORAGE BENCHMARK")
+        print("=" * 80)
+        print(f"Assignment: {ASSIGNMENT_ID}, students: {len(self.cookies)}")
+        print()
+
+        results = [self.submit_once(cookie) for cookie in self.cookies]
+        submitted = [r for r in results if r["status"] == 200]
+        failed = [r for r in results if r["status"] != 200]
+
+        if submitted:
+            latencies = [r["latency_ms"] for r in submitted]
+            modes = {"packed answers" if r["packed"] else "student_responses rows" for r in submitted}
+            incomplete = [r for r in submitted if r["results"] != r["questions"]]
+            print(f"📊 Submit + detailed results ({', '.join(sorted(modes))}): {len(submitted)} submissions")
+            print(f"   Latency p50 {statistics.median(latencies):.0f}ms, p95 {percentile(latencies, 95):.0f}ms, "
+                  f"max {max(latencies):.0f}ms")
+            if incomplete:
+                print(f"   ❌ {len(incomplete)} submissions returned fewer detailed results than questions")
+            print()
+        for r in failed[:5]:
+            print(f"❌ Submission failed with {r['status']}: {r['error']}")
+
+        if SUPABASE_URL and SERVICE_ROLE_KEY:
+            report = storage_report()
+            for name, stats in (("student_responses rows", report["student_responses"]),
+                                ("packed answers", report["packed_answers"])):
+                print(f"📦 {name}: {stats['total_bytes'] / 1024:.1f} KB total, "
+                      f"{stats['bytes_per_answer'] or 0} bytes per answer")
+                if stats.get("assignment_read_ms") is not None:
+                    print(f"   Reading this assignment's {stats['assignment_rows_read']} answers: "
+                          f"{stats['assignment_read_ms']}ms")
+            print()
+        else:
+            print("⏭️  SKIP: storage report (NEXT_PUBLIC_SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY not set)")
+            print()
+
+        return not failed
+
+
+if __name__ == "__main__":
+    student_cookies = load_student_cookies()
+    if not student_cookies or not ASSIGNMENT_ID:
+        print("⏭️  SKIP - set PROXILEARN_STUDENT_COOKIES and PROXILEARN_ASSIGNMENT_ID to run the benchmark")
+        raise SystemExit(0)
+
+    raise SystemExit(0 if CompactAnswersBenchmark(student_cookies).run() else 1)
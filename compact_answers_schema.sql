@@ -0,0 +1,393 @@
+-- ================================================================================================
+-- COMPACT ANSWER STORAGE - SUPABASE SQL SCHEMA EXTENSION
+-- ================================================================================================
+-- Stores an attempt's graded answers packed into one JSONB column on assignment_attempts instead
+-- of one student_responses row per question. A 30-question quiz taken by 2,000 students becomes
+-- 2,000 values instead of 60,000 rows (each repeating assignment, student and attempt number and
+-- carrying five index entries). Per-question rows are derived on demand by a view.
+-- Prerequisites: Student Phase, Teacher Phase and Regrade schemas must be applied first.
+-- Execute this script in your Supabase SQL editor, then set COMPACT_ANSWERS=true on the API
+-- server. Attempts submitted before the switch keep their student_responses rows; every reader
+-- below handles both representations.
+--
+-- Packed format, keyed by question id:
+--   { "<question_id>": [student_answer, is_correct, points_earned], ... }
+
+-- ------------------------------------------------------------------------------------------------
+-- 1. PACKED ANSWERS COLUMN
+-- ------------------------------------------------------------------------------------------------
+ALTER TABLE public.assignment_attempts ADD COLUMN IF NOT EXISTS answers JSONB;
+
+ALTER TABLE public.assignment_attempts DROP CONSTRAINT IF EXISTS assignment_attempts_answers_object;
+ALTER TABLE public.assignment_attempts ADD CONSTRAINT assignment_attempts_answers_object
+    CHECK (answers IS NULL OR jsonb_typeof(answers) = 'object');
+
+-- ------------------------------------------------------------------------------------------------
+-- 2. PER-QUESTION VIEW - One row per answered question, whichever way it was stored
+-- ------------------------------------------------------------------------------------------------
+-- security_invoker keeps the RLS policies of the underlying tables in force for API callers.
+CREATE OR REPLACE VIEW public.attempt_answers
+WITH (security_invoker = true) AS
+SELECT
+    t.id AS attempt_id,
+    t.assignment_id,
+    t.student_id,
+    t.attempt_number,
+    a.key::UUID AS question_id,
+    a.value->>0 AS student_answer,
+    (a.value->>1)::BOOLEAN AS is_correct,
+    (a.value->>2)::DECIMAL(5,2) AS points_earned,
+    t.submitted_at
+FROM public.assignment_attempts t
+CROSS JOIN LATERAL jsonb_each(t.answers) a
+WHERE t.answers IS NOT NULL
+UNION ALL
+SELECT
+    t.id,
+    r.assignment_id,
+    r.student_id,
+    r.attempt_number,
+    r.question_id,
+    r.student_answer,
+    r.is_correct,
+    r.points_earned,
+    r.submitted_at
+FROM public.student_responses r
+JOIN public.assignment_attempts t ON (
+    t.assignment_id = r.assignment_id AND
+    t.student_id = r.student_id AND
+    t.attempt_number = r.attempt_number
+)
+WHERE t.answers IS NULL;
+
+GRANT SELECT ON public.attempt_answers TO authenticated;
+
+-- ------------------------------------------------------------------------------------------------
+-- 3. REGRADE FUNCTION - Regrade packed answers alongside student_responses rows
+-- ------------------------------------------------------------------------------------------------
+-- Supersedes the version in regrade_schema.sql. Same parameters, rules and result; step 2 also
+-- re-marks packed answers and step 3 sums either representation.
+CREATE OR REPLACE FUNCTION public.regrade_assignment(
+    p_assignment_id UUID,
+    p_answer_key JSONB DEFAULT NULL,
+    p_dry_run BOOLEAN DEFAULT false
+)
+RETURNS JSONB
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    result JSONB;
+    question_changes JSONB := '[]'::JSONB;
+    attempt_changes JSONB := '[]'::JSONB;
+    responses_changed INTEGER := 0;
+    packed_changed INTEGER := 0;
+    attempts_regraded INTEGER := 0;
+    gradebook_updated INTEGER := 0;
+    attempts_checked INTEGER := 0;
+BEGIN
+    -- Only the owning teacher may regrade; the row lock serializes concurrent regrades
+    PERFORM 1
+    FROM public.assignments
+    WHERE id = p_assignment_id AND teacher_id = auth.uid()
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Assignment not found or not owned by the current teacher'
+            USING ERRCODE = '42501';
+    END IF;
+
+    IF p_answer_key IS NOT NULL AND jsonb_typeof(p_answer_key) <> 'object' THEN
+        RAISE EXCEPTION 'Answer key must be a JSON object of question_id -> correct_answer'
+            USING ERRCODE = '22023';
+    END IF;
+
+    BEGIN
+        -- Step 1: apply answer key changes (old values read from the pre-update snapshot)
+        IF p_answer_key IS NOT NULL THEN
+            WITH changed AS (
+                UPDATE public.assignment_questions q
+                SET correct_answer = k.value,
+                    updated_at = NOW()
+                FROM jsonb_each_text(p_answer_key) k
+                JOIN public.assignment_questions old ON old.id = k.key::UUID
+                WHERE q.id = old.id
+                AND q.assignment_id = p_assignment_id
+                AND q.correct_answer IS DISTINCT FROM k.value
+                RETURNING q.id, old.correct_answer AS old_answer, q.correct_answer AS new_answer
+            )
+            SELECT COALESCE(jsonb_agg(jsonb_build_object(
+                'questionId', id,
+                'oldAnswer', old_answer,
+                'newAnswer', new_answer
+            )), '[]'::JSONB)
+            INTO question_changes
+            FROM changed;
+        END IF;
+
+        -- Step 2: re-mark every response against the current answer key
+        WITH graded AS (
+            SELECT
+                r.id,
+                COALESCE(r.student_answer = q.correct_answer, false) AS is_correct,
+                CASE WHEN r.student_answer = q.correct_answer THEN q.points ELSE 0 END AS points_earned
+            FROM public.student_responses r
+            JOIN public.assignment_questions q ON q.id = r.question_id
+            WHERE r.assignment_id = p_assignment_id
+        ),
+        changed AS (
+            UPDATE public.student_responses r
+            SET is_correct = g.is_correct,
+                points_earned = g.points_earned
+            FROM graded g
+            WHERE r.id = g.id
+            AND (r.is_correct IS DISTINCT FROM g.is_correct OR r.points_earned IS DISTINCT FROM g.points_earned)
+            RETURNING r.id
+        )
+        SELECT COUNT(*) INTO responses_changed FROM changed;
+
+        -- Step 2b: the same for answers packed on the attempt, rewriting each changed attempt once
+        WITH graded AS (
+            SELECT
+                t.id AS attempt_id,
+                a.key,
+                a.value->0 AS student_answer,
+                COALESCE(a.value->>0 = q.correct_answer, false) AS is_correct,
+                CASE WHEN a.value->>0 = q.correct_answer THEN q.points ELSE 0 END AS points_earned,
+                (a.value->>1)::BOOLEAN AS old_is_correct,
+                (a.value->>2)::DECIMAL AS old_points_earned
+            FROM public.assignment_attempts t
+            CROSS JOIN LATERAL jsonb_each(t.answers) a
+            JOIN public.assignment_questions q ON q.id = a.key::UUID
+            WHERE t.assignment_id = p_assignment_id
+            AND t.answers IS NOT NULL
+        ),
+        repacked AS (
+            SELECT
+                attempt_id,
+                jsonb_object_agg(key, jsonb_build_array(student_answer, is_correct, points_earned)) AS answers,
+                COUNT(*) FILTER (WHERE
+                    old_is_correct IS DISTINCT FROM is_correct OR old_points_earned IS DISTINCT FROM points_earned
+                ) AS changed_count
+            FROM graded
+            GROUP BY attempt_id
+        ),
+        changed AS (
+            UPDATE public.assignment_attempts t
+            SET answers = r.answers
+            FROM repacked r
+            WHERE t.id = r.attempt_id
+            AND r.changed_count > 0
+            RETURNING r.changed_count
+        )
+        SELECT COALESCE(SUM(changed_count), 0) INTO packed_changed FROM changed;
+
+        responses_changed := responses_changed + packed_changed;
+
+        -- Step 3: recompute attempt totals and push changed scores into the gradebook
+        WITH possible AS (
+            SELECT COALESCE(SUM(points), 0) AS total_points
+            FROM public.assignment_questions
+            WHERE assignment_id = p_assignment_id
+        ),
+        scores AS (
+            SELECT
+                t.id AS attempt_id,
+                CASE
+                    WHEN t.answers IS NOT NULL THEN COALESCE((
+                        SELECT SUM((a.value->>2)::DECIMAL) FROM jsonb_each(t.answers) a
+                    ), 0)
+                    ELSE COALESCE(SUM(r.points_earned), 0)
+                END AS total_score
+            FROM public.assignment_attempts t
+            LEFT JOIN public.student_responses r ON (
+                t.answers IS NULL AND
+                r.assignment_id = t.assignment_id AND
+                r.student_id = t.student_id AND
+                r.attempt_number = t.attempt_number
+            )
+            WHERE t.assignment_id = p_assignment_id
+            AND t.status IN ('completed', 'submitted', 'graded')
+            GROUP BY t.id
+        ),
+        recomputed AS (
+            SELECT
+                s.attempt_id,
+                s.total_score,
+                CASE
+                    WHEN p.total_points > 0 THEN ROUND((s.total_score / p.total_points) * 100, 2)
+                    ELSE 0
+                END AS percentage_score
+            FROM scores s
+            CROSS JOIN possible p
+        ),
+        changed_attempts AS (
+            UPDATE public.assignment_attempts t
+            SET total_score = c.total_score,
+                percentage_score = c.percentage_score
+            FROM recomputed c
+            JOIN public.assignment_attempts old ON old.id = c.attempt_id
+            WHERE t.id = c.attempt_id
+            AND (t.total_score IS DISTINCT FROM c.total_score OR t.percentage_score IS DISTINCT FROM c.percentage_score)
+            RETURNING
+                t.id AS attempt_id,
+                t.student_id,
+                t.attempt_number,
+                old.total_score AS old_score,
+                t.total_score AS new_score,
+                old.percentage_score AS old_percentage,
+                t.percentage_score AS new_percentage
+        ),
+        changed_gradebook AS (
+            UPDATE public.teacher_gradebook g
+            SET auto_score = c.new_score,
+                final_score = COALESCE(g.manual_score, c.new_score),
+                percentage = c.new_percentage,
+                graded_at = NOW(),
+                updated_at = NOW()
+            FROM changed_attempts c
+            WHERE g.assignment_attempt_id = c.attempt_id
+            RETURNING g.id
+        )
+        SELECT
+            (SELECT COUNT(*) FROM recomputed),
+            (SELECT COUNT(*) FROM changed_attempts),
+            (SELECT COUNT(*) FROM changed_gradebook),
+            COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'attemptId', attempt_id,
+                    'studentId', student_id,
+                    'attemptNumber', attempt_number,
+                    'oldScore', old_score,
+                    'newScore', new_score,
+                    'oldPercentage', old_percentage,
+                    'newPercentage', new_percentage,
+                    'oldGradeLetter', calculate_grade_letter(old_percentage),
+                    'newGradeLetter', calculate_grade_letter(new_percentage)
+                ) ORDER BY new_percentage - old_percentage DESC)
+                FROM changed_attempts
+            ), '[]'::JSONB)
+        INTO attempts_checked, attempts_regraded, gradebook_updated, attempt_changes;
+
+        IF p_dry_run THEN
+            -- Roll back this block's changes; the computed diff survives in variables
+            RAISE EXCEPTION 'regrade dry run' USING ERRCODE = 'RG001';
+        END IF;
+    EXCEPTION
+        WHEN SQLSTATE 'RG001' THEN
+            NULL;
+    END;
+
+    result := jsonb_build_object(
+        'assignment_id', p_assignment_id,
+        'dry_run', p_dry_run,
+        'questions_updated', jsonb_array_length(question_changes),
+        'responses_changed', responses_changed,
+        'attempts_checked', attempts_checked,
+        'attempts_regraded', attempts_regraded,
+        'gradebook_updated', gradebook_updated,
+        'question_changes', question_changes,
+        'attempt_changes', attempt_changes,
+        'regraded_at', NOW()
+    );
+
+    RETURN result;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION public.regrade_assignment(UUID, JSONB, BOOLEAN) TO authenticated;
+
+-- ------------------------------------------------------------------------------------------------
+-- 4. STORAGE REPORT - Compare the two representations (used by compact_answers_benchmark.py)
+-- ------------------------------------------------------------------------------------------------
+-- Bytes include indexes and TOAST for student_responses (all partitions when partitioned) and
+-- the packed column's stored size for assignment_attempts. With p_assignment_id, also times
+-- reading every per-question row of that assignment from each representation.
+CREATE OR REPLACE FUNCTION public.answer_storage_report(p_assignment_id UUID DEFAULT NULL)
+RETURNS JSONB AS $$
+DECLARE
+    row_bytes BIGINT;
+    row_count BIGINT;
+    packed_bytes BIGINT;
+    packed_attempts BIGINT;
+    packed_answers BIGINT;
+    read_rows BIGINT;
+    read_packed BIGINT;
+    started TIMESTAMPTZ;
+    row_read_ms NUMERIC;
+    packed_read_ms NUMERIC;
+BEGIN
+    SELECT COALESCE(SUM(pg_total_relation_size(relid)), 0) INTO row_bytes
+    FROM pg_partition_tree('public.student_responses');
+    SELECT COUNT(*) INTO row_count FROM public.student_responses;
+
+    SELECT COALESCE(SUM(pg_column_size(answers)), 0), COUNT(*),
+           COALESCE(SUM((SELECT COUNT(*) FROM jsonb_object_keys(answers))), 0)
+    INTO packed_bytes, packed_attempts, packed_answers
+    FROM public.assignment_attempts
+    WHERE answers IS NOT NULL;
+
+    IF p_assignment_id IS NOT NULL THEN
+        started := clock_timestamp();
+        SELECT COUNT(*) INTO read_rows
+        FROM public.student_responses r
+        JOIN public.assignment_questions q ON q.id = r.question_id
+        WHERE r.assignment_id = p_assignment_id;
+        row_read_ms := EXTRACT(EPOCH FROM clock_timestamp() - started) * 1000;
+
+        started := clock_timestamp();
+        SELECT COUNT(*) INTO read_packed
+        FROM public.assignment_attempts t
+        CROSS JOIN LATERAL jsonb_each(t.answers) a
+        JOIN public.assignment_questions q ON q.id = a.key::UUID
+        WHERE t.assignment_id = p_assignment_id
+        AND t.answers IS NOT NULL;
+        packed_read_ms := EXTRACT(EPOCH FROM clock_timestamp() - started) * 1000;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'student_responses', jsonb_build_object(
+            'rows', row_count,
+            'total_bytes', row_bytes,
+            'bytes_per_answer', CASE WHEN row_count > 0 THEN ROUND(row_bytes::NUMERIC / row_count, 1) END,
+            'assignment_rows_read', read_rows,
+            'assignment_read_ms', ROUND(row_read_ms, 2)
+        ),
+        'packed_answers', jsonb_build_object(
+            'attempts', packed_attempts,
+            'answers', packed_answers,
+            'total_bytes', packed_bytes,
+            'bytes_per_answer', CASE WHEN packed_answers > 0 THEN ROUND(packed_bytes::NUMERIC / packed_answers, 1) END,
+            'assignment_rows_read', read_packed,
+            'assignment_read_ms', ROUND(packed_read_ms, 2)
+        )
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+REVOKE EXECUTE ON FUNCTION public.answer_storage_report(UUID) FROM PUBLIC, anon, authenticated;
+
+-- ================================================================================================
+-- SCHEMA VALIDATION FOR COMPACT ANSWER STORAGE
+-- ================================================================================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'assignment_attempts' AND column_name = 'answers'
+    ) AND EXISTS (
+        SELECT 1 FROM information_schema.views
+        WHERE table_schema = 'public' AND table_name = 'attempt_answers'
+    ) THEN
+        RAISE NOTICE '🎉 SUCCESS: Packed answers column and attempt_answers view created';
+        RAISE NOTICE '⚡ regrade_assignment() now regrades packed answers too';
+        RAISE NOTICE '✅ Set COMPACT_ANSWERS=true on the API server to store new submissions packed';
+    ELSE
+        RAISE NOTICE '❌ Compact answer storage is incomplete - check the SQL execution log for errors.';
+    END IF;
+END $$;
+
+-- ================================================================================================
+-- END OF COMPACT ANSWER STORAGE SCHEMA
+-- ================================================================================================
@@ -0,0 +1,36 @@
+'use client'
+
+import { useState, useEffect, useRef } from 'react'
+import { Badge } from '@/components/ui/badge'
+import { Clock } from 'lucide-react'
+import { formatTime } from '@/components/dashboards/shared'
+
+const secondsUntil = (deadline) => Math.max(0, Math.ceil((deadline - Date.now()) / 1000))
+
+// Quiz countdown. The per-second tick is local state here, so only this badge
+// re-renders while a quiz is open instead of the whole student dashboard.
+export default function QuizTimer({ deadline, onExpire }) {
+  const [secondsLeft, setSecondsLeft] = useState(() => secondsUntil(deadline))
+  const onExpireRef = useRef(onExpire)
+  onExpireRef.current = onExpire // Submit with the latest answers
+
+  useEffect(() => {
+    setSecondsLeft(secondsUntil(deadline))
+    const interval = setInterval(() => {
+      const remaining = secondsUntil(deadline)
+      setSecondsLeft(remaining)
+      if (remaining === 0) {
+        clearInterval(interval)
+        onExpireRef.current()
+      }
+    }, 1000)
+    return () => clearInterval(interval)
+  }, [deadline])
+
+  return (
+    <Badge variant="outline" className="text-orange-600 border-orange-200">
+      <Clock className="w-4 h-4 mr-1" />
+      {formatTime(secondsLeft)}
+    </Badge>
+  )
+}
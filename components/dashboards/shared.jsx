@@ -0,0 +1,43 @@
+import { BookOpen, Users, User, GraduationCap, UserCheck, Crown } from 'lucide-react'
+
+// Display helpers shared by the role dashboards and the app shell
+export const getRoleIcon = (role) => {
+  switch (role) {
+    case 'student': return <GraduationCap className="w-4 h-4" />
+    case 'teacher': return <BookOpen className="w-4 h-4" />
+    case 'coordinator': return <UserCheck className="w-4 h-4" />
+    case 'principal': return <Users className="w-4 h-4" />
+    case 'chairman': return <Crown className="w-4 h-4" />
+    default: return <User className="w-4 h-4" />
+  }
+}
+
+export const getRoleBadgeColor = (role) => {
+  switch (role) {
+    case 'student': return 'bg-blue-100 text-blue-800'
+    case 'teacher': return 'bg-green-100 text-green-800'
+    case 'coordinator': return 'bg-purple-100 text-purple-800'
+    case 'principal': return 'bg-orange-100 text-orange-800'
+    case 'chairman': return 'bg-red-100 text-red-800'
+    default: return 'bg-gray-100 text-gray-800'
+  }
+}
+
+export const formatTime = (seconds) => {
+  const mins = Math.floor(seconds / 60)
+  const secs = seconds % 60
+  return `${mins}:${secs.toString().padStart(2, '0')}`
+}
+
+export const getSubjectColor = (subject) => {
+  const colors = {
+    'Mathematics': 'bg-blue-100 text-blue-800',
+    'Science': 'bg-green-100 text-green-800',
+    'English': 'bg-purple-100 text-purple-800',
+    'History': 'bg-orange-100 text-orange-800',
+    'Geography': 'bg-teal-100 text-teal-800',
+  }
+  return colors[subject] || 'bg-gray-100 text-gray-800'
+}
+
+export const emojis = ['😊', '👍', '❤️', '😄', '🎉', '👏', '🔥', '💯', '🤔', '😅']
@@ -0,0 +1,1183 @@
+'use client'
+
+import { useState } from 'react'
+import { Button } from '@/components/ui/button'
+import { Input } from '@/components/ui/input'
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
+import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs'
+import { Label } from '@/components/ui/label'
+import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select'
+import { Avatar, AvatarFallback, AvatarImage } from '@/components/ui/avatar'
+import { Badge } from '@/components/ui/badge'
+import { Dialog, DialogContent, DialogDescription, DialogFooter, DialogHeader, DialogTitle, DialogTrigger } from '@/components/ui/dialog'
+import { Textarea } from '@/components/ui/textarea'
+import { Progress } from '@/components/ui/progress'
+import { BookOpen, Users, Settings, LogOut, GraduationCap, Clock, CheckCircle, MessageSquare,
+         TrendingUp, Brain, HelpCircle, Plus, Target, Award, Filter } from 'lucide-react'
+import { toast } from 'sonner'
+import { useApiQuery, invalidateQueries, mutateOptimistic, authorizedJson } from '@/lib/queryClient'
+import { getRoleIcon, getRoleBadgeColor, getSubjectColor } from '@/components/dashboards/shared'
+
+// Teacher dashboard: overview, lesson plans, assignments, gradebook, analytics and messages.
+// Loaded on demand from app/page.js so other roles never download it.
+export default function TeacherDashboard({ user, profile, supabase, handleSignOut }) {
+  // Teacher Dashboard State
+  const [teacherActiveTab, setTeacherActiveTab] = useState('overview')
+  const [teacherResources, setTeacherResources] = useState([])
+
+  // Dashboard data, served from the query cache and revalidated in the background
+  const dashboardQuery = useApiQuery(supabase, '/api/teacher/dashboard')
+  const subjectsQuery = useApiQuery(supabase, '/api/subjects')
+  const lessonPlansQuery = useApiQuery(supabase, '/api/teacher/lesson-plans')
+  const assignmentsQuery = useApiQuery(supabase, '/api/teacher/assignments')
+  const gradebookQuery = useApiQuery(supabase, '/api/teacher/gradebook')
+  const analyticsQuery = useApiQuery(supabase, '/api/teacher/analytics')
+  const messagesQuery = useApiQuery(supabase, '/api/teacher/messages')
+  const teacherDashboard = dashboardQuery.data || null
+  const subjects = subjectsQuery.data?.subjects || []
+  const lessonPlans = lessonPlansQuery.data?.lesson_plans || []
+  const teacherAssignments = assignmentsQuery.data?.assignments || []
+  const gradebook = gradebookQuery.data?.grades || []
+  const teacherAnalytics = analyticsQuery.data || null
+  const teacherMessages = messagesQuery.data?.messages || []
+  const loadingData = [dashboardQuery, subjectsQuery, lessonPlansQuery, assignmentsQuery, gradebookQuery, analyticsQuery, messagesQuery]
+    .some(query => query.isLoading)
+  
+  // Teacher UI State
+  const [showCreateLessonPlan, setShowCreateLessonPlan] = useState(false)
+  const [showCreateAssignment, setShowCreateAssignment] = useState(false)
+  const [showCreateResource, setShowCreateResource] = useState(false)
+  const [showSendMessage, setShowSendMessage] = useState(false)
+  const [lessonPlanForm, setLessonPlanForm] = useState({
+    title: '', subject: '', grade: '', duration: 40, objectives: '', ai_prompt: ''
+  })
+  const [assignmentForm, setAssignmentForm] = useState({
+    title: '', subject: '', description: '', difficulty: 'medium', questionCount: 10, timeLimit: 30
+  })
+
+  // Teacher Action Functions
+  const createLessonPlan = async (formData) => {
+    try {
+      const response = await fetch('/api/teacher/lesson-plans', {
+        method: 'POST',
+        headers: {
+          'Authorization': `Bearer ${(await supabase.auth.getSession()).data.session?.access_token}`,
+          'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({
+          title: formData.get('title'),
+          subject_id: formData.get('subject'),
+          grade_level: formData.get('grade'),
+          duration_minutes: parseInt(formData.get('duration')),
+          learning_objectives: formData.get('objectives').split('\n').filter(obj => obj.trim()),
+          ai_prompt: formData.get('ai_prompt'),
+          ai_generated: !!formData.get('ai_prompt')
+        })
+      })
+      const data = await response.json()
+      
+      if (response.ok) {
+        toast.success('Lesson plan created successfully!')
+        setShowCreateLessonPlan(false)
+        setLessonPlanForm({ title: '', subject: '', grade: '', duration: 40, objectives: '', ai_prompt: '' })
+        invalidateQueries('/api/teacher/lesson-plans', '/api/teacher/dashboard')
+      } else {
+        toast.error(data.error || 'Failed to create lesson plan')
+      }
+    } catch (error) {
+      console.error('Error creating lesson plan:', error)
+      toast.error('Failed to create lesson plan')
+    }
+  }
+
+  const createAssignment = async (formData) => {
+    try {
+      const response = await fetch('/api/teacher/assignments', {
+        method: 'POST',
+        headers: {
+          'Authorization': `Bearer ${(await supabase.auth.getSession()).data.session?.access_token}`,
+          'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({
+          title: formData.get('title'),
+          subject_id: formData.get('subject'),
+          description: formData.get('description'),
+          difficulty: formData.get('difficulty'),
+          question_count: parseInt(formData.get('questionCount')),
+          time_limit_minutes: parseInt(formData.get('timeLimit')),
+          due_date: formData.get('dueDate'),
+          ai_generated: true
+        })
+      })
+      const data = await response.json()
+      
+      if (response.ok) {
+        toast.success('Assignment created successfully!')
+        setShowCreateAssignment(false)
+        setAssignmentForm({ title: '', subject: '', description: '', difficulty: 'medium', questionCount: 10, timeLimit: 30 })
+        invalidateQueries('/api/teacher/assignments', '/api/teacher/dashboard')
+      } else {
+        toast.error(data.error || 'Failed to create assignment')
+      }
+    } catch (error) {
+      console.error('Error creating assignment:', error)
+      toast.error('Failed to create assignment')
+    }
+  }
+
+  const publishAssignment = async (assignmentId) => {
+    try {
+      // Flip the badge immediately; rolled back if the publish fails
+      await mutateOptimistic({
+        optimistic: {
+          '/api/teacher/assignments': (data) => ({
+            ...data,
+            assignments: (data?.assignments || []).map(assignment =>
+              assignment.id === assignmentId ? { ...assignment, is_published: true, status: 'published' } : assignment
+            )
+          })
+        },
+        mutate: () => authorizedJson(supabase, `/api/teacher/assignments/${assignmentId}/publish`, {
+          method: 'PUT'
+        }),
+        invalidate: ['/api/teacher/assignments']
+      })
+      toast.success('Assignment published successfully!')
+    } catch (error) {
+      console.error('Error publishing assignment:', error)
+      toast.error(error.message || 'Failed to publish assignment')
+    }
+  }
+
+  // Teacher Dashboard
+  return (
+    <div className="min-h-screen bg-gray-50">
+      {/* Header */}
+      <header className="bg-white border-b border-gray-200 px-4 py-3">
+        <div className="flex items-center justify-between max-w-7xl mx-auto">
+          <div className="flex items-center gap-4">
+            <div className="p-2 bg-blue-600 rounded-lg">
+              <BookOpen className="w-6 h-6 text-white" />
+            </div>
+            <div>
+              <h1 className="text-xl font-semibold text-gray-900">Proxilearn</h1>
+              <p className="text-sm text-gray-500">Teacher Dashboard</p>
+            </div>
+          </div>
+          
+          <div className="flex items-center gap-4">
+            <Badge className={`${getRoleBadgeColor(profile.role)} border-0`}>
+              {getRoleIcon(profile.role)}
+              <span className="ml-1 capitalize">{profile.role}</span>
+            </Badge>
+            
+            <div className="flex items-center gap-3">
+              <Avatar className="w-8 h-8">
+                <AvatarImage src={profile.avatar_url} />
+                <AvatarFallback className="bg-blue-100 text-blue-600">
+                  {profile.full_name?.charAt(0) || user.email?.charAt(0)}
+                </AvatarFallback>
+              </Avatar>
+              <div className="hidden sm:block">
+                <p className="text-sm font-medium text-gray-900">{profile.full_name}</p>
+                <p className="text-xs text-gray-500">{user.email}</p>
+              </div>
+            </div>
+            
+            <Button
+              variant="ghost"
+              size="sm"
+              onClick={handleSignOut}
+              className="text-gray-500 hover:text-gray-700"
+            >
+              <LogOut className="w-4 h-4" />
+            </Button>
+          </div>
+        </div>
+      </header>
+
+      {/* Main Content */}
+      <main className="max-w-7xl mx-auto px-4 py-8">
+        <div className="mb-8">
+          <h2 className="text-2xl font-bold text-gray-900 mb-2">
+            Welcome back, {profile.full_name?.split(' ')[0] || 'Teacher'}! 👋
+          </h2>
+          <p className="text-gray-600">
+            Ready to inspire and educate your students today?
+          </p>
+        </div>
+
+        {loadingData ? (
+          <div className="flex items-center justify-center py-12">
+            <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>
+          </div>
+        ) : (
+          <Tabs value={teacherActiveTab} onValueChange={setTeacherActiveTab} className="space-y-6">
+            <TabsList className="grid w-full grid-cols-5 max-w-3xl">
+              <TabsTrigger value="overview" className="flex items-center gap-2">
+                <Target className="w-4 h-4" />
+                <span className="hidden sm:inline">Overview</span>
+              </TabsTrigger>
+              <TabsTrigger value="lessons" className="flex items-center gap-2">
+                <Brain className="w-4 h-4" />
+                <span className="hidden sm:inline">Lessons</span>
+              </TabsTrigger>
+              <TabsTrigger value="assignments" className="flex items-center gap-2">
+                <BookOpen className="w-4 h-4" />
+                <span className="hidden sm:inline">Assignments</span>
+              </TabsTrigger>
+              <TabsTrigger value="gradebook" className="flex items-center gap-2">
+                <Award className="w-4 h-4" />
+                <span className="hidden sm:inline">Gradebook</span>
+              </TabsTrigger>
+              <TabsTrigger value="analytics" className="flex items-center gap-2">
+                <TrendingUp className="w-4 h-4" />
+                <span className="hidden sm:inline">Analytics</span>
+              </TabsTrigger>
+            </TabsList>
+
+            {/* Overview Tab */}
+            <TabsContent value="overview" className="space-y-6">
+              <div className="flex items-center justify-between">
+                <h3 className="text-lg font-semibold">Dashboard Overview</h3>
+              </div>
+
+              {teacherDashboard && (
+                <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
+                  <Card>
+                    <CardContent className="p-6">
+                      <div className="flex items-center justify-between">
+                        <div>
+                          <p className="text-sm text-gray-600">Total Classes</p>
+                          <p className="text-2xl font-bold">{teacherDashboard.total_classes || 0}</p>
+                        </div>
+                        <Users className="w-8 h-8 text-blue-600" />
+                      </div>
+                    </CardContent>
+                  </Card>
+
+                  <Card>
+                    <CardContent className="p-6">
+                      <div className="flex items-center justify-between">
+                        <div>
+                          <p className="text-sm text-gray-600">Total Students</p>
+                          <p className="text-2xl font-bold">{teacherDashboard.total_students || 0}</p>
+                        </div>
+                        <GraduationCap className="w-8 h-8 text-green-600" />
+                      </div>
+                    </CardContent>
+                  </Card>
+
+                  <Card>
+                    <CardContent className="p-6">
+                      <div className="flex items-center justify-between">
+                        <div>
+                          <p className="text-sm text-gray-600">Assignments</p>
+                          <p className="text-2xl font-bold">{teacherDashboard.total_assignments || 0}</p>
+                        </div>
+                        <BookOpen className="w-8 h-8 text-purple-600" />
+                      </div>
+                    </CardContent>
+                  </Card>
+
+                  <Card>
+                    <CardContent className="p-6">
+                      <div className="flex items-center justify-between">
+                        <div>
+                          <p className="text-sm text-gray-600">Lesson Plans</p>
+                          <p className="text-2xl font-bold">{teacherDashboard.total_lesson_plans || 0}</p>
+                        </div>
+                        <Brain className="w-8 h-8 text-orange-600" />
+                      </div>
+                    </CardContent>
+                  </Card>
+                </div>
+              )}
+
+              <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+                {/* Recent Assignments */}
+                <Card>
+                  <CardHeader>
+                    <CardTitle className="flex items-center gap-2">
+                      <BookOpen className="w-5 h-5" />
+                      Recent Assignments
+                    </CardTitle>
+                  </CardHeader>
+                  <CardContent>
+                    {teacherAssignments.length === 0 ? (
+                      <p className="text-gray-500 text-center py-4">No assignments yet</p>
+                    ) : (
+                      <div className="space-y-3">
+                        {teacherAssignments.slice(0, 5).map((assignment) => (
+                          <div key={assignment.id} className="flex items-center justify-between p-3 bg-gray-50 rounded-lg">
+                            <div>
+                              <p className="font-medium">{assignment.title}</p>
+                              <p className="text-sm text-gray-600">{assignment.subject}</p>
+                            </div>
+                            <Badge 
+                              variant={assignment.status === 'published' ? 'default' : 'secondary'}
+                              className={assignment.status === 'published' ? 'bg-green-600' : ''}
+                            >
+                              {assignment.status}
+                            </Badge>
+                          </div>
+                        ))}
+                      </div>
+                    )}
+                  </CardContent>
+                </Card>
+
+                {/* Recent Lesson Plans */}
+                <Card>
+                  <CardHeader>
+                    <CardTitle className="flex items-center gap-2">
+                      <Brain className="w-5 h-5" />
+                      Recent Lesson Plans
+                    </CardTitle>
+                  </CardHeader>
+                  <CardContent>
+                    {lessonPlans.length === 0 ? (
+                      <p className="text-gray-500 text-center py-4">No lesson plans yet</p>
+                    ) : (
+                      <div className="space-y-3">
+                        {lessonPlans.slice(0, 5).map((plan) => (
+                          <div key={plan.id} className="flex items-center justify-between p-3 bg-gray-50 rounded-lg">
+                            <div>
+                              <p className="font-medium">{plan.title}</p>
+                              <p className="text-sm text-gray-600">{plan.subject}</p>
+                            </div>
+                            <Badge variant="outline">
+                              {plan.duration_minutes}min
+                            </Badge>
+                          </div>
+                        ))}
+                      </div>
+                    )}
+                  </CardContent>
+                </Card>
+              </div>
+            </TabsContent>
+
+            {/* AI Lesson Plans Tab */}
+            <TabsContent value="lessons" className="space-y-6">
+              <div className="flex items-center justify-between">
+                <h3 className="text-lg font-semibold">AI Lesson Planner</h3>
+                <Dialog open={showCreateLessonPlan} onOpenChange={setShowCreateLessonPlan}>
+                  <DialogTrigger asChild>
+                    <Button>
+                      <Plus className="w-4 h-4 mr-2" />
+                      Create Lesson Plan
+                    </Button>
+                  </DialogTrigger>
+                  <DialogContent className="max-w-2xl">
+                    <DialogHeader>
+                      <DialogTitle>Create AI-Powered Lesson Plan</DialogTitle>
+                      <DialogDescription>
+                        Let AI help you create comprehensive lesson plans with learning objectives, activities, and resources.
+                      </DialogDescription>
+                    </DialogHeader>
+                    <form action={createLessonPlan} className="space-y-4">
+                      <div className="grid grid-cols-2 gap-4">
+                        <div className="space-y-2">
+                          <Label htmlFor="title">Lesson Title</Label>
+                          <Input
+                            id="title"
+                            name="title"
+                            placeholder="e.g., Introduction to Photosynthesis"
+                            required
+                          />
+                        </div>
+                        <div className="space-y-2">
+                          <Label htmlFor="subject">Subject</Label>
+                          <Select name="subject" required>
+                            <SelectTrigger>
+                              <SelectValue placeholder="Select subject" />
+                            </SelectTrigger>
+                            <SelectContent>
+                              {subjects.map((subject) => (
+                                <SelectItem key={subject.id} value={subject.id}>
+                                  {subject.name}
+                                </SelectItem>
+                              ))}
+                            </SelectContent>
+                          </Select>
+                        </div>
+                      </div>
+                      <div className="grid grid-cols-2 gap-4">
+                        <div className="space-y-2">
+                          <Label htmlFor="grade">Grade Level</Label>
+                          <Input
+                            id="grade"
+                            name="grade"
+                            placeholder="e.g., Grade 8"
+                            required
+                          />
+                        </div>
+                        <div className="space-y-2">
+                          <Label htmlFor="duration">Duration (minutes)</Label>
+                          <Input
+                            id="duration"
+                            name="duration"
+                            type="number"
+                            defaultValue={40}
+                            min={15}
+                            max={120}
+                            required
+                          />
+                        </div>
+                      </div>
+                      <div className="space-y-2">
+                        <Label htmlFor="objectives">Learning Objectives (one per line)</Label>
+                        <Textarea
+                          id="objectives"
+                          name="objectives"
+                          placeholder="Students will be able to:&#10;- Explain the process of photosynthesis&#10;- Identify factors affecting photosynthesis"
+                          rows={4}
+                        />
+                      </div>
+                      <div className="space-y-2">
+                        <Label htmlFor="ai_prompt">AI Prompt (Optional)</Label>
+                        <Textarea
+                          id="ai_prompt"
+                          name="ai_prompt"
+                          placeholder="Describe what you want the AI to focus on... e.g., 'Create an interactive lesson with hands-on experiments and real-world examples'"
+                          rows={3}
+                        />
+                        <p className="text-sm text-gray-500">
+                          Let AI generate detailed content including key concepts, discussion points, activities, and resources.
+                        </p>
+                      </div>
+                      <DialogFooter>
+                        <Button type="submit">Create Lesson Plan</Button>
+                      </DialogFooter>
+                    </form>
+                  </DialogContent>
+                </Dialog>
+              </div>
+
+              {lessonPlans.length === 0 ? (
+                <Card>
+                  <CardContent className="text-center py-12">
+                    <div className="mx-auto mb-4 p-4 bg-blue-100 rounded-full w-fit">
+                      <Brain className="w-8 h-8 text-blue-600" />
+                    </div>
+                    <h3 className="text-lg font-semibold mb-2">No Lesson Plans Yet</h3>
+                    <p className="text-gray-600 mb-4">Create your first AI-powered lesson plan to get started.</p>
+                    <Button onClick={() => setShowCreateLessonPlan(true)}>
+                      <Plus className="w-4 h-4 mr-2" />
+                      Create Lesson Plan
+                    </Button>
+                  </CardContent>
+                </Card>
+              ) : (
+                <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+                  {lessonPlans.map((plan) => (
+                    <Card key={plan.id} className="hover:shadow-md transition-shadow">
+                      <CardHeader>
+                        <div className="flex items-start justify-between">
+                          <div>
+                            <CardTitle className="text-lg mb-1">{plan.title}</CardTitle>
+                            <Badge className={getSubjectColor(plan.subject)} variant="secondary">
+                              {plan.subject}
+                            </Badge>
+                          </div>
+                          {plan.ai_generated && (
+                            <Badge variant="outline" className="text-purple-600 border-purple-200">
+                              <Brain className="w-3 h-3 mr-1" />
+                              AI
+                            </Badge>
+                          )}
+                        </div>
+                      </CardHeader>
+                      <CardContent>
+                        <div className="space-y-2 text-sm">
+                          <div className="flex items-center justify-between">
+                            <span className="text-gray-500">Grade:</span>
+                            <span className="font-medium">{plan.grade_level}</span>
+                          </div>
+                          <div className="flex items-center justify-between">
+                            <span className="text-gray-500">Duration:</span>
+                            <span className="font-medium">{plan.duration_minutes} min</span>
+                          </div>
+                          <div className="flex items-center justify-between">
+                            <span className="text-gray-500">Status:</span>
+                            <Badge 
+                              variant={plan.status === 'active' ? 'default' : 'secondary'}
+                              className={plan.status === 'active' ? 'bg-green-600' : ''}
+                            >
+                              {plan.status}
+                            </Badge>
+                          </div>
+                        </div>
+                        {plan.learning_objectives && plan.learning_objectives.length > 0 && (
+                          <div className="mt-4">
+                            <p className="text-sm font-medium text-gray-700 mb-2">Objectives:</p>
+                            <ul className="text-sm text-gray-600 space-y-1">
+                              {plan.learning_objectives.slice(0, 2).map((objective, index) => (
+                                <li key={index} className="flex items-start gap-2">
+                                  <span className="text-blue-600 mt-0.5">•</span>
+                                  <span className="line-clamp-2">{objective}</span>
+                                </li>
+                              ))}
+                              {plan.learning_objectives.length > 2 && (
+                                <li className="text-gray-500">
+                                  +{plan.learning_objectives.length - 2} more...
+                                </li>
+                              )}
+                            </ul>
+                          </div>
+                        )}
+                      </CardContent>
+                      <CardContent className="pt-0">
+                        <Button variant="outline" className="w-full">
+                          <BookOpen className="w-4 h-4 mr-2" />
+                          View Details
+                        </Button>
+                      </CardContent>
+                    </Card>
+                  ))}
+                </div>
+              )}
+            </TabsContent>
+
+            {/* Assignments Tab */}
+            <TabsContent value="assignments" className="space-y-6">
+              <div className="flex items-center justify-between">
+                <h3 className="text-lg font-semibold">Assignment & Quiz Creation</h3>
+                <Dialog open={showCreateAssignment} onOpenChange={setShowCreateAssignment}>
+                  <DialogTrigger asChild>
+                    <Button>
+                      <Plus className="w-4 h-4 mr-2" />
+                      Create Assignment
+                    </Button>
+                  </DialogTrigger>
+                  <DialogContent className="max-w-2xl">
+                    <DialogHeader>
+                      <DialogTitle>Create AI-Generated Assignment</DialogTitle>
+                      <DialogDescription>
+                        Create engaging quizzes with AI-generated questions tailored to your requirements.
+                      </DialogDescription>
+                    </DialogHeader>
+                    <form action={createAssignment} className="space-y-4">
+                      <div className="grid grid-cols-2 gap-4">
+                        <div className="space-y-2">
+                          <Label htmlFor="title">Assignment Title</Label>
+                          <Input
+                            id="title"
+                            name="title"
+                            placeholder="e.g., Photosynthesis Quiz"
+                            required
+                          />
+                        </div>
+                        <div className="space-y-2">
+                          <Label htmlFor="subject">Subject</Label>
+                          <Select name="subject" required>
+                            <SelectTrigger>
+                              <SelectValue placeholder="Select subject" />
+                            </SelectTrigger>
+                            <SelectContent>
+                              {subjects.map((subject) => (
+                                <SelectItem key={subject.id} value={subject.id}>
+                                  {subject.name}
+                                </SelectItem>
+                              ))}
+                            </SelectContent>
+                          </Select>
+                        </div>
+                      </div>
+                      <div className="space-y-2">
+                        <Label htmlFor="description">Description</Label>
+                        <Textarea
+                          id="description"
+                          name="description"
+                          placeholder="Brief description of the assignment..."
+                          rows={3}
+                        />
+                      </div>
+                      <div className="grid grid-cols-3 gap-4">
+                        <div className="space-y-2">
+                          <Label htmlFor="difficulty">Difficulty</Label>
+                          <Select name="difficulty" defaultValue="medium">
+                            <SelectTrigger>
+                              <SelectValue />
+                            </SelectTrigger>
+                            <SelectContent>
+                              <SelectItem value="easy">Easy</SelectItem>
+                              <SelectItem value="medium">Medium</SelectItem>
+                              <SelectItem value="hard">Hard</SelectItem>
+                            </SelectContent>
+                          </Select>
+                        </div>
+                        <div className="space-y-2">
+                          <Label htmlFor="questionCount">Questions</Label>
+                          <Input
+                            id="questionCount"
+                            name="questionCount"
+                            type="number"
+                            defaultValue={10}
+                            min={5}
+                            max={50}
+                            required
+                          />
+                        </div>
+                        <div className="space-y-2">
+                          <Label htmlFor="timeLimit">Time Limit (min)</Label>
+                          <Input
+                            id="timeLimit"
+                            name="timeLimit"
+                            type="number"
+                            defaultValue={30}
+                            min={10}
+                            max={180}
+                            required
+                          />
+                        </div>
+                      </div>
+                      <div className="space-y-2">
+                        <Label htmlFor="dueDate">Due Date</Label>
+                        <Input
+                          id="dueDate"
+                          name="dueDate"
+                          type="date"
+                          min={new Date().toISOString().split('T')[0]}
+                          required
+                        />
+                      </div>
+                      <DialogFooter>
+                        <Button type="submit">Create Assignment</Button>
+                      </DialogFooter>
+                    </form>
+                  </DialogContent>
+                </Dialog>
+              </div>
+
+              {teacherAssignments.length === 0 ? (
+                <Card>
+                  <CardContent className="text-center py-12">
+                    <div className="mx-auto mb-4 p-4 bg-green-100 rounded-full w-fit">
+                      <BookOpen className="w-8 h-8 text-green-600" />
+                    </div>
+                    <h3 className="text-lg font-semibold mb-2">No Assignments Yet</h3>
+                    <p className="text-gray-600 mb-4">Create your first AI-generated assignment to engage your students.</p>
+                    <Button onClick={() => setShowCreateAssignment(true)}>
+                      <Plus className="w-4 h-4 mr-2" />
+                      Create Assignment
+                    </Button>
+                  </CardContent>
+                </Card>
+              ) : (
+                <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+                  {teacherAssignments.map((assignment) => (
+                    <Card key={assignment.id} className="hover:shadow-md transition-shadow">
+                      <CardHeader>
+                        <div className="flex items-start justify-between">
+                          <div>
+                            <CardTitle className="text-lg mb-1">{assignment.title}</CardTitle>
+                            <Badge className={getSubjectColor(assignment.subject)} variant="secondary">
+                              {assignment.subject}
+                            </Badge>
+                          </div>
+                          <Badge 
+                            variant={assignment.status === 'published' ? 'default' : 'secondary'}
+                            className={assignment.status === 'published' ? 'bg-green-600' : ''}
+                          >
+                            {assignment.status}
+                          </Badge>
+                        </div>
+                      </CardHeader>
+                      <CardContent>
+                        <p className="text-gray-600 text-sm mb-4 line-clamp-2">{assignment.description}</p>
+                        <div className="space-y-2 text-sm">
+                          <div className="flex items-center justify-between">
+                            <span className="text-gray-500">Questions:</span>
+                            <span className="font-medium">{assignment.question_count}</span>
+                          </div>
+                          <div className="flex items-center justify-between">
+                            <span className="text-gray-500">Time Limit:</span>
+                            <span className="font-medium">{assignment.time_limit_minutes} min</span>
+                          </div>
+                          <div className="flex items-center justify-between">
+                            <span className="text-gray-500">Difficulty:</span>
+                            <Badge variant="outline" className={
+                              assignment.difficulty === 'easy' ? 'text-green-600 border-green-200' :
+                              assignment.difficulty === 'hard' ? 'text-red-600 border-red-200' :
+                              'text-orange-600 border-orange-200'
+                            }>
+                              {assignment.difficulty}
+                            </Badge>
+                          </div>
+                          <div className="flex items-center justify-between">
+                            <span className="text-gray-500">Due Date:</span>
+                            <span className="font-medium">
+                              {new Date(assignment.due_date).toLocaleDateString()}
+                            </span>
+                          </div>
+                          {assignment.completion_stats && (
+                            <div className="flex items-center justify-between pt-2 border-t">
+                              <span className="text-gray-500">Completed:</span>
+                              <span className="font-medium text-blue-600">
+                                {assignment.completion_stats.completed}/{assignment.completion_stats.total} students
+                              </span>
+                            </div>
+                          )}
+                        </div>
+                      </CardContent>
+                      <CardContent className="pt-0">
+                        <div className="flex gap-2">
+                          {assignment.status === 'draft' ? (
+                            <Button
+                              onClick={() => publishAssignment(assignment.id)}
+                              className="flex-1"
+                            >
+                              <CheckCircle className="w-4 h-4 mr-2" />
+                              Publish
+                            </Button>
+                          ) : (
+                            <Button variant="outline" className="flex-1">
+                              <BookOpen className="w-4 h-4 mr-2" />
+                              View Results
+                            </Button>
+                          )}
+                          <Button variant="outline" size="icon">
+                            <Settings className="w-4 h-4" />
+                          </Button>
+                        </div>
+                      </CardContent>
+                    </Card>
+                  ))}
+                </div>
+              )}
+            </TabsContent>
+
+            {/* Gradebook Tab */}
+            <TabsContent value="gradebook" className="space-y-6">
+              <div className="flex items-center justify-between">
+                <h3 className="text-lg font-semibold">Grade Book & Student Performance</h3>
+                <div className="flex gap-2">
+                  <Select defaultValue="all">
+                    <SelectTrigger className="w-[180px]">
+                      <SelectValue placeholder="Filter by subject" />
+                    </SelectTrigger>
+                    <SelectContent>
+                      <SelectItem value="all">All Subjects</SelectItem>
+                      {subjects.map((subject) => (
+                        <SelectItem key={subject.id} value={subject.id}>
+                          {subject.name}
+                        </SelectItem>
+                      ))}
+                    </SelectContent>
+                  </Select>
+                  <Button variant="outline">
+                    <Settings className="w-4 h-4 mr-2" />
+                    Export Grades
+                  </Button>
+                </div>
+              </div>
+
+              {gradebook.length === 0 ? (
+                <Card>
+                  <CardContent className="text-center py-12">
+                    <div className="mx-auto mb-4 p-4 bg-orange-100 rounded-full w-fit">
+                      <Award className="w-8 h-8 text-orange-600" />
+                    </div>
+                    <h3 className="text-lg font-semibold mb-2">No Grades Yet</h3>
+                    <p className="text-gray-600">Grades will appear here once students complete assignments.</p>
+                  </CardContent>
+                </Card>
+              ) : (
+                <div className="space-y-6">
+                  {/* Grade Summary Cards */}
+                  <div className="grid grid-cols-1 md:grid-cols-4 gap-4">
+                    <Card>
+                      <CardContent className="p-6">
+                        <div className="flex items-center justify-between">
+                          <div>
+                            <p className="text-sm text-gray-600">Total Students</p>
+                            <p className="text-2xl font-bold">{new Set(gradebook.map(g => g.student_id)).size}</p>
+                          </div>
+                          <Users className="w-8 h-8 text-blue-600" />
+                        </div>
+                      </CardContent>
+                    </Card>
+                    <Card>
+                      <CardContent className="p-6">
+                        <div className="flex items-center justify-between">
+                          <div>
+                            <p className="text-sm text-gray-600">Avg Grade</p>
+                            <p className="text-2xl font-bold">
+                              {gradebook.length > 0 ? 
+                                Math.round(gradebook.reduce((sum, g) => sum + g.percentage, 0) / gradebook.length) : 0
+                              }%
+                            </p>
+                          </div>
+                          <TrendingUp className="w-8 h-8 text-green-600" />
+                        </div>
+                      </CardContent>
+                    </Card>
+                    <Card>
+                      <CardContent className="p-6">
+                        <div className="flex items-center justify-between">
+                          <div>
+                            <p className="text-sm text-gray-600">A Grades</p>
+                            <p className="text-2xl font-bold">
+                              {gradebook.filter(g => g.grade_letter?.startsWith('A')).length}
+                            </p>
+                          </div>
+                          <Award className="w-8 h-8 text-yellow-600" />
+                        </div>
+                      </CardContent>
+                    </Card>
+                    <Card>
+                      <CardContent className="p-6">
+                        <div className="flex items-center justify-between">
+                          <div>
+                            <p className="text-sm text-gray-600">Need Help</p>
+                            <p className="text-2xl font-bold">
+                              {gradebook.filter(g => g.percentage < 70).length}
+                            </p>
+                          </div>
+                          <HelpCircle className="w-8 h-8 text-red-600" />
+                        </div>
+                      </CardContent>
+                    </Card>
+                  </div>
+
+                  {/* Grades Table */}
+                  <Card>
+                    <CardHeader>
+                      <CardTitle>Student Grades</CardTitle>
+                    </CardHeader>
+                    <CardContent>
+                      <div className="overflow-x-auto">
+                        <table className="w-full">
+                          <thead>
+                            <tr className="border-b">
+                              <th className="text-left p-4 font-medium">Student</th>
+                              <th className="text-left p-4 font-medium">Assignment</th>
+                              <th className="text-left p-4 font-medium">Subject</th>
+                              <th className="text-center p-4 font-medium">Score</th>
+                              <th className="text-center p-4 font-medium">Grade</th>
+                              <th className="text-center p-4 font-medium">Status</th>
+                              <th className="text-center p-4 font-medium">Actions</th>
+                            </tr>
+                          </thead>
+                          <tbody>
+                            {gradebook.map((grade) => (
+                              <tr key={grade.id} className="border-b hover:bg-gray-50">
+                                <td className="p-4">
+                                  <div className="flex items-center gap-3">
+                                    <Avatar className="w-8 h-8">
+                                      <AvatarFallback className="bg-blue-100 text-blue-600">
+                                        {grade.student_name?.charAt(0)}
+                                      </AvatarFallback>
+                                    </Avatar>
+                                    <div>
+                                      <p className="font-medium">{grade.student_name}</p>
+                                      <p className="text-sm text-gray-500">{grade.student_email}</p>
+                                    </div>
+                                  </div>
+                                </td>
+                                <td className="p-4">
+                                  <p className="font-medium">{grade.assignment_title}</p>
+                                  <p className="text-sm text-gray-500">
+                                    {new Date(grade.graded_at).toLocaleDateString()}
+                                  </p>
+                                </td>
+                                <td className="p-4">
+                                  <Badge className={getSubjectColor(grade.subject)} variant="secondary">
+                                    {grade.subject}
+                                  </Badge>
+                                </td>
+                                <td className="p-4 text-center">
+                                  <div className="font-medium">
+                                    {grade.final_score}/{grade.total_points}
+                                  </div>
+                                  <div className="text-sm text-gray-500">
+                                    {Math.round(grade.percentage)}%
+                                  </div>
+                                </td>
+                                <td className="p-4 text-center">
+                                  <Badge 
+                                    variant={grade.grade_letter?.startsWith('A') ? 'default' : 
+                                             grade.grade_letter?.startsWith('B') ? 'secondary' : 
+                                             'outline'}
+                                    className={
+                                      grade.grade_letter?.startsWith('A') ? 'bg-green-600' :
+                                      grade.grade_letter?.startsWith('B') ? 'bg-blue-600' :
+                                      grade.percentage < 70 ? 'text-red-600 border-red-200' : ''
+                                    }
+                                  >
+                                    {grade.grade_letter || 'N/A'}
+                                  </Badge>
+                                </td>
+                                <td className="p-4 text-center">
+                                  <div className="flex items-center justify-center gap-2">
+                                    {grade.late_submission && (
+                                      <Badge variant="outline" className="text-orange-600 border-orange-200">
+                                        <Clock className="w-3 h-3 mr-1" />
+                                        Late
+                                      </Badge>
+                                    )}
+                                    {grade.manual_score !== null && (
+                                      <Badge variant="outline" className="text-purple-600 border-purple-200">
+                                        Manual
+                                      </Badge>
+                                    )}
+                                  </div>
+                                </td>
+                                <td className="p-4 text-center">
+                                  <div className="flex items-center justify-center gap-2">
+                                    <Button variant="outline" size="sm">
+                                      <Settings className="w-3 h-3" />
+                                    </Button>
+                                    <Button variant="outline" size="sm">
+                                      <MessageSquare className="w-3 h-3" />
+                                    </Button>
+                                  </div>
+                                </td>
+                              </tr>
+                            ))}
+                          </tbody>
+                        </table>
+                      </div>
+                    </CardContent>
+                  </Card>
+                </div>
+              )}
+            </TabsContent>
+
+            {/* Analytics Tab */}
+            <TabsContent value="analytics" className="space-y-6">
+              <div className="flex items-center justify-between">
+                <h3 className="text-lg font-semibold">Analytics & Performance Insights</h3>
+                <div className="flex gap-2">
+                  <Select defaultValue="week">
+                    <SelectTrigger className="w-[180px]">
+                      <SelectValue placeholder="Time period" />
+                    </SelectTrigger>
+                    <SelectContent>
+                      <SelectItem value="week">This Week</SelectItem>
+                      <SelectItem value="month">This Month</SelectItem>
+                      <SelectItem value="quarter">This Quarter</SelectItem>
+                    </SelectContent>
+                  </Select>
+                  <Button variant="outline">
+                    <Settings className="w-4 h-4 mr-2" />
+                    Generate Report
+                  </Button>
+                </div>
+              </div>
+
+              {!teacherAnalytics ? (
+                <Card>
+                  <CardContent className="text-center py-12">
+                    <div className="mx-auto mb-4 p-4 bg-indigo-100 rounded-full w-fit">
+                      <TrendingUp className="w-8 h-8 text-indigo-600" />
+                    </div>
+                    <h3 className="text-lg font-semibold mb-2">No Analytics Data</h3>
+                    <p className="text-gray-600">Analytics will appear once you have assignments and student activity.</p>
+                  </CardContent>
+                </Card>
+              ) : (
+                <>
+                  {/* Performance Overview */}
+                  <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
+                    <Card>
+                      <CardContent className="p-6">
+                        <div className="flex items-center justify-between">
+                          <div>
+                            <p className="text-sm text-gray-600">Avg Performance</p>
+                            <p className="text-2xl font-bold">{teacherAnalytics.overall_performance || 0}%</p>
+                          </div>
+                          <TrendingUp className="w-8 h-8 text-green-600" />
+                        </div>
+                        <div className="mt-2">
+                          <Progress value={teacherAnalytics.overall_performance || 0} className="h-2" />
+                        </div>
+                      </CardContent>
+                    </Card>
+
+                    <Card>
+                      <CardContent className="p-6">
+                        <div className="flex items-center justify-between">
+                          <div>
+                            <p className="text-sm text-gray-600">Completion Rate</p>
+                            <p className="text-2xl font-bold">{teacherAnalytics.completion_rate || 0}%</p>
+                          </div>
+                          <CheckCircle className="w-8 h-8 text-blue-600" />
+                        </div>
+                        <div className="mt-2">
+                          <Progress value={teacherAnalytics.completion_rate || 0} className="h-2" />
+                        </div>
+                      </CardContent>
+                    </Card>
+
+                    <Card>
+                      <CardContent className="p-6">
+                        <div className="flex items-center justify-between">
+                          <div>
+                            <p className="text-sm text-gray-600">Active Students</p>
+                            <p className="text-2xl font-bold">{teacherAnalytics.active_students || 0}</p>
+                          </div>
+                          <Users className="w-8 h-8 text-purple-600" />
+                        </div>
+                      </CardContent>
+                    </Card>
+
+                    <Card>
+                      <CardContent className="p-6">
+                        <div className="flex items-center justify-between">
+                          <div>
+                            <p className="text-sm text-gray-600">Improvement</p>
+                            <p className="text-2xl font-bold text-green-600">+{teacherAnalytics.improvement_rate || 0}%</p>
+                          </div>
+                          <TrendingUp className="w-8 h-8 text-green-600" />
+                        </div>
+                      </CardContent>
+                    </Card>
+                  </div>
+
+                  <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+                    {/* Assignment Performance */}
+                    <Card>
+                      <CardHeader>
+                        <CardTitle className="flex items-center gap-2">
+                          <BookOpen className="w-5 h-5" />
+                          Assignment Performance
+                        </CardTitle>
+                      </CardHeader>
+                      <CardContent>
+                        {teacherAnalytics.assignment_performance?.length > 0 ? (
+                          <div className="space-y-4">
+                            {teacherAnalytics.assignment_performance.map((assignment, index) => (
+                              <div key={index} className="flex items-center justify-between p-4 bg-gray-50 rounded-lg">
+                                <div>
+                                  <p className="font-medium">{assignment.title}</p>
+                                  <p className="text-sm text-gray-600">{assignment.subject}</p>
+                                </div>
+                                <div className="text-right">
+                                  <p className="font-medium">{assignment.avg_score}%</p>
+                                  <p className="text-sm text-gray-500">
+                                    {assignment.completed}/{assignment.total} completed
+                                  </p>
+                                </div>
+                              </div>
+                            ))}
+                          </div>
+                        ) : (
+                          <p className="text-gray-500 text-center py-8">No assignment data available</p>
+                        )}
+                      </CardContent>
+                    </Card>
+
+                    {/* Grade Distribution */}
+                    <Card>
+                      <CardHeader>
+                        <CardTitle className="flex items-center gap-2">
+                          <Award className="w-5 h-5" />
+                          Grade Distribution
+                        </CardTitle>
+                      </CardHeader>
+                      <CardContent>
+                        {teacherAnalytics.grade_distribution ? (
+                          <div className="space-y-4">
+                            {Object.entries(teacherAnalytics.grade_distribution).map(([grade, count]) => (
+                              <div key={grade} className="flex items-center justify-between">
+                                <div className="flex items-center gap-3">
+                                  <Badge 
+                                    variant={grade.startsWith('A') ? 'default' : 'secondary'}
+                                    className={grade.startsWith('A') ? 'bg-green-600' : ''}
+                                  >
+                                    {grade}
+                                  </Badge>
+                                  <span className="font-medium">{count} students</span>
+                                </div>
+                                <div className="flex-1 mx-4">
+                                  <Progress 
+                                    value={(count / teacherAnalytics.total_graded) * 100} 
+                                    className="h-2" 
+                                  />
+                                </div>
+                                <span className="text-sm text-gray-500">
+                                  {Math.round((count / teacherAnalytics.total_graded) * 100)}%
+                                </span>
+                              </div>
+                            ))}
+                          </div>
+                        ) : (
+                          <p className="text-gray-500 text-center py-8">No grade data available</p>
+                        )}
+                      </CardContent>
+                    </Card>
+                  </div>
+
+                  {/* AI-Generated Insights */}
+                  {teacherAnalytics.insights && teacherAnalytics.insights.length > 0 && (
+                    <Card>
+                      <CardHeader>
+                        <CardTitle className="flex items-center gap-2">
+                          <Brain className="w-5 h-5" />
+                          AI-Generated Insights & Recommendations
+                        </CardTitle>
+                      </CardHeader>
+                      <CardContent>
+                        <div className="space-y-4">
+                          {teacherAnalytics.insights.map((insight, index) => (
+                            <div key={index} className="p-4 bg-blue-50 rounded-lg border-l-4 border-blue-500">
+                              <div className="flex items-start gap-3">
+                                <Brain className="w-5 h-5 text-blue-600 mt-0.5" />
+                                <div>
+                                  <p className="font-medium text-blue-900">{insight.title}</p>
+                                  <p className="text-blue-800 mt-1">{insight.description}</p>
+                                  {insight.action && (
+                                    <div className="mt-3">
+                                      <Button variant="outline" size="sm" className="text-blue-700 border-blue-300">
+                                        {insight.action}
+                                      </Button>
+                                    </div>
+                                  )}
+                                </div>
+                              </div>
+                            </div>
+                          ))}
+                        </div>
+                      </CardContent>
+                    </Card>
+                  )}
+
+                  {/* Subject Performance */}
+                  {teacherAnalytics.subject_performance && (
+                    <Card>
+                      <CardHeader>
+                        <CardTitle>Subject Performance Overview</CardTitle>
+                      </CardHeader>
+                      <CardContent>
+                        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
+                          {Object.entries(teacherAnalytics.subject_performance).map(([subject, data]) => (
+                            <div key={subject} className="p-4 border rounded-lg">
+                              <div className="flex items-center justify-between mb-3">
+                                <Badge className={getSubjectColor(subject)} variant="secondary">
+                                  {subject}
+                                </Badge>
+                                <span className="text-lg font-bold">{data.avg_score}%</span>
+                              </div>
+                              <Progress value={data.avg_score} className="h-2 mb-2" />
+                              <div className="text-sm text-gray-600">
+                                <p>{data.assignments} assignments</p>
+                                <p>{data.students} students</p>
+                              </div>
+                            </div>
+                          ))}
+                        </div>
+                      </CardContent>
+                    </Card>
+                  )}
+                </>
+              )}
+            </TabsContent>
+          </Tabs>
+        )}
+      </main>
+    </div>
+  )
+}
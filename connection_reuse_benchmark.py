@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Connection Reuse Benchmark for Proxilearn Outbound HTTP
+Fires bursts of authenticated API requests (each one calls Supabase at least
+for auth) and reads GET /api/status/transport before and after, reporting how
+many upstream requests rode an already-open keep-alive connection versus how
+many new connections (and TLS handshakes) the server had to open.
+
+Environment:
+  PROXILEARN_AUTH_COOKIE   Cookie header of a signed-in user (required)
+  BENCH_PATH               API path to hit (default /subjects)
+  BURST_SIZE               concurrent requests per burst (default 20)
+  BURST_COUNT              number of bursts (default 5)
+  METRICS_TOKEN            server's token for /status/transport (required)
+"""
+
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+AUTH_COOKIE = os.environ.get("PROXILEARN_AUTH_COOKIE")
+BENCH_PATH = os.environ.get("BENCH_PATH", "/subjects")
+BURST_SIZE = int(os.environ.get("BURST_SIZE", "20"))
+BURST_COUNT = int(os.environ.get("BURST_COUNT", "5"))
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def transport_stats():
+    response = requests.get(f"{API_BASE}/status/transport",
+                            headers={"Authorization": f"Bearer {METRICS_TOKEN}"} if METRICS_TOKEN else {})
+    response.raise_for_status()
+    return response.json()
+
+
+class ConnectionReuseBenchmark:
+    def run_burst(self):
+        barrier = threading.Barrier(BURST_SIZE)
+
+        def call(_):
+            session = requests.Session()
+            barrier.wait()
+            started = time.perf_counter()
+            response = session.get(f"{API_BASE}{BENCH_PATH}", headers={'Cookie': AUTH_COOKIE})
+            return response.status_code, (time.perf_counter() - started) * 1000
+
+        with ThreadPoolExecutor(max_workers=BURST_SIZE) as pool:
+            return list(pool.map(call, range(BURST_SIZE)))
+
+    def run(self):
+        print("=" * 80)
+        print("PROXILEARN CONNECTION REUSE BENCHMARK")
+        print("=" * 80)
+        print(f"Path: {BENCH_PATH}, {BURST_COUNT} bursts of {BURST_SIZE} concurrent requests")
+        print()
+
+        before = transport_stats()
+        print(f"Pool: {before['maxConnectionsPerOrigin']} connections per origin, "
+              f"keep-alive {before['keepAliveTimeoutMs']}ms")
+        print()
+
+        results = []
+        for burst in range(BURST_COUNT):
+            burst_results = self.run_burst()
+            latencies = [latency for _, latency in burst_results]
+            print(f"📊 Burst {burst + 1}: p50 {statistics.median(latencies):.0f}ms, "
+                  f"p95 {percentile(latencies, 95):.0f}ms, max {max(latencies):.0f}ms")
+            results.extend(burst_results)
+        print()
+
+        after = transport_stats()
+        requests_sent = after['requests'] - before['requests']
+        reused = after['reusedRequests'] - before['reusedRequests']
+        opened = after['connectionsOpened'] - before['connectionsOpened']
+        latencies = [latency for _, latency in results]
+        failures = [status for status, _ in results if status != 200]
+
+        print(f"Overall latency: p50 {statistics.median(latencies):.0f}ms, p95 {percentile(latencies, 95):.0f}ms")
+        print(f"Upstream requests: {requests_sent}, on reused connections: {reused}, "
+              f"new connections: {opened}")
+        if requests_sent:
+            print(f"Reuse ratio: {reused / requests_sent:.1%}")
+        for origin, counts in after['origins'].items():
+            print(f"   {origin}: {counts['requests']} requests, {counts['connectionsOpened']} connections, "
+                  f"reuse {counts['reuseRatio']}")
+        print()
+
+        if failures:
+            print(f"❌ {len(failures)} requests failed: {sorted(set(failures))}")
+        return not failures
+
+
+if __name__ == "__main__":
+    if not AUTH_COOKIE:
+        print("⏭️  SKIP - set PROXILEARN_AUTH_COOKIE to run the benchmark")
+        raise SystemExit(0)
+
+    raise SystemExit(0 if ConnectionReuseBenchmark().run() else 1)
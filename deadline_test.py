@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Deadline / Fault Injection Test for the Proxilearn API Server
+Checks that request deadlines keep tail latency bounded when upstreams
+misbehave. Start the server with faults injected into its outbound calls, e.g.
+
+  FAULT_INJECTION="supabase:latency=3000@0.2,supabase:error=503@0.05,supabase:hang@0.05" \\
+  REQUEST_DEADLINE_MS=5000 DASHBOARD_SECTION_BUDGET_MS=2000 yarn start
+
+then run this script. It drives the dashboards and list reads of every role
+with a cookie and checks that:
+  - no request takes longer than its deadline plus DEADLINE_SLACK_MS
+  - nothing hangs until the client timeout or drops the connection
+  - server errors are only 504 "Request deadline exceeded"
+and reports how often dashboards were served with some sections unavailable
+instead of failing. The deadlines and fault rules are read from
+GET /api/status/transport; the test is skipped when no faults are configured.
+
+Environment:
+  PROXILEARN_STUDENT_COOKIE       Cookie headers; at least one is required, since
+  PROXILEARN_TEACHER_COOKIE       unauthenticated requests never reach Supabase
+  PROXILEARN_COORDINATOR_COOKIE
+  DEADLINE_TEST_REQUESTS          total requests (default 200)
+  DEADLINE_TEST_WORKERS           concurrent clients (default 10)
+  DEADLINE_SLACK_MS               allowed overshoot past the deadline (default 1000)
+  METRICS_TOKEN                   server's token for /status/transport (required)
+"""
+
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+TOTAL_REQUESTS = int(os.environ.get("DEADLINE_TEST_REQUESTS", "200"))
+WORKERS = int(os.environ.get("DEADLINE_TEST_WORKERS", "10"))
+SLACK_MS = float(os.environ.get("DEADLINE_SLACK_MS", "1000"))
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+# Dashboards answer with an `unavailable` list when sections are cut off
+DASHBOARDS = {"/student/progress", "/teacher/dashboard", "/coordinator/dashboard"}
+ROLE_ROUTES = {
+    "student": ["/student/progress", "/assignments", "/subjects"],
+    "teacher": ["/teacher/dashboard", "/teacher/assignments", "/teacher/gradebook"],
+    "coordinator": ["/coordinator/dashboard", "/coordinator/alerts"],
+}
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class DeadlineTester:
+    def __init__(self, routes, deadline_ms):
+        self.routes = routes
+        self.deadline_ms = deadline_ms
+        self.results = []
+        self.test_results = []
+
+    def log_test(self, test_name, success, message=""):
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status}: {test_name}")
+        if message:
+            print(f"   {message}")
+        print()
+        self.test_results.append({"test": test_name, "success": success, "message": message})
+
+    def send(self, index):
+        path, cookie = self.routes[index % len(self.routes)]
+        started = time.monotonic()
+        partial = False
+        try:
+            # Well past the deadline, so a hang shows up as a client timeout
+            response = requests.get(f"{API_BASE}{path}", headers={"Cookie": cookie},
+                                    timeout=self.deadline_ms * 3 / 1000)
+            status = response.status_code
+            if status == 200 and path in DASHBOARDS:
+                partial = bool(response.json().get("unavailable"))
+        except requests.Timeout:
+            status = "timeout"
+        except requests.RequestException:
+            status = "connection error"
+        elapsed_ms = (time.monotonic() - started) * 1000
+        return {"path": path, "status": status, "ms": elapsed_ms, "partial": partial}
+
+    def run(self):
+        print("=" * 80)
+        print("PROXILEARN DEADLINE / FAULT INJECTION TEST")
+        print("=" * 80)
+        print(f"{TOTAL_REQUESTS} requests with {WORKERS} workers over {len(self.routes)} routes, "
+              f"deadline {self.deadline_ms}ms (+{SLACK_MS:g}ms slack)")
+        print()
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            self.results = list(pool.map(self.send, range(TOTAL_REQUESTS)))
+
+        latencies = [result["ms"] for result in self.results]
+        statuses = Counter(result["status"] for result in self.results)
+        print(f"Status codes: {dict(statuses)}")
+        print(f"Latency p50 {percentile(latencies, 0.5):.0f}ms  p95 {percentile(latencies, 0.95):.0f}ms  "
+              f"p99 {percentile(latencies, 0.99):.0f}ms  max {max(latencies):.0f}ms")
+        print()
+
+        limit_ms = self.deadline_ms + SLACK_MS
+        slow = [result for result in self.results if result["ms"] > limit_ms]
+        self.log_test("Tail latency bounded by the deadline", not slow,
+                      f"{len(slow)} requests over {limit_ms:g}ms" +
+                      (f", slowest {max(slow, key=lambda r: r['ms'])['path']}" if slow else ""))
+
+        hung = statuses["timeout"] + statuses["connection error"]
+        self.log_test("No hung or dropped requests", hung == 0,
+                      f"{statuses['timeout']} client timeouts, {statuses['connection error']} connection errors")
+
+        other_errors = sum(count for status, count in statuses.items()
+                           if isinstance(status, int) and status >= 500 and status != 504)
+        self.log_test("Server errors are deadline 504s", other_errors == 0,
+                      f"{statuses[504]} x 504, {other_errors} other 5xx")
+
+        dashboard_results = [result for result in self.results if result["path"] in DASHBOARDS]
+        if dashboard_results:
+            served = sum(1 for result in dashboard_results if result["status"] == 200)
+            partial = sum(1 for result in dashboard_results if result["partial"])
+            print(f"📊 Dashboards: {served}/{len(dashboard_results)} served, {partial} with sections unavailable")
+            print()
+
+        passed = sum(1 for result in self.test_results if result["success"])
+        print("=" * 80)
+        print(f"SUMMARY: {passed}/{len(self.test_results)} tests passed")
+        print("=" * 80)
+        return passed == len(self.test_results)
+
+
+if __name__ == "__main__":
+    routes = []
+    for role, paths in ROLE_ROUTES.items():
+        cookie = os.environ.get(f"PROXILEARN_{role.upper()}_COOKIE")
+        if cookie:
+            routes.extend((path, cookie) for path in paths)
+    if not routes:
+        print("⏭️  SKIP - set PROXILEARN_STUDENT_COOKIE, PROXILEARN_TEACHER_COOKIE or PROXILEARN_COORDINATOR_COOKIE")
+        raise SystemExit(0)
+
+    probe = requests.get(f"{API_BASE}/status/transport", timeout=30,
+                         headers={"Authorization": f"Bearer {METRICS_TOKEN}"} if METRICS_TOKEN else {})
+    if probe.status_code != 200:
+        print(f"⏭️  SKIP - GET /api/status/transport returned {probe.status_code} (set METRICS_TOKEN?)")
+        raise SystemExit(0)
+    transport = probe.json()
+    if not transport.get("faultInjection", {}).get("enabled"):
+        print("⏭️  SKIP - the server has no FAULT_INJECTION rules (see the docstring for an example)")
+        raise SystemExit(0)
+    print(f"Fault rules: {transport['faultInjection']['rules']}")
+
+    success = DeadlineTester(routes, transport["deadlines"]["requestMs"]).run()
+    raise SystemExit(0 if success else 1)
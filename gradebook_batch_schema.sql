@@ -0,0 +1,128 @@
+-- ================================================================================================
+-- BATCH GRADEBOOK UPDATES - SUPABASE SQL SCHEMA EXTENSION
+-- ================================================================================================
+-- Applies many manual score / comment changes to a teacher's gradebook in one call, used by
+-- PUT /api/teacher/gradebook. One UPDATE statement covers the whole batch (one transaction), and
+-- final_score, percentage and grade_letter are recomputed set-wise for every changed row.
+-- Prerequisites: Student Phase and Teacher Phase schemas must be applied first.
+-- Execute this script in your Supabase SQL editor.
+
+-- ------------------------------------------------------------------------------------------------
+-- 1. BATCH UPDATE FUNCTION
+-- ------------------------------------------------------------------------------------------------
+-- p_changes: [{ "id": "<gradebook id>", "has_manual": true, "manual_score": 42.5,
+--               "has_comments": true, "comments": "..." }, ...]
+-- has_manual / has_comments say whether the field is being changed, so a null manual_score
+-- clears the override and a missing one leaves it alone.
+--
+-- Scoring rules:
+--   final_score = manual_score, or auto_score when there is no override (as auto_populate_gradebook)
+--   percentage  = final_score over the points of all the assignment's questions, as on submit;
+--                 unchanged when the assignment has no questions with points
+--   grade_letter from calculate_grade_letter(percentage)
+--
+-- Returns one result per change, in input order:
+--   [{ "id": ..., "status": "updated", "grade": {...} } | { "id": ..., "status": "not_found" }]
+-- Rows that do not exist or belong to another teacher are "not_found" and nothing else fails.
+-- When the same id appears twice, the last change wins.
+CREATE OR REPLACE FUNCTION public.bulk_update_grades(p_changes JSONB)
+RETURNS JSONB
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    results JSONB;
+BEGIN
+    IF jsonb_typeof(p_changes) <> 'array' THEN
+        RAISE EXCEPTION 'Changes must be a JSON array' USING ERRCODE = '22023';
+    END IF;
+
+    WITH input AS (
+        SELECT (e.change->>'id')::UUID AS id,
+               e.position,
+               COALESCE((e.change->>'has_manual')::BOOLEAN, false) AS has_manual,
+               (e.change->>'manual_score')::DECIMAL(5,2) AS manual_score,
+               COALESCE((e.change->>'has_comments')::BOOLEAN, false) AS has_comments,
+               e.change->>'comments' AS comments
+        FROM jsonb_array_elements(p_changes) WITH ORDINALITY AS e(change, position)
+    ), latest AS (
+        SELECT DISTINCT ON (id) * FROM input ORDER BY id, position DESC
+    ), targets AS (
+        SELECT g.id, g.assignment_id, l.has_manual, l.manual_score, l.has_comments, l.comments,
+               COALESCE(
+                   CASE WHEN l.has_manual THEN l.manual_score ELSE g.manual_score END,
+                   g.auto_score,
+                   g.final_score
+               ) AS final_score
+        FROM latest l
+        JOIN public.teacher_gradebook g ON g.id = l.id AND g.teacher_id = auth.uid()
+    ), totals AS (
+        -- One sum per assignment in the batch, not per row
+        SELECT q.assignment_id, SUM(q.points) AS total_points
+        FROM public.assignment_questions q
+        WHERE q.assignment_id IN (SELECT DISTINCT assignment_id FROM targets)
+        GROUP BY q.assignment_id
+    ), scored AS (
+        SELECT t.*,
+               CASE WHEN tot.total_points > 0
+                    THEN LEAST(ROUND(t.final_score / tot.total_points * 100, 2), 999.99)
+               END AS percentage
+        FROM targets t
+        LEFT JOIN totals tot ON tot.assignment_id = t.assignment_id
+    ), updated AS (
+        UPDATE public.teacher_gradebook g
+        SET manual_score = CASE WHEN s.has_manual THEN s.manual_score ELSE g.manual_score END,
+            comments = CASE WHEN s.has_comments THEN s.comments ELSE g.comments END,
+            final_score = s.final_score,
+            percentage = COALESCE(s.percentage, g.percentage),
+            grade_letter = CASE
+                WHEN COALESCE(s.percentage, g.percentage) IS NOT NULL
+                THEN calculate_grade_letter(COALESCE(s.percentage, g.percentage))
+                ELSE g.grade_letter
+            END,
+            graded_at = NOW(),
+            graded_by = auth.uid(),
+            updated_at = NOW()
+        FROM scored s
+        WHERE g.id = s.id
+        RETURNING g.id, g.student_id, g.assignment_id, g.auto_score, g.manual_score, g.final_score,
+                  g.percentage, g.grade_letter, g.comments, g.graded_at
+    )
+    SELECT COALESCE(jsonb_agg(
+               CASE WHEN u.id IS NULL
+                    THEN jsonb_build_object('id', i.id, 'status', 'not_found')
+                    ELSE jsonb_build_object('id', i.id, 'status', 'updated', 'grade', to_jsonb(u))
+               END
+               ORDER BY i.position
+           ), '[]'::JSONB)
+    INTO results
+    FROM input i
+    LEFT JOIN updated u ON u.id = i.id;
+
+    RETURN results;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION public.bulk_update_grades(JSONB) TO authenticated;
+
+-- ================================================================================================
+-- SCHEMA VALIDATION FOR BATCH GRADEBOOK UPDATES
+-- ================================================================================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_proc p
+        JOIN pg_namespace n ON n.oid = p.pronamespace
+        WHERE n.nspname = 'public' AND p.proname = 'bulk_update_grades'
+    ) THEN
+        RAISE NOTICE '🎉 SUCCESS: bulk_update_grades() created';
+        RAISE NOTICE '✅ Batch gradebook updates are ready: PUT /api/teacher/gradebook';
+    ELSE
+        RAISE NOTICE '❌ bulk_update_grades() is missing - check the SQL execution log for errors.';
+    END IF;
+END $$;
+
+-- ================================================================================================
+-- END OF BATCH GRADEBOOK UPDATES SCHEMA
+-- ================================================================================================
@@ -0,0 +1,177 @@
+// Structured output for AI question generation.
+// Question helpers ask for a JSON object { "questions": [...] }, constrained by
+// a JSON schema when the provider supports response_format json_schema. The
+// parser below does not need the whole document to be valid: it walks the
+// questions array item by item and keeps every complete object, so output cut
+// off by max_tokens still yields the questions written before the cut, and a
+// retry only asks for the ones still missing.
+
+const QUESTION_TYPES = ['multiple_choice', 'short_answer', 'essay']
+const DIFFICULTIES = ['easy', 'medium', 'hard']
+
+function questionsSchema(name, itemProperties, required) {
+  return {
+    type: 'json_schema',
+    json_schema: {
+      name,
+      strict: true,
+      schema: {
+        type: 'object',
+        properties: {
+          questions: {
+            type: 'array',
+            items: {
+              type: 'object',
+              properties: itemProperties,
+              required,
+              additionalProperties: false
+            }
+          }
+        },
+        required: ['questions'],
+        additionalProperties: false
+      }
+    }
+  }
+}
+
+export const QUIZ_QUESTIONS_FORMAT = questionsSchema('quiz_questions', {
+  question: { type: 'string' },
+  options: { type: 'array', items: { type: 'string' } },
+  correct_answer: { type: 'string' },
+  explanation: { type: 'string' }
+}, ['question', 'options', 'correct_answer', 'explanation'])
+
+export const ASSESSMENT_QUESTIONS_FORMAT = questionsSchema('assessment_questions', {
+  question: { type: 'string' },
+  type: { type: 'string', enum: QUESTION_TYPES },
+  options: { type: 'array', items: { type: 'string' } },
+  correct_answer: { type: 'string' },
+  explanation: { type: 'string' },
+  points: { type: 'integer' },
+  difficulty: { type: 'string', enum: DIFFICULTIES },
+  topic: { type: 'string' }
+}, ['question', 'type', 'options', 'correct_answer', 'explanation', 'points', 'difficulty', 'topic'])
+
+// Index just past the string literal starting at `start` (a double quote),
+// or -1 when the text ends inside it
+function skipString(text, start) {
+  for (let i = start + 1; i < text.length; i++) {
+    if (text[i] === '\\') {
+      i++
+    } else if (text[i] === '"') {
+      return i + 1
+    }
+  }
+  return -1
+}
+
+// Index just past the object or array starting at `start`, or -1 when truncated
+function skipValue(text, start) {
+  let depth = 0
+  for (let i = start; i < text.length; i++) {
+    const char = text[i]
+    if (char === '"') {
+      i = skipString(text, i)
+      if (i === -1) {
+        return -1
+      }
+      i--
+    } else if (char === '{' || char === '[') {
+      depth++
+    } else if (char === '}' || char === ']') {
+      depth--
+      if (depth === 0) {
+        return i + 1
+      }
+    }
+  }
+  return -1
+}
+
+// Start of the questions array: the value of a "questions" key, or else the
+// first array in the text (plain [...] output, possibly wrapped in prose or fences)
+function findItemsArray(text) {
+  const keyed = text.match(/"questions"\s*:\s*\[/)
+  if (keyed) {
+    return keyed.index + keyed[0].length - 1
+  }
+  return text.indexOf('[')
+}
+
+// Parse the complete objects of the questions array in `text`.
+// Returns { items, complete }; complete is false when the array was cut off.
+export function parseJsonItems(text) {
+  const items = []
+  const start = findItemsArray(text || '')
+  if (start === -1) {
+    return { items, complete: false }
+  }
+
+  let i = start + 1
+  while (i < text.length) {
+    const char = text[i]
+    if (char === ']') {
+      return { items, complete: true }
+    }
+    if (char !== '{') {
+      i++ // Whitespace, commas, stray tokens between items
+      continue
+    }
+    const end = skipValue(text, i)
+    if (end === -1) {
+      break // Truncated inside this item
+    }
+    try {
+      items.push(JSON.parse(text.slice(i, end)))
+    } catch {
+      // Malformed item: skip it and keep the rest
+    }
+    i = end
+  }
+  return { items, complete: false }
+}
+
+function isNonEmptyString(value) {
+  return typeof value === 'string' && value.trim().length > 0
+}
+
+// Normalize a generated quiz question, or return null when it is unusable
+export function normalizeQuizQuestion(item) {
+  if (!item || !isNonEmptyString(item.question) || !Array.isArray(item.options)) {
+    return null
+  }
+  const options = item.options.filter(isNonEmptyString)
+  if (options.length < 2 || !options.includes(item.correct_answer)) {
+    return null
+  }
+  return {
+    question: item.question.trim(),
+    options,
+    correct_answer: item.correct_answer,
+    explanation: isNonEmptyString(item.explanation) ? item.explanation : ''
+  }
+}
+
+// Normalize a generated assessment question, or return null when it is unusable
+export function normalizeAssessmentQuestion(item) {
+  if (!item || !isNonEmptyString(item.question) || !isNonEmptyString(item.correct_answer)) {
+    return null
+  }
+  const type = QUESTION_TYPES.includes(item.type) ? item.type : 'multiple_choice'
+  const options = Array.isArray(item.options) ? item.options.filter(isNonEmptyString) : []
+  if (type === 'multiple_choice' && (options.length < 2 || !options.includes(item.correct_answer))) {
+    return null
+  }
+  const points = Number(item.points)
+  return {
+    question: item.question.trim(),
+    type,
+    options: type === 'multiple_choice' ? options : [],
+    correct_answer: item.correct_answer,
+    explanation: isNonEmptyString(item.explanation) ? item.explanation : '',
+    points: Number.isFinite(points) ? Math.min(5, Math.max(1, Math.round(points))) : 1,
+    difficulty: DIFFICULTIES.includes(item.difficulty) ? item.difficulty : 'medium',
+    topic: isNonEmptyString(item.topic) ? item.topic : ''
+  }
+}
@@ -0,0 +1,204 @@
+// Offline-first answer log for quizzes. Every answer a student picks is written
+// to IndexedDB before anything goes over the network, together with a delta
+// carrying a per-attempt sequence number. Pending deltas are flushed in batches
+// to POST /api/assignments/{id}/answers, which merges them by sequence number,
+// and are dropped once the server acknowledges them. A submit that fails because
+// the connection dropped is remembered in the log and retried when the browser
+// is back online (or when the service worker in public/sw.js gets a sync event).
+// Each attempt carries its own Idempotency-Key for the submit, so a retry after
+// a submit that did reach the server returns the original result.
+
+import { authorizedJson } from '@/lib/queryClient'
+
+const DB_NAME = 'proxilearn-offline'
+const STORE = 'answer-logs'
+const SYNC_TAG = 'quiz-outbox'
+const MAX_DELTAS_PER_FLUSH = 200 // Server limit per batch
+
+// Used when IndexedDB is unavailable (private browsing, old browsers)
+const memoryLogs = new Map()
+let dbPromise = null
+
+// Read-modify-write updates of a log run one at a time, so two quick answer
+// clicks cannot hand out the same sequence number
+let updateQueue = Promise.resolve()
+
+function serialized(update) {
+  const run = updateQueue.then(update)
+  updateQueue = run.catch(() => {})
+  return run
+}
+
+function openDb() {
+  if (typeof indexedDB === 'undefined') {
+    return Promise.resolve(null)
+  }
+  if (!dbPromise) {
+    dbPromise = new Promise(resolve => {
+      const request = indexedDB.open(DB_NAME, 1)
+      request.onupgradeneeded = () => request.result.createObjectStore(STORE, { keyPath: 'key' })
+      request.onsuccess = () => resolve(request.result)
+      request.onerror = () => resolve(null)
+    })
+  }
+  return dbPromise
+}
+
+async function withStore(mode, run) {
+  const db = await openDb()
+  if (!db) {
+    return run(null)
+  }
+  return new Promise((resolve, reject) => {
+    const transaction = db.transaction(STORE, mode)
+    const request = run(transaction.objectStore(STORE))
+    transaction.oncomplete = () => resolve(request?.result)
+    transaction.onerror = () => reject(transaction.error)
+  })
+}
+
+function newSubmitKey() {
+  if (typeof crypto !== 'undefined' && crypto.randomUUID) {
+    return crypto.randomUUID()
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`
+}
+
+function logKey(assignmentId, attemptNumber) {
+  return `${assignmentId}:${attemptNumber}`
+}
+
+async function readLog(key) {
+  const stored = await withStore('readonly', store => store ? store.get(key) : null)
+  return stored ?? memoryLogs.get(key) ?? null
+}
+
+async function writeLog(log) {
+  memoryLogs.set(log.key, log)
+  await withStore('readwrite', store => store?.put(log))
+}
+
+export async function deleteAnswerLog(assignmentId, attemptNumber) {
+  const key = logKey(assignmentId, attemptNumber)
+  memoryLogs.delete(key)
+  await withStore('readwrite', store => store?.delete(key))
+}
+
+// Start the log of a new attempt
+export async function createAnswerLog(assignmentId, attemptNumber, quiz) {
+  const log = {
+    key: logKey(assignmentId, attemptNumber),
+    assignmentId,
+    attemptNumber,
+    quiz,
+    answers: {},
+    deltas: [],
+    nextSeq: 1,
+    submitKey: newSubmitKey(),
+    submitRequested: false,
+    updatedAt: Date.now()
+  }
+  await writeLog(log)
+  return log
+}
+
+// Record one answer locally. Only the newest unsent change per question is kept.
+export function recordAnswer(assignmentId, attemptNumber, questionId, answer) {
+  return serialized(async () => {
+    const log = await readLog(logKey(assignmentId, attemptNumber))
+    if (!log) {
+      return
+    }
+    const seq = log.nextSeq
+    log.nextSeq += 1
+    log.answers[questionId] = answer
+    log.deltas = log.deltas.filter(delta => delta.questionId !== questionId)
+    log.deltas.push({ seq, questionId, answer })
+    log.updatedAt = Date.now()
+    await writeLog(log)
+  })
+}
+
+// Send pending deltas. Returns the number still pending (0 when fully saved);
+// network errors leave the deltas in the log for the next flush.
+export async function flushAnswerLog(supabase, assignmentId, attemptNumber) {
+  const key = logKey(assignmentId, attemptNumber)
+  let log = await readLog(key)
+  while (log && log.deltas.length > 0) {
+    const batch = log.deltas.slice(0, MAX_DELTAS_PER_FLUSH)
+    const { ackSeq } = await authorizedJson(supabase, `/api/assignments/${assignmentId}/answers`, {
+      method: 'POST',
+      body: { attemptNumber, deltas: batch }
+    })
+    // Re-read: answers picked while the request was in flight must not be lost
+    log = await serialized(async () => {
+      const current = await readLog(key)
+      if (current) {
+        current.deltas = current.deltas.filter(delta => delta.seq > ackSeq)
+        await writeLog(current)
+      }
+      return current
+    })
+  }
+  return log ? log.deltas.length : 0
+}
+
+// Idempotency-Key for submitting this attempt (null when there is no log)
+export async function getSubmitKey(assignmentId, attemptNumber) {
+  const log = await readLog(logKey(assignmentId, attemptNumber))
+  return log?.submitKey ?? null
+}
+
+// Remember that the student asked to submit, so it can be retried after a drop
+export async function markSubmitRequested(assignmentId, attemptNumber) {
+  await serialized(async () => {
+    const log = await readLog(logKey(assignmentId, attemptNumber))
+    if (log) {
+      log.submitRequested = true
+      await writeLog(log)
+    }
+  })
+  if (typeof navigator !== 'undefined' && navigator.serviceWorker?.ready) {
+    navigator.serviceWorker.ready
+      .then(registration => registration.sync?.register(SYNC_TAG))
+      .catch(() => {}) // Background Sync is optional; the online event covers the rest
+  }
+}
+
+// Logs whose submit did not reach the server
+export async function pendingSubmissions() {
+  const stored = await withStore('readonly', store => store ? store.getAll() : null)
+  const logs = stored || [...memoryLogs.values()]
+  return logs.filter(log => log.submitRequested)
+}
+
+// Register the service worker (production builds only) and call `onSync` whenever pending work should be
+// retried: when the browser comes back online or the worker relays a sync event.
+// Returns a function that removes the listeners.
+export function watchConnectivity(onSync) {
+  if (typeof window === 'undefined') {
+    return () => {}
+  }
+  const onMessage = event => {
+    if (event.data?.type === SYNC_TAG) {
+      onSync()
+    }
+  }
+  // Dev builds serve unhashed /_next/static/ files, which the worker would keep
+  // serving stale; drop any worker left over from a production run instead
+  if (process.env.NODE_ENV === 'production') {
+    navigator.serviceWorker?.register('/sw.js').catch(error => {
+      console.error('Service worker registration failed:', error)
+    })
+  } else {
+    navigator.serviceWorker?.getRegistrations()
+      .then(registrations => registrations.forEach(registration => registration.unregister()))
+      .catch(() => {})
+  }
+  navigator.serviceWorker?.addEventListener('message', onMessage)
+  window.addEventListener('online', onSync)
+  return () => {
+    navigator.serviceWorker?.removeEventListener('message', onMessage)
+    window.removeEventListener('online', onSync)
+  }
+}
@@ -0,0 +1,139 @@
+import { createClient } from '@supabase/supabase-js'
+import { pooledFetch } from '@/lib/http'
+
+// Bulk import of school data from CSV. bulk_import.py streams a file to
+// POST /api/import/{kind} in batches; each batch is validated here, so the SQL
+// functions in bulk_import_schema.sql can cast every field, and then upserted
+// by one set-based call in a single transaction.
+
+export const IMPORT_BATCH_LIMIT = parseInt(process.env.IMPORT_BATCH_LIMIT || '1000')
+const ACCOUNT_CONCURRENCY = parseInt(process.env.IMPORT_ACCOUNT_CONCURRENCY || '8')
+
+const EMAIL = /^[^\s@]+@[^\s@]+\.[^\s@]+$/
+const UUID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+
+// CSV columns per kind; `type` is checked and converted, `max` is the column width
+export const IMPORT_KINDS = {
+  students: {
+    rpc: 'bulk_import_students',
+    columns: {
+      email: { required: true, type: 'email' },
+      full_name: { required: true, max: 255 },
+      grade_level: { required: true, max: 20 },
+      section: { max: 20 },
+      phone: { max: 20 }
+    }
+  },
+  enrollments: {
+    rpc: 'bulk_import_enrollments',
+    columns: {
+      email: { required: true, type: 'email' },
+      teacher_class_id: { required: true, type: 'uuid' }
+    }
+  },
+  grades: {
+    rpc: 'bulk_import_grades',
+    columns: {
+      email: { required: true, type: 'email' },
+      assignment_id: { required: true, type: 'uuid' },
+      score: { required: true, type: 'number', min: 0, maxValue: 999.99 },
+      percentage: { type: 'number', min: 0, maxValue: 100 },
+      comments: { max: 2000 }
+    }
+  }
+}
+
+function validateValue(name, rule, raw) {
+  const value = typeof raw === 'string' ? raw.trim() : raw
+  if (value === undefined || value === null || value === '') {
+    return rule.required ? { error: `${name} is required` } : { value: null }
+  }
+  if (rule.type === 'email') {
+    return EMAIL.test(value) ? { value: value.toLowerCase() } : { error: `${name} is not a valid email` }
+  }
+  if (rule.type === 'uuid') {
+    return UUID.test(value) ? { value } : { error: `${name} is not a valid id` }
+  }
+  if (rule.type === 'number') {
+    const number = Number(value)
+    if (!Number.isFinite(number) || number < rule.min || number > rule.maxValue) {
+      return { error: `${name} must be a number from ${rule.min} to ${rule.maxValue}` }
+    }
+    return { value: number }
+  }
+  const text = String(value)
+  return text.length > rule.max ? { error: `${name} is longer than ${rule.max} characters` } : { value: text }
+}
+
+// Split a batch into rows the SQL function can take and per-row errors.
+// Every row carries `row`, its line in the CSV, which errors refer back to.
+export function validateImportRows(kind, rows) {
+  const { columns } = IMPORT_KINDS[kind]
+  const valid = []
+  const errors = []
+  rows.forEach((input, index) => {
+    const row = Number.isInteger(input?.row) ? input.row : index + 1
+    const clean = { row }
+    const problems = []
+    for (const [name, rule] of Object.entries(columns)) {
+      const { value, error } = validateValue(name, rule, input?.[name])
+      if (error) {
+        problems.push(error)
+      } else {
+        clean[name] = value
+      }
+    }
+    if (problems.length > 0) {
+      errors.push({ row, error: problems.join('; ') })
+    } else {
+      valid.push(clean)
+    }
+  })
+  return { valid, errors }
+}
+
+let adminClient = null
+
+function getAdminClient() {
+  if (!adminClient && process.env.SUPABASE_SERVICE_ROLE_KEY) {
+    adminClient = createClient(process.env.NEXT_PUBLIC_SUPABASE_URL, process.env.SUPABASE_SERVICE_ROLE_KEY, {
+      auth: { persistSession: false, autoRefreshToken: false },
+      global: { fetch: pooledFetch }
+    })
+  }
+  return adminClient
+}
+
+// Create confirmed auth accounts for roster rows whose email has none yet.
+// Needs SUPABASE_SERVICE_ROLE_KEY; without it the rows come back as errors
+// and the students have to sign up before the roster is imported again.
+export async function createStudentAccounts(rows) {
+  const admin = getAdminClient()
+  if (!admin) {
+    return {
+      created: [],
+      errors: rows.map(({ row }) => ({
+        row,
+        error: 'No account for this email (the student must sign up first, or set SUPABASE_SERVICE_ROLE_KEY)'
+      }))
+    }
+  }
+
+  const created = []
+  const errors = []
+  for (let i = 0; i < rows.length; i += ACCOUNT_CONCURRENCY) {
+    await Promise.all(rows.slice(i, i + ACCOUNT_CONCURRENCY).map(async row => {
+      const { error } = await admin.auth.admin.createUser({
+        email: row.email,
+        email_confirm: true,
+        user_metadata: { full_name: row.full_name }
+      })
+      if (error) {
+        errors.push({ row: row.row, error: `Could not create account: ${error.message}` })
+      } else {
+        created.push(row)
+      }
+    }))
+  }
+  return { created, errors }
+}
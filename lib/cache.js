@@ -0,0 +1,183 @@
+import { createHash } from 'crypto'
+import { NextResponse } from 'next/server'
+import { recordCacheResult } from '@/lib/metrics'
+
+// HTTP caching for read-mostly GET endpoints.
+// Responses get content-based ETags so unchanged data is answered with 304, and
+// the JSON bodies are kept in an in-process cache tagged by the data they were
+// built from. Writes invalidate by tag; the TTL bounds staleness on other server
+// instances, which do not see the invalidation. Concurrent misses for the same
+// key are coalesced into a single load.
+
+const MAX_ENTRIES = parseInt(process.env.RESPONSE_CACHE_MAX_ENTRIES || '1000')
+const DEFAULT_TTL_MS = 60 * 1000
+
+// Cache-Control presets. Authenticated responses are always `private`; data a
+// user may edit and immediately re-read is revalidated on every request.
+export const CACHE_POLICIES = {
+  // Reference data that changes a few times a term
+  static: 'private, max-age=300, stale-while-revalidate=3600',
+  // Published content that is safe to show slightly stale
+  published: 'private, max-age=60, stale-while-revalidate=600',
+  // User-edited lists: always revalidate, but a 304 skips the body
+  revalidate: 'private, no-cache'
+}
+
+const entries = new Map()
+const tagIndex = new Map()
+const inFlight = new Map()
+const versions = new Map()
+
+export function computeEtag(body) {
+  const json = typeof body === 'string' ? body : JSON.stringify(body)
+  return `"${createHash('sha1').update(json).digest('base64url')}"`
+}
+
+// True when any entity tag in If-None-Match matches (weak comparison)
+export function etagMatches(request, etag) {
+  const header = request.headers.get('if-none-match')
+  if (!header) {
+    return false
+  }
+  if (header.trim() === '*') {
+    return true
+  }
+  const strip = value => value.trim().replace(/^W\//, '')
+  return header.split(',').some(candidate => strip(candidate) === strip(etag))
+}
+
+function unindex(key, entry) {
+  for (const tag of entry.tags) {
+    const keys = tagIndex.get(tag)
+    if (keys) {
+      keys.delete(key)
+      if (keys.size === 0) {
+        tagIndex.delete(tag)
+      }
+    }
+  }
+}
+
+function deleteEntry(key) {
+  const entry = entries.get(key)
+  if (entry) {
+    entries.delete(key)
+    unindex(key, entry)
+  }
+}
+
+export function getCachedResponse(key) {
+  const entry = entries.get(key)
+  if (!entry) {
+    return null
+  }
+  if (entry.expiresAt <= Date.now()) {
+    deleteEntry(key)
+    return null
+  }
+  // Refresh LRU position
+  entries.delete(key)
+  entries.set(key, entry)
+  return entry
+}
+
+export function setCachedResponse(key, body, { tags = [], ttlMs = DEFAULT_TTL_MS, etag } = {}) {
+  deleteEntry(key)
+  const entry = {
+    body,
+    etag: etag || computeEtag(body),
+    tags,
+    expiresAt: Date.now() + ttlMs
+  }
+  entries.set(key, entry)
+  for (const tag of tags) {
+    if (!tagIndex.has(tag)) {
+      tagIndex.set(tag, new Set())
+    }
+    tagIndex.get(tag).add(key)
+  }
+
+  while (entries.size > MAX_ENTRIES) {
+    deleteEntry(entries.keys().next().value)
+  }
+  return entry
+}
+
+// Drop every cached response built from any of the given tags
+export function invalidateTags(...tags) {
+  for (const tag of tags) {
+    const keys = tagIndex.get(tag)
+    if (keys) {
+      for (const key of [...keys]) {
+        deleteEntry(key)
+      }
+    }
+  }
+}
+
+// Build a JSON response with ETag/Cache-Control, or a bodiless 304 when the
+// client already holds the current representation
+export function conditionalJsonResponse(request, body, { etag, cacheControl = CACHE_POLICIES.revalidate, cacheStatus } = {}) {
+  const tag = etag || computeEtag(body)
+  const headers = {
+    ETag: tag,
+    'Cache-Control': cacheControl,
+    Vary: 'Authorization, Cookie'
+  }
+  if (cacheStatus) {
+    headers['X-Response-Cache'] = cacheStatus
+  }
+
+  if (etagMatches(request, tag)) {
+    return new NextResponse(null, { status: 304, headers })
+  }
+  return NextResponse.json(body, { headers })
+}
+
+// Run `load` once per key at a time; concurrent callers share the same promise
+export function singleflight(key, load) {
+  if (inFlight.has(key)) {
+    return inFlight.get(key)
+  }
+  const promise = Promise.resolve()
+    .then(load)
+    .finally(() => inFlight.delete(key))
+  inFlight.set(key, promise)
+  return promise
+}
+
+// Current version of a cache scope. Embedding it in cache keys means a load
+// that was already in flight when the scope changed cannot repopulate the new key.
+export function cacheVersion(scope) {
+  return versions.get(scope) || 0
+}
+
+// Invalidate a scope: bump its version and drop everything tagged with it
+export function bumpCacheVersion(scope) {
+  versions.set(scope, cacheVersion(scope) + 1)
+  invalidateTags(scope)
+}
+
+// Cache-or-load with request coalescing. `load` returns { status, body }; only
+// 200s are stored. Resolves to { status, body, etag, cacheStatus } where
+// cacheStatus is HIT, MISS or COALESCED (joined another caller's load).
+export async function cachedLoad(key, { tags = [], ttlMs } = {}, load) {
+  const cached = getCachedResponse(key)
+  if (cached) {
+    recordCacheResult('response', 'HIT')
+    return { status: 200, body: cached.body, etag: cached.etag, cacheStatus: 'HIT' }
+  }
+
+  const joining = inFlight.has(key)
+  const result = await singleflight(key, async () => {
+    const loaded = await load()
+    if (loaded.status !== 200) {
+      return loaded
+    }
+    const entry = setCachedResponse(key, loaded.body, { tags, ttlMs })
+    return { status: 200, body: entry.body, etag: entry.etag }
+  })
+  const cacheStatus = joining ? 'COALESCED' : 'MISS'
+  recordCacheResult('response', cacheStatus)
+  return { ...result, cacheStatus }
+}
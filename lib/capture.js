@@ -0,0 +1,114 @@
+import { createHash } from 'crypto'
+import { createWriteStream } from 'fs'
+import { routeLabel } from '@/lib/metrics'
+
+// Optional traffic capture for load testing. With TRAFFIC_CAPTURE_FILE set,
+// every API request is appended to that file as one JSON line: when it arrived,
+// route, method, status, duration and the shape of its body and query string.
+// traffic_replay.py plays a capture back against a local stack.
+//
+// Records are sanitized: strings are replaced by a length placeholder unless
+// they are ids, dates or the value of a known enum field, and callers are
+// identified only by a hash of their credentials, so a capture can be shared
+// without student answers, messages or tokens in it.
+
+const CAPTURE_FILE = process.env.TRAFFIC_CAPTURE_FILE
+const SAMPLE_RATE = parseFloat(process.env.TRAFFIC_CAPTURE_SAMPLE || '1')
+
+const UUID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+const KEYWORD = /^[a-z0-9_.,-]{1,40}$/ // Enum-like values such as 'medium' or 'lesson_plans,doubts'
+// Body and query fields whose values are enums, flags or counts, never free text
+const ENUM_FIELDS = new Set([
+  'type', 'types', 'status', 'role', 'difficulty', 'severity', 'priorityLevel', 'priority_level',
+  'intervention_type', 'support_type', 'gradeLevel', 'grade_level', 'period', 'days', 'limit',
+  'variants', 'download', 'unread', 'resolved', 'follow_up_required', 'attemptNumber'
+])
+const ISO_DATE = /^\d{4}-\d{2}-\d{2}(T[\d:.]+(Z|[+-]\d{2}:?\d{2})?)?$/
+
+let stream = null
+
+function captureStream() {
+  if (!stream) {
+    stream = createWriteStream(CAPTURE_FILE, { flags: 'a' })
+    stream.on('error', error => console.error('Traffic capture write failed:', error))
+  }
+  return stream
+}
+
+// Keep ids, dates, numbers, booleans and keyword values of ENUM_FIELDS; replace
+// other strings by "<text:N>" so the replayer can send text of the same length.
+// `field` is the key the value sits under (array items inherit their array's).
+export function sanitizeValue(value, field = null) {
+  if (typeof value === 'string') {
+    if (UUID.test(value) || ISO_DATE.test(value) || (ENUM_FIELDS.has(field) && KEYWORD.test(value))) {
+      return value
+    }
+    return `<text:${value.length}>`
+  }
+  if (Array.isArray(value)) {
+    return value.map(item => sanitizeValue(item, field))
+  }
+  if (value && typeof value === 'object') {
+    return Object.fromEntries(Object.entries(value).map(([key, item]) => [key, sanitizeValue(item, key)]))
+  }
+  return value
+}
+
+function clientId(request) {
+  const credentials = request.headers.get('authorization') || request.headers.get('cookie')
+  if (!credentials) {
+    return null
+  }
+  return createHash('sha256').update(credentials).digest('hex').slice(0, 12)
+}
+
+async function bodyShape(request) {
+  if (request.method === 'GET' || request.method === 'DELETE') {
+    return undefined
+  }
+  const text = await request.text().catch(() => '')
+  if (!text) {
+    return undefined
+  }
+  try {
+    return sanitizeValue(JSON.parse(text))
+  } catch {
+    return `<text:${text.length}>`
+  }
+}
+
+// Run `handler` and append a record of the request once it has been answered.
+// The body is read from a clone, so the handler still sees the original stream.
+export async function captureRequest(request, route, handler) {
+  if (!CAPTURE_FILE || Math.random() >= SAMPLE_RATE) {
+    return handler()
+  }
+
+  const arrivedAt = new Date()
+  const copy = request.clone()
+  const started = process.hrtime.bigint()
+  let status = 500
+  try {
+    const response = await handler()
+    status = response.status
+    return response
+  } finally {
+    const durationMs = Number(process.hrtime.bigint() - started) / 1e6
+    const url = new URL(request.url)
+    bodyShape(copy).then(body => {
+      const record = {
+        ts: arrivedAt.toISOString(),
+        method: request.method,
+        path: route,
+        route: routeLabel(route),
+        query: sanitizeValue(Object.fromEntries(url.searchParams)),
+        prefer: request.headers.get('prefer') || undefined,
+        client: clientId(request),
+        status,
+        durationMs: Math.round(durationMs * 10) / 10,
+        body
+      }
+      captureStream().write(`${JSON.stringify(record)}\n`)
+    })
+  }
+}
@@ -0,0 +1,66 @@
+import { AsyncLocalStorage } from 'async_hooks'
+
+// Per-request deadlines. Every API request runs under a deadline kept in async
+// context; the pooled fetch combines it with its own signal, so Supabase queries
+// and AI calls made anywhere while serving the request are aborted once it
+// passes instead of holding the worker until the platform kills it. Work that
+// takes no AbortSignal (Mongo, rendering) is bounded with raceDeadline().
+
+const deadlineContext = new AsyncLocalStorage()
+
+export class DeadlineExceededError extends Error {
+  constructor(message = 'Request deadline exceeded') {
+    super(message)
+    this.name = 'DeadlineExceededError'
+  }
+}
+
+function startDeadline(ms, parent) {
+  const deadline = Math.min(Date.now() + ms, parent ? parent.deadline : Infinity)
+  const timeout = AbortSignal.timeout(Math.max(0, deadline - Date.now()))
+  return {
+    deadline,
+    signal: parent ? AbortSignal.any([parent.signal, timeout]) : timeout
+  }
+}
+
+// Run `handler` under a fresh deadline of `ms`, ignoring any enclosing one.
+// Used for API requests and background jobs, which outlive their request.
+export function runWithDeadline(ms, handler) {
+  return deadlineContext.run(startDeadline(ms, null), handler)
+}
+
+// Run `work` with at most `ms` of the current deadline, e.g. one optional
+// section of a dashboard. Never extends the enclosing deadline.
+export function withTimeBudget(ms, work) {
+  return deadlineContext.run(startDeadline(ms, deadlineContext.getStore()), async () => await work())
+}
+
+// AbortSignal of the current deadline (undefined outside one)
+export function deadlineSignal() {
+  return deadlineContext.getStore()?.signal
+}
+
+export function remainingMs() {
+  const current = deadlineContext.getStore()
+  return current ? Math.max(0, current.deadline - Date.now()) : Infinity
+}
+
+// Resolve with `work()`, or reject with DeadlineExceededError when the current
+// deadline passes first. The work itself keeps running; anything it sends
+// upstream afterwards is aborted by the signal.
+export function raceDeadline(work) {
+  const signal = deadlineSignal()
+  if (!signal) {
+    return work()
+  }
+  if (signal.aborted) {
+    return Promise.reject(new DeadlineExceededError())
+  }
+  let onAbort
+  const expired = new Promise((_, reject) => {
+    onAbort = () => reject(new DeadlineExceededError())
+    signal.addEventListener('abort', onAbort, { once: true })
+  })
+  return Promise.race([work(), expired]).finally(() => signal.removeEventListener('abort', onAbort))
+}
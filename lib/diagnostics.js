@@ -0,0 +1,85 @@
+import { readdir } from 'fs/promises'
+import path from 'path'
+import v8 from 'v8'
+
+// Process health for soak tests (soak_test.py): memory, V8 heap, open file
+// descriptors and the libuv resources keeping the event loop busy. A leak of
+// Mongo connections, keep-alive sockets or timers shows up as steady growth in
+// one of these between samples.
+
+const HEAP_SNAPSHOT_DIR = process.env.HEAP_SNAPSHOT_DIR || '/tmp'
+const HEAP_SNAPSHOT_MAX_FILES = parseInt(process.env.HEAP_SNAPSHOT_MAX_FILES || '20')
+const HEAP_SNAPSHOT_MIN_INTERVAL_MS = parseInt(process.env.HEAP_SNAPSHOT_MIN_INTERVAL_SECONDS || '60') * 1000
+
+// Snapshots contain user data and stall the process, so they also need the
+// METRICS_TOKEN that guards the endpoint
+export const heapSnapshotsEnabled = process.env.ENABLE_HEAP_SNAPSHOTS === 'true' && Boolean(process.env.METRICS_TOKEN)
+
+if (process.env.ENABLE_HEAP_SNAPSHOTS === 'true' && !heapSnapshotsEnabled) {
+  console.error('ENABLE_HEAP_SNAPSHOTS is ignored because METRICS_TOKEN is not set')
+}
+
+let snapshotsWritten = 0
+let lastSnapshotAt = 0
+
+async function openFileDescriptors() {
+  try {
+    return (await readdir('/proc/self/fd')).length
+  } catch {
+    return null // Not Linux
+  }
+}
+
+function countBy(items) {
+  const counts = {}
+  for (const item of items) {
+    counts[item] = (counts[item] || 0) + 1
+  }
+  return counts
+}
+
+export async function getProcessStats() {
+  const memory = process.memoryUsage()
+  const heap = v8.getHeapStatistics()
+  const resources = process.getActiveResourcesInfo()
+  const byType = countBy(resources)
+  return {
+    pid: process.pid,
+    uptimeSeconds: Math.round(process.uptime()),
+    rssBytes: memory.rss,
+    heapUsedBytes: memory.heapUsed,
+    heapTotalBytes: memory.heapTotal,
+    externalBytes: memory.external,
+    arrayBuffersBytes: memory.arrayBuffers,
+    heapSizeLimitBytes: heap.heap_size_limit,
+    detachedContexts: heap.number_of_detached_contexts,
+    openFileDescriptors: await openFileDescriptors(),
+    activeResources: resources.length,
+    activeSockets: byType.TCPSocketWrap || 0,
+    activeTimers: byType.Timeout || 0,
+    activeResourcesByType: byType
+  }
+}
+
+// Why a heap snapshot cannot be written right now, or null. Each process writes
+// at most HEAP_SNAPSHOT_MAX_FILES, at least HEAP_SNAPSHOT_MIN_INTERVAL_SECONDS apart.
+export function heapSnapshotLimitReason() {
+  if (snapshotsWritten >= HEAP_SNAPSHOT_MAX_FILES) {
+    return `Heap snapshot limit of ${HEAP_SNAPSHOT_MAX_FILES} reached for this process`
+  }
+  const waitMs = lastSnapshotAt + HEAP_SNAPSHOT_MIN_INTERVAL_MS - Date.now()
+  if (waitMs > 0) {
+    return `Next heap snapshot allowed in ${Math.ceil(waitMs / 1000)}s`
+  }
+  return null
+}
+
+// Write a .heapsnapshot for Chrome DevTools. This blocks the event loop for
+// seconds on a large heap, which is why it is off unless explicitly enabled.
+export function writeHeapSnapshot(label = 'soak') {
+  const safeLabel = String(label).replace(/[^a-z0-9_-]/gi, '').slice(0, 40) || 'soak'
+  const file = path.join(HEAP_SNAPSHOT_DIR, `proxilearn-${safeLabel}-${process.pid}-${Date.now()}.heapsnapshot`)
+  snapshotsWritten++
+  lastSnapshotAt = Date.now()
+  return v8.writeHeapSnapshot(file)
+}
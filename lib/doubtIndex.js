@@ -0,0 +1,260 @@
+// Similar-doubt retrieval for POST /doubts.
+// Answered doubts are stored in the Mongo `doubt_index` collection (the API
+// cannot read other students' doubts through RLS) and indexed in memory as
+// TF-IDF vectors per subject. A new doubt whose cosine similarity to an
+// answered one in the same subject and assignment clears the threshold reuses
+// that answer instead of waiting on a fresh AI completion.
+
+const INDEX_COLLECTION = 'doubt_index'
+const MATCH_THRESHOLD = parseFloat(process.env.DOUBT_MATCH_THRESHOLD || '0.8')
+const MIN_SHARED_TERMS = 3
+const MAX_DOCUMENTS_PER_SUBJECT = 5000
+const SUBJECT_INDEX_TTL_MS = 30 * 60 * 1000 // Reload from Mongo to pick up other instances' entries
+
+const STOPWORDS = new Set([
+  'a', 'about', 'am', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'been', 'but', 'by', 'can',
+  'could', 'did', 'do', 'does', 'for', 'from', 'get', 'had', 'has', 'have', 'he', 'her', 'here',
+  'him', 'his', 'how', 'i', 'if', 'in', 'into', 'is', 'it', 'its', 'just', 'me', 'my', 'of', 'on',
+  'or', 'our', 'please', 'she', 'so', 'some', 'that', 'the', 'their', 'them', 'then', 'there',
+  'these', 'they', 'this', 'to', 'understand', 'was', 'we', 'were', 'what', 'when', 'where',
+  'which', 'who', 'why', 'will', 'with', 'would', 'you', 'your', 'sir', 'maam', 'teacher',
+  'question', 'doubt', 'help', 'explain', 'dont', 'know', 'im', 'confused'
+])
+
+const subjectIndexes = new Map()
+let indexesReady = null
+
+async function ensureIndexCollection(db) {
+  if (!indexesReady) {
+    indexesReady = Promise.all([
+      db.collection(INDEX_COLLECTION).createIndex({ doubt_id: 1 }, { unique: true }),
+      db.collection(INDEX_COLLECTION).createIndex({ subject_id: 1, created_at: -1 })
+    ]).catch(error => {
+      indexesReady = null
+      console.error('Failed to create doubt index collection indexes:', error)
+    })
+  }
+  return indexesReady
+}
+
+// Light suffix stripping so "fractions"/"fraction" and "dividing"/"divide" meet
+function stem(word) {
+  if (word.length > 5 && word.endsWith('ing')) return word.slice(0, -3)
+  if (word.length > 4 && word.endsWith('ies')) return `${word.slice(0, -3)}y`
+  if (word.length > 4 && word.endsWith('ed')) return word.slice(0, -2)
+  if (word.length > 3 && word.endsWith('es')) return word.slice(0, -2)
+  if (word.length > 3 && word.endsWith('s') && !word.endsWith('ss')) return word.slice(0, -1)
+  return word
+}
+
+// Unigrams plus bigrams of content words
+export function tokenize(text) {
+  const words = String(text || '')
+    .toLowerCase()
+    .replace(/[’']/g, '')
+    .split(/[^a-z0-9]+/)
+    .filter(word => word && !STOPWORDS.has(word))
+    .map(stem)
+
+  const terms = [...words]
+  for (let i = 0; i < words.length - 1; i++) {
+    terms.push(`${words[i]} ${words[i + 1]}`)
+  }
+  return terms
+}
+
+function termCounts(terms) {
+  const counts = new Map()
+  for (const term of terms) {
+    counts.set(term, (counts.get(term) || 0) + 1)
+  }
+  return counts
+}
+
+function doubtText({ title, questionText, context }) {
+  return [title, questionText, context].filter(Boolean).join(' ')
+}
+
+function createSubjectIndex() {
+  return {
+    documents: new Map(),
+    documentFrequency: new Map(),
+    loadedAt: Date.now()
+  }
+}
+
+function addToSubjectIndex(index, entry) {
+  // Entries without a saved response have nothing to reuse
+  if (index.documents.has(entry.doubt_id) || !entry.response_id || !entry.response_text) {
+    return
+  }
+  const counts = termCounts(tokenize(entry.text))
+  if (counts.size === 0) {
+    return
+  }
+  for (const term of counts.keys()) {
+    index.documentFrequency.set(term, (index.documentFrequency.get(term) || 0) + 1)
+  }
+  index.documents.set(entry.doubt_id, {
+    doubtId: entry.doubt_id,
+    assignmentId: entry.assignment_id || null,
+    responseId: entry.response_id,
+    responseText: entry.response_text,
+    counts
+  })
+}
+
+// Sublinear-tf TF-IDF vector, L2 normalized
+function vectorize(index, counts) {
+  const total = index.documents.size
+  const vector = new Map()
+  let norm = 0
+  for (const [term, count] of counts) {
+    const idf = Math.log((total + 1) / ((index.documentFrequency.get(term) || 0) + 1)) + 1
+    const weight = (1 + Math.log(count)) * idf
+    vector.set(term, weight)
+    norm += weight * weight
+  }
+  norm = Math.sqrt(norm) || 1
+  for (const [term, weight] of vector) {
+    vector.set(term, weight / norm)
+  }
+  return vector
+}
+
+async function getSubjectIndex(db, subjectId) {
+  const existing = subjectIndexes.get(subjectId)
+  if (existing && Date.now() - existing.loadedAt < SUBJECT_INDEX_TTL_MS) {
+    return existing
+  }
+
+  const index = createSubjectIndex()
+  const entries = await db.collection(INDEX_COLLECTION)
+    .find({ subject_id: subjectId })
+    .sort({ created_at: -1 })
+    .limit(MAX_DOCUMENTS_PER_SUBJECT)
+    .project({ doubt_id: 1, assignment_id: 1, response_id: 1, response_text: 1, text: 1 })
+    .toArray()
+  for (const entry of entries) {
+    addToSubjectIndex(index, entry)
+  }
+  subjectIndexes.set(subjectId, index)
+  return index
+}
+
+// Find an answered doubt similar enough to reuse its answer.
+// Returns { doubtId, responseId, responseText, similarity } or null.
+export async function findSimilarDoubt(db, { subjectId, assignmentId, title, questionText, context }) {
+  const index = await getSubjectIndex(db, subjectId)
+  if (index.documents.size === 0) {
+    return null
+  }
+
+  const queryCounts = termCounts(tokenize(doubtText({ title, questionText, context })))
+  if (queryCounts.size === 0) {
+    return null
+  }
+  const queryVector = vectorize(index, queryCounts)
+
+  let best = null
+  for (const document of index.documents.values()) {
+    // Answers are only reused within the same assignment (or both unattached)
+    if (document.assignmentId !== (assignmentId || null)) {
+      continue
+    }
+    let shared = 0
+    for (const term of queryVector.keys()) {
+      if (document.counts.has(term)) shared++
+    }
+    if (shared < MIN_SHARED_TERMS) {
+      continue
+    }
+    const documentVector = vectorize(index, document.counts)
+    let similarity = 0
+    for (const [term, weight] of queryVector) {
+      similarity += weight * (documentVector.get(term) || 0)
+    }
+    if (!best || similarity > best.similarity) {
+      best = { document, similarity }
+    }
+  }
+
+  if (!best || best.similarity < MATCH_THRESHOLD) {
+    return null
+  }
+  return {
+    doubtId: best.document.doubtId,
+    responseId: best.document.responseId,
+    responseText: best.document.responseText,
+    similarity: Math.round(best.similarity * 1000) / 1000
+  }
+}
+
+// Record an answered doubt so later similar doubts can reuse the answer
+export async function addDoubtToIndex(db, { doubtId, subjectId, assignmentId, title, questionText, context, responseId, responseText }) {
+  if (!responseId || !responseText) {
+    return
+  }
+  await ensureIndexCollection(db)
+  const entry = {
+    doubt_id: doubtId,
+    subject_id: subjectId,
+    assignment_id: assignmentId || null,
+    text: doubtText({ title, questionText, context }),
+    response_id: responseId,
+    response_text: responseText,
+    created_at: new Date()
+  }
+  await db.collection(INDEX_COLLECTION).updateOne(
+    { doubt_id: doubtId },
+    { $set: entry },
+    { upsert: true }
+  )
+
+  const index = subjectIndexes.get(subjectId)
+  if (index) {
+    addToSubjectIndex(index, entry)
+  }
+}
+
+// Rebuild the stored index for a subject from its answered doubts (backfill).
+// `doubts` rows carry doubt_responses; AI answers, or teacher answers not marked
+// unhelpful, are indexed.
+export async function rebuildSubjectIndex(db, subjectId, doubts) {
+  await ensureIndexCollection(db)
+  let indexed = 0
+  const operations = []
+  for (const doubt of doubts) {
+    const answer = (doubt.doubt_responses || [])
+      .filter(response => ['ai', 'teacher'].includes(response.response_type) && response.is_helpful !== false &&
+        response.response_text)
+      .sort((a, b) => (b.is_helpful === true) - (a.is_helpful === true) || (b.upvotes || 0) - (a.upvotes || 0))[0]
+    if (!answer) {
+      continue
+    }
+    operations.push({
+      updateOne: {
+        filter: { doubt_id: doubt.id },
+        update: {
+          $set: {
+            doubt_id: doubt.id,
+            subject_id: subjectId,
+            assignment_id: doubt.assignment_id || null,
+            text: doubtText({ title: doubt.title, questionText: doubt.question_text, context: doubt.context }),
+            response_id: answer.id,
+            response_text: answer.response_text,
+            created_at: new Date(doubt.created_at)
+          }
+        },
+        upsert: true
+      }
+    })
+    indexed++
+  }
+
+  if (operations.length > 0) {
+    await db.collection(INDEX_COLLECTION).bulkWrite(operations, { ordered: false })
+  }
+  subjectIndexes.delete(subjectId)
+  return indexed
+}
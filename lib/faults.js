@@ -0,0 +1,86 @@
+import { Response } from 'undici'
+
+// Fault injection for outbound calls, used to check that deadlines keep tail
+// latency bounded when Supabase or OpenRouter misbehave (deadline_test.py).
+// Off unless FAULT_INJECTION is set; never set it in production. Format is a
+// comma-separated list of `upstream:fault@rate` rules, for example
+//
+//   FAULT_INJECTION="supabase:latency=800@0.3,supabase:error=503@0.05,openrouter:hang@0.2"
+//
+// upstream is supabase, openrouter, other or * ; fault is latency=<ms>,
+// error=<status> or hang (wait until the request is aborted); rate is the
+// fraction of calls affected (default 1). Every matching rule rolls separately.
+
+const FAULT_KINDS = ['latency', 'error', 'hang']
+
+function parseRule(text) {
+  const match = text.trim().match(/^([\w*]+):(latency|error|hang)(?:=(\d+))?(?:@([\d.]+))?$/)
+  if (!match) {
+    console.error(`Ignoring malformed FAULT_INJECTION rule: ${text}`)
+    return null
+  }
+  const [, upstream, kind, value, rate] = match
+  if (kind !== 'hang' && value === undefined) {
+    console.error(`Ignoring FAULT_INJECTION rule without a value: ${text}`)
+    return null
+  }
+  return {
+    upstream,
+    kind,
+    value: value === undefined ? null : parseInt(value),
+    rate: rate === undefined ? 1 : Math.min(1, parseFloat(rate))
+  }
+}
+
+const rules = (process.env.FAULT_INJECTION || '')
+  .split(',')
+  .filter(text => text.trim())
+  .map(parseRule)
+  .filter(rule => rule && FAULT_KINDS.includes(rule.kind))
+
+const injected = { latency: 0, error: 0, hang: 0 }
+
+function abortError(signal) {
+  return signal.reason || new DOMException('This operation was aborted', 'AbortError')
+}
+
+// Resolve after `ms`, or reject as soon as `signal` aborts
+function sleep(ms, signal) {
+  return new Promise((resolve, reject) => {
+    if (signal?.aborted) {
+      reject(abortError(signal))
+      return
+    }
+    const timer = ms === Infinity ? null : setTimeout(resolve, ms)
+    signal?.addEventListener('abort', () => {
+      clearTimeout(timer)
+      reject(abortError(signal))
+    }, { once: true })
+  })
+}
+
+export function getFaultConfig() {
+  return { enabled: rules.length > 0, rules, injected: { ...injected } }
+}
+
+// Apply the configured faults to one outbound call. Resolves to a synthetic
+// error Response to return instead of calling upstream, or null to proceed.
+export async function injectFault(upstream, signal) {
+  for (const rule of rules) {
+    if ((rule.upstream !== '*' && rule.upstream !== upstream) || Math.random() >= rule.rate) {
+      continue
+    }
+    injected[rule.kind]++
+    if (rule.kind === 'latency') {
+      await sleep(rule.value, signal)
+    } else if (rule.kind === 'hang') {
+      await sleep(Infinity, signal)
+    } else {
+      return new Response(JSON.stringify({ message: `Injected ${upstream} fault`, code: 'FAULT_INJECTED' }), {
+        status: rule.value,
+        headers: { 'Content-Type': 'application/json' }
+      })
+    }
+  }
+  return null
+}
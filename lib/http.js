@@ -0,0 +1,183 @@
+import diagnosticsChannel from 'diagnostics_channel'
+import dns from 'dns'
+import net from 'net'
+import { Agent, fetch as undiciFetch } from 'undici'
+import { deadlineSignal } from '@/lib/deadline'
+import { getFaultConfig, injectFault } from '@/lib/faults'
+import { recordUpstreamCall } from '@/lib/metrics'
+
+// Shared outbound HTTP transport for Supabase and OpenRouter calls.
+// One keep-alive dispatcher per server process keeps TLS connections open
+// between requests, so a burst of API calls reuses warm sockets instead of
+// paying a handshake each time. Per-origin connections are capped so a burst
+// queues on the pool instead of opening hundreds of sockets.
+// Every call is also bound to the current request deadline (lib/deadline.js).
+
+const MAX_CONNECTIONS_PER_ORIGIN = parseInt(process.env.HTTP_MAX_CONNECTIONS || '64')
+const KEEP_ALIVE_TIMEOUT_MS = parseInt(process.env.HTTP_KEEP_ALIVE_MS || '30000')
+
+const dispatcher = new Agent({
+  connections: MAX_CONNECTIONS_PER_ORIGIN,
+  keepAliveTimeout: KEEP_ALIVE_TIMEOUT_MS,
+  keepAliveMaxTimeout: 10 * 60 * 1000,
+  pipelining: 1
+})
+
+const SUPABASE_HOST = hostOf(process.env.NEXT_PUBLIC_SUPABASE_URL)
+const OPENROUTER_HOST = hostOf(process.env.OPENROUTER_BASE_URL)
+
+function hostOf(url) {
+  try {
+    return new URL(url).host
+  } catch {
+    return null
+  }
+}
+
+function upstreamOf(input) {
+  const host = hostOf(typeof input === 'string' ? input : input.url || String(input))
+  if (host && host === SUPABASE_HOST) return 'supabase'
+  if (host && host === OPENROUTER_HOST) return 'openrouter'
+  return 'other'
+}
+
+// Abort on either the caller's signal or the request deadline
+function combinedSignal(signal) {
+  const deadline = deadlineSignal()
+  if (!signal || !deadline) {
+    return signal || deadline
+  }
+  return AbortSignal.any([signal, deadline])
+}
+
+// fetch() that goes through the shared pool. Used as the `fetch` option of
+// supabase-js and the OpenAI SDK.
+export async function pooledFetch(input, init = {}) {
+  const upstream = upstreamOf(input)
+  recordUpstreamCall(upstream)
+  const signal = combinedSignal(init.signal)
+  const fault = await injectFault(upstream, signal)
+  if (fault) {
+    return fault
+  }
+  return undiciFetch(input, { ...init, signal, dispatcher })
+}
+
+// Addresses a user-supplied URL must never reach: loopback, private networks,
+// link-local (including the 169.254.169.254 metadata service), CGNAT,
+// multicast/reserved ranges and their IPv6 counterparts. BlockList checks
+// IPv4-mapped IPv6 addresses (::ffff:a.b.c.d) against the IPv4 rules.
+const NON_PUBLIC_ADDRESSES = new net.BlockList()
+for (const [address, prefix] of [
+  ['0.0.0.0', 8], ['10.0.0.0', 8], ['100.64.0.0', 10], ['127.0.0.0', 8], ['169.254.0.0', 16],
+  ['172.16.0.0', 12], ['192.0.0.0', 24], ['192.168.0.0', 16], ['198.18.0.0', 15], ['224.0.0.0', 4], ['240.0.0.0', 4]
+]) {
+  NON_PUBLIC_ADDRESSES.addSubnet(address, prefix, 'ipv4')
+}
+for (const [address, prefix] of [
+  ['::', 128], ['::1', 128], ['64:ff9b::', 96], ['fc00::', 7], ['fe80::', 10], ['ff00::', 8]
+]) {
+  NON_PUBLIC_ADDRESSES.addSubnet(address, prefix, 'ipv6')
+}
+
+export function isPublicAddress(address) {
+  const family = net.isIP(address)
+  return family !== 0 && !NON_PUBLIC_ADDRESSES.check(address, family === 4 ? 'ipv4' : 'ipv6')
+}
+
+// DNS lookup for sockets opened to user-supplied hosts. The addresses are
+// checked inside the socket's own lookup, so a host cannot resolve to a public
+// address for a check and to a private one for the connection.
+function publicLookup(hostname, options, callback) {
+  dns.lookup(hostname, options, (error, address, family) => {
+    if (error) {
+      callback(error)
+      return
+    }
+    const addresses = Array.isArray(address) ? address : [{ address, family }]
+    const blocked = addresses.find(entry => !isPublicAddress(entry.address))
+    if (blocked) {
+      callback(new Error(`Refusing to connect to non-public address ${blocked.address} for ${hostname}`))
+      return
+    }
+    callback(null, address, family)
+  })
+}
+
+const publicDispatcher = new Agent({
+  connections: 8,
+  keepAliveTimeout: KEEP_ALIVE_TIMEOUT_MS,
+  connect: { lookup: publicLookup }
+})
+
+// fetch() for URLs that users control (school logos). Only https URLs on public
+// addresses are fetched, and redirects are returned as-is instead of followed,
+// so the server cannot be pointed at internal hosts.
+export async function publicFetch(url, init = {}) {
+  const target = new URL(url)
+  if (target.protocol !== 'https:') {
+    throw new Error(`Refusing to fetch ${target.protocol} URL`)
+  }
+  // Literal IP hosts skip the DNS lookup, so check them here
+  const host = target.hostname.replace(/^\[|\]$/g, '')
+  if (net.isIP(host) && !isPublicAddress(host)) {
+    throw new Error(`Refusing to fetch non-public address ${host}`)
+  }
+  return undiciFetch(target, { ...init, redirect: 'manual', dispatcher: publicDispatcher })
+}
+
+// Connection reuse counters, fed by undici's diagnostics channels. A request
+// sent on a socket that already carried one counts as reused.
+const stats = {
+  startedAt: new Date().toISOString(),
+  requests: 0,
+  reusedRequests: 0,
+  connectionsOpened: 0,
+  byOrigin: new Map()
+}
+const usedSockets = new WeakSet()
+
+function originStats(origin) {
+  if (!stats.byOrigin.has(origin)) {
+    stats.byOrigin.set(origin, { requests: 0, reusedRequests: 0, connectionsOpened: 0 })
+  }
+  return stats.byOrigin.get(origin)
+}
+
+diagnosticsChannel.channel('undici:client:connected').subscribe(({ connectParams }) => {
+  const origin = `${connectParams.protocol}//${connectParams.host}`
+  stats.connectionsOpened++
+  originStats(origin).connectionsOpened++
+})
+
+diagnosticsChannel.channel('undici:client:sendHeaders').subscribe(({ request, socket }) => {
+  const origin = originStats(request.origin)
+  stats.requests++
+  origin.requests++
+  if (usedSockets.has(socket)) {
+    stats.reusedRequests++
+    origin.reusedRequests++
+  } else {
+    usedSockets.add(socket)
+  }
+})
+
+function reuseRatio({ requests, reusedRequests }) {
+  return requests > 0 ? Math.round((reusedRequests / requests) * 1000) / 1000 : null
+}
+
+export function getTransportStats() {
+  return {
+    startedAt: stats.startedAt,
+    maxConnectionsPerOrigin: MAX_CONNECTIONS_PER_ORIGIN,
+    keepAliveTimeoutMs: KEEP_ALIVE_TIMEOUT_MS,
+    requests: stats.requests,
+    reusedRequests: stats.reusedRequests,
+    connectionsOpened: stats.connectionsOpened,
+    reuseRatio: reuseRatio(stats),
+    faultInjection: getFaultConfig(),
+    origins: Object.fromEntries(
+      [...stats.byOrigin].map(([origin, counts]) => [origin, { ...counts, reuseRatio: reuseRatio(counts) }])
+    )
+  }
+}
@@ -0,0 +1,148 @@
+import { createHash } from 'crypto'
+import { NextResponse } from 'next/server'
+import { incrementCounter } from '@/lib/metrics'
+
+// Idempotency-Key support for POSTs that are expensive or not safe to repeat
+// (quiz submit, coordinator communications, AI generation). The first request
+// with a key runs normally and its response is kept; a retry with the same key
+// gets the stored response back without running the handler again, and a
+// duplicate that arrives while the first is still running waits for it.
+// Results live in an in-process LRU bounded by IDEMPOTENCY_MAX_ENTRIES and
+// expire after IDEMPOTENCY_TTL_SECONDS. Like the response cache, the store is
+// per server instance, so retries must reach the same instance to be deduplicated.
+
+const MAX_ENTRIES = parseInt(process.env.IDEMPOTENCY_MAX_ENTRIES || '5000')
+const TTL_MS = parseInt(process.env.IDEMPOTENCY_TTL_SECONDS || '86400') * 1000
+const MAX_KEY_LENGTH = 255
+const KEY_PATTERN = /^[\x21-\x7e]+$/ // Visible ASCII, no spaces
+
+// Not stored, so a retry runs again: auth failures, rate limiting and server errors
+const TRANSIENT_STATUSES = new Set([401, 408, 429])
+
+const results = new Map()
+const inFlight = new Map()
+
+function recordResult(result) {
+  incrementCounter('proxilearn_idempotency_requests_total', 'Requests carrying an Idempotency-Key by result', { result })
+}
+
+// JSON with object keys sorted, so a retry that rebuilt its body in a different
+// key order still matches
+function canonicalJson(value) {
+  if (Array.isArray(value)) {
+    return `[${value.map(canonicalJson).join(',')}]`
+  }
+  if (value && typeof value === 'object') {
+    const fields = Object.keys(value).sort().map(key => `${JSON.stringify(key)}:${canonicalJson(value[key])}`)
+    return `{${fields.join(',')}}`
+  }
+  return JSON.stringify(value)
+}
+
+function fingerprint(method, route, text) {
+  let body = text
+  try {
+    body = canonicalJson(JSON.parse(text))
+  } catch {
+    // Not JSON: compare the raw body
+  }
+  return createHash('sha256').update(`${method} ${route}\n${body}`).digest('base64url')
+}
+
+function getResult(key) {
+  const entry = results.get(key)
+  if (!entry) {
+    return null
+  }
+  if (entry.expiresAt <= Date.now()) {
+    results.delete(key)
+    return null
+  }
+  return entry
+}
+
+function storeResult(key, entry) {
+  results.delete(key)
+  results.set(key, { ...entry, expiresAt: Date.now() + TTL_MS })
+  while (results.size > MAX_ENTRIES) {
+    results.delete(results.keys().next().value)
+  }
+}
+
+function isStorable(status) {
+  return status < 500 && !TRANSIENT_STATUSES.has(status)
+}
+
+// Snapshot a handler response so it can be replayed later
+async function snapshot(response) {
+  const headers = [...response.headers].filter(([name]) => name.toLowerCase() !== 'set-cookie')
+  return { status: response.status, headers, body: await response.clone().text() }
+}
+
+function replay(entry) {
+  const response = new NextResponse(entry.body, { status: entry.status, headers: entry.headers })
+  response.headers.set('Idempotent-Replayed', 'true')
+  return response
+}
+
+function errorResponse(status, error) {
+  return NextResponse.json({ error }, { status })
+}
+
+// Run `handle` at most once per Idempotency-Key. `resolveScope` returns the
+// caller's identity (e.g. the user id) so keys never collide across users, or
+// null when the caller cannot be identified, in which case the request runs
+// without deduplication. Requests without the header are passed straight through.
+export async function withIdempotency(request, route, resolveScope, handle) {
+  const idempotencyKey = request.headers.get('idempotency-key')
+  if (idempotencyKey === null) {
+    return handle()
+  }
+  if (idempotencyKey.length > MAX_KEY_LENGTH || !KEY_PATTERN.test(idempotencyKey)) {
+    return errorResponse(400, `Idempotency-Key must be 1-${MAX_KEY_LENGTH} visible ASCII characters`)
+  }
+
+  const scope = await resolveScope().catch(() => null)
+  if (!scope) {
+    return handle()
+  }
+
+  const key = `${scope}:${idempotencyKey}`
+  const requestFingerprint = fingerprint(request.method, route, await request.clone().text())
+
+  const stored = getResult(key)
+  if (stored) {
+    if (stored.fingerprint !== requestFingerprint) {
+      recordResult('mismatch')
+      return errorResponse(422, 'Idempotency-Key was already used for a different request')
+    }
+    recordResult('replayed')
+    return replay(stored)
+  }
+
+  const running = inFlight.get(key)
+  if (running) {
+    if (running.fingerprint !== requestFingerprint) {
+      recordResult('mismatch')
+      return errorResponse(422, 'Idempotency-Key was already used for a different request')
+    }
+    recordResult('joined')
+    return replay(await running.promise)
+  }
+
+  const promise = Promise.resolve()
+    .then(handle)
+    .then(snapshot)
+    .then(entry => {
+      if (isStorable(entry.status)) {
+        storeResult(key, { ...entry, fingerprint: requestFingerprint })
+      }
+      return entry
+    })
+    .finally(() => inFlight.delete(key))
+  inFlight.set(key, { fingerprint: requestFingerprint, promise })
+  recordResult('executed')
+
+  const entry = await promise
+  return new NextResponse(entry.body, { status: entry.status, headers: entry.headers })
+}
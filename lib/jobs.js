@@ -0,0 +1,236 @@
+import { v4 as uuidv4 } from 'uuid'
+import { runWithDeadline } from '@/lib/deadline'
+
+// Background jobs for long-running AI generation endpoints.
+// Job records live in the Mongo `generation_jobs` collection so that status and
+// results outlive the request that created them; the work itself runs in an
+// in-process queue with a concurrency cap.
+
+const JOBS_COLLECTION = 'generation_jobs'
+const MAX_CONCURRENT_JOBS = parseInt(process.env.JOB_CONCURRENCY || '4')
+const JOB_RETENTION_SECONDS = 7 * 24 * 60 * 60 // Keep finished jobs for a week
+const JOB_DEADLINE_MS = parseInt(process.env.JOB_DEADLINE_MS || String(10 * 60 * 1000))
+const JOB_HEARTBEAT_MS = 30 * 1000
+// No heartbeat for longer than a job may run = the worker process died
+const JOB_STALE_AFTER_MS = JOB_DEADLINE_MS + 5 * 60 * 1000
+const ACTIVE_STATUSES = ['queued', 'running']
+
+const pendingJobs = []
+let runningJobs = 0
+let indexesReady = null
+
+// Jobs queued or running in this process. A timer refreshes their heartbeat
+// while they wait for a slot or sit in a long AI call, so only jobs whose
+// process went away stop heartbeating.
+const localJobs = new Map() // id -> db
+let heartbeatTimer = null
+
+function trackLocalJob(db, jobId) {
+  localJobs.set(jobId, db)
+  if (!heartbeatTimer) {
+    heartbeatTimer = setInterval(sendHeartbeats, JOB_HEARTBEAT_MS)
+    heartbeatTimer.unref?.()
+  }
+}
+
+function untrackLocalJob(jobId) {
+  localJobs.delete(jobId)
+  if (localJobs.size === 0 && heartbeatTimer) {
+    clearInterval(heartbeatTimer)
+    heartbeatTimer = null
+  }
+}
+
+function sendHeartbeats() {
+  const idsByDb = new Map()
+  for (const [jobId, db] of localJobs) {
+    idsByDb.set(db, [...(idsByDb.get(db) || []), jobId])
+  }
+  for (const [db, ids] of idsByDb) {
+    db.collection(JOBS_COLLECTION)
+      .updateMany({ id: { $in: ids }, status: { $in: ACTIVE_STATUSES } }, { $set: { heartbeat_at: new Date() } })
+      .catch(error => console.error('Failed to send job heartbeats:', error))
+  }
+}
+
+async function ensureJobIndexes(db) {
+  if (!indexesReady) {
+    indexesReady = Promise.all([
+      db.collection(JOBS_COLLECTION).createIndex({ id: 1 }, { unique: true }),
+      db.collection(JOBS_COLLECTION).createIndex({ user_id: 1, created_at: -1 }),
+      db.collection(JOBS_COLLECTION).createIndex(
+        { created_at: 1 },
+        { expireAfterSeconds: JOB_RETENTION_SECONDS }
+      )
+    ]).catch(error => {
+      indexesReady = null
+      console.error('Failed to create job indexes:', error)
+    })
+  }
+  return indexesReady
+}
+
+// Check whether the caller asked for async mode (?async=true or Prefer: respond-async)
+export function wantsAsync(request) {
+  const url = new URL(request.url)
+  const asyncParam = url.searchParams.get('async')
+  if (asyncParam === 'true' || asyncParam === '1') {
+    return true
+  }
+  const prefer = request.headers.get('prefer') || ''
+  return prefer.split(',').some(value => value.trim() === 'respond-async')
+}
+
+// Create a job record and schedule `work(reportProgress)` in the background.
+// `work` must resolve to `{ status, body }`, i.e. the response the synchronous
+// endpoint would have returned.
+export async function enqueueJob(db, { type, userId, input }, work) {
+  await ensureJobIndexes(db)
+
+  const now = new Date()
+  const job = {
+    id: uuidv4(),
+    type,
+    user_id: userId,
+    input: input || {},
+    status: 'queued',
+    progress: 0,
+    stage: 'queued',
+    result: null,
+    error: null,
+    created_at: now,
+    started_at: null,
+    completed_at: null,
+    heartbeat_at: now
+  }
+
+  await db.collection(JOBS_COLLECTION).insertOne(job)
+
+  trackLocalJob(db, job.id)
+  pendingJobs.push({ db, jobId: job.id, work })
+  setImmediate(drainJobQueue)
+
+  return serializeJob(job)
+}
+
+// Look up a job owned by `userId`; returns null when missing or not owned.
+export async function getJob(db, jobId, userId) {
+  const job = await db.collection(JOBS_COLLECTION).findOne({ id: jobId, user_id: userId })
+  if (!job) {
+    return null
+  }
+
+  // A queued/running job whose worker stopped heartbeating will never finish.
+  // Jobs this process still holds are alive by definition.
+  const active = ACTIVE_STATUSES.includes(job.status)
+  if (active && !localJobs.has(job.id) && Date.now() - new Date(job.heartbeat_at).getTime() > JOB_STALE_AFTER_MS) {
+    const failedAt = new Date()
+    await db.collection(JOBS_COLLECTION).updateOne(
+      { id: job.id, status: job.status },
+      { $set: { status: 'failed', error: 'Job worker stopped before completion', completed_at: failedAt } }
+    )
+    job.status = 'failed'
+    job.error = 'Job worker stopped before completion'
+    job.completed_at = failedAt
+  }
+
+  return serializeJob(job)
+}
+
+function serializeJob(job) {
+  const finished = job.status === 'completed' || job.status === 'failed'
+  return {
+    id: job.id,
+    type: job.type,
+    status: job.status,
+    progress: job.progress,
+    stage: job.stage,
+    createdAt: job.created_at,
+    startedAt: job.started_at,
+    completedAt: job.completed_at,
+    durationMs: finished && job.completed_at
+      ? new Date(job.completed_at).getTime() - new Date(job.created_at).getTime()
+      : null,
+    result: job.status === 'completed' ? job.result : null,
+    error: job.error,
+    errorDetails: job.error_details || null
+  }
+}
+
+function drainJobQueue() {
+  while (runningJobs < MAX_CONCURRENT_JOBS && pendingJobs.length > 0) {
+    const next = pendingJobs.shift()
+    runningJobs++
+    runJob(next).finally(() => {
+      untrackLocalJob(next.jobId)
+      runningJobs--
+      drainJobQueue()
+    })
+  }
+}
+
+async function runJob({ db, jobId, work }) {
+  const jobs = db.collection(JOBS_COLLECTION)
+  // Status writes only apply while the job is still active, so a job another
+  // process already marked failed is never brought back
+  const activeJob = { id: jobId, status: { $in: ACTIVE_STATUSES } }
+
+  const reportProgress = async (progress, stage) => {
+    try {
+      await jobs.updateOne(
+        activeJob,
+        { $set: { progress: Math.max(0, Math.min(100, Math.round(progress))), stage, heartbeat_at: new Date() } }
+      )
+    } catch (error) {
+      console.error(`Failed to report progress for job ${jobId}:`, error)
+    }
+  }
+
+  try {
+    const started = await jobs.updateOne(
+      activeJob,
+      { $set: { status: 'running', stage: 'starting', started_at: new Date(), heartbeat_at: new Date() } }
+    )
+    if (started.matchedCount === 0) {
+      return // Already failed (stale) before it got a slot
+    }
+
+    // Jobs outlive the request that queued them, so they get their own deadline
+    const result = await runWithDeadline(JOB_DEADLINE_MS, () => work(reportProgress))
+    const succeeded = result.status < 400
+
+    await jobs.updateOne(
+      activeJob,
+      {
+        $set: {
+          status: succeeded ? 'completed' : 'failed',
+          progress: 100,
+          stage: succeeded ? 'completed' : 'failed',
+          result: succeeded ? result.body : null,
+          error: succeeded ? null : (result.body?.error || 'Job failed'),
+          error_details: succeeded ? null : (result.body?.details || null),
+          completed_at: new Date(),
+          heartbeat_at: new Date()
+        }
+      }
+    )
+  } catch (error) {
+    console.error(`Background job ${jobId} failed:`, error)
+    try {
+      await jobs.updateOne(
+        activeJob,
+        {
+          $set: {
+            status: 'failed',
+            stage: 'failed',
+            error: error.message || 'Job failed',
+            completed_at: new Date(),
+            heartbeat_at: new Date()
+          }
+        }
+      )
+    } catch (updateError) {
+      console.error(`Failed to record failure for job ${jobId}:`, updateError)
+    }
+  }
+}
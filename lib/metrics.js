@@ -0,0 +1,224 @@
+import { AsyncLocalStorage } from 'async_hooks'
+
+// In-process metrics in Prometheus text format, served by GET /api/metrics.
+// Counters and fixed-bucket histograms live in plain Maps keyed by their label
+// values, so recording is a couple of map lookups and additions per event.
+// Values are per server process; Prometheus aggregates across instances.
+
+const DURATION_BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+const AI_DURATION_BUCKETS = [0.5, 1, 2.5, 5, 10, 20, 30, 60, 120]
+const CALL_COUNT_BUCKETS = [0, 1, 2, 3, 5, 8, 13, 21, 34]
+const PROMPT_TOKEN_BUCKETS = [100, 250, 500, 750, 1000, 1500, 2000, 4000, 8000, 16000]
+const MAX_ROUTE_LABELS = 300
+
+const UUID_SEGMENT = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+const NUMERIC_SEGMENT = /^\d+$/
+
+const metrics = new Map()
+const requestContext = new AsyncLocalStorage()
+const routeLabels = new Set()
+const startedAt = Date.now()
+
+function labelKey(labels) {
+  return JSON.stringify(labels)
+}
+
+function defineMetric(name, type, help, buckets) {
+  if (!metrics.has(name)) {
+    metrics.set(name, { name, type, help, buckets, series: new Map() })
+  }
+  return metrics.get(name)
+}
+
+function series(metric, labels, create) {
+  const key = labelKey(labels)
+  if (!metric.series.has(key)) {
+    metric.series.set(key, { labels, ...create() })
+  }
+  return metric.series.get(key)
+}
+
+export function incrementCounter(name, help, labels = {}, value = 1) {
+  const metric = defineMetric(name, 'counter', help)
+  series(metric, labels, () => ({ value: 0 })).value += value
+}
+
+export function observeHistogram(name, help, labels, value, buckets = DURATION_BUCKETS) {
+  const metric = defineMetric(name, 'histogram', help, buckets)
+  const entry = series(metric, labels, () => ({ counts: new Array(buckets.length).fill(0), sum: 0, count: 0 }))
+  for (let i = 0; i < buckets.length; i++) {
+    if (value <= buckets[i]) {
+      entry.counts[i]++
+    }
+  }
+  entry.sum += value
+  entry.count++
+}
+
+// Collapse ids so /assignments/<uuid>/start reports as /assignments/:id/start.
+// Label count is capped so unmatched paths cannot grow memory without bound.
+export function routeLabel(route) {
+  const label = route
+    .split('/')
+    .map(segment => (UUID_SEGMENT.test(segment) || NUMERIC_SEGMENT.test(segment) ? ':id' : segment))
+    .join('/')
+  if (routeLabels.has(label)) {
+    return label
+  }
+  if (routeLabels.size >= MAX_ROUTE_LABELS) {
+    return 'other'
+  }
+  routeLabels.add(label)
+  return label
+}
+
+// Time one API request and count the upstream calls made while serving it
+export async function observeRequest(method, route, handler) {
+  const context = { supabaseCalls: 0 }
+  const started = process.hrtime.bigint()
+  let status = 500
+  try {
+    const response = await requestContext.run(context, handler)
+    status = response.status
+    return response
+  } finally {
+    const seconds = Number(process.hrtime.bigint() - started) / 1e9
+    const labels = { method, route: routeLabel(route), status: String(status) }
+    incrementCounter('proxilearn_http_requests_total', 'API requests by route and status code', labels)
+    observeHistogram('proxilearn_http_request_duration_seconds', 'API request latency by route and status code', labels, seconds)
+    observeHistogram(
+      'proxilearn_supabase_calls_per_request',
+      'Supabase HTTP calls made while serving one API request',
+      { method, route: labels.route },
+      context.supabaseCalls,
+      CALL_COUNT_BUCKETS
+    )
+  }
+}
+
+// Called by the pooled fetch for every outbound HTTP request
+export function recordUpstreamCall(upstream) {
+  incrementCounter('proxilearn_upstream_requests_total', 'Outbound HTTP requests by upstream service', { upstream })
+  if (upstream === 'supabase') {
+    const context = requestContext.getStore()
+    if (context) {
+      context.supabaseCalls++
+    }
+  }
+}
+
+// Time an AI completion and record its token usage under the calling helper's name
+export async function observeAiCall(helper, call) {
+  const started = process.hrtime.bigint()
+  let outcome = 'error'
+  try {
+    const completion = await call()
+    outcome = 'success'
+    const usage = completion?.usage
+    if (usage) {
+      incrementCounter('proxilearn_ai_tokens_total', 'AI tokens used by helper and token type',
+        { helper, type: 'prompt' }, usage.prompt_tokens || 0)
+      incrementCounter('proxilearn_ai_tokens_total', 'AI tokens used by helper and token type',
+        { helper, type: 'completion' }, usage.completion_tokens || 0)
+      // Prompt tokens the provider served from its prefix cache (subset of prompt)
+      incrementCounter('proxilearn_ai_tokens_total', 'AI tokens used by helper and token type',
+        { helper, type: 'cached' }, usage.prompt_tokens_details?.cached_tokens || 0)
+    }
+    return completion
+  } finally {
+    const seconds = Number(process.hrtime.bigint() - started) / 1e9
+    observeHistogram('proxilearn_ai_call_duration_seconds', 'AI completion latency by helper and outcome',
+      { helper, outcome }, seconds, AI_DURATION_BUCKETS)
+  }
+}
+
+// Prompt size of one AI call, counted locally before it is sent (lib/tokens.js)
+export function recordPromptTokens(helper, tokens) {
+  observeHistogram('proxilearn_ai_prompt_tokens', 'Estimated prompt tokens per AI call by helper',
+    { helper }, tokens, PROMPT_TOKEN_BUCKETS)
+}
+
+// Outcome of parsing one AI completion into items: complete, salvaged (cut off
+// or with malformed items, but some were usable) or failed (nothing usable)
+export function recordAiParseResult(helper, result) {
+  incrementCounter('proxilearn_ai_parse_results_total', 'AI completions by helper and parse result', { helper, result })
+}
+
+// result is HIT, MISS or COALESCED
+export function recordCacheResult(cache, result) {
+  incrementCounter('proxilearn_cache_requests_total', 'Cache lookups by cache and result', { cache, result })
+}
+
+function escapeLabel(value) {
+  return String(value).replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"')
+}
+
+function formatLabels(labels, extra = {}) {
+  const entries = Object.entries({ ...labels, ...extra })
+  if (entries.length === 0) {
+    return ''
+  }
+  return `{${entries.map(([key, value]) => `${key}="${escapeLabel(value)}"`).join(',')}}`
+}
+
+// Hit ratio per cache, derived from the lookup counters at scrape time
+function cacheHitRatioLines() {
+  const lookups = metrics.get('proxilearn_cache_requests_total')
+  if (!lookups) {
+    return []
+  }
+  const totals = new Map()
+  for (const { labels, value } of lookups.series.values()) {
+    const total = totals.get(labels.cache) || { hits: 0, all: 0 }
+    total.all += value
+    if (labels.result !== 'MISS') {
+      total.hits += value
+    }
+    totals.set(labels.cache, total)
+  }
+  const lines = [
+    '# HELP proxilearn_cache_hit_ratio Share of lookups served without a fresh load (HIT or COALESCED)',
+    '# TYPE proxilearn_cache_hit_ratio gauge'
+  ]
+  for (const [cache, { hits, all }] of totals) {
+    lines.push(`proxilearn_cache_hit_ratio${formatLabels({ cache })} ${all > 0 ? hits / all : 0}`)
+  }
+  return lines
+}
+
+// Render every metric, plus process gauges and any extra gauges passed in
+// as { name: { help, value } } (e.g. outbound connection pool counters).
+export function renderMetrics(extraGauges = {}) {
+  const lines = []
+  for (const metric of metrics.values()) {
+    lines.push(`# HELP ${metric.name} ${metric.help}`)
+    lines.push(`# TYPE ${metric.name} ${metric.type}`)
+    for (const entry of metric.series.values()) {
+      if (metric.type === 'counter') {
+        lines.push(`${metric.name}${formatLabels(entry.labels)} ${entry.value}`)
+        continue
+      }
+      metric.buckets.forEach((bucket, i) => {
+        lines.push(`${metric.name}_bucket${formatLabels(entry.labels, { le: bucket })} ${entry.counts[i]}`)
+      })
+      lines.push(`${metric.name}_bucket${formatLabels(entry.labels, { le: '+Inf' })} ${entry.count}`)
+      lines.push(`${metric.name}_sum${formatLabels(entry.labels)} ${entry.sum}`)
+      lines.push(`${metric.name}_count${formatLabels(entry.labels)} ${entry.count}`)
+    }
+  }
+  lines.push(...cacheHitRatioLines())
+
+  const memory = process.memoryUsage()
+  const gauges = {
+    proxilearn_process_uptime_seconds: { help: 'Seconds since this server process loaded the API', value: (Date.now() - startedAt) / 1000 },
+    proxilearn_process_heap_used_bytes: { help: 'V8 heap in use', value: memory.heapUsed },
+    proxilearn_process_rss_bytes: { help: 'Resident set size', value: memory.rss },
+    ...extraGauges
+  }
+  for (const [name, { help, value }] of Object.entries(gauges)) {
+    lines.push(`# HELP ${name} ${help}`)
+    lines.push(`# TYPE ${name} gauge`)
+    lines.push(`${name} ${value ?? 0}`)
+  }
+  return `${lines.join('\n')}\n`
+}
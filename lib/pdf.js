@@ -0,0 +1,703 @@
+import { createHash } from 'crypto'
+import { deflateSync } from 'zlib'
+import { publicFetch } from '@/lib/http'
+
+// Server-side rendering of PDF assessments into printable papers.
+// The writer is dependency-free: it uses the standard Helvetica fonts (no font
+// embedding), Flate-compressed content streams and DCT passthrough for JPEG
+// logos. Rendered documents are cached as artifacts keyed on a hash of the
+// assessment content and render options, so repeated prints are served from
+// the cache instead of being re-rendered.
+
+const RENDERER_VERSION = 1
+const PAGE_WIDTH = 595.28 // A4
+const PAGE_HEIGHT = 841.89
+const MARGIN = 50
+const CONTENT_WIDTH = PAGE_WIDTH - MARGIN * 2
+const FOOTER_HEIGHT = 30
+const MAX_VARIANTS = 26
+const LOGO_MAX_BYTES = 2 * 1024 * 1024
+const LOGO_FETCH_TIMEOUT_MS = 5000
+const STREAM_CHUNK_BYTES = 64 * 1024
+
+const ARTIFACTS_COLLECTION = 'pdf_artifacts'
+const ARTIFACT_RETENTION_SECONDS = 30 * 24 * 60 * 60
+const MEMORY_CACHE_MAX_BYTES = parseInt(process.env.PDF_MEMORY_CACHE_BYTES || String(32 * 1024 * 1024))
+
+// Helvetica glyph widths (1/1000 em) for printable ASCII, from the standard AFM
+const HELVETICA_WIDTHS = [
+  278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+  556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+  1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+  667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+  333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+  556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+]
+const BOLD_WIDTH_FACTOR = 1.06
+
+const FONTS = {
+  regular: { name: 'F1', base: 'Helvetica' },
+  bold: { name: 'F2', base: 'Helvetica-Bold' }
+}
+
+const ANSWER_LINES = {
+  multiple_choice: 0,
+  true_false: 0,
+  short_answer: 3,
+  essay: 10
+}
+
+// ==================================================================================
+// TEXT HELPERS
+// ==================================================================================
+
+// Map text onto the WinAnsi subset the standard fonts can show
+function toPdfText(value) {
+  return String(value ?? '')
+    .replace(/[‘’‛]/g, "'")
+    .replace(/[“”‟]/g, '"')
+    .replace(/[–—−]/g, '-')
+    .replace(/…/g, '...')
+    .replace(/ /g, ' ')
+    .replace(/\t/g, '    ')
+    .replace(/[^\n\x20-\x7E\xA1-\xFF]/g, '?')
+}
+
+function escapePdfString(text) {
+  return text.replace(/\\/g, '\\\\').replace(/\(/g, '\\(').replace(/\)/g, '\\)')
+}
+
+function textWidth(text, size, font = 'regular') {
+  let units = 0
+  for (let i = 0; i < text.length; i++) {
+    const code = text.charCodeAt(i)
+    units += code >= 32 && code <= 126 ? HELVETICA_WIDTHS[code - 32] : 556
+  }
+  return (units / 1000) * size * (font === 'bold' ? BOLD_WIDTH_FACTOR : 1)
+}
+
+// Greedy word wrap; words longer than a line are split
+function wrapText(value, size, maxWidth, font = 'regular') {
+  const lines = []
+  for (const paragraph of toPdfText(value).split('\n')) {
+    let line = ''
+    for (const word of paragraph.split(/ +/)) {
+      let remaining = word
+      while (textWidth(remaining, size, font) > maxWidth) {
+        let cut = remaining.length - 1
+        while (cut > 1 && textWidth(remaining.slice(0, cut), size, font) > maxWidth) {
+          cut--
+        }
+        if (line) {
+          lines.push(line)
+          line = ''
+        }
+        lines.push(remaining.slice(0, cut))
+        remaining = remaining.slice(cut)
+      }
+      const candidate = line ? `${line} ${remaining}` : remaining
+      if (textWidth(candidate, size, font) <= maxWidth) {
+        line = candidate
+      } else {
+        lines.push(line)
+        line = remaining
+      }
+    }
+    lines.push(line)
+  }
+  return lines
+}
+
+// ==================================================================================
+// QUESTION NORMALIZATION & VARIANTS
+// ==================================================================================
+
+const OPTION_LABEL = /^\s*\(?([A-Za-z])[\)\.:]\s+/
+
+function normalizeQuestion(question, index) {
+  const type = question.type || question.question_type || 'short_answer'
+  const rawOptions = Array.isArray(question.options) ? question.options : []
+  const options = rawOptions.map(option => String(option).replace(OPTION_LABEL, ''))
+  const correctAnswer = question.correct_answer ?? question.correctAnswer ?? ''
+
+  // Resolve the correct option by exact text, stripped text or leading letter
+  let correctIndex = rawOptions.findIndex(option => String(option) === String(correctAnswer))
+  if (correctIndex === -1 && options.length) {
+    const stripped = String(correctAnswer).replace(OPTION_LABEL, '')
+    correctIndex = options.findIndex(option => option === stripped)
+  }
+  if (correctIndex === -1 && options.length) {
+    const letter = String(correctAnswer).match(/^\s*\(?([A-Za-z])(?:[\)\.:]|$)/)
+    if (letter) {
+      const letterIndex = letter[1].toUpperCase().charCodeAt(0) - 65
+      if (letterIndex >= 0 && letterIndex < options.length) {
+        correctIndex = letterIndex
+      }
+    }
+  }
+
+  return {
+    number: index + 1,
+    text: question.question || question.question_text || '',
+    type,
+    options,
+    correctIndex,
+    correctAnswer: String(correctAnswer),
+    explanation: question.explanation || '',
+    points: Number(question.points ?? question.marks ?? 1) || 1
+  }
+}
+
+function createRandom(seed) {
+  // mulberry32 seeded from the first 32 bits of a sha256
+  let state = createHash('sha256').update(seed).digest().readUInt32LE(0)
+  return () => {
+    state = (state + 0x6D2B79F5) | 0
+    let t = Math.imul(state ^ (state >>> 15), 1 | state)
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296
+  }
+}
+
+function shuffled(items, random) {
+  const result = items.slice()
+  for (let i = result.length - 1; i > 0; i--) {
+    const j = Math.floor(random() * (i + 1))
+    ;[result[i], result[j]] = [result[j], result[i]]
+  }
+  return result
+}
+
+// Set A keeps the authored order; later sets shuffle question and option order
+// deterministically from the assessment id, so re-renders are identical.
+function buildVariant(questions, variantIndex, seed) {
+  const label = `Set ${String.fromCharCode(65 + variantIndex)}`
+  if (variantIndex === 0) {
+    return { label, questions }
+  }
+
+  const random = createRandom(`${seed}:${variantIndex}`)
+  const variantQuestions = shuffled(questions, random).map(question => {
+    if (question.options.length < 2 || question.type === 'true_false') {
+      return question
+    }
+    const order = shuffled(question.options.map((_, i) => i), random)
+    return {
+      ...question,
+      options: order.map(i => question.options[i]),
+      correctIndex: question.correctIndex === -1 ? -1 : order.indexOf(question.correctIndex)
+    }
+  })
+  return { label, questions: variantQuestions }
+}
+
+function optionLabel(index) {
+  return String.fromCharCode(65 + index)
+}
+
+// ==================================================================================
+// LOGO IMAGES
+// ==================================================================================
+
+function readJpegInfo(data) {
+  if (data.length < 4 || data[0] !== 0xFF || data[1] !== 0xD8) {
+    return null
+  }
+  let offset = 2
+  while (offset + 9 < data.length) {
+    if (data[offset] !== 0xFF) {
+      offset++
+      continue
+    }
+    const marker = data[offset + 1]
+    const length = data.readUInt16BE(offset + 2)
+    // SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+    if (marker >= 0xC0 && marker <= 0xCF && marker !== 0xC4 && marker !== 0xC8 && marker !== 0xCC) {
+      return {
+        height: data.readUInt16BE(offset + 5),
+        width: data.readUInt16BE(offset + 7),
+        components: data[offset + 9]
+      }
+    }
+    offset += 2 + length
+  }
+  return null
+}
+
+// Read a response body, giving up (and closing the stream) once it passes maxBytes
+async function readBodyUpTo(body, maxBytes) {
+  const chunks = []
+  let size = 0
+  for await (const chunk of body || []) {
+    size += chunk.length
+    if (size > maxBytes) {
+      return null // Leaving the loop cancels the stream
+    }
+    chunks.push(chunk)
+  }
+  return Buffer.concat(chunks)
+}
+
+// Fetch the school logo; only baseline/progressive JPEGs are embedded, any other
+// format (or a failed fetch) falls back to the text-only header. The URL is set
+// by teachers, so it goes through publicFetch (https, public hosts, no redirects).
+export async function loadLogoImage(url) {
+  if (!url) {
+    return null
+  }
+  try {
+    const response = await publicFetch(url, { signal: AbortSignal.timeout(LOGO_FETCH_TIMEOUT_MS) })
+    const declaredBytes = parseInt(response.headers.get('content-length'))
+    if (!response.ok || declaredBytes > LOGO_MAX_BYTES) {
+      await response.body?.cancel()
+      return null
+    }
+    const data = await readBodyUpTo(response.body, LOGO_MAX_BYTES)
+    if (!data) {
+      return null
+    }
+    const info = readJpegInfo(data)
+    if (!info || ![1, 3, 4].includes(info.components)) {
+      return null
+    }
+    return { data, ...info }
+  } catch (error) {
+    console.error('Failed to load school logo:', error.message)
+    return null
+  }
+}
+
+// ==================================================================================
+// PAGE LAYOUT
+// ==================================================================================
+
+function createLayout(footerText) {
+  const pages = []
+  let ops = []
+  let y = 0
+
+  const startPage = () => {
+    ops = []
+    y = PAGE_HEIGHT - MARGIN
+  }
+
+  const finishPage = () => {
+    pages.push(ops)
+  }
+
+  startPage()
+
+  const layout = {
+    get y() {
+      return y
+    },
+
+    ensureSpace(height) {
+      if (y - height < MARGIN + FOOTER_HEIGHT) {
+        finishPage()
+        startPage()
+      }
+    },
+
+    moveDown(amount) {
+      y -= amount
+    },
+
+    text(value, { size = 11, font = 'regular', x = MARGIN, align = 'left', width = CONTENT_WIDTH } = {}) {
+      const text = toPdfText(value)
+      let left = x
+      if (align === 'center') {
+        left = x + (width - textWidth(text, size, font)) / 2
+      } else if (align === 'right') {
+        left = x + width - textWidth(text, size, font)
+      }
+      ops.push(`BT /${FONTS[font].name} ${size} Tf ${left.toFixed(2)} ${y.toFixed(2)} Td (${escapePdfString(text)}) Tj ET`)
+    },
+
+    // Wrapped paragraph; breaks across pages line by line
+    paragraph(value, { size = 11, font = 'regular', x = MARGIN, width = CONTENT_WIDTH, leading = 1.35 } = {}) {
+      for (const line of wrapText(value, size, width, font)) {
+        layout.ensureSpace(size * leading)
+        y -= size * leading
+        layout.text(line, { size, font, x, width })
+      }
+    },
+
+    rule({ x = MARGIN, width = CONTENT_WIDTH, weight = 0.5, gray = 0 } = {}) {
+      ops.push(`q ${gray} G ${weight} w ${x.toFixed(2)} ${y.toFixed(2)} m ${(x + width).toFixed(2)} ${y.toFixed(2)} l S Q`)
+    },
+
+    image(name, { x, width, height }) {
+      ops.push(`q ${width.toFixed(2)} 0 0 ${height.toFixed(2)} ${x.toFixed(2)} ${(y - height).toFixed(2)} cm /${name} Do Q`)
+    },
+
+    // Close the layout and stamp "<footer> - Page n of m" on every page
+    finish() {
+      finishPage()
+      return pages.map((pageOps, index) => {
+        const footer = toPdfText(`${footerText} - Page ${index + 1} of ${pages.length}`)
+        const left = (PAGE_WIDTH - textWidth(footer, 8)) / 2
+        return [
+          ...pageOps,
+          `BT /${FONTS.regular.name} 8 Tf ${left.toFixed(2)} ${(MARGIN / 2).toFixed(2)} Td (${escapePdfString(footer)}) Tj ET`
+        ].join('\n')
+      })
+    }
+  }
+
+  return layout
+}
+
+function drawHeader(layout, assessment, variantLabel, logo) {
+  const top = layout.y
+  let textX = MARGIN
+  let textWidthAvailable = CONTENT_WIDTH
+
+  if (logo) {
+    const logoHeight = 54
+    const logoWidth = Math.min(120, logoHeight * (logo.width / logo.height))
+    layout.image('Logo', { x: MARGIN, width: logoWidth, height: logoHeight })
+    textX = MARGIN + logoWidth + 12
+    textWidthAvailable = CONTENT_WIDTH - logoWidth - 12
+  }
+
+  layout.moveDown(16)
+  layout.text(assessment.title, { size: 16, font: 'bold', x: textX, width: textWidthAvailable, align: logo ? 'left' : 'center' })
+  if (variantLabel) {
+    layout.text(variantLabel, { size: 11, font: 'bold', align: 'right' })
+  }
+
+  const subjectName = assessment.subjects?.name
+  if (subjectName) {
+    layout.moveDown(16)
+    layout.text(subjectName, { size: 11, x: textX, width: textWidthAvailable, align: logo ? 'left' : 'center' })
+  }
+
+  const details = [
+    assessment.duration_minutes ? `Duration: ${assessment.duration_minutes} minutes` : null,
+    `Total Marks: ${Number(assessment.total_marks)}`,
+    `Questions: ${assessment.questionCount}`
+  ].filter(Boolean).join('     ')
+  layout.moveDown(16)
+  layout.text(details, { size: 10, x: textX, width: textWidthAvailable, align: logo ? 'left' : 'center' })
+
+  if (logo) {
+    // Keep the rule below the logo even when the text block is shorter
+    layout.moveDown(Math.max(0, layout.y - (top - 54)))
+  }
+  layout.moveDown(12)
+  layout.rule({ weight: 1 })
+
+  layout.moveDown(22)
+  layout.text('Name: ______________________________', { size: 10 })
+  layout.text('Roll No: __________     Date: __________', { size: 10, align: 'right' })
+  layout.moveDown(10)
+
+  if (assessment.instructions) {
+    layout.ensureSpace(30)
+    layout.moveDown(14)
+    layout.text('Instructions:', { size: 10, font: 'bold' })
+    layout.paragraph(assessment.instructions, { size: 10 })
+  }
+
+  layout.moveDown(8)
+  layout.rule({ gray: 0.6 })
+  layout.moveDown(6)
+}
+
+function drawQuestion(layout, question, position) {
+  const numberLabel = `${position}.`
+  const marksLabel = `[${question.points} ${question.points === 1 ? 'mark' : 'marks'}]`
+  const indent = MARGIN + 22
+  const textWidthAvailable = CONTENT_WIDTH - 22 - textWidth(marksLabel, 9) - 10
+  const lines = wrapText(question.text, 11, textWidthAvailable)
+
+  // Keep the question stem together with its first option/answer line
+  layout.ensureSpace(lines.length * 15 + 30)
+  layout.moveDown(20)
+  layout.text(numberLabel, { size: 11, font: 'bold' })
+  layout.text(marksLabel, { size: 9, align: 'right' })
+  lines.forEach((line, index) => {
+    if (index > 0) {
+      layout.moveDown(15)
+    }
+    layout.text(line, { size: 11, x: indent, width: textWidthAvailable })
+  })
+
+  question.options.forEach((option, index) => {
+    layout.paragraph(`(${optionLabel(index)})  ${option}`, { size: 10.5, x: indent + 8, width: CONTENT_WIDTH - 30 })
+  })
+
+  const answerLines = ANSWER_LINES[question.type] ?? (question.options.length ? 0 : 3)
+  for (let i = 0; i < answerLines; i++) {
+    layout.ensureSpace(22)
+    layout.moveDown(22)
+    layout.rule({ x: indent, width: CONTENT_WIDTH - 22, weight: 0.3, gray: 0.5 })
+  }
+}
+
+function drawAnswerKey(layout, assessment, variant) {
+  layout.moveDown(16)
+  layout.text(`Answer Key - ${assessment.title}`, { size: 14, font: 'bold' })
+  layout.text(variant.label, { size: 11, font: 'bold', align: 'right' })
+  layout.moveDown(10)
+  layout.rule({ weight: 1 })
+  layout.moveDown(4)
+
+  variant.questions.forEach((question, index) => {
+    const answer = question.correctIndex >= 0
+      ? `(${optionLabel(question.correctIndex)}) ${question.options[question.correctIndex]}`
+      : question.correctAnswer || 'Open response'
+    layout.paragraph(`${index + 1}.  ${answer}   [${question.points}]`, { size: 10.5, font: 'bold' })
+    if (question.explanation) {
+      layout.paragraph(question.explanation, { size: 9, x: MARGIN + 22, width: CONTENT_WIDTH - 22 })
+    }
+    layout.moveDown(4)
+  })
+}
+
+// ==================================================================================
+// PDF SERIALIZATION
+// ==================================================================================
+
+export function normalizeRenderOptions({ variants, answerKey } = {}) {
+  return {
+    variants: Math.min(MAX_VARIANTS, Math.max(1, parseInt(variants) || 1)),
+    answerKey: answerKey === true || answerKey === 'true' || answerKey === '1'
+  }
+}
+
+// Cache key: everything that affects the printed bytes
+export function assessmentContentHash(assessment, options) {
+  const { variants, answerKey } = normalizeRenderOptions(options)
+  return createHash('sha256').update(JSON.stringify({
+    rendererVersion: RENDERER_VERSION,
+    title: assessment.title,
+    subject: assessment.subjects?.name || null,
+    instructions: assessment.instructions || null,
+    durationMinutes: assessment.duration_minutes || null,
+    totalMarks: assessment.total_marks,
+    questions: assessment.questions,
+    schoolLogoUrl: assessment.school_logo_url || null,
+    templateStyle: assessment.template_style || 'standard',
+    variants,
+    answerKey
+  })).digest('hex')
+}
+
+// Render an assessment as a sequence of PDF byte chunks. Each variant set (and
+// its answer key) is laid out and emitted before the next one is started, so a
+// large batch can be streamed to the client while it is still being rendered.
+export function* renderAssessmentPdf(assessment, { variants, answerKey, logo = null } = {}) {
+  const options = normalizeRenderOptions({ variants, answerKey })
+  // Seeded per assessment so Set B is the same paper whether 2 or 5 sets are printed
+  const seed = String(assessment.id)
+  const questions = (Array.isArray(assessment.questions) ? assessment.questions : []).map(normalizeQuestion)
+  const header = { ...assessment, questionCount: questions.length }
+
+  let offset = 0
+  const offsets = []
+  const pageRefs = []
+  // 1 = catalog, 2 = page tree, 3-4 = fonts, 5 = logo; pages follow
+  let nextObject = logo ? 6 : 5
+
+  const object = (number, body, stream = null) => {
+    offsets[number] = offset
+    const parts = [Buffer.from(`${number} 0 obj\n${body}\n`, 'latin1')]
+    if (stream) {
+      parts.push(Buffer.from('stream\n', 'latin1'), stream, Buffer.from('\nendstream\n', 'latin1'))
+    }
+    parts.push(Buffer.from('endobj\n', 'latin1'))
+    const chunk = Buffer.concat(parts)
+    offset += chunk.length
+    return chunk
+  }
+
+  const header0 = Buffer.from('%PDF-1.4\n%\xE2\xE3\xCF\xD3\n', 'latin1')
+  offset += header0.length
+  yield header0
+
+  yield Buffer.concat(Object.values(FONTS).map((font, index) => object(
+    3 + index,
+    `<< /Type /Font /Subtype /Type1 /BaseFont /${font.base} /Encoding /WinAnsiEncoding >>`
+  )))
+
+  if (logo) {
+    const colorSpace = { 1: '/DeviceGray', 3: '/DeviceRGB', 4: '/DeviceCMYK' }[logo.components]
+    yield object(
+      5,
+      `<< /Type /XObject /Subtype /Image /Width ${logo.width} /Height ${logo.height} /ColorSpace ${colorSpace} /BitsPerComponent 8 /Filter /DCTDecode /Length ${logo.data.length} >>`,
+      logo.data
+    )
+  }
+
+  const resources = `<< /Font << /F1 3 0 R /F2 4 0 R >>${logo ? ' /XObject << /Logo 5 0 R >>' : ''} >>`
+
+  const emitPages = (pages) => {
+    const chunks = pages.map(content => {
+      const compressed = deflateSync(Buffer.from(content, 'latin1'))
+      const contentNumber = nextObject++
+      const pageNumber = nextObject++
+      pageRefs.push(pageNumber)
+      return Buffer.concat([
+        object(contentNumber, `<< /Length ${compressed.length} /Filter /FlateDecode >>`, compressed),
+        object(pageNumber, `<< /Type /Page /Parent 2 0 R /MediaBox [0 0 ${PAGE_WIDTH} ${PAGE_HEIGHT}] /Resources ${resources} /Contents ${contentNumber} 0 R >>`)
+      ])
+    })
+    return Buffer.concat(chunks)
+  }
+
+  for (let variantIndex = 0; variantIndex < options.variants; variantIndex++) {
+    const variant = buildVariant(questions, variantIndex, seed)
+    const footer = options.variants > 1 ? `${assessment.title} (${variant.label})` : assessment.title
+
+    const paper = createLayout(footer)
+    drawHeader(paper, header, options.variants > 1 ? variant.label : '', logo)
+    variant.questions.forEach((question, index) => drawQuestion(paper, question, index + 1))
+    yield emitPages(paper.finish())
+
+    if (options.answerKey) {
+      const key = createLayout(`${footer} - Answer Key`)
+      drawAnswerKey(key, assessment, variant)
+      yield emitPages(key.finish())
+    }
+  }
+
+  const trailerObjects = Buffer.concat([
+    object(2, `<< /Type /Pages /Kids [${pageRefs.map(ref => `${ref} 0 R`).join(' ')}] /Count ${pageRefs.length} >>`),
+    object(1, `<< /Type /Catalog /Pages 2 0 R /ViewerPreferences << /DisplayDocTitle true >> >>`)
+  ])
+  yield trailerObjects
+
+  const xrefOffset = offset
+  const entries = ['0000000000 65535 f \n']
+  for (let number = 1; number < nextObject; number++) {
+    entries.push(`${String(offsets[number] ?? 0).padStart(10, '0')} 00000 ${offsets[number] === undefined ? 'f' : 'n'} \n`)
+  }
+  yield Buffer.from(
+    `xref\n0 ${nextObject}\n${entries.join('')}trailer\n<< /Size ${nextObject} /Root 1 0 R >>\nstartxref\n${xrefOffset}\n%%EOF\n`,
+    'latin1'
+  )
+}
+
+// ==================================================================================
+// ARTIFACT CACHE & STREAMING
+// ==================================================================================
+
+// Small in-process LRU in front of the Mongo artifact store
+const memoryArtifacts = new Map()
+let memoryArtifactBytes = 0
+let artifactIndexesReady = null
+
+function rememberArtifact(key, buffer) {
+  if (buffer.length > MEMORY_CACHE_MAX_BYTES) {
+    return
+  }
+  if (memoryArtifacts.has(key)) {
+    memoryArtifactBytes -= memoryArtifacts.get(key).length
+    memoryArtifacts.delete(key)
+  }
+  memoryArtifacts.set(key, buffer)
+  memoryArtifactBytes += buffer.length
+  for (const [oldestKey, oldest] of memoryArtifacts) {
+    if (memoryArtifactBytes <= MEMORY_CACHE_MAX_BYTES) {
+      break
+    }
+    memoryArtifacts.delete(oldestKey)
+    memoryArtifactBytes -= oldest.length
+  }
+}
+
+async function ensureArtifactIndexes(db) {
+  if (!artifactIndexesReady) {
+    artifactIndexesReady = Promise.all([
+      db.collection(ARTIFACTS_COLLECTION).createIndex({ key: 1 }, { unique: true }),
+      db.collection(ARTIFACTS_COLLECTION).createIndex(
+        { last_used_at: 1 },
+        { expireAfterSeconds: ARTIFACT_RETENTION_SECONDS }
+      )
+    ]).catch(error => {
+      artifactIndexesReady = null
+      console.error('Failed to create PDF artifact indexes:', error)
+    })
+  }
+  return artifactIndexesReady
+}
+
+export async function getPdfArtifact(db, key) {
+  const cached = memoryArtifacts.get(key)
+  if (cached) {
+    memoryArtifacts.delete(key)
+    memoryArtifacts.set(key, cached)
+    return cached
+  }
+
+  const artifact = await db.collection(ARTIFACTS_COLLECTION).findOneAndUpdate(
+    { key },
+    { $set: { last_used_at: new Date() }, $inc: { hits: 1 } },
+    { returnDocument: 'after' }
+  )
+  if (!artifact) {
+    return null
+  }
+  const buffer = Buffer.from(artifact.data.buffer)
+  rememberArtifact(key, buffer)
+  return buffer
+}
+
+export async function savePdfArtifact(db, key, buffer, metadata = {}) {
+  rememberArtifact(key, buffer)
+  await ensureArtifactIndexes(db)
+  const now = new Date()
+  await db.collection(ARTIFACTS_COLLECTION).updateOne(
+    { key },
+    {
+      $set: { ...metadata, data: buffer, size: buffer.length, last_used_at: now },
+      $setOnInsert: { created_at: now, hits: 0 }
+    },
+    { upsert: true }
+  )
+}
+
+// Wrap a chunk iterator in a web ReadableStream; `onComplete` receives the full
+// document once the last chunk has been pulled (used to store the artifact).
+export function streamPdfChunks(chunks, onComplete) {
+  const iterator = chunks[Symbol.iterator]()
+  const rendered = []
+  return new ReadableStream({
+    pull(controller) {
+      try {
+        const { value, done } = iterator.next()
+        if (done) {
+          controller.close()
+          if (onComplete) {
+            onComplete(Buffer.concat(rendered))
+          }
+          return
+        }
+        rendered.push(value)
+        controller.enqueue(new Uint8Array(value.buffer, value.byteOffset, value.length))
+      } catch (error) {
+        controller.error(error)
+      }
+    },
+    cancel() {
+      iterator.return?.()
+    }
+  })
+}
+
+export function streamPdfBuffer(buffer) {
+  let position = 0
+  return new ReadableStream({
+    pull(controller) {
+      if (position >= buffer.length) {
+        controller.close()
+        return
+      }
+      const end = Math.min(buffer.length, position + STREAM_CHUNK_BYTES)
+      controller.enqueue(new Uint8Array(buffer.buffer, buffer.byteOffset + position, end - position))
+      position = end
+    }
+  })
+}
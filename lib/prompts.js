@@ -0,0 +1,121 @@
+// Prompts for the AI helpers.
+// Each system prompt opens with the same preamble and holds all of a helper's
+// fixed instructions and output format; the user message carries only the
+// details of the request. The fixed text is sent byte-for-byte identical on
+// every call, so providers that cache prompt prefixes can serve it from cache,
+// and per-call input no longer repeats instructions.
+// Coordinator metrics go in as per-subject summaries, not raw score arrays,
+// so the prompt stays the same size however many attempts a school has.
+
+const PREAMBLE = 'You are the AI assistant of Proxilearn, a learning platform used by schools. ' +
+  'Be accurate, age-appropriate and encouraging. When a JSON format is given, reply with that JSON only.'
+
+const QUIZ_FORMAT = `{"questions": [{"question": "Question text?", "options": ["Option A", "Option B", "Option C", "Option D"], "correct_answer": "Option A", "explanation": "Why this is correct"}]}`
+
+const ASSESSMENT_FORMAT = `{"questions": [{"question": "Question text?", "type": "multiple_choice", "options": ["A) Option 1", "B) Option 2", "C) Option 3", "D) Option 4"], "correct_answer": "A) Option 1", "explanation": "Why this is correct", "points": 2, "difficulty": "medium", "topic": "specific topic"}]}`
+
+const LESSON_PLAN_FORMAT = `{"keyConcepts": ["..."], "discussionPoints": ["..."], "activities": [{"type": "...", "description": "...", "duration": "10 minutes", "resources": ["..."]}], "resources": [{"type": "video|document|website|demonstration", "title": "...", "url": "https://... (if available)", "description": "How it supports learning"}], "assessmentNotes": "...", "homeworkSuggestions": "..."}`
+
+const INSIGHTS_FORMAT = `{"insights": ["..."], "recommendations": ["..."], "concerns": ["..."], "positives": ["..."]}`
+
+export const SYSTEM_PROMPTS = {
+  generateQuizQuestions: `${PREAMBLE}
+
+You write multiple choice quiz questions that are pedagogically sound and match the requested difficulty.
+Each question has 4 options, exactly one correct answer (copied verbatim from the options) and a clear explanation.
+
+JSON format:
+${QUIZ_FORMAT}`,
+
+  generateAssessmentQuestions: `${PREAMBLE}
+
+You design balanced assessment questions that measure understanding across cognitive levels:
+easy = recall and understanding, medium = application and analysis, hard = evaluation and synthesis.
+Each question has a type (multiple_choice, short_answer or essay), a correct answer, an explanation,
+points from 1 to 5 by difficulty, its difficulty and the topic it covers. Multiple choice questions have
+4 options and the correct answer copied verbatim from them; other types have an empty options array.
+Keep questions clear, unambiguous and spread evenly across the requested topics.
+
+JSON format:
+${ASSESSMENT_FORMAT}`,
+
+  generateLessonPlan: `${PREAMBLE}
+
+You are an experienced curriculum designer writing lesson plans that promote active learning.
+A plan covers: key concepts, discussion questions for class engagement, interactive activities with timing
+that fit the lesson duration, supporting resources, how to assess understanding during and after the lesson,
+and homework that reinforces it.
+
+JSON format:
+${LESSON_PLAN_FORMAT}`,
+
+  generateCoordinatorInsights: `${PREAMBLE}
+
+You analyse school performance summaries for an academic coordinator. Give key insights into performance
+patterns, areas of concern, positive trends, specific actions for the coordinator, ideas for teacher
+collaboration and student support interventions. Prefer actionable, growth-oriented guidance to listing problems.
+Subject lines read: name: attempts, mean, median, middle 50% range, min-max, share of scores below 60%.
+
+JSON format:
+${INSIGHTS_FORMAT}`,
+
+  generateDoubtResponse: `${PREAMBLE}
+
+You are a patient teaching assistant answering a student's question. Answer it directly, explain the concept
+with an example where it helps, pitch it at the student's subject and level, and suggest a next step to
+learn. Keep the answer concise but complete.`
+}
+
+// Expected prompt size per helper (system + user, estimated tokens). Larger
+// prompts are logged so growth is noticed before it shows up in latency and cost.
+export const PROMPT_TOKEN_BUDGETS = {
+  generateQuizQuestions: 600,
+  generateAssessmentQuestions: 900,
+  generateLessonPlan: 700,
+  generateCoordinatorInsights: 900,
+  generateDoubtResponse: 800
+}
+
+const MAX_SUMMARY_SUBJECTS = 25
+
+function round1(value) {
+  return Math.round(value * 10) / 10
+}
+
+// Count, mean, quartiles, range and share below 60% of a list of scores
+export function summarizeScores(scores) {
+  const sorted = scores.filter(score => typeof score === 'number').sort((a, b) => a - b)
+  if (sorted.length === 0) {
+    return null
+  }
+  const at = fraction => sorted[Math.min(sorted.length - 1, Math.floor(fraction * sorted.length))]
+  return {
+    count: sorted.length,
+    mean: round1(sorted.reduce((sum, score) => sum + score, 0) / sorted.length),
+    median: round1(at(0.5)),
+    p25: round1(at(0.25)),
+    p75: round1(at(0.75)),
+    min: round1(sorted[0]),
+    max: round1(sorted[sorted.length - 1]),
+    belowPassing: Math.round(sorted.filter(score => score < 60).length / sorted.length * 100)
+  }
+}
+
+// One line per subject, busiest first; subjects past the cap are folded into one line
+export function formatSubjectSummaries(subjectBreakdown) {
+  const summaries = Object.entries(subjectBreakdown || {})
+    .map(([name, breakdown]) => [name, summarizeScores(breakdown.scores || [])])
+    .filter(([, summary]) => summary)
+    .sort(([, a], [, b]) => b.count - a.count)
+
+  const lines = summaries.slice(0, MAX_SUMMARY_SUBJECTS).map(([name, s]) =>
+    `- ${name}: ${s.count}, ${s.mean}, ${s.median}, ${s.p25}-${s.p75}, ${s.min}-${s.max}, ${s.belowPassing}%`
+  )
+  const rest = summaries.slice(MAX_SUMMARY_SUBJECTS)
+  if (rest.length > 0) {
+    const attempts = rest.reduce((sum, [, s]) => sum + s.count, 0)
+    const mean = rest.reduce((sum, [, s]) => sum + s.mean * s.count, 0) / attempts
+    lines.push(`- ${rest.length} more subjects: ${attempts} attempts, mean ${round1(mean)}`)
+  }
+  return lines.length > 0 ? lines.join('\n') : '- no completed attempts'
+}
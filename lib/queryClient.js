@@ -0,0 +1,226 @@
+import { useCallback, useEffect, useSyncExternalStore } from 'react'
+
+// Client-side query cache for the dashboards.
+// Results are keyed by API path (including query string). A key that already
+// has data renders it immediately and is revalidated in the background once it
+// is older than `staleMs`; concurrent fetches of one key share a single request,
+// and a forced refetch aborts the request it supersedes. Mutations can apply
+// optimistic updates that are rolled back if the request fails.
+
+const DEFAULT_STALE_MS = 30 * 1000
+
+const EMPTY_STATE = Object.freeze({ data: undefined, error: null, updatedAt: 0, isFetching: false })
+
+const entries = new Map()
+const listeners = new Map()
+
+function getEntry(key) {
+  if (!entries.has(key)) {
+    entries.set(key, { state: EMPTY_STATE, promise: null, controller: null, fetcher: null })
+  }
+  return entries.get(key)
+}
+
+function setState(key, patch) {
+  const entry = getEntry(key)
+  entry.state = { ...entry.state, ...patch }
+  for (const listener of listeners.get(key) || []) {
+    listener()
+  }
+}
+
+function abortFetch(entry) {
+  entry.controller?.abort()
+  entry.controller = null
+  entry.promise = null
+}
+
+function subscribe(key, listener) {
+  if (!listeners.has(key)) {
+    listeners.set(key, new Set())
+  }
+  listeners.get(key).add(listener)
+  return () => {
+    const keyListeners = listeners.get(key)
+    keyListeners.delete(listener)
+    if (keyListeners.size === 0) {
+      listeners.delete(key)
+      // Nobody is waiting for this result any more
+      const entry = entries.get(key)
+      if (entry?.controller) {
+        abortFetch(entry)
+        entry.state = { ...entry.state, isFetching: false }
+      }
+    }
+  }
+}
+
+// Build a cache key from a path and query params (sorted, empty values dropped)
+export function queryKey(path, params = {}) {
+  const search = new URLSearchParams(
+    Object.entries(params)
+      .filter(([, value]) => value !== undefined && value !== null && value !== '')
+      .sort(([a], [b]) => a.localeCompare(b))
+  ).toString()
+  return search ? `${path}?${search}` : path
+}
+
+export function getQueryData(key) {
+  return entries.get(key)?.state.data
+}
+
+// Replace cached data; `updater` may be a value or a function of the previous data
+export function setQueryData(key, updater) {
+  const previous = getQueryData(key)
+  const data = typeof updater === 'function' ? updater(previous) : updater
+  setState(key, { data, updatedAt: Date.now() })
+}
+
+// Fetch a key, sharing the request with any fetch already in flight.
+// `force` aborts an in-flight request and starts a new one.
+export function fetchQuery(key, fetcher, { force = false } = {}) {
+  const entry = getEntry(key)
+  entry.fetcher = fetcher
+  if (entry.promise && !force) {
+    return entry.promise
+  }
+  abortFetch(entry)
+
+  const controller = new AbortController()
+  entry.controller = controller
+  setState(key, { isFetching: true })
+
+  const promise = Promise.resolve()
+    .then(() => fetcher({ signal: controller.signal }))
+    .then(data => {
+      if (entry.controller === controller) {
+        setState(key, { data, error: null, updatedAt: Date.now() })
+      }
+      return data
+    })
+    .catch(error => {
+      if (controller.signal.aborted) {
+        return entry.state.data
+      }
+      console.error(`Error loading ${key}:`, error)
+      setState(key, { error })
+      return entry.state.data
+    })
+    .finally(() => {
+      if (entry.controller === controller) {
+        entry.promise = null
+        entry.controller = null
+        setState(key, { isFetching: false })
+      }
+    })
+  entry.promise = promise
+  return promise
+}
+
+// Mark every key starting with one of `prefixes` stale and refetch the ones on screen
+export function invalidateQueries(...prefixes) {
+  const refetches = []
+  for (const [key, entry] of entries) {
+    if (!prefixes.some(prefix => key.startsWith(prefix))) {
+      continue
+    }
+    entry.state = { ...entry.state, updatedAt: 0 }
+    if (listeners.has(key) && entry.fetcher) {
+      refetches.push(fetchQuery(key, entry.fetcher, { force: true }))
+    }
+  }
+  return Promise.all(refetches)
+}
+
+// Drop everything, e.g. on sign-out so the next user never sees cached data
+export function clearQueryCache() {
+  for (const entry of entries.values()) {
+    abortFetch(entry)
+  }
+  entries.clear()
+}
+
+// Run a mutation with optimistic cache updates.
+// `optimistic` maps keys to updater functions applied before the request; on
+// failure every touched key is restored. Keys in `invalidate` are refetched
+// once the mutation settles either way.
+export async function mutateOptimistic({ optimistic = {}, mutate, invalidate = [] }) {
+  const snapshots = new Map()
+  for (const [key, updater] of Object.entries(optimistic)) {
+    snapshots.set(key, getEntry(key).state)
+    setQueryData(key, updater)
+  }
+
+  try {
+    return await mutate()
+  } catch (error) {
+    for (const [key, state] of snapshots) {
+      setState(key, { data: state.data, updatedAt: state.updatedAt })
+    }
+    throw error
+  } finally {
+    if (invalidate.length > 0) {
+      invalidateQueries(...invalidate)
+    }
+  }
+}
+
+// Fetch JSON from the API with the current session's bearer token.
+// Non-2xx responses throw an Error carrying the API's error message and status.
+export async function authorizedJson(supabase, path, { method = 'GET', body, signal, headers: extraHeaders } = {}) {
+  const { data: { session } } = await supabase.auth.getSession()
+  const headers = { ...extraHeaders, 'Authorization': `Bearer ${session?.access_token}` }
+  if (body !== undefined) {
+    headers['Content-Type'] = 'application/json'
+  }
+  const response = await fetch(path, {
+    method,
+    headers,
+    body: body !== undefined ? JSON.stringify(body) : undefined,
+    signal
+  })
+  const data = await response.json().catch(() => ({}))
+  if (!response.ok) {
+    const error = new Error(data.error || `Request failed with status ${response.status}`)
+    error.status = response.status
+    error.details = data.details
+    throw error
+  }
+  return data
+}
+
+// Subscribe a component to a cached query.
+// Returns { data, error, isLoading, isFetching, refetch }; isLoading is only true
+// while there is nothing cached to show yet.
+export function useQuery(key, fetcher, { staleMs = DEFAULT_STALE_MS, enabled = true } = {}) {
+  const subscribeKey = useCallback(listener => subscribe(key, listener), [key])
+  const getSnapshot = useCallback(() => entries.get(key)?.state || EMPTY_STATE, [key])
+  const state = useSyncExternalStore(subscribeKey, getSnapshot, () => EMPTY_STATE)
+
+  useEffect(() => {
+    if (!enabled || !key) {
+      return
+    }
+    const entry = getEntry(key)
+    if (Date.now() - entry.state.updatedAt >= staleMs) {
+      fetchQuery(key, fetcher)
+    } else {
+      entry.fetcher = fetcher
+    }
+  }, [key, enabled])
+
+  const refetch = useCallback(() => fetchQuery(key, fetcher, { force: true }), [key])
+
+  return {
+    data: state.data,
+    error: state.error,
+    isLoading: enabled && !!key && state.data === undefined && !state.error,
+    isFetching: state.isFetching,
+    refetch
+  }
+}
+
+// useQuery for a GET endpoint of this app's API
+export function useApiQuery(supabase, path, options) {
+  return useQuery(path, ({ signal }) => authorizedJson(supabase, path, { signal }), options)
+}
@@ -0,0 +1,205 @@
+import { NextResponse } from 'next/server'
+import { incrementCounter } from '@/lib/metrics'
+
+// Token-bucket rate limiting for AI and write endpoints.
+// Every request is charged against two buckets: one for the user and one for
+// their school (the sharing scope), so a single user cannot drain the shared
+// OpenRouter quota and a single school cannot starve the others. AI calls are
+// weighted by their estimated token cost; plain writes cost 1.
+//
+// Buckets live in memory by default. Set RATE_LIMIT_BACKEND=mongo when running
+// more than one server instance so all instances draw from the same buckets.
+
+const BACKEND = process.env.RATE_LIMIT_BACKEND || 'memory'
+const BUCKETS_COLLECTION = 'rate_limit_buckets'
+const BURST_MINUTES = 5 // A full bucket holds five minutes of refill
+
+function perMinute(name, fallback) {
+  return parseInt(process.env[name] || String(fallback))
+}
+
+function bucketPolicy(refillPerMinute) {
+  return { capacity: refillPerMinute * BURST_MINUTES, refillPerSecond: refillPerMinute / 60 }
+}
+
+// Sustained rates; AI limits are in estimated tokens, write limits in requests
+export const RATE_LIMITS = {
+  ai: {
+    user: bucketPolicy(perMinute('RATE_LIMIT_AI_USER_TOKENS_PER_MINUTE', 6000)),
+    school: bucketPolicy(perMinute('RATE_LIMIT_AI_SCHOOL_TOKENS_PER_MINUTE', 60000))
+  },
+  write: {
+    user: bucketPolicy(perMinute('RATE_LIMIT_WRITE_USER_PER_MINUTE', 30)),
+    school: bucketPolicy(perMinute('RATE_LIMIT_WRITE_SCHOOL_PER_MINUTE', 600))
+  }
+}
+
+// Rough token cost of the AI helpers, prompt plus completion
+const PROMPT_OVERHEAD_TOKENS = 400
+const TOKENS_PER_QUESTION = 180
+const LESSON_PLAN_TOKENS = 2500
+
+function textTokens(text) {
+  return Math.ceil(String(text || '').length / 4)
+}
+
+export function estimateQuizCost(questionCount) {
+  return PROMPT_OVERHEAD_TOKENS + TOKENS_PER_QUESTION * (parseInt(questionCount) || 1)
+}
+
+export function estimateLessonPlanCost(prompt) {
+  return PROMPT_OVERHEAD_TOKENS + LESSON_PLAN_TOKENS + textTokens(prompt)
+}
+
+export function estimateDoubtCost(questionText, context) {
+  return PROMPT_OVERHEAD_TOKENS + 800 + textTokens(questionText) + textTokens(context)
+}
+
+// Refill a bucket for the time elapsed since it was last charged
+function refill(bucket, policy, now) {
+  const elapsedSeconds = Math.max(0, (now - bucket.updatedAt) / 1000)
+  return {
+    tokens: Math.min(policy.capacity, bucket.tokens + elapsedSeconds * policy.refillPerSecond),
+    updatedAt: now
+  }
+}
+
+function retryAfterSeconds(tokens, cost, policy) {
+  return Math.max(1, Math.ceil((cost - tokens) / policy.refillPerSecond))
+}
+
+// In-memory backend: exact, but per server process
+const MAX_MEMORY_BUCKETS = 10000
+const memoryBuckets = new Map()
+
+// Forget buckets that have been idle long enough to be full again
+function pruneMemoryBuckets(now) {
+  for (const [key, bucket] of memoryBuckets) {
+    if (now >= bucket.fullAt) {
+      memoryBuckets.delete(key)
+    }
+  }
+}
+
+function consumeMemory(checks, now) {
+  if (memoryBuckets.size >= MAX_MEMORY_BUCKETS) {
+    pruneMemoryBuckets(now)
+  }
+  const refilled = checks.map(({ key, policy }) =>
+    refill(memoryBuckets.get(key) || { tokens: policy.capacity, updatedAt: now }, policy, now))
+
+  const denied = checks.findIndex(({ cost }, i) => refilled[i].tokens < cost)
+  checks.forEach(({ key, cost, policy }, i) => {
+    const tokens = denied === -1 ? refilled[i].tokens - cost : refilled[i].tokens
+    memoryBuckets.set(key, {
+      tokens,
+      updatedAt: now,
+      fullAt: now + ((policy.capacity - tokens) / policy.refillPerSecond) * 1000
+    })
+  })
+
+  if (denied !== -1) {
+    const { cost, policy, scope } = checks[denied]
+    return { allowed: false, scope, retryAfter: retryAfterSeconds(refilled[denied].tokens, cost, policy) }
+  }
+  return { allowed: true, remaining: Math.floor(Math.min(...checks.map(({ cost }, i) => refilled[i].tokens - cost))) }
+}
+
+// Mongo backend: each bucket is refilled and charged in one atomic update, so
+// concurrent requests on different instances cannot both spend the same tokens
+let indexesReady = null
+
+async function ensureBucketIndexes(db) {
+  if (!indexesReady) {
+    indexesReady = Promise.all([
+      db.collection(BUCKETS_COLLECTION).createIndex({ key: 1 }, { unique: true }),
+      // Idle buckets are full again by expires_at and can be dropped
+      db.collection(BUCKETS_COLLECTION).createIndex({ expires_at: 1 }, { expireAfterSeconds: 0 })
+    ]).catch(error => {
+      indexesReady = null
+      console.error('Failed to create rate limit indexes:', error)
+    })
+  }
+  return indexesReady
+}
+
+function takeFromBucket(db, { key, policy }, cost, now) {
+  const elapsedSeconds = { $divide: [{ $subtract: [now, { $ifNull: ['$updated_at', now] }] }, 1000] }
+  return db.collection(BUCKETS_COLLECTION).findOneAndUpdate(
+    { key },
+    [
+      {
+        $set: {
+          tokens: {
+            $min: [
+              policy.capacity,
+              { $add: [{ $ifNull: ['$tokens', policy.capacity] }, { $multiply: [elapsedSeconds, policy.refillPerSecond] }] }
+            ]
+          },
+          updated_at: now,
+          expires_at: new Date(now.getTime() + (policy.capacity / policy.refillPerSecond) * 1000)
+        }
+      },
+      { $set: { allowed: { $gte: ['$tokens', cost] } } },
+      { $set: { tokens: { $cond: ['$allowed', { $subtract: ['$tokens', cost] }, '$tokens'] } } }
+    ],
+    { upsert: true, returnDocument: 'after' }
+  )
+}
+
+function refundBucket(db, { key, policy }, cost) {
+  return db.collection(BUCKETS_COLLECTION).updateOne(
+    { key },
+    [{ $set: { tokens: { $min: [policy.capacity, { $add: ['$tokens', cost] }] } } }]
+  )
+}
+
+async function consumeMongo(db, checks, now) {
+  await ensureBucketIndexes(db)
+
+  const taken = []
+  for (const check of checks) {
+    const bucket = await takeFromBucket(db, check, check.cost, now)
+    if (!bucket.allowed) {
+      // Give back what the earlier buckets were charged for this request
+      await Promise.all(taken.map(previous => refundBucket(db, previous, previous.cost)))
+      return { allowed: false, scope: check.scope, retryAfter: retryAfterSeconds(bucket.tokens, check.cost, check.policy) }
+    }
+    taken.push({ ...check, tokens: bucket.tokens })
+  }
+  return { allowed: true, remaining: Math.floor(Math.min(...taken.map(({ tokens }) => tokens))) }
+}
+
+// Charge `cost` to the user's and school's buckets for `action` ('ai' or 'write').
+// Returns { allowed, remaining } or { allowed: false, scope, retryAfter }.
+// A failing backend lets the request through rather than taking the API down.
+export async function consumeRateLimit(db, action, { userId, schoolKey }, cost = 1) {
+  const policies = RATE_LIMITS[action]
+  const checks = [
+    { scope: 'user', key: `${action}:user:${userId}`, policy: policies.user },
+    { scope: 'school', key: `${action}:${schoolKey}`, policy: policies.school }
+  ].map(check => ({ ...check, cost: Math.min(cost, check.policy.capacity) })) // Oversized calls drain a full bucket
+
+  try {
+    const result = BACKEND === 'mongo'
+      ? await consumeMongo(db, checks, new Date())
+      : consumeMemory(checks, Date.now())
+    if (!result.allowed) {
+      incrementCounter('proxilearn_rate_limited_total', 'Requests rejected by rate limiting', { action, scope: result.scope })
+    }
+    return result
+  } catch (error) {
+    console.error('Rate limit check failed:', error)
+    return { allowed: true, remaining: null }
+  }
+}
+
+export function rateLimitedResponse({ scope, retryAfter }) {
+  return NextResponse.json({
+    error: "Too many requests",
+    details: scope === 'school'
+      ? `Your school has reached its usage limit. Try again in ${retryAfter} seconds.`
+      : `You have reached your usage limit. Try again in ${retryAfter} seconds.`,
+    retryAfter
+  }, { status: 429, headers: { 'Retry-After': String(retryAfter) } })
+}
@@ -0,0 +1,49 @@
+// Offline token counting for AI prompts, so prompt size can be tracked per
+// helper without calling the provider. This approximates the BPE tokenizers of
+// the chat models: text is split the way cl100k-style tokenizers pre-split it
+// (words with their leading space, digit groups of up to three, punctuation
+// runs, whitespace) and each piece is priced by length. Close enough (roughly
+// ±10% on English prose and JSON) for budgets and before/after comparisons;
+// billing uses the provider's reported usage.
+
+const PIECE_PATTERN = /'(?:[sdmt]|ll|ve|re)| ?\p{L}+| ?\p{N}{1,3}| ?[^\s\p{L}\p{N}]+|\s+/gu
+const NON_ASCII = /[^\x00-\x7f]/
+
+// Chat formatting adds a few tokens per message and for priming the reply
+const TOKENS_PER_MESSAGE = 4
+const TOKENS_PER_REPLY = 3
+
+function pieceTokens(piece) {
+  const text = piece.trimStart() || piece
+  if (/^\s+$/.test(text)) {
+    return 1
+  }
+  if (/^\p{L}+$/u.test(text)) {
+    // Scripts without a dense vocabulary (CJK, Devanagari, ...) run close to a token per character
+    if (NON_ASCII.test(text)) {
+      return text.length
+    }
+    // Common words are one token; long or rare ones split into chunks of ~6 letters
+    return Math.max(1, Math.round(text.length / 6))
+  }
+  if (/^\p{N}+$/u.test(text)) {
+    return 1
+  }
+  return Math.ceil(text.length / 2)
+}
+
+export function countTokens(text) {
+  if (!text) {
+    return 0
+  }
+  let tokens = 0
+  for (const [piece] of String(text).matchAll(PIECE_PATTERN)) {
+    tokens += pieceTokens(piece)
+  }
+  return tokens
+}
+
+// Prompt tokens of a chat completion request
+export function countMessageTokens(messages) {
+  return messages.reduce((sum, message) => sum + TOKENS_PER_MESSAGE + countTokens(message.content), TOKENS_PER_REPLY)
+}
@@ -0,0 +1,456 @@
+-- ================================================================================================
+-- MONTHLY PARTITIONING AND ARCHIVAL - SUPABASE SQL SCHEMA EXTENSION
+-- ================================================================================================
+-- Converts the high-volume, append-mostly tables to declarative range partitioning by month:
+--   student_responses    (submitted_at)  one row per question per attempt
+--   group_chat_messages  (created_at)
+--   coordinator_alerts   (created_at)
+-- Queries that filter on the partition column only scan the matching months, new months are
+-- created ahead of time, and months past their retention are detached into the `archive` schema
+-- where they can be dumped and dropped without touching the live table.
+-- Prerequisites: Student Phase, Coordinator Phase and Regrade schemas must be applied first.
+-- Execute this script in your Supabase SQL editor.
+--
+-- Notes:
+--   * assignment_attempts stays unpartitioned. teacher_gradebook.assignment_attempt_id references
+--     it by id alone, and a partitioned table can only have unique keys that include the
+--     partition column. It gets a BRIN index on its dates instead.
+--   * Primary keys become (id, <partition column>). Uniqueness of one response per question per
+--     attempt is enforced per monthly partition, which covers every submission because an attempt
+--     is submitted once.
+--   * None of these tables carry school_id, so there is no school sub-partitioning; RLS already
+--     scopes every query to one user or group.
+--   * Partitions live in the `partitions` schema, which is not exposed through the API, and are
+--     always read through the parent table where RLS applies.
+
+-- ------------------------------------------------------------------------------------------------
+-- 1. SCHEMAS AND POLICY TABLE
+-- ------------------------------------------------------------------------------------------------
+CREATE SCHEMA IF NOT EXISTS partitions;
+CREATE SCHEMA IF NOT EXISTS archive;
+REVOKE ALL ON SCHEMA partitions FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON SCHEMA archive FROM PUBLIC, anon, authenticated;
+
+CREATE TABLE IF NOT EXISTS public.partitioned_tables (
+    table_name TEXT PRIMARY KEY,
+    partition_column TEXT NOT NULL,
+    retention_months INTEGER NOT NULL CHECK (retention_months >= 1),
+    months_ahead INTEGER NOT NULL DEFAULT 3,
+    partition_unique_columns TEXT -- e.g. 'student_id, question_id, attempt_number'
+);
+
+REVOKE ALL ON public.partitioned_tables FROM anon, authenticated;
+
+INSERT INTO public.partitioned_tables (table_name, partition_column, retention_months, partition_unique_columns)
+VALUES
+    ('student_responses', 'submitted_at', 24, 'student_id, question_id, attempt_number'),
+    ('group_chat_messages', 'created_at', 12, NULL),
+    ('coordinator_alerts', 'created_at', 18, NULL)
+ON CONFLICT (table_name) DO NOTHING;
+
+-- ------------------------------------------------------------------------------------------------
+-- 2. PARTITION MAINTENANCE FUNCTIONS
+-- ------------------------------------------------------------------------------------------------
+-- Partitions are named <table>_pYYYYMM and cover one calendar month (UTC).
+
+-- Create the monthly partitions from p_from's month through months_ahead months from now
+CREATE OR REPLACE FUNCTION public.create_monthly_partitions(p_table TEXT, p_from DATE DEFAULT CURRENT_DATE)
+RETURNS INTEGER AS $$
+DECLARE
+    v_policy public.partitioned_tables;
+    v_month DATE;
+    v_last DATE;
+    v_partition TEXT;
+    v_created INTEGER := 0;
+BEGIN
+    SELECT * INTO v_policy FROM public.partitioned_tables WHERE table_name = p_table;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'No partitioning policy for table %', p_table;
+    END IF;
+
+    v_month := date_trunc('month', LEAST(p_from, CURRENT_DATE))::DATE;
+    v_last := (date_trunc('month', CURRENT_DATE) + make_interval(months => v_policy.months_ahead))::DATE;
+
+    WHILE v_month <= v_last LOOP
+        v_partition := format('%s_p%s', p_table, to_char(v_month, 'YYYYMM'));
+
+        IF to_regclass(format('partitions.%I', v_partition)) IS NULL THEN
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE partitions.%I PARTITION OF public.%I FOR VALUES FROM (%L) TO (%L)',
+                    v_partition, p_table, v_month, (v_month + INTERVAL '1 month')::DATE
+                );
+                EXECUTE format('REVOKE ALL ON partitions.%I FROM PUBLIC, anon, authenticated', v_partition);
+                IF v_policy.partition_unique_columns IS NOT NULL THEN
+                    EXECUTE format('CREATE UNIQUE INDEX %I ON partitions.%I (%s)',
+                        v_partition || '_unique', v_partition, v_policy.partition_unique_columns);
+                END IF;
+                v_created := v_created + 1;
+            EXCEPTION WHEN check_violation THEN
+                -- Rows for this month already landed in the default partition
+                RAISE NOTICE '⚠️ Could not create % - move its rows out of %_default first', v_partition, p_table;
+            END;
+        END IF;
+
+        v_month := (v_month + INTERVAL '1 month')::DATE;
+    END LOOP;
+
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Detach partitions older than the retention window and move them to the archive schema
+CREATE OR REPLACE FUNCTION public.archive_old_partitions(p_table TEXT)
+RETURNS INTEGER AS $$
+DECLARE
+    v_policy public.partitioned_tables;
+    v_cutoff DATE;
+    v_partition RECORD;
+    v_archived INTEGER := 0;
+BEGIN
+    SELECT * INTO v_policy FROM public.partitioned_tables WHERE table_name = p_table;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'No partitioning policy for table %', p_table;
+    END IF;
+
+    v_cutoff := (date_trunc('month', CURRENT_DATE) - make_interval(months => v_policy.retention_months))::DATE;
+
+    FOR v_partition IN
+        SELECT child.relname
+        FROM pg_inherits i
+        JOIN pg_class child ON child.oid = i.inhrelid
+        JOIN pg_class parent ON parent.oid = i.inhparent
+        JOIN pg_namespace pn ON pn.oid = parent.relnamespace
+        WHERE pn.nspname = 'public'
+        AND parent.relname = p_table
+        AND child.relname ~ ('^' || p_table || '_p[0-9]{6}$')
+        AND to_date(right(child.relname, 6), 'YYYYMM') < v_cutoff
+        ORDER BY child.relname
+    LOOP
+        EXECUTE format('ALTER TABLE public.%I DETACH PARTITION partitions.%I', p_table, v_partition.relname);
+        EXECUTE format('ALTER TABLE partitions.%I SET SCHEMA archive', v_partition.relname);
+        v_archived := v_archived + 1;
+    END LOOP;
+
+    RETURN v_archived;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Run both for every partitioned table; meant to be scheduled daily
+CREATE OR REPLACE FUNCTION public.run_partition_maintenance()
+RETURNS TABLE (table_name TEXT, partitions_created INTEGER, partitions_archived INTEGER) AS $$
+    SELECT pt.table_name,
+           public.create_monthly_partitions(pt.table_name),
+           public.archive_old_partitions(pt.table_name)
+    FROM public.partitioned_tables pt
+    ORDER BY pt.table_name;
+$$ LANGUAGE sql;
+
+REVOKE EXECUTE ON FUNCTION public.create_monthly_partitions(TEXT, DATE) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.archive_old_partitions(TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.run_partition_maintenance() FROM PUBLIC, anon, authenticated;
+
+-- ------------------------------------------------------------------------------------------------
+-- 3. STUDENT_RESPONSES - Partitioned by submitted_at
+-- ------------------------------------------------------------------------------------------------
+-- The existing table is moved to archive.student_responses_unpartitioned and its rows copied
+-- into the new partitioned table. Drop the old copy once the migration has been checked.
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'public.student_responses'::regclass) = 'p' THEN
+        RAISE NOTICE 'student_responses is already partitioned';
+        RETURN;
+    END IF;
+
+    ALTER TABLE public.student_responses SET SCHEMA archive;
+    ALTER TABLE archive.student_responses RENAME TO student_responses_unpartitioned;
+
+    CREATE TABLE public.student_responses (
+        id UUID NOT NULL DEFAULT gen_random_uuid(),
+        assignment_id UUID CONSTRAINT student_responses_assignment_id_fkey
+            REFERENCES public.assignments(id) ON DELETE CASCADE,
+        student_id UUID CONSTRAINT student_responses_student_id_fkey
+            REFERENCES public.user_profiles(id) ON DELETE CASCADE,
+        question_id UUID CONSTRAINT student_responses_question_id_fkey
+            REFERENCES public.assignment_questions(id) ON DELETE CASCADE,
+        student_answer TEXT,
+        is_correct BOOLEAN,
+        points_earned DECIMAL(5,2) DEFAULT 0.00,
+        attempt_number INTEGER DEFAULT 1,
+        time_spent_seconds INTEGER DEFAULT 0,
+        submitted_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (id, submitted_at)
+    ) PARTITION BY RANGE (submitted_at);
+
+    CREATE TABLE partitions.student_responses_default PARTITION OF public.student_responses DEFAULT;
+    REVOKE ALL ON partitions.student_responses_default FROM PUBLIC, anon, authenticated;
+    CREATE UNIQUE INDEX student_responses_default_unique
+        ON partitions.student_responses_default (student_id, question_id, attempt_number);
+
+    PERFORM public.create_monthly_partitions('student_responses',
+        COALESCE((SELECT MIN(submitted_at)::DATE FROM archive.student_responses_unpartitioned), CURRENT_DATE));
+
+    INSERT INTO public.student_responses (
+        id, assignment_id, student_id, question_id, student_answer, is_correct,
+        points_earned, attempt_number, time_spent_seconds, submitted_at
+    )
+    SELECT id, assignment_id, student_id, question_id, student_answer, is_correct,
+           points_earned, attempt_number, time_spent_seconds, COALESCE(submitted_at, NOW())
+    FROM archive.student_responses_unpartitioned;
+
+    CREATE INDEX idx_student_responses_assignment_id ON public.student_responses(assignment_id);
+    CREATE INDEX idx_student_responses_student_id ON public.student_responses(student_id);
+    CREATE INDEX idx_student_responses_question_id ON public.student_responses(question_id);
+    CREATE INDEX idx_student_responses_attempt
+        ON public.student_responses(assignment_id, student_id, attempt_number);
+
+    ALTER TABLE public.student_responses ENABLE ROW LEVEL SECURITY;
+
+    CREATE POLICY "Students can manage their own responses" ON public.student_responses
+    FOR ALL USING (student_id = auth.uid());
+
+    CREATE POLICY "Teachers can view responses to their assignments" ON public.student_responses
+    FOR SELECT USING (
+        assignment_id IN (
+            SELECT id FROM public.assignments WHERE teacher_id = auth.uid()
+        )
+    );
+END $$;
+
+-- ------------------------------------------------------------------------------------------------
+-- 4. GROUP_CHAT_MESSAGES - Partitioned by created_at
+-- ------------------------------------------------------------------------------------------------
+-- Foreign key names are kept: the API embeds senders via group_chat_messages_sender_id_fkey.
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'public.group_chat_messages'::regclass) = 'p' THEN
+        RAISE NOTICE 'group_chat_messages is already partitioned';
+        RETURN;
+    END IF;
+
+    ALTER TABLE public.group_chat_messages SET SCHEMA archive;
+    ALTER TABLE archive.group_chat_messages RENAME TO group_chat_messages_unpartitioned;
+
+    CREATE TABLE public.group_chat_messages (
+        id UUID NOT NULL DEFAULT gen_random_uuid(),
+        group_id UUID CONSTRAINT group_chat_messages_group_id_fkey
+            REFERENCES public.study_groups(id) ON DELETE CASCADE,
+        sender_id UUID CONSTRAINT group_chat_messages_sender_id_fkey
+            REFERENCES public.user_profiles(id) ON DELETE CASCADE,
+        message_text TEXT,
+        message_type TEXT DEFAULT 'text' CHECK (message_type IN ('text', 'emoji', 'system')),
+        emoji_code TEXT,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at);
+
+    CREATE TABLE partitions.group_chat_messages_default PARTITION OF public.group_chat_messages DEFAULT;
+    REVOKE ALL ON partitions.group_chat_messages_default FROM PUBLIC, anon, authenticated;
+
+    PERFORM public.create_monthly_partitions('group_chat_messages',
+        COALESCE((SELECT MIN(created_at)::DATE FROM archive.group_chat_messages_unpartitioned), CURRENT_DATE));
+
+    INSERT INTO public.group_chat_messages (id, group_id, sender_id, message_text, message_type, emoji_code, created_at)
+    SELECT id, group_id, sender_id, message_text, message_type, emoji_code, COALESCE(created_at, NOW())
+    FROM archive.group_chat_messages_unpartitioned;
+
+    CREATE INDEX idx_group_chat_group_id ON public.group_chat_messages(group_id, created_at);
+    CREATE INDEX idx_group_chat_created_at ON public.group_chat_messages(created_at);
+
+    ALTER TABLE public.group_chat_messages ENABLE ROW LEVEL SECURITY;
+
+    CREATE POLICY "Group members can view chat messages" ON public.group_chat_messages
+    FOR SELECT USING (
+        group_id IN (
+            SELECT group_id FROM public.group_members
+            WHERE student_id = auth.uid() AND is_active = true
+        )
+    );
+
+    CREATE POLICY "Group members can send chat messages" ON public.group_chat_messages
+    FOR INSERT WITH CHECK (
+        sender_id = auth.uid() AND
+        group_id IN (
+            SELECT group_id FROM public.group_members
+            WHERE student_id = auth.uid() AND is_active = true
+        )
+    );
+END $$;
+
+-- ------------------------------------------------------------------------------------------------
+-- 5. COORDINATOR_ALERTS - Partitioned by created_at
+-- ------------------------------------------------------------------------------------------------
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'public.coordinator_alerts'::regclass) = 'p' THEN
+        RAISE NOTICE 'coordinator_alerts is already partitioned';
+        RETURN;
+    END IF;
+
+    ALTER TABLE public.coordinator_alerts SET SCHEMA archive;
+    ALTER TABLE archive.coordinator_alerts RENAME TO coordinator_alerts_unpartitioned;
+
+    CREATE TABLE public.coordinator_alerts (
+        id UUID NOT NULL DEFAULT gen_random_uuid(),
+        coordinator_id UUID NOT NULL CONSTRAINT coordinator_alerts_coordinator_id_fkey
+            REFERENCES public.user_profiles(id) ON DELETE CASCADE,
+        alert_type VARCHAR(50) NOT NULL CHECK (alert_type IN (
+            'attendance_drop', 'grade_decline', 'homework_pattern', 'doubt_spike',
+            'teacher_concern', 'parent_request', 'system_notification', 'deadline_reminder'
+        )),
+        severity_level VARCHAR(20) NOT NULL CHECK (severity_level IN ('info', 'warning', 'high', 'critical')),
+        alert_title VARCHAR(255) NOT NULL,
+        alert_message TEXT NOT NULL,
+        related_student_id UUID CONSTRAINT coordinator_alerts_related_student_id_fkey
+            REFERENCES public.user_profiles(id) ON DELETE CASCADE,
+        related_teacher_id UUID CONSTRAINT coordinator_alerts_related_teacher_id_fkey
+            REFERENCES public.user_profiles(id) ON DELETE SET NULL,
+        related_assignment_id UUID CONSTRAINT coordinator_alerts_related_assignment_id_fkey
+            REFERENCES public.assignments(id) ON DELETE SET NULL,
+        auto_generated BOOLEAN DEFAULT false,
+        trigger_data JSONB,
+        action_required BOOLEAN DEFAULT true,
+        action_taken TEXT,
+        is_resolved BOOLEAN DEFAULT false,
+        resolved_at TIMESTAMPTZ,
+        acknowledged BOOLEAN DEFAULT false,
+        acknowledged_at TIMESTAMPTZ,
+        expires_at TIMESTAMPTZ,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        updated_at TIMESTAMPTZ DEFAULT NOW(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at);
+
+    CREATE TABLE partitions.coordinator_alerts_default PARTITION OF public.coordinator_alerts DEFAULT;
+    REVOKE ALL ON partitions.coordinator_alerts_default FROM PUBLIC, anon, authenticated;
+
+    PERFORM public.create_monthly_partitions('coordinator_alerts',
+        COALESCE((SELECT MIN(created_at)::DATE FROM archive.coordinator_alerts_unpartitioned), CURRENT_DATE));
+
+    INSERT INTO public.coordinator_alerts
+    SELECT id, coordinator_id, alert_type, severity_level, alert_title, alert_message,
+           related_student_id, related_teacher_id, related_assignment_id, auto_generated,
+           trigger_data, action_required, action_taken, is_resolved, resolved_at,
+           acknowledged, acknowledged_at, expires_at, COALESCE(created_at, NOW()), updated_at
+    FROM archive.coordinator_alerts_unpartitioned;
+
+    CREATE INDEX idx_coordinator_alerts_coordinator_id ON public.coordinator_alerts(coordinator_id, created_at DESC);
+    CREATE INDEX idx_coordinator_alerts_type ON public.coordinator_alerts(alert_type);
+    CREATE INDEX idx_coordinator_alerts_severity ON public.coordinator_alerts(severity_level);
+    CREATE INDEX idx_coordinator_alerts_student_id ON public.coordinator_alerts(related_student_id);
+    CREATE INDEX idx_coordinator_alerts_resolved ON public.coordinator_alerts(is_resolved);
+    CREATE INDEX idx_coordinator_alerts_acknowledged ON public.coordinator_alerts(acknowledged);
+    CREATE INDEX idx_coordinator_alerts_auto ON public.coordinator_alerts(auto_generated);
+
+    ALTER TABLE public.coordinator_alerts ENABLE ROW LEVEL SECURITY;
+
+    CREATE POLICY "Coordinators can manage their own alerts" ON public.coordinator_alerts
+    FOR ALL USING (
+        coordinator_id = auth.uid() AND
+        auth.uid() IN (SELECT id FROM public.user_profiles WHERE role = 'coordinator')
+    );
+END $$;
+
+-- ------------------------------------------------------------------------------------------------
+-- 6. ASSIGNMENT_ATTEMPTS - Block-range indexes for date filters
+-- ------------------------------------------------------------------------------------------------
+-- Attempts are inserted in time order, so BRIN indexes stay tiny and let date-range analytics
+-- skip old blocks without the cost of partitioning a table other tables reference by id.
+CREATE INDEX IF NOT EXISTS idx_assignment_attempts_started_at_brin
+    ON public.assignment_attempts USING BRIN (started_at);
+CREATE INDEX IF NOT EXISTS idx_assignment_attempts_submitted_at_brin
+    ON public.assignment_attempts USING BRIN (submitted_at);
+
+-- ------------------------------------------------------------------------------------------------
+-- 7. PARTITION PRUNING REPORT - Check the date-filtered queries only touch recent months
+-- ------------------------------------------------------------------------------------------------
+-- Each row is one query shape used by the API or the coordinator functions, with the number of
+-- partitions its plan scans out of the number attached. Partitions pruned at executor startup
+-- (filters on NOW() or CURRENT_DATE) are already removed from the plan EXPLAIN returns.
+CREATE OR REPLACE FUNCTION public.partition_pruning_report()
+RETURNS TABLE (query_name TEXT, table_name TEXT, partitions_scanned INTEGER, partitions_total INTEGER) AS $$
+DECLARE
+    v_query RECORD;
+    v_plan JSONB;
+BEGIN
+    FOR v_query IN
+        SELECT * FROM (VALUES
+            ('chat history (GET /api/study-groups/{id}/chat)', 'group_chat_messages',
+             'SELECT id FROM public.group_chat_messages WHERE group_id = ''00000000-0000-0000-0000-000000000000''
+              AND created_at >= NOW() - INTERVAL ''90 days'' ORDER BY created_at LIMIT 100'),
+            ('alert list (GET /api/coordinator/alerts)', 'coordinator_alerts',
+             'SELECT id FROM public.coordinator_alerts WHERE coordinator_id = ''00000000-0000-0000-0000-000000000000''
+              AND created_at >= NOW() - INTERVAL ''90 days'' ORDER BY created_at DESC'),
+            ('duplicate alert check (generate_coordinator_alerts)', 'coordinator_alerts',
+             'SELECT 1 FROM public.coordinator_alerts WHERE alert_type = ''system_notification''
+              AND created_at >= CURRENT_DATE'),
+            ('submitted answers (POST /api/assignments/{id}/submit)', 'student_responses',
+             'SELECT id FROM public.student_responses WHERE assignment_id = ''00000000-0000-0000-0000-000000000000''
+              AND student_id = ''00000000-0000-0000-0000-000000000000'' AND attempt_number = 1
+              AND submitted_at >= NOW() - INTERVAL ''1 day''')
+        ) AS q(name, tbl, sql)
+    LOOP
+        EXECUTE 'EXPLAIN (FORMAT JSON) ' || v_query.sql INTO v_plan;
+
+        query_name := v_query.name;
+        table_name := v_query.tbl;
+        SELECT COUNT(*) INTO partitions_scanned
+        FROM jsonb_path_query(v_plan, 'strict $.**."Relation Name"') AS relation
+        WHERE relation #>> '{}' LIKE v_query.tbl || '\_%';
+        SELECT COUNT(*) INTO partitions_total
+        FROM pg_inherits i
+        WHERE i.inhparent = format('public.%I', v_query.tbl)::regclass;
+        RETURN NEXT;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+REVOKE EXECUTE ON FUNCTION public.partition_pruning_report() FROM PUBLIC, anon, authenticated;
+
+-- ================================================================================================
+-- SCHEDULED MAINTENANCE (Optional - requires pg_cron extension)
+-- ================================================================================================
+
+/*
+-- Create next months' partitions and archive expired ones (runs at 2 AM daily)
+SELECT cron.schedule('daily-partition-maintenance', '0 2 * * *', 'SELECT * FROM public.run_partition_maintenance();');
+*/
+
+-- ================================================================================================
+-- SCHEMA VALIDATION FOR PARTITIONING
+-- ================================================================================================
+
+DO $$
+DECLARE
+    partitioned_count INTEGER;
+    unpruned RECORD;
+BEGIN
+    SELECT COUNT(*) INTO partitioned_count
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public'
+    AND c.relkind = 'p'
+    AND c.relname IN ('student_responses', 'group_chat_messages', 'coordinator_alerts');
+
+    IF partitioned_count = 3 THEN
+        RAISE NOTICE '🎉 SUCCESS: All 3 high-volume tables are partitioned by month!';
+        RAISE NOTICE '📅 Partitions created through % months ahead', (SELECT MAX(months_ahead) FROM public.partitioned_tables);
+        RAISE NOTICE '📦 Old tables kept in the archive schema - drop them once the row counts are checked';
+    ELSE
+        RAISE NOTICE '⚠️ WARNING: Only % out of 3 tables are partitioned.', partitioned_count;
+        RAISE NOTICE '🔍 Please check the SQL execution log for errors.';
+    END IF;
+
+    FOR unpruned IN
+        SELECT * FROM public.partition_pruning_report() r
+        WHERE r.partitions_scanned >= r.partitions_total AND r.partitions_total > 2
+    LOOP
+        RAISE NOTICE '⚠️ No pruning for %: % of % partitions scanned',
+            unpruned.query_name, unpruned.partitions_scanned, unpruned.partitions_total;
+    END LOOP;
+    RAISE NOTICE '✅ Run SELECT * FROM public.partition_pruning_report() to check pruning at any time';
+END $$;
+
+-- ================================================================================================
+-- END OF PARTITIONING SCHEMA
+-- ================================================================================================
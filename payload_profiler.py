@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Response Payload Profiler for the Proxilearn API
+Fetches every endpoint the dashboards load (the useApiQuery paths in
+components/dashboards) as each role, and records response bytes, row counts and
+the bytes spent on every field. Field names are cross-referenced with the
+frontend source (app/page.js, components, hooks): a field whose name is never
+read there, as `.name`, `['name']` or a destructured `{ name }`, is counted as
+wasted, together with everything nested under it. The report ranks endpoints
+by wasted bytes and lists the biggest unused fields of each, which usually
+points straight at a select('*') or a nested join the UI never renders.
+
+The name match is deliberately loose (any read of `.email` anywhere counts as
+using every `email` field), so the wasted figures are a lower bound.
+
+Budgets: `--write-budgets` stores the current size of each endpoint plus
+PAYLOAD_BUDGET_HEADROOM in payload_budgets.json; `--check-budgets` (also
+`python backend_test.py --payload-budgets`) fails every endpoint whose payload
+has grown past its budget. Sizes are uncompressed JSON bytes, so compare runs
+against the same seed data.
+
+Environment:
+  PROXILEARN_STUDENT_COOKIE       Cookie headers; endpoints of roles without one
+  PROXILEARN_TEACHER_COOKIE       are skipped
+  PROXILEARN_COORDINATOR_COOKIE
+  PAYLOAD_BUDGET_FILE             default payload_budgets.json next to this script
+  PAYLOAD_BUDGET_HEADROOM         share added when writing budgets (default 0.25)
+  PAYLOAD_TOP_FIELDS              unused fields listed per endpoint (default 5)
+"""
+
+import glob
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+BUDGET_FILE = os.environ.get("PAYLOAD_BUDGET_FILE", os.path.join(REPO_ROOT, "payload_budgets.json"))
+BUDGET_HEADROOM = float(os.environ.get("PAYLOAD_BUDGET_HEADROOM", "0.25"))
+TOP_FIELDS = int(os.environ.get("PAYLOAD_TOP_FIELDS", "5"))
+
+# GET endpoints the dashboards load, per role
+ENDPOINTS = {
+    "student": ["/subjects", "/assignments", "/study-groups", "/doubts", "/student/progress"],
+    "teacher": ["/teacher/dashboard", "/teacher/lesson-plans", "/teacher/assignments", "/teacher/gradebook",
+                "/teacher/analytics", "/teacher/messages"],
+    "coordinator": ["/coordinator/dashboard", "/coordinator/support-categories", "/coordinator/analytics",
+                    "/coordinator/communications", "/coordinator/interventions", "/coordinator/alerts"],
+}
+
+FRONTEND_SOURCES = ["app/page.js", "components/**/*.jsx", "components/**/*.js", "hooks/*.js"]
+PROPERTY_READ = re.compile(r"\??\.\s*([A-Za-z_$][\w$]*)")
+BRACKET_READ = re.compile(r"\[\s*['\"`]([^'\"`]+)['\"`]\s*\]")
+DESTRUCTURE = re.compile(r"\{([^{}]*)\}\s*(?:=[^=>]|\)\s*=>)")
+IDENTIFIER = re.compile(r"^[A-Za-z_$][\w$]*$")
+UUID_SEGMENT = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I)
+
+
+def frontend_field_names():
+    """Every property name the frontend source reads"""
+    names = set()
+    for pattern in FRONTEND_SOURCES:
+        for path in glob.glob(os.path.join(REPO_ROOT, pattern), recursive=True):
+            with open(path, encoding="utf-8") as handle:
+                source = handle.read()
+            names.update(PROPERTY_READ.findall(source))
+            names.update(BRACKET_READ.findall(source))
+            for group in DESTRUCTURE.findall(source):
+                for part in group.split(","):
+                    name = part.split(":")[0].split("=")[0].strip().lstrip(".")
+                    if IDENTIFIER.match(name):
+                        names.add(name)
+    return names
+
+
+def json_bytes(value):
+    """Size of a value as JSON.stringify would send it"""
+    return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def route_label(path):
+    return "/".join(":id" if UUID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def profile_fields(value, used_names, path="", fields=None):
+    """Bytes per field path ("students[].user_profiles.email"), stopping at unused fields"""
+    if fields is None:
+        fields = defaultdict(lambda: {"bytes": 0, "count": 0, "used": True})
+    if isinstance(value, list):
+        for item in value:
+            profile_fields(item, used_names, f"{path}[]", fields)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            field_path = f"{path}.{key}" if path else key
+            entry = fields[field_path]
+            # "key":value, as it appears inside the object
+            entry["bytes"] += json_bytes(key) + 1 + json_bytes(item) + 1
+            entry["count"] += 1
+            entry["used"] = key in used_names
+            if entry["used"]:
+                profile_fields(item, used_names, field_path, fields)
+    return fields
+
+
+def count_rows(value):
+    """Objects inside arrays, i.e. the rows the endpoint returned"""
+    if isinstance(value, list):
+        return sum((1 if isinstance(item, dict) else 0) + count_rows(item) for item in value)
+    if isinstance(value, dict):
+        return sum(count_rows(item) for item in value.values())
+    return 0
+
+
+def load_budgets():
+    if not os.path.exists(BUDGET_FILE):
+        return {}
+    with open(BUDGET_FILE) as handle:
+        return json.load(handle)
+
+
+class PayloadProfiler:
+    def __init__(self):
+        self.used_names = frontend_field_names()
+        self.sessions = {}
+        for role in ENDPOINTS:
+            cookie = os.environ.get(f"PROXILEARN_{role.upper()}_COOKIE")
+            if cookie:
+                session = requests.Session()
+                session.headers["Cookie"] = cookie
+                self.sessions[role] = session
+
+    def endpoints(self):
+        for role, paths in ENDPOINTS.items():
+            if role in self.sessions:
+                for path in paths:
+                    yield role, path
+
+    def profile(self, role, path):
+        response = self.sessions[role].get(f"{API_BASE}{path}", timeout=60)
+        result = {"role": role, "path": path, "route": route_label(path), "status": response.status_code,
+                  "bytes": len(response.content), "rows": 0, "wasted": 0, "unused": []}
+        if response.status_code != 200:
+            return result, None
+
+        body = response.json()
+        fields = profile_fields(body, self.used_names)
+        unused = sorted(((field, stats) for field, stats in fields.items() if not stats["used"]),
+                        key=lambda item: -item[1]["bytes"])
+        result["rows"] = count_rows(body)
+        result["wasted"] = sum(stats["bytes"] for _, stats in unused)
+        result["unused"] = unused
+        return result, body
+
+    def profile_all(self):
+        results = []
+        for role, path in self.endpoints():
+            result, body = self.profile(role, path)
+            results.append(result)
+            # The profile dialog opens from a support-category entry
+            if path == "/coordinator/support-categories" and body:
+                students = [entry.get("student_id") for entry in body.get("support_categories", [])]
+                if students and students[0]:
+                    results.append(self.profile(role, f"/coordinator/students/{students[0]}/profile")[0])
+        return results
+
+    def report(self, results):
+        print("=" * 80)
+        print("PROXILEARN RESPONSE PAYLOAD PROFILE")
+        print("=" * 80)
+        print(f"{len(self.used_names)} field names read by the frontend, {len(results)} endpoints profiled")
+        print()
+
+        ranked = sorted(results, key=lambda result: -result["wasted"])
+        print(f"{'Role':<12} {'Route':<44} {'KB':>8} {'rows':>6} {'wasted KB':>10} {'wasted':>7}")
+        print("-" * 92)
+        for result in ranked:
+            if result["status"] != 200:
+                print(f"{result['role']:<12} {result['route'][:44]:<44} {'HTTP ' + str(result['status']):>8}")
+                continue
+            share = result["wasted"] / result["bytes"] * 100 if result["bytes"] else 0
+            print(f"{result['role']:<12} {result['route'][:44]:<44} {result['bytes'] / 1024:>8.1f} "
+                  f"{result['rows']:>6} {result['wasted'] / 1024:>10.1f} {share:>6.0f}%")
+        print()
+
+        for result in ranked:
+            if not result["unused"]:
+                continue
+            print(f"📦 {result['route']} - largest fields the frontend never reads:")
+            for field, stats in result["unused"][:TOP_FIELDS]:
+                print(f"   {field:<60} {stats['bytes'] / 1024:>8.1f} KB in {stats['count']} rows")
+            print()
+
+        total = sum(result["bytes"] for result in results)
+        wasted = sum(result["wasted"] for result in results)
+        print(f"Total {total / 1024:.1f} KB, of which {wasted / 1024:.1f} KB in fields the frontend never reads")
+
+    def write_budgets(self, results):
+        budgets = load_budgets()
+        for result in results:
+            if result["status"] == 200:
+                budgets[result["route"]] = int(result["bytes"] * (1 + BUDGET_HEADROOM))
+        with open(BUDGET_FILE, "w") as handle:
+            json.dump(dict(sorted(budgets.items())), handle, indent=2)
+            handle.write("\n")
+        print(f"Budgets for {len(budgets)} routes written to {BUDGET_FILE}")
+
+
+class PayloadBudgetTester:
+    def __init__(self):
+        self.profiler = PayloadProfiler()
+        self.budgets = load_budgets()
+        self.test_results = []
+
+    def log_test(self, test_name, success, message=""):
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status}: {test_name}")
+        if message:
+            print(f"   {message}")
+        print()
+        self.test_results.append({"test": test_name, "success": success, "message": message})
+
+    def run(self):
+        print("=" * 80)
+        print("PROXILEARN PAYLOAD BUDGETS")
+        print("=" * 80)
+        if not self.budgets:
+            print(f"⏭️  SKIP - no budgets in {BUDGET_FILE} (create them with payload_profiler.py --write-budgets)")
+            return True
+        if not self.profiler.sessions:
+            print("⏭️  SKIP - set PROXILEARN_STUDENT_COOKIE, PROXILEARN_TEACHER_COOKIE or PROXILEARN_COORDINATOR_COOKIE")
+            return True
+
+        for result in self.profiler.profile_all():
+            budget = self.budgets.get(result["route"])
+            if budget is None:
+                print(f"⏭️  SKIP: {result['route']} has no budget")
+                continue
+            if result["status"] != 200:
+                self.log_test(f"Payload budget {result['route']}", False, f"HTTP {result['status']}")
+                continue
+            self.log_test(f"Payload budget {result['route']}", result["bytes"] <= budget,
+                          f"{result['bytes']} bytes (budget {budget}), {result['rows']} rows, "
+                          f"{result['wasted']} bytes in unused fields")
+
+        passed = sum(1 for result in self.test_results if result["success"])
+        print("=" * 80)
+        print(f"SUMMARY: {passed}/{len(self.test_results)} endpoints within budget")
+        print("=" * 80)
+        return passed == len(self.test_results)
+
+
+if __name__ == "__main__":
+    if "--check-budgets" in sys.argv:
+        raise SystemExit(0 if PayloadBudgetTester().run() else 1)
+
+    profiler = PayloadProfiler()
+    if not profiler.sessions:
+        print("⏭️  SKIP - set PROXILEARN_STUDENT_COOKIE, PROXILEARN_TEACHER_COOKIE or PROXILEARN_COORDINATOR_COOKIE")
+        raise SystemExit(0)
+
+    profile_results = profiler.profile_all()
+    profiler.report(profile_results)
+    if "--write-budgets" in sys.argv:
+        profiler.write_budgets(profile_results)
@@ -0,0 +1,70 @@
+// Service worker for offline quiz taking (registered by lib/answerLog.js).
+// Keeps the app shell and built assets available when school Wi-Fi drops, so a
+// reload mid-quiz still opens the app, and relays Background Sync events to open
+// pages, which hold the session needed to flush saved answers and submits.
+// API requests are never cached here.
+
+const CACHE_NAME = 'proxilearn-shell-v3'
+const SHELL_URLS = ['/']
+const SYNC_TAG = 'quiz-outbox'
+
+self.addEventListener('install', event => {
+  event.waitUntil(caches.open(CACHE_NAME).then(cache => cache.addAll(SHELL_URLS)))
+  self.skipWaiting()
+})
+
+self.addEventListener('activate', event => {
+  event.waitUntil(
+    caches.keys()
+      .then(keys => Promise.all(keys.filter(key => key !== CACHE_NAME).map(key => caches.delete(key))))
+      .then(() => self.clients.claim())
+  )
+})
+
+self.addEventListener('fetch', event => {
+  const { request } = event
+  const url = new URL(request.url)
+  if (request.method !== 'GET' || url.origin !== self.location.origin || url.pathname.startsWith('/api/')) {
+    return
+  }
+
+  // Pages: network first, cached shell when offline. Only the app shell itself
+  // refreshes the cached copy, so visiting another page cannot replace it.
+  if (request.mode === 'navigate') {
+    event.respondWith(
+      fetch(request)
+        .then(response => {
+          if (url.pathname === '/' && response.ok) {
+            const copy = response.clone()
+            caches.open(CACHE_NAME).then(cache => cache.put('/', copy))
+          }
+          return response
+        })
+        .catch(() => caches.match('/'))
+    )
+    return
+  }
+
+  // Hashed build assets never change: cache first
+  if (url.pathname.startsWith('/_next/static/')) {
+    event.respondWith(
+      caches.match(request).then(cached => cached || fetch(request).then(response => {
+        // Never keep a failed load, or it would be served from cache forever
+        if (response.ok) {
+          const copy = response.clone()
+          caches.open(CACHE_NAME).then(cache => cache.put(request, copy))
+        }
+        return response
+      }))
+    )
+  }
+})
+
+self.addEventListener('sync', event => {
+  if (event.tag === SYNC_TAG) {
+    event.waitUntil(
+      self.clients.matchAll({ type: 'window' })
+        .then(clients => clients.forEach(client => client.postMessage({ type: SYNC_TAG })))
+    )
+  }
+})
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Rate Limit Test for Proxilearn Write and AI Endpoints
+Drains one user's write bucket with POST /api/study-groups/join calls that use
+an invite code which does not exist (so nothing is written), then checks that
+the limited responses are 429 with a usable Retry-After header and that the
+bucket refills once that time has passed.
+
+Run it against a server started with a low write limit so the bucket drains
+quickly, e.g. RATE_LIMIT_WRITE_USER_PER_MINUTE=6 (a burst of 30).
+
+Environment:
+  PROXILEARN_AUTH_COOKIE   Cookie header of a signed-in user (required)
+  MAX_REQUESTS             give up when no 429 arrives within this many calls (default 400)
+"""
+
+import os
+import time
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+AUTH_COOKIE = os.environ.get("PROXILEARN_AUTH_COOKIE")
+MAX_REQUESTS = int(os.environ.get("MAX_REQUESTS", "400"))
+MISSING_INVITE_CODE = "rate-limit-test-no-such-group"
+
+
+class RateLimitTester:
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers['Cookie'] = AUTH_COOKIE
+        self.test_results = []
+        self.limited_response = None
+
+    def log_test(self, test_name, success, message=""):
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status}: {test_name}")
+        if message:
+            print(f"   {message}")
+        print()
+        self.test_results.append({"test": test_name, "success": success, "message": message})
+
+    def join(self):
+        return self.session.post(f"{API_BASE}/study-groups/join", json={'inviteCode': MISSING_INVITE_CODE})
+
+    def test_bucket_drains(self):
+        """Repeated writes are eventually rejected with 429"""
+        for sent in range(1, MAX_REQUESTS + 1):
+            response = self.join()
+            if response.status_code == 429:
+                self.limited_response = response
+                self.log_test("Write bucket drains", True, f"First 429 after {sent} requests")
+                return
+            if response.status_code != 404:
+                self.log_test("Write bucket drains", False,
+                              f"Unexpected status {response.status_code}: {response.text[:200]}")
+                return
+        self.log_test("Write bucket drains", False, f"No 429 within {MAX_REQUESTS} requests")
+
+    def test_retry_after_header(self):
+        """429 responses carry Retry-After in whole seconds and a JSON error"""
+        if self.limited_response is None:
+            print("⏭️  SKIP: Retry-After header (bucket never drained)")
+            print()
+            return
+
+        retry_after = self.limited_response.headers.get('Retry-After', '')
+        body = self.limited_response.json()
+        if not retry_after.isdigit() or int(retry_after) < 1:
+            self.log_test("Retry-After header", False, f"Bad Retry-After: {retry_after!r}")
+        elif body.get('retryAfter') != int(retry_after) or not body.get('error'):
+            self.log_test("Retry-After header", False, f"Body does not match header: {body}")
+        else:
+            self.log_test("Retry-After header", True, f"Retry-After {retry_after}s, details: {body.get('details')}")
+
+    def test_bucket_refills(self):
+        """Waiting Retry-After seconds is enough to be served again"""
+        if self.limited_response is None:
+            print("⏭️  SKIP: Bucket refills (bucket never drained)")
+            print()
+            return
+
+        wait = int(self.limited_response.headers['Retry-After'])
+        print(f"   Waiting {wait}s for the bucket to refill...")
+        time.sleep(wait + 0.5)
+        response = self.join()
+        self.log_test("Bucket refills", response.status_code == 404,
+                      f"Status after waiting: {response.status_code}")
+
+    def run_all_tests(self):
+        print("=" * 80)
+        print("PROXILEARN RATE LIMIT TEST")
+        print("=" * 80)
+        print()
+
+        self.test_bucket_drains()
+        self.test_retry_after_header()
+        self.test_bucket_refills()
+
+        passed = sum(1 for result in self.test_results if result["success"])
+        print("=" * 80)
+        print(f"SUMMARY: {passed}/{len(self.test_results)} tests passed")
+        print("=" * 80)
+        return passed == len(self.test_results)
+
+
+if __name__ == "__main__":
+    if not AUTH_COOKIE:
+        print("⏭️  SKIP - set PROXILEARN_AUTH_COOKIE to run the rate limit test")
+        raise SystemExit(0)
+
+    raise SystemExit(0 if RateLimitTester().run_all_tests() else 1)
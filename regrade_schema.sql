@@ -0,0 +1,236 @@
+-- ================================================================================================
+-- BULK REGRADE ENGINE - SUPABASE SQL SCHEMA EXTENSION
+-- ================================================================================================
+-- Recomputes grades for every submitted attempt of an assignment after its answer key changes.
+-- Everything runs as set-based statements inside a single function call (one transaction), so
+-- thousands of attempts are regraded without per-row round-trips from the API server.
+-- Prerequisites: Student Phase and Teacher Phase schemas must be applied first.
+-- Execute this script in your Supabase SQL editor.
+
+-- ------------------------------------------------------------------------------------------------
+-- 1. SUPPORTING INDEX - Per-attempt response lookups
+-- ------------------------------------------------------------------------------------------------
+-- Attempt totals are summed per (assignment, student, attempt); without this index the
+-- aggregation scans every response of the assignment once per attempt.
+CREATE INDEX IF NOT EXISTS idx_student_responses_attempt
+    ON public.student_responses(assignment_id, student_id, attempt_number);
+
+CREATE INDEX IF NOT EXISTS idx_gradebook_attempt_id
+    ON public.teacher_gradebook(assignment_attempt_id);
+
+-- ------------------------------------------------------------------------------------------------
+-- 2. REGRADE FUNCTION - Apply answer key changes and regrade all attempts
+-- ------------------------------------------------------------------------------------------------
+-- p_answer_key: optional {"<question_id>": "<new correct answer>", ...} applied before regrading
+-- p_dry_run:    compute and return the diff, then roll every change back
+--
+-- Grading rules match POST /api/assignments/{id}/submit: an answer is correct when it equals
+-- correct_answer exactly, and the percentage is taken over the points of all questions.
+-- Gradebook rows keep teacher overrides (manual_score) exactly like auto_populate_gradebook().
+CREATE OR REPLACE FUNCTION public.regrade_assignment(
+    p_assignment_id UUID,
+    p_answer_key JSONB DEFAULT NULL,
+    p_dry_run BOOLEAN DEFAULT false
+)
+RETURNS JSONB
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    result JSONB;
+    question_changes JSONB := '[]'::JSONB;
+    attempt_changes JSONB := '[]'::JSONB;
+    responses_changed INTEGER := 0;
+    attempts_regraded INTEGER := 0;
+    gradebook_updated INTEGER := 0;
+    attempts_checked INTEGER := 0;
+BEGIN
+    -- Only the owning teacher may regrade; the row lock serializes concurrent regrades
+    PERFORM 1
+    FROM public.assignments
+    WHERE id = p_assignment_id AND teacher_id = auth.uid()
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Assignment not found or not owned by the current teacher'
+            USING ERRCODE = '42501';
+    END IF;
+
+    IF p_answer_key IS NOT NULL AND jsonb_typeof(p_answer_key) <> 'object' THEN
+        RAISE EXCEPTION 'Answer key must be a JSON object of question_id -> correct_answer'
+            USING ERRCODE = '22023';
+    END IF;
+
+    BEGIN
+        -- Step 1: apply answer key changes (old values read from the pre-update snapshot)
+        IF p_answer_key IS NOT NULL THEN
+            WITH changed AS (
+                UPDATE public.assignment_questions q
+                SET correct_answer = k.value,
+                    updated_at = NOW()
+                FROM jsonb_each_text(p_answer_key) k
+                JOIN public.assignment_questions old ON old.id = k.key::UUID
+                WHERE q.id = old.id
+                AND q.assignment_id = p_assignment_id
+                AND q.correct_answer IS DISTINCT FROM k.value
+                RETURNING q.id, old.correct_answer AS old_answer, q.correct_answer AS new_answer
+            )
+            SELECT COALESCE(jsonb_agg(jsonb_build_object(
+                'questionId', id,
+                'oldAnswer', old_answer,
+                'newAnswer', new_answer
+            )), '[]'::JSONB)
+            INTO question_changes
+            FROM changed;
+        END IF;
+
+        -- Step 2: re-mark every response against the current answer key
+        WITH graded AS (
+            SELECT
+                r.id,
+                COALESCE(r.student_answer = q.correct_answer, false) AS is_correct,
+                CASE WHEN r.student_answer = q.correct_answer THEN q.points ELSE 0 END AS points_earned
+            FROM public.student_responses r
+            JOIN public.assignment_questions q ON q.id = r.question_id
+            WHERE r.assignment_id = p_assignment_id
+        ),
+        changed AS (
+            UPDATE public.student_responses r
+            SET is_correct = g.is_correct,
+                points_earned = g.points_earned
+            FROM graded g
+            WHERE r.id = g.id
+            AND (r.is_correct IS DISTINCT FROM g.is_correct OR r.points_earned IS DISTINCT FROM g.points_earned)
+            RETURNING r.id
+        )
+        SELECT COUNT(*) INTO responses_changed FROM changed;
+
+        -- Step 3: recompute attempt totals and push changed scores into the gradebook
+        WITH possible AS (
+            SELECT COALESCE(SUM(points), 0) AS total_points
+            FROM public.assignment_questions
+            WHERE assignment_id = p_assignment_id
+        ),
+        scores AS (
+            SELECT
+                t.id AS attempt_id,
+                COALESCE(SUM(r.points_earned), 0) AS total_score
+            FROM public.assignment_attempts t
+            LEFT JOIN public.student_responses r ON (
+                r.assignment_id = t.assignment_id AND
+                r.student_id = t.student_id AND
+                r.attempt_number = t.attempt_number
+            )
+            WHERE t.assignment_id = p_assignment_id
+            AND t.status IN ('completed', 'submitted', 'graded')
+            GROUP BY t.id
+        ),
+        recomputed AS (
+            SELECT
+                s.attempt_id,
+                s.total_score,
+                CASE
+                    WHEN p.total_points > 0 THEN ROUND((s.total_score / p.total_points) * 100, 2)
+                    ELSE 0
+                END AS percentage_score
+            FROM scores s
+            CROSS JOIN possible p
+        ),
+        changed_attempts AS (
+            UPDATE public.assignment_attempts t
+            SET total_score = c.total_score,
+                percentage_score = c.percentage_score
+            FROM recomputed c
+            JOIN public.assignment_attempts old ON old.id = c.attempt_id
+            WHERE t.id = c.attempt_id
+            AND (t.total_score IS DISTINCT FROM c.total_score OR t.percentage_score IS DISTINCT FROM c.percentage_score)
+            RETURNING
+                t.id AS attempt_id,
+                t.student_id,
+                t.attempt_number,
+                old.total_score AS old_score,
+                t.total_score AS new_score,
+                old.percentage_score AS old_percentage,
+                t.percentage_score AS new_percentage
+        ),
+        changed_gradebook AS (
+            UPDATE public.teacher_gradebook g
+            SET auto_score = c.new_score,
+                final_score = COALESCE(g.manual_score, c.new_score),
+                percentage = c.new_percentage,
+                graded_at = NOW(),
+                updated_at = NOW()
+            FROM changed_attempts c
+            WHERE g.assignment_attempt_id = c.attempt_id
+            RETURNING g.id
+        )
+        SELECT
+            (SELECT COUNT(*) FROM recomputed),
+            (SELECT COUNT(*) FROM changed_attempts),
+            (SELECT COUNT(*) FROM changed_gradebook),
+            COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'attemptId', attempt_id,
+                    'studentId', student_id,
+                    'attemptNumber', attempt_number,
+                    'oldScore', old_score,
+                    'newScore', new_score,
+                    'oldPercentage', old_percentage,
+                    'newPercentage', new_percentage,
+                    'oldGradeLetter', calculate_grade_letter(old_percentage),
+                    'newGradeLetter', calculate_grade_letter(new_percentage)
+                ) ORDER BY new_percentage - old_percentage DESC)
+                FROM changed_attempts
+            ), '[]'::JSONB)
+        INTO attempts_checked, attempts_regraded, gradebook_updated, attempt_changes;
+
+        IF p_dry_run THEN
+            -- Roll back this block's changes; the computed diff survives in variables
+            RAISE EXCEPTION 'regrade dry run' USING ERRCODE = 'RG001';
+        END IF;
+    EXCEPTION
+        WHEN SQLSTATE 'RG001' THEN
+            NULL;
+    END;
+
+    result := jsonb_build_object(
+        'assignment_id', p_assignment_id,
+        'dry_run', p_dry_run,
+        'questions_updated', jsonb_array_length(question_changes),
+        'responses_changed', responses_changed,
+        'attempts_checked', attempts_checked,
+        'attempts_regraded', attempts_regraded,
+        'gradebook_updated', gradebook_updated,
+        'question_changes', question_changes,
+        'attempt_changes', attempt_changes,
+        'regraded_at', NOW()
+    );
+
+    RETURN result;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION public.regrade_assignment(UUID, JSONB, BOOLEAN) TO authenticated;
+
+-- ================================================================================================
+-- SCHEMA VALIDATION FOR REGRADE ENGINE
+-- ================================================================================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_proc p
+        JOIN pg_namespace n ON n.oid = p.pronamespace
+        WHERE n.nspname = 'public' AND p.proname = 'regrade_assignment'
+    ) THEN
+        RAISE NOTICE '🎉 SUCCESS: regrade_assignment() created';
+        RAISE NOTICE '⚡ Per-attempt response index configured';
+        RAISE NOTICE '✅ Bulk regrade is ready: SELECT regrade_assignment(''<assignment_id>'', NULL, true);';
+    ELSE
+        RAISE NOTICE '❌ regrade_assignment() is missing - check the SQL execution log for errors.';
+    END IF;
+END $$;
+
+-- ================================================================================================
+-- END OF BULK REGRADE ENGINE SCHEMA
+-- ================================================================================================
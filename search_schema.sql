@@ -0,0 +1,312 @@
+-- ================================================================================================
+-- FULL-TEXT SEARCH - SUPABASE SQL SCHEMA EXTENSION
+-- ================================================================================================
+-- Adds trigger-maintained tsvector columns with GIN indexes to lesson plans, doubts, PDF
+-- assessments, teacher messages and coordinator communications, plus a ranked, highlighted,
+-- cursor-paginated search function used by GET /api/search.
+-- Prerequisites: Student, Teacher and Coordinator Phase schemas must be applied first.
+-- Execute this script in your Supabase SQL editor.
+
+-- ------------------------------------------------------------------------------------------------
+-- 1. LESSON PLANS - title (A), description/objectives/concepts/tags (B), the rest (C)
+-- ------------------------------------------------------------------------------------------------
+ALTER TABLE public.lesson_plans ADD COLUMN IF NOT EXISTS search_vector TSVECTOR;
+
+CREATE OR REPLACE FUNCTION public.lesson_plan_search_document(lp public.lesson_plans)
+RETURNS TSVECTOR AS $$
+    SELECT
+        setweight(to_tsvector('english', COALESCE(lp.title, '')), 'A') ||
+        setweight(to_tsvector('english',
+            COALESCE(lp.description, '') || ' ' ||
+            COALESCE(array_to_string(lp.learning_objectives, ' '), '') || ' ' ||
+            COALESCE(array_to_string(lp.key_concepts, ' '), '') || ' ' ||
+            COALESCE(array_to_string(lp.tags, ' '), '')
+        ), 'B') ||
+        setweight(to_tsvector('english',
+            COALESCE(array_to_string(lp.discussion_points, ' '), '') || ' ' ||
+            COALESCE(lp.assessment_notes, '') || ' ' ||
+            COALESCE(lp.homework_suggestions, '') || ' ' ||
+            COALESCE(lp.activities::TEXT, '')
+        ), 'C');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION update_lesson_plan_search_vector()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector = public.lesson_plan_search_document(NEW);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS lesson_plans_search_vector ON public.lesson_plans;
+CREATE TRIGGER lesson_plans_search_vector
+    BEFORE INSERT OR UPDATE OF title, description, learning_objectives, key_concepts, tags,
+        discussion_points, assessment_notes, homework_suggestions, activities
+    ON public.lesson_plans
+    FOR EACH ROW
+    EXECUTE FUNCTION update_lesson_plan_search_vector();
+
+UPDATE public.lesson_plans lp SET search_vector = public.lesson_plan_search_document(lp);
+
+CREATE INDEX IF NOT EXISTS idx_lesson_plans_search ON public.lesson_plans USING GIN(search_vector);
+
+-- ------------------------------------------------------------------------------------------------
+-- 2. DOUBTS - title (A), question (B), context (C)
+-- ------------------------------------------------------------------------------------------------
+ALTER TABLE public.doubts ADD COLUMN IF NOT EXISTS search_vector TSVECTOR;
+
+CREATE OR REPLACE FUNCTION public.doubt_search_document(d public.doubts)
+RETURNS TSVECTOR AS $$
+    SELECT
+        setweight(to_tsvector('english', COALESCE(d.title, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(d.question_text, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(d.context, '')), 'C');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION update_doubt_search_vector()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector = public.doubt_search_document(NEW);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS doubts_search_vector ON public.doubts;
+CREATE TRIGGER doubts_search_vector
+    BEFORE INSERT OR UPDATE OF title, question_text, context
+    ON public.doubts
+    FOR EACH ROW
+    EXECUTE FUNCTION update_doubt_search_vector();
+
+UPDATE public.doubts d SET search_vector = public.doubt_search_document(d);
+
+CREATE INDEX IF NOT EXISTS idx_doubts_search ON public.doubts USING GIN(search_vector);
+
+-- ------------------------------------------------------------------------------------------------
+-- 3. PDF ASSESSMENTS - title (A), description/topics (B), instructions and question text (C)
+-- ------------------------------------------------------------------------------------------------
+ALTER TABLE public.pdf_assessments ADD COLUMN IF NOT EXISTS search_vector TSVECTOR;
+
+CREATE OR REPLACE FUNCTION public.pdf_assessment_search_document(pa public.pdf_assessments)
+RETURNS TSVECTOR AS $$
+    SELECT
+        setweight(to_tsvector('english', COALESCE(pa.title, '')), 'A') ||
+        setweight(to_tsvector('english',
+            COALESCE(pa.description, '') || ' ' ||
+            COALESCE(array_to_string(pa.topics, ' '), '')
+        ), 'B') ||
+        setweight(to_tsvector('english',
+            COALESCE(pa.instructions, '') || ' ' ||
+            COALESCE((
+                SELECT string_agg(COALESCE(q->>'question', q->>'question_text', ''), ' ')
+                FROM jsonb_array_elements(
+                    CASE WHEN jsonb_typeof(pa.questions) = 'array' THEN pa.questions ELSE '[]'::JSONB END
+                ) q
+            ), '')
+        ), 'C');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION update_pdf_assessment_search_vector()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector = public.pdf_assessment_search_document(NEW);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS pdf_assessments_search_vector ON public.pdf_assessments;
+CREATE TRIGGER pdf_assessments_search_vector
+    BEFORE INSERT OR UPDATE OF title, description, topics, instructions, questions
+    ON public.pdf_assessments
+    FOR EACH ROW
+    EXECUTE FUNCTION update_pdf_assessment_search_vector();
+
+UPDATE public.pdf_assessments pa SET search_vector = public.pdf_assessment_search_document(pa);
+
+CREATE INDEX IF NOT EXISTS idx_pdf_assessments_search ON public.pdf_assessments USING GIN(search_vector);
+
+-- ------------------------------------------------------------------------------------------------
+-- 4. TEACHER MESSAGES - subject (A), message text (B)
+-- ------------------------------------------------------------------------------------------------
+ALTER TABLE public.teacher_messages ADD COLUMN IF NOT EXISTS search_vector TSVECTOR;
+
+CREATE OR REPLACE FUNCTION public.teacher_message_search_document(tm public.teacher_messages)
+RETURNS TSVECTOR AS $$
+    SELECT
+        setweight(to_tsvector('english', COALESCE(tm.subject, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(tm.message_text, '')), 'B');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION update_teacher_message_search_vector()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector = public.teacher_message_search_document(NEW);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS teacher_messages_search_vector ON public.teacher_messages;
+CREATE TRIGGER teacher_messages_search_vector
+    BEFORE INSERT OR UPDATE OF subject, message_text
+    ON public.teacher_messages
+    FOR EACH ROW
+    EXECUTE FUNCTION update_teacher_message_search_vector();
+
+UPDATE public.teacher_messages tm SET search_vector = public.teacher_message_search_document(tm);
+
+CREATE INDEX IF NOT EXISTS idx_teacher_messages_search ON public.teacher_messages USING GIN(search_vector);
+
+-- ------------------------------------------------------------------------------------------------
+-- 5. COORDINATOR COMMUNICATIONS - subject (A), message content (B), tags (C)
+-- ------------------------------------------------------------------------------------------------
+ALTER TABLE public.coordinator_communications ADD COLUMN IF NOT EXISTS search_vector TSVECTOR;
+
+CREATE OR REPLACE FUNCTION public.coordinator_communication_search_document(cc public.coordinator_communications)
+RETURNS TSVECTOR AS $$
+    SELECT
+        setweight(to_tsvector('english', COALESCE(cc.subject, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(cc.message_content, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(array_to_string(cc.tags, ' '), '')), 'C');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION update_coordinator_communication_search_vector()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_vector = public.coordinator_communication_search_document(NEW);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS coordinator_communications_search_vector ON public.coordinator_communications;
+CREATE TRIGGER coordinator_communications_search_vector
+    BEFORE INSERT OR UPDATE OF subject, message_content, tags
+    ON public.coordinator_communications
+    FOR EACH ROW
+    EXECUTE FUNCTION update_coordinator_communication_search_vector();
+
+UPDATE public.coordinator_communications cc
+SET search_vector = public.coordinator_communication_search_document(cc);
+
+CREATE INDEX IF NOT EXISTS idx_coordinator_comms_search ON public.coordinator_communications USING GIN(search_vector);
+
+-- ------------------------------------------------------------------------------------------------
+-- 6. SEARCH FUNCTION - Ranked, highlighted, keyset-paginated search across all sources
+-- ------------------------------------------------------------------------------------------------
+-- Runs with the caller's privileges, so every branch is filtered by the table's RLS policies.
+-- Results are ordered by (rank DESC, id DESC); pass the last row's rank and id as the cursor
+-- to fetch the next page. Ranks are rounded so the cursor compares exactly across calls.
+-- ts_headline is only computed for the rows of the returned page.
+CREATE OR REPLACE FUNCTION public.search_content(
+    p_query TEXT,
+    p_types TEXT[] DEFAULT NULL,
+    p_limit INTEGER DEFAULT 20,
+    p_cursor_rank NUMERIC DEFAULT NULL,
+    p_cursor_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+    result_type TEXT,
+    id UUID,
+    title TEXT,
+    snippet TEXT,
+    rank NUMERIC,
+    created_at TIMESTAMPTZ
+) AS $$
+    WITH query AS (
+        SELECT websearch_to_tsquery('english', p_query) AS q
+    ),
+    matches AS (
+        SELECT 'lesson_plan'::TEXT AS result_type, lp.id, lp.title::TEXT AS title,
+               concat_ws(' ', lp.description, array_to_string(lp.key_concepts, ', ')) AS body,
+               ROUND(ts_rank_cd(lp.search_vector, query.q)::NUMERIC, 6) AS rank, lp.created_at
+        FROM public.lesson_plans lp, query
+        WHERE (p_types IS NULL OR 'lesson_plans' = ANY(p_types))
+        AND lp.search_vector @@ query.q
+
+        UNION ALL
+
+        SELECT 'doubt', d.id, d.title,
+               concat_ws(' ', d.question_text, d.context),
+               ROUND(ts_rank_cd(d.search_vector, query.q)::NUMERIC, 6), d.created_at
+        FROM public.doubts d, query
+        WHERE (p_types IS NULL OR 'doubts' = ANY(p_types))
+        AND d.search_vector @@ query.q
+
+        UNION ALL
+
+        SELECT 'pdf_assessment', pa.id, pa.title::TEXT,
+               concat_ws(' ', pa.description, array_to_string(pa.topics, ', '), pa.instructions),
+               ROUND(ts_rank_cd(pa.search_vector, query.q)::NUMERIC, 6), pa.created_at
+        FROM public.pdf_assessments pa, query
+        WHERE (p_types IS NULL OR 'pdf_assessments' = ANY(p_types))
+        AND pa.search_vector @@ query.q
+
+        UNION ALL
+
+        SELECT 'teacher_message', tm.id, COALESCE(tm.subject, '')::TEXT,
+               tm.message_text,
+               ROUND(ts_rank_cd(tm.search_vector, query.q)::NUMERIC, 6), tm.created_at
+        FROM public.teacher_messages tm, query
+        WHERE (p_types IS NULL OR 'teacher_messages' = ANY(p_types))
+        AND tm.search_vector @@ query.q
+
+        UNION ALL
+
+        SELECT 'coordinator_communication', cc.id, cc.subject::TEXT,
+               cc.message_content,
+               ROUND(ts_rank_cd(cc.search_vector, query.q)::NUMERIC, 6), cc.created_at
+        FROM public.coordinator_communications cc, query
+        WHERE (p_types IS NULL OR 'coordinator_communications' = ANY(p_types))
+        AND cc.search_vector @@ query.q
+    ),
+    page AS (
+        SELECT *
+        FROM matches m
+        WHERE p_cursor_rank IS NULL
+        OR (m.rank, m.id) < (p_cursor_rank, p_cursor_id)
+        ORDER BY m.rank DESC, m.id DESC
+        LIMIT LEAST(GREATEST(p_limit, 1), 100)
+    )
+    SELECT
+        page.result_type,
+        page.id,
+        page.title,
+        ts_headline('english', COALESCE(page.body, ''), query.q,
+            'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2, FragmentDelimiter=" ... "'),
+        page.rank,
+        page.created_at
+    FROM page, query
+    ORDER BY page.rank DESC, page.id DESC;
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION public.search_content(TEXT, TEXT[], INTEGER, NUMERIC, UUID) TO authenticated;
+
+-- ================================================================================================
+-- SCHEMA VALIDATION FOR FULL-TEXT SEARCH
+-- ================================================================================================
+
+DO $$
+DECLARE
+    index_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO index_count
+    FROM pg_indexes
+    WHERE schemaname = 'public'
+    AND indexname IN (
+        'idx_lesson_plans_search', 'idx_doubts_search', 'idx_pdf_assessments_search',
+        'idx_teacher_messages_search', 'idx_coordinator_comms_search'
+    );
+
+    IF index_count = 5 THEN
+        RAISE NOTICE '🎉 SUCCESS: Full-text search configured on all 5 tables!';
+        RAISE NOTICE '🔍 GIN indexes created and search vectors backfilled';
+        RAISE NOTICE '⚡ Triggers keep search vectors current on insert/update';
+        RAISE NOTICE '✅ search_content() is ready to use!';
+    ELSE
+        RAISE NOTICE '⚠️ WARNING: Only % out of 5 search indexes were created.', index_count;
+        RAISE NOTICE '🔍 Please check the SQL execution log for errors.';
+    END IF;
+END $$;
+
+-- ================================================================================================
+-- END OF FULL-TEXT SEARCH SCHEMA
+-- ================================================================================================
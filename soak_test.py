@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Soak Test for the Proxilearn API Server
+Drives a steady mix of dashboard reads, list loads and status writes for hours
+while sampling the server process through GET /api/status/process (RSS, V8
+heap, open file descriptors, sockets, timers). At the end it fits a line to
+each series against the number of requests served and fails when growth per
+1,000 requests exceeds the limit, which is how a slow leak (Mongo or keep-alive
+connections, timers, caches without bounds) shows up long before an OOM.
+
+Start the server with ENABLE_HEAP_SNAPSHOTS=true and METRICS_TOKEN to also
+capture heap snapshots every HEAP_SNAPSHOT_MINUTES (the server writes at most
+HEAP_SNAPSHOT_MAX_FILES per process, default 20, and one a minute); compare the
+first and last in Chrome DevTools (Memory > Comparison) to see what accumulated.
+
+Environment:
+  PROXILEARN_STUDENT_COOKIE       Cookie headers; the mix includes the routes of
+  PROXILEARN_TEACHER_COOKIE       each role that has one (status routes always run)
+  PROXILEARN_COORDINATOR_COOKIE
+  METRICS_TOKEN                   server's token for /status/process (required)
+  SOAK_MINUTES                    duration (default 120)
+  SOAK_RPS                        target requests per second (default 20)
+  SOAK_WORKERS                    concurrent clients (default 8)
+  SAMPLE_SECONDS                  sampling interval (default 30)
+  HEAP_SNAPSHOT_MINUTES           snapshot interval (default 0 = off)
+  WARMUP_FRACTION                 share of samples ignored while caches fill (default 0.2)
+  RSS_LIMIT_KB_PER_1K, HEAP_LIMIT_KB_PER_1K     allowed growth per 1,000 requests (defaults 256, 128)
+  FD_LIMIT_PER_1K, SOCKET_LIMIT_PER_1K, TIMER_LIMIT_PER_1K   (default 0.5 each)
+  SOAK_SAMPLES_FILE               write every sample as CSV
+"""
+
+import csv
+import os
+import random
+import threading
+import time
+from collections import Counter
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+SOAK_MINUTES = float(os.environ.get("SOAK_MINUTES", "120"))
+SOAK_RPS = float(os.environ.get("SOAK_RPS", "20"))
+SOAK_WORKERS = int(os.environ.get("SOAK_WORKERS", "8"))
+SAMPLE_SECONDS = float(os.environ.get("SAMPLE_SECONDS", "30"))
+HEAP_SNAPSHOT_MINUTES = float(os.environ.get("HEAP_SNAPSHOT_MINUTES", "0"))
+WARMUP_FRACTION = float(os.environ.get("WARMUP_FRACTION", "0.2"))
+SAMPLES_FILE = os.environ.get("SOAK_SAMPLES_FILE")
+
+# Growth allowed per 1,000 requests once warm
+LIMITS = {
+    "rssBytes": float(os.environ.get("RSS_LIMIT_KB_PER_1K", "256")) * 1024,
+    "heapUsedBytes": float(os.environ.get("HEAP_LIMIT_KB_PER_1K", "128")) * 1024,
+    "openFileDescriptors": float(os.environ.get("FD_LIMIT_PER_1K", "0.5")),
+    "activeSockets": float(os.environ.get("SOCKET_LIMIT_PER_1K", "0.5")),
+    "activeTimers": float(os.environ.get("TIMER_LIMIT_PER_1K", "0.5")),
+}
+
+# (weight, method, path, body) per role
+ROLE_MIX = {
+    "student": [
+        (4, "GET", "/subjects", None),
+        (4, "GET", "/assignments", None),
+        (2, "GET", "/study-groups", None),
+        (2, "GET", "/doubts", None),
+        (2, "GET", "/student/progress", None),
+    ],
+    "teacher": [
+        (3, "GET", "/teacher/dashboard", None),
+        (2, "GET", "/teacher/assignments", None),
+        (2, "GET", "/teacher/gradebook", None),
+        (1, "GET", "/teacher/analytics", None),
+        (1, "GET", "/teacher/lesson-plans", None),
+    ],
+    "coordinator": [
+        (3, "GET", "/coordinator/dashboard", None),
+        (1, "GET", "/coordinator/analytics", None),
+        (1, "GET", "/coordinator/alerts", None),
+    ],
+}
+PUBLIC_MIX = [
+    (1, "POST", "/status", {"client_name": "soak-test"}),
+    (1, "GET", "/status", None),
+]
+
+
+def build_mix():
+    mix = [(weight, method, path, body, None) for weight, method, path, body in PUBLIC_MIX]
+    for role, routes in ROLE_MIX.items():
+        cookie = os.environ.get(f"PROXILEARN_{role.upper()}_COOKIE")
+        if cookie:
+            mix.extend((weight, method, path, body, cookie) for weight, method, path, body in routes)
+    return mix
+
+
+def fit_line(xs, ys):
+    """Least-squares slope and R² of ys against xs"""
+    n = len(xs)
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    if sxx == 0:
+        return 0.0, 0.0
+    slope = sxy / sxx
+    r_squared = (sxy * sxy) / (sxx * syy) if syy else 0.0
+    return slope, r_squared
+
+
+def format_amount(metric, value):
+    return f"{value / 1024:.1f} KB" if metric.endswith("Bytes") else f"{value:.2f}"
+
+
+class SoakTester:
+    def __init__(self, mix):
+        self.mix = mix
+        self.weights = [entry[0] for entry in mix]
+        self.stop = threading.Event()
+        self.lock = threading.Lock()
+        self.requests_sent = 0
+        self.statuses = Counter()
+        self.samples = []
+        self.snapshots = []
+        self.test_results = []
+
+    def log_test(self, test_name, success, message=""):
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status}: {test_name}")
+        if message:
+            print(f"   {message}")
+        print()
+        self.test_results.append({"test": test_name, "success": success, "message": message})
+
+    def operator_headers(self):
+        return {"Authorization": f"Bearer {METRICS_TOKEN}"} if METRICS_TOKEN else {}
+
+    def worker(self):
+        session = requests.Session()
+        interval = SOAK_WORKERS / SOAK_RPS
+        next_at = time.monotonic() + random.random() * interval
+        while not self.stop.is_set():
+            _, method, path, body, cookie = random.choices(self.mix, weights=self.weights)[0]
+            headers = {"Cookie": cookie} if cookie else {}
+            try:
+                status = session.request(method, f"{API_BASE}{path}", json=body, headers=headers, timeout=60).status_code
+            except requests.RequestException:
+                status = 0
+            with self.lock:
+                self.requests_sent += 1
+                self.statuses[status] += 1
+            next_at += interval
+            self.stop.wait(max(0.0, next_at - time.monotonic()))
+
+    def sample(self, started):
+        response = requests.get(f"{API_BASE}/status/process", headers=self.operator_headers(), timeout=30)
+        response.raise_for_status()
+        stats = response.json()
+        with self.lock:
+            stats["requests"] = self.requests_sent
+        stats["elapsedSeconds"] = round(time.monotonic() - started)
+        self.samples.append(stats)
+        print(f"📊 {stats['elapsedSeconds'] // 60:>4}m  {stats['requests']:>8} req  "
+              f"rss {stats['rssBytes'] / 1048576:7.1f} MB  heap {stats['heapUsedBytes'] / 1048576:7.1f} MB  "
+              f"fds {stats['openFileDescriptors']}  sockets {stats['activeSockets']}  timers {stats['activeTimers']}")
+
+    def heap_snapshot(self, label):
+        response = requests.post(f"{API_BASE}/status/heap-snapshot", json={"label": label},
+                                 headers=self.operator_headers(), timeout=300)
+        if response.status_code == 404:
+            print("⏭️  Heap snapshots disabled on the server (ENABLE_HEAP_SNAPSHOTS=true and METRICS_TOKEN)")
+            return False
+        if response.status_code == 429:
+            print(f"⏭️  Heap snapshots stopped: {response.json().get('error')}")
+            return False
+        response.raise_for_status()
+        self.snapshots.append(response.json()["file"])
+        print(f"📸 Heap snapshot written to {response.json()['file']}")
+        return True
+
+    def drive(self):
+        started = time.monotonic()
+        deadline = started + SOAK_MINUTES * 60
+        next_snapshot = started if HEAP_SNAPSHOT_MINUTES > 0 else None
+        threads = [threading.Thread(target=self.worker, daemon=True) for _ in range(SOAK_WORKERS)]
+        for thread in threads:
+            thread.start()
+        try:
+            while time.monotonic() < deadline:
+                self.sample(started)
+                if next_snapshot is not None and time.monotonic() >= next_snapshot:
+                    label = f"{int((time.monotonic() - started) // 60)}m"
+                    next_snapshot = (next_snapshot + HEAP_SNAPSHOT_MINUTES * 60) if self.heap_snapshot(label) else None
+                self.stop.wait(min(SAMPLE_SECONDS, max(0.0, deadline - time.monotonic())))
+        finally:
+            self.stop.set()
+            for thread in threads:
+                thread.join(timeout=60)
+        self.sample(started)
+
+    def check_growth(self):
+        warm = self.samples[int(len(self.samples) * WARMUP_FRACTION):]
+        if len(warm) < 3 or warm[-1]["requests"] == warm[0]["requests"]:
+            self.log_test("Growth per 1k requests", False, "Not enough samples after warmup - run longer")
+            return
+
+        xs = [sample["requests"] / 1000 for sample in warm]
+        for metric, limit in LIMITS.items():
+            ys = [sample[metric] for sample in warm if sample.get(metric) is not None]
+            if len(ys) != len(xs):
+                print(f"⏭️  SKIP: {metric} (not reported by this platform)")
+                continue
+            slope, r_squared = fit_line(xs, ys)
+            # Only a steady trend counts as a leak; noisy GC sawtooth has a low R²
+            leaking = slope > limit and r_squared >= 0.5
+            self.log_test(f"{metric} growth", not leaking,
+                          f"{format_amount(metric, slope)} per 1k requests (limit {format_amount(metric, limit)}), "
+                          f"R² {r_squared:.2f}, {format_amount(metric, ys[0])} -> {format_amount(metric, ys[-1])}")
+
+    def write_samples(self):
+        columns = ["elapsedSeconds", "requests", "rssBytes", "heapUsedBytes", "heapTotalBytes", "externalBytes",
+                   "arrayBuffersBytes", "openFileDescriptors", "activeSockets", "activeTimers", "activeResources"]
+        with open(SAMPLES_FILE, "w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(self.samples)
+        print(f"Samples written to {SAMPLES_FILE}")
+
+    def run(self):
+        print("=" * 80)
+        print("PROXILEARN SOAK TEST")
+        print("=" * 80)
+        print(f"{SOAK_MINUTES:g} minutes at ~{SOAK_RPS:g} req/s with {SOAK_WORKERS} workers, "
+              f"{len(self.mix)} routes in the mix, sampling every {SAMPLE_SECONDS:g}s")
+        print()
+
+        self.drive()
+        print()
+        print(f"Requests: {self.requests_sent}, status codes: {dict(self.statuses)}")
+        print()
+
+        self.check_growth()
+        errors = sum(count for status, count in self.statuses.items() if status == 0 or status >= 500)
+        self.log_test("Server errors", errors == 0, f"{errors} requests failed with 5xx or a connection error")
+
+        if SAMPLES_FILE:
+            self.write_samples()
+        if self.snapshots:
+            print(f"Heap snapshots: {', '.join(self.snapshots)}")
+
+        passed = sum(1 for result in self.test_results if result["success"])
+        print("=" * 80)
+        print(f"SUMMARY: {passed}/{len(self.test_results)} tests passed")
+        print("=" * 80)
+        return passed == len(self.test_results)
+
+
+if __name__ == "__main__":
+    probe = requests.get(f"{API_BASE}/status/process",
+                         headers={"Authorization": f"Bearer {METRICS_TOKEN}"} if METRICS_TOKEN else {})
+    if probe.status_code != 200:
+        print(f"⏭️  SKIP - GET /api/status/process returned {probe.status_code} (set METRICS_TOKEN?)")
+        raise SystemExit(0)
+
+    raise SystemExit(0 if SoakTester(build_mix()).run() else 1)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Traffic Replay for Proxilearn Load Tests
+Plays a capture written by the API (TRAFFIC_CAPTURE_FILE, see lib/capture.js)
+back against a local stack, keeping the original inter-arrival times scaled by
+REPLAY_SPEED, and reports latency per route next to the latency the same
+requests had when they were captured.
+
+Captured callers are identified only by a hash, so each distinct caller is
+mapped onto one of the cookies in PROXILEARN_REPLAY_COOKIES (round-robin in
+order of first appearance). Use accounts whose roles match the captured mix,
+listed in that order, or expect 401/403s on role-specific routes. Free-text
+placeholders such as "<text:42>" are filled with filler text of that length.
+
+Environment:
+  TRAFFIC_CAPTURE_FILE        JSONL capture to replay (required)
+  PROXILEARN_REPLAY_COOKIES   file with one Cookie header per line (required)
+  REPLAY_SPEED                1, 10, 100... (default 1)
+  REPLAY_WORKERS              concurrent requests in flight at most (default 64)
+  REPLAY_LIMIT                replay only the first N records
+"""
+
+import json
+import os
+import re
+import statistics
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+# Configuration
+BASE_URL = os.environ.get("PROXILEARN_BASE_URL", "http://localhost:3000")
+API_BASE = f"{BASE_URL}/api"
+CAPTURE_FILE = os.environ.get("TRAFFIC_CAPTURE_FILE")
+COOKIES_FILE = os.environ.get("PROXILEARN_REPLAY_COOKIES")
+REPLAY_SPEED = float(os.environ.get("REPLAY_SPEED", "1"))
+REPLAY_WORKERS = int(os.environ.get("REPLAY_WORKERS", "64"))
+REPLAY_LIMIT = os.environ.get("REPLAY_LIMIT")
+
+TEXT_PLACEHOLDER = re.compile(r"^<text:(\d+)>$")
+FILLER = "lorem ipsum dolor sit amet consectetur adipiscing elit "
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def fill_placeholders(value):
+    """Turn "<text:N>" placeholders back into N characters of filler text"""
+    if isinstance(value, str):
+        match = TEXT_PLACEHOLDER.match(value)
+        if match:
+            length = int(match.group(1))
+            return (FILLER * (length // len(FILLER) + 1))[:length]
+        return value
+    if isinstance(value, list):
+        return [fill_placeholders(item) for item in value]
+    if isinstance(value, dict):
+        return {key: fill_placeholders(item) for key, item in value.items()}
+    return value
+
+
+def load_records():
+    records = []
+    with open(CAPTURE_FILE) as handle:
+        for line in handle:
+            if line.strip():
+                record = json.loads(line)
+                record["arrival"] = datetime.fromisoformat(record["ts"].replace("Z", "+00:00")).timestamp()
+                records.append(record)
+    records.sort(key=lambda record: record["arrival"])
+    if REPLAY_LIMIT:
+        records = records[:int(REPLAY_LIMIT)]
+    return records
+
+
+def load_cookies():
+    with open(COOKIES_FILE) as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+class TrafficReplayer:
+    def __init__(self, records, cookies):
+        self.records = records
+        self.cookies = cookies
+        self.client_cookies = {}
+        self.sessions = threading.local()
+        self.results = []
+        self.results_lock = threading.Lock()
+
+    def cookie_for(self, client):
+        if client not in self.client_cookies:
+            self.client_cookies[client] = self.cookies[len(self.client_cookies) % len(self.cookies)]
+        return self.client_cookies[client]
+
+    def session(self):
+        if not hasattr(self.sessions, "session"):
+            self.sessions.session = requests.Session()
+        return self.sessions.session
+
+    def send(self, record, cookie, scheduled_at):
+        headers = {"Cookie": cookie} if cookie else {}
+        if record.get("prefer"):
+            headers["Prefer"] = record["prefer"]
+        body = record.get("body")
+        started = time.perf_counter()
+        try:
+            response = self.session().request(
+                record["method"],
+                f"{API_BASE}{record['path']}",
+                params=fill_placeholders(record.get("query") or {}),
+                json=fill_placeholders(body) if body is not None else None,
+                headers=headers,
+                timeout=120,
+            )
+            status = response.status_code
+        except requests.RequestException:
+            status = 0
+        finished = time.perf_counter()
+        with self.results_lock:
+            self.results.append({
+                "route": f"{record['method']} {record['route']}",
+                "status": status,
+                "captured_status": record.get("status"),
+                "latency_ms": (finished - started) * 1000,
+                "captured_ms": record.get("durationMs"),
+                "lag_ms": (started - scheduled_at) * 1000,
+            })
+
+    def run(self):
+        print("=" * 80)
+        print("PROXILEARN TRAFFIC REPLAY")
+        print("=" * 80)
+        span = self.records[-1]["arrival"] - self.records[0]["arrival"] if self.records else 0
+        print(f"Capture: {CAPTURE_FILE}, {len(self.records)} requests over {span / 60:.1f} minutes")
+        print(f"Speed: {REPLAY_SPEED:g}x (about {span / REPLAY_SPEED / 60:.1f} minutes), "
+              f"{len(self.cookies)} cookies, {REPLAY_WORKERS} workers")
+        print()
+
+        first_arrival = self.records[0]["arrival"]
+        replay_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=REPLAY_WORKERS) as pool:
+            for record in self.records:
+                scheduled_at = replay_start + (record["arrival"] - first_arrival) / REPLAY_SPEED
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                cookie = self.cookie_for(record["client"]) if record.get("client") else None
+                pool.submit(self.send, record, cookie, scheduled_at)
+
+        return self.report()
+
+    def report(self):
+        by_route = defaultdict(list)
+        for result in self.results:
+            by_route[result["route"]].append(result)
+
+        print(f"{'Route':<52} {'n':>5} {'p50':>7} {'p95':>7} {'max':>7} {'capt p50':>9} {'5xx':>5} {'diff':>5}")
+        print("-" * 104)
+        for route, results in sorted(by_route.items(), key=lambda item: -len(item[1])):
+            latencies = [r["latency_ms"] for r in results]
+            captured = [r["captured_ms"] for r in results if r["captured_ms"] is not None]
+            server_errors = sum(1 for r in results if r["status"] >= 500 or r["status"] == 0)
+            # Status class differs from the captured one (e.g. 200 then, 403 now)
+            mismatched = sum(1 for r in results
+                             if r["captured_status"] and r["status"] // 100 != r["captured_status"] // 100)
+            captured_p50 = f"{statistics.median(captured):.0f}" if captured else "-"
+            print(f"{route[:52]:<52} {len(results):>5} {statistics.median(latencies):>7.0f} "
+                  f"{percentile(latencies, 95):>7.0f} {max(latencies):>7.0f} {captured_p50:>9} "
+                  f"{server_errors:>5} {mismatched:>5}")
+        print()
+
+        lags = [r["lag_ms"] for r in self.results]
+        total_errors = sum(1 for r in self.results if r["status"] >= 500 or r["status"] == 0)
+        print(f"Dispatch lag p95 {percentile(lags, 95):.0f}ms (high values mean the replayer, "
+              f"not the server, is the bottleneck - raise REPLAY_WORKERS)")
+        if total_errors:
+            print(f"❌ {total_errors} requests failed with 5xx or a connection error")
+        else:
+            print("✅ No server errors")
+        return total_errors == 0
+
+
+if __name__ == "__main__":
+    if not CAPTURE_FILE or not COOKIES_FILE:
+        print("⏭️  SKIP - set TRAFFIC_CAPTURE_FILE and PROXILEARN_REPLAY_COOKIES to replay a capture")
+        raise SystemExit(0)
+
+    capture = load_records()
+    if not capture:
+        print(f"⏭️  SKIP - {CAPTURE_FILE} has no records")
+        raise SystemExit(0)
+
+    raise SystemExit(0 if TrafficReplayer(capture, load_cookies()).run() else 1)